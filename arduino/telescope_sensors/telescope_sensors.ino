@@ -11,12 +11,21 @@
  * Output Format (tab-separated, newline terminated):
  * aX\taY\taZ\tmX\tmY\tmZ\ttemperature\thumidity\r\n
  *
+ * Binary Format (after BINARY command, 34-byte little-endian frames):
+ * [0xAA 0x55][seq u16][aX aY aZ mX mY mZ f32][temp, humidity i16 x100][crc u16]
+ * CRC is CRC-16/CCITT-FALSE (poly 0x1021, init 0xFFFF) over seq..humidity.
+ * The sequence counter lets the host detect lost frames. Command replies
+ * stay ASCII text; 0xAA never occurs in text, so the host can separate them.
+ *
  * Serial Commands:
  * - RESET     : Reinitialize all sensors
  * - STATUS    : Report sensor status and configuration
  * - CALIBRATE : Run magnetometer calibration (collect samples while rotating)
  * - STOP      : Pause sensor output
  * - START     : Resume sensor output
+ * - BINARY    : Switch sample output to binary frames
+ * - ASCII     : Switch sample output back to tab-separated text (default)
+ * - RATE <hz> : Set the sample rate (1-100 Hz, default 10); kept until power off
  *
  * Units:
  * - Accelerometer: g (gravitational acceleration)
@@ -43,7 +52,9 @@
 #include <Arduino_HTS221.h>
 
 // Configuration
-const unsigned long SAMPLE_INTERVAL_MS = 100;  // 10 Hz sampling rate
+const unsigned long DEFAULT_SAMPLE_RATE_HZ = 10;  // Rate after power-up
+const unsigned long MIN_SAMPLE_RATE_HZ = 1;
+const unsigned long MAX_SAMPLE_RATE_HZ = 100;     // ASCII lines still fit 115200 baud
 const long SERIAL_BAUD_RATE = 115200;
 const int LED_PIN = LED_BUILTIN;               // Onboard LED for status
 const int WARMUP_SAMPLES = 10;                 // Samples to discard during warmup
@@ -64,6 +75,22 @@ float magOffsetZ = 0.0;
 bool imuInitialized = false;
 bool htsInitialized = false;
 bool outputEnabled = true;
+bool binaryOutput = false;     // Binary frames instead of ASCII lines
+uint16_t frameSeq = 0;         // Binary frame sequence counter (wraps)
+unsigned long sampleRateHz = DEFAULT_SAMPLE_RATE_HZ;
+unsigned long sampleIntervalMs = 1000 / DEFAULT_SAMPLE_RATE_HZ;
+
+// Binary frame layout (matches drivers/sensors/arduino.py)
+const uint8_t FRAME_SYNC_0 = 0xAA;
+const uint8_t FRAME_SYNC_1 = 0x55;
+
+struct __attribute__((packed)) SensorFrame {
+    uint8_t sync[2];
+    uint16_t seq;
+    float imu[6];          // aX, aY, aZ, mX, mY, mZ
+    int16_t env[2];        // temperature, humidity in hundredths
+    uint16_t crc;          // CRC-16/CCITT-FALSE over seq..env
+};
 
 // Command buffer
 String commandBuffer = "";
@@ -203,8 +230,10 @@ void reportStatus() {
     Serial.println(htsInitialized ? "OK" : "FAILED");
     Serial.print("Output: ");
     Serial.println(outputEnabled ? "ENABLED" : "PAUSED");
+    Serial.print("Protocol: ");
+    Serial.println(binaryOutput ? "BINARY" : "ASCII");
     Serial.print("Sample Rate: ");
-    Serial.print(1000 / SAMPLE_INTERVAL_MS);
+    Serial.print(sampleRateHz);
     Serial.println(" Hz");
     Serial.print("Mag Offsets (X,Y,Z): ");
     Serial.print(magOffsetX, 2);
@@ -305,6 +334,9 @@ void runCalibration() {
  * - CALIBRATE: Run magnetometer calibration
  * - STOP: Pause sensor output
  * - START: Resume sensor output
+ * - BINARY: Output binary frames
+ * - ASCII: Output tab-separated text
+ * - RATE <hz>: Set the sample rate; replies with the rate now in effect
  */
 void processCommand(String cmd) {
     cmd.trim();
@@ -328,10 +360,34 @@ void processCommand(String cmd) {
         outputEnabled = true;
         Serial.println("CMD: Output resumed");
     }
+    else if (cmd == "BINARY") {
+        Serial.println("CMD: Binary output");
+        binaryOutput = true;
+    }
+    else if (cmd == "ASCII") {
+        binaryOutput = false;
+        Serial.println("CMD: ASCII output");
+    }
+    else if (cmd.startsWith("RATE ")) {
+        long hz = cmd.substring(5).toInt();
+        if (hz < (long)MIN_SAMPLE_RATE_HZ || hz > (long)MAX_SAMPLE_RATE_HZ) {
+            Serial.print("ERROR: Rate must be ");
+            Serial.print(MIN_SAMPLE_RATE_HZ);
+            Serial.print("-");
+            Serial.print(MAX_SAMPLE_RATE_HZ);
+            Serial.println(" Hz");
+        } else {
+            sampleRateHz = hz;
+            sampleIntervalMs = 1000 / sampleRateHz;
+            Serial.print("OK: Sample Rate: ");
+            Serial.print(sampleRateHz);
+            Serial.println(" Hz");
+        }
+    }
     else if (cmd.length() > 0) {
         Serial.print("ERROR: Unknown command: ");
         Serial.println(cmd);
-        Serial.println("Available: RESET, STATUS, CALIBRATE, STOP, START");
+        Serial.println("Available: RESET, STATUS, CALIBRATE, STOP, START, BINARY, ASCII, RATE <hz>");
     }
 }
 
@@ -385,7 +441,7 @@ void setup() {
 
     Serial.println();
     Serial.println("==============================");
-    Serial.println("Telescope Sensors v1.2-debug");
+    Serial.println("Telescope Sensors v1.3-debug");
     Serial.println("Arduino Nano BLE33 Sense");
     Serial.println("==============================");
     Serial.flush();
@@ -417,7 +473,7 @@ void loop() {
     unsigned long currentTime = millis();
 
     // Check if it's time for a new sample
-    if (outputEnabled && (currentTime - lastSampleTime >= SAMPLE_INTERVAL_MS)) {
+    if (outputEnabled && (currentTime - lastSampleTime >= sampleIntervalMs)) {
         lastSampleTime = currentTime;
 
         // Read accelerometer data
@@ -440,8 +496,12 @@ void loop() {
             humidity = HTS.readHumidity();
         }
 
-        // Output data in tab-separated format
-        outputSensorData();
+        // Output data as a binary frame or tab-separated text
+        if (binaryOutput) {
+            outputSensorFrame();
+        } else {
+            outputSensorData();
+        }
     }
 }
 
@@ -476,3 +536,48 @@ void outputSensorData() {
     // Humidity
     Serial.println(humidity, 2);  // println adds \r\n
 }
+
+/**
+ * Compute CRC-16/CCITT-FALSE (poly 0x1021, init 0xFFFF).
+ *
+ * Args:
+ *     data: Bytes to checksum.
+ *     length: Number of bytes.
+ *
+ * Returns:
+ *     16-bit CRC, identical to Python's binascii.crc_hqx(data, 0xFFFF).
+ */
+uint16_t crc16(const uint8_t* data, size_t length) {
+    uint16_t crc = 0xFFFF;
+    for (size_t i = 0; i < length; i++) {
+        crc ^= (uint16_t)data[i] << 8;
+        for (int bit = 0; bit < 8; bit++) {
+            crc = (crc & 0x8000) ? (crc << 1) ^ 0x1021 : crc << 1;
+        }
+    }
+    return crc;
+}
+
+/**
+ * Output all sensor data as one binary frame.
+ *
+ * 34 bytes instead of ~50 for the ASCII line, full float precision for
+ * the IMU channels, and a sequence counter for loss detection.
+ */
+void outputSensorFrame() {
+    SensorFrame frame;
+    frame.sync[0] = FRAME_SYNC_0;
+    frame.sync[1] = FRAME_SYNC_1;
+    frame.seq = frameSeq++;
+    frame.imu[0] = accelX;
+    frame.imu[1] = accelY;
+    frame.imu[2] = accelZ;
+    frame.imu[3] = magX;
+    frame.imu[4] = magY;
+    frame.imu[5] = magZ;
+    frame.env[0] = (int16_t)lroundf(temperature * 100.0f);
+    frame.env[1] = (int16_t)lroundf(humidity * 100.0f);
+    const uint8_t* bytes = (const uint8_t*)&frame;
+    frame.crc = crc16(bytes + 2, sizeof(SensorFrame) - 4);
+    Serial.write(bytes, sizeof(SensorFrame));
+}
@@ -3,6 +3,7 @@
 Provides the ``telescope-mcp`` console script with subcommands:
 
 - ``install`` — Generate ``.vscode/mcp.json`` for a project
+- ``export`` — Convert session archives to per-frame FITS/NPY files
 - ``server`` — Run the MCP server (default if no subcommand)
 
 Usage::
@@ -16,12 +17,16 @@ Usage::
     # Run MCP server (default, same as python -m telescope_mcp.server)
     telescope-mcp
 
+    # Export a night's archives to FITS using 8 worker processes
+    telescope-mcp export ~/.telescope-mcp/data/2025/12/31 -o ./fits -j 8
+
     # Run MCP server with explicit subcommand
     telescope-mcp server --dashboard-host 127.0.0.1 --dashboard-port 8080
 
 Module Structure:
     - ``main()`` — CLI entry point, dispatches subcommands
     - ``run_install()`` — Generate/update .vscode/mcp.json
+    - ``run_export()`` — Bulk export archives to FITS/NPY
     - ``_generate_mcp_template()`` — JSONC template with all options
     - ``_strip_jsonc_comments()`` — Parse existing JSONC configs
 """
@@ -333,11 +338,63 @@ def run_install(
     _log(f"Python: {python_path}")
 
 
+def run_export(
+    paths: list[Path],
+    output_dir: Path,
+    *,
+    fmt: str = "fits",
+    workers: int | None = None,
+    overwrite: bool = False,
+) -> int:
+    """Export session archives to per-frame FITS or NPY files.
+
+    Thin CLI wrapper over ``telescope_mcp.data.export.export_archives``
+    that reports throughput and any per-frame failures.
+
+    Args:
+        paths: Archive files or directories (searched recursively).
+        output_dir: Destination root directory.
+        fmt: ``"fits"`` or ``"npy"``.
+        workers: Worker processes (None = CPU count).
+        overwrite: Replace existing output files.
+
+    Returns:
+        Exit code: 0 on success, 1 if any frame or archive failed.
+
+    Example:
+        >>> run_export([Path("data/2025/12/31")], Path("fits"), workers=4)
+        0
+    """
+    from telescope_mcp.data.export import export_archives
+
+    try:
+        summary = export_archives(
+            paths, output_dir, fmt=fmt, workers=workers, overwrite=overwrite
+        )
+    except (FileNotFoundError, ValueError) as e:
+        _log(str(e), emoji="❌")
+        return 1
+
+    _log(
+        f"Exported {summary.frames} frame(s) from {summary.archives} archive(s) "
+        f"to {output_dir}",
+        emoji="✅",
+    )
+    _log(
+        f"{summary.elapsed_sec:.1f}s, {summary.frames_per_second:.1f} frames/s, "
+        f"{summary.megabytes_per_second:.1f} MB/s"
+    )
+    for error in summary.errors:
+        _log(error, emoji="⚠️")
+    return 1 if summary.errors else 0
+
+
 def main() -> int:
     """Main CLI entry point for telescope-mcp.
 
     Dispatches to subcommands:
     - ``install``: Generate .vscode/mcp.json configuration
+    - ``export``: Bulk export archives to FITS/NPY
     - ``server`` or no subcommand: Run MCP server (delegates to
       ``server.main()`` which has its own arg parser)
 
@@ -378,6 +435,45 @@ def main() -> int:
         help="Install to global VS Code settings",
     )
 
+    # Export subcommand
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Export session archives to per-frame FITS/NPY files",
+    )
+    export_parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="ASDF archive files or directories (searched recursively)",
+    )
+    export_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("export"),
+        help="Output directory (default: ./export)",
+    )
+    export_parser.add_argument(
+        "-f",
+        "--format",
+        dest="fmt",
+        choices=["fits", "npy"],
+        default="fits",
+        help="Output format (default: fits)",
+    )
+    export_parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)",
+    )
+    export_parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Replace existing output files",
+    )
+
     # Server subcommand (pass-through to server.main())
     subparsers.add_parser(
         "server",
@@ -392,6 +488,15 @@ def main() -> int:
         run_install(global_install=args.global_install)
         return 0
 
+    if args.command == "export":
+        return run_export(
+            args.paths,
+            args.output,
+            fmt=args.fmt,
+            workers=args.workers,
+            overwrite=args.overwrite,
+        )
+
     # Default or "server": delegate to server.main()
     # Strip "server" subcommand so server.parse_args() works
     if len(sys.argv) > 1 and sys.argv[1] == "server":
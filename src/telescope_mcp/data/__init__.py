@@ -26,12 +26,58 @@ Example:
     path = sessions.end_session()
 """
 
+from telescope_mcp.data.compaction import (
+    ArchiveCompactor,
+    CompactionResult,
+    CompactionStatus,
+    archive_lock,
+    compact_archive,
+)
+from telescope_mcp.data.events import (
+    EventBus,
+    EventPublisher,
+    Subscription,
+    TelemetryEvent,
+)
+from telescope_mcp.data.export import ExportFormat, ExportSummary, export_archives
+from telescope_mcp.data.sequence import (
+    ExposureSequence,
+    FrameType,
+    SequenceState,
+    SequenceStatus,
+    SequenceStep,
+)
 from telescope_mcp.data.session import LogLevel, Session, SessionType
 from telescope_mcp.data.session_manager import SessionManager
+from telescope_mcp.data.telemetry import (
+    TelemetryColumns,
+    TelemetryRecorder,
+    TelemetrySink,
+)
 
 __all__ = [
+    "ArchiveCompactor",
+    "CompactionResult",
+    "CompactionStatus",
+    "EventBus",
+    "EventPublisher",
+    "ExportFormat",
+    "ExportSummary",
+    "ExposureSequence",
+    "FrameType",
     "LogLevel",
+    "SequenceState",
+    "SequenceStatus",
+    "SequenceStep",
     "Session",
     "SessionManager",
     "SessionType",
+    "Subscription",
+    "TelemetryColumns",
+    "TelemetryEvent",
+    "TelemetryRecorder",
+    "TelemetrySink",
+    "archive_lock",
+    "compact_archive",
+    "export_archives",
 ]
@@ -0,0 +1,666 @@
+"""Background compaction and recompression of completed ASDF archives.
+
+Daily capture archives are appended one frame at a time with af.update(),
+which leaves blocks scattered through the file and stores every frame
+uncompressed. Session files written by Session.close() are contiguous but
+also uncompressed. This module rewrites finished archives into a single
+contiguous layout, optionally compressed (off by default: compressed blocks
+cannot be memory-mapped, so exports and ranged frame downloads would have
+to decompress whole frames):
+
+1. Hash every array in the source archive (memory-mapped, chunked reads)
+2. Write a temporary copy next to the original with write_to()
+3. Reopen the copy with ASDF block checksum validation and re-hash
+4. Atomically replace the original only if digests match and the source
+   was not modified while the copy was being written; the check and the
+   swap run under archive_lock() so an in-place update cannot slip between
+
+All reads and writes pass through a byte-rate throttle so a compaction pass
+never saturates the SD card while captures are being written, and the
+background thread lowers its own scheduling priority where supported.
+
+Classes:
+    CompactionStatus: Per-archive outcome
+    CompactionResult: Outcome, sizes and timing for one archive
+    ArchiveCompactor: Periodic low-priority background compaction thread
+
+Functions:
+    compact_archive: Compact one archive in place (synchronous)
+    archive_lock: Per-archive lock shared with in-place writers
+
+Example:
+    from telescope_mcp.data import ArchiveCompactor
+
+    compactor = ArchiveCompactor([Path("data/captures")], compression="zlib")
+    compactor.start()
+    ...
+    compactor.stop()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import shutil
+import sys
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from telescope_mcp.drivers.config import (
+    DEFAULT_COMPACTION_COMPRESSION,
+    DEFAULT_COMPACTION_INTERVAL_SEC,
+    DEFAULT_COMPACTION_MAX_BYTES_PER_SEC,
+)
+from telescope_mcp.observability import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "DEFAULT_COMPACTION_COMPRESSION",
+    "DEFAULT_COMPACTION_INTERVAL_SEC",
+    "DEFAULT_COMPACTION_MAX_BYTES_PER_SEC",
+    "DEFAULT_COMPACTION_MIN_AGE_SEC",
+    "SUPPORTED_COMPRESSION",
+    "ArchiveCompactor",
+    "CompactionResult",
+    "CompactionStatus",
+    "archive_lock",
+    "compact_archive",
+]
+
+# Block compression codecs accepted by ASDF write_to()
+SUPPORTED_COMPRESSION: tuple[str, ...] = ("zlib", "bzp2", "lz4")
+
+# Archives modified more recently than this are considered still in use
+DEFAULT_COMPACTION_MIN_AGE_SEC = 6 * 3600.0
+
+# Delay before the first background pass so startup I/O is not competing
+_DEFAULT_STARTUP_DELAY_SEC = 60.0
+
+# Granularity of throttled reads/writes
+_IO_CHUNK_SIZE = 1024 * 1024
+
+# Top-level tree key recording how an archive was compacted
+_COMPACTION_KEY = "compaction"
+
+# Nice value applied to the background thread (Linux per-thread priority)
+_LOW_PRIORITY_NICE = 19
+
+# Per-archive write locks keyed by resolved path (see archive_lock())
+_archive_locks: dict[str, threading.Lock] = {}
+_archive_locks_guard = threading.Lock()
+
+
+class CompactionStatus(str, Enum):
+    """Outcome of compacting one archive."""
+
+    COMPACTED = "compacted"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
+@dataclass(slots=True)
+class CompactionResult:
+    """Outcome of compact_archive() for one file.
+
+    Attributes:
+        path: Archive that was examined.
+        status: COMPACTED, SKIPPED or FAILED.
+        reason: Why the archive was skipped or failed (empty on success).
+        bytes_before: Archive size before compaction.
+        bytes_after: Archive size after compaction (equals bytes_before
+            unless COMPACTED).
+        arrays: Number of arrays verified and rewritten.
+        elapsed_sec: Wall time spent, including throttling.
+    """
+
+    path: Path
+    status: CompactionStatus
+    reason: str = ""
+    bytes_before: int = 0
+    bytes_after: int = 0
+    arrays: int = 0
+    elapsed_sec: float = 0.0
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes reclaimed (negative if the rewrite grew the file)."""
+        return self.bytes_before - self.bytes_after
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable summary.
+
+        Returns:
+            Dict with path, status, reason, sizes, arrays and elapsed_sec.
+
+        Example:
+            >>> compact_archive(path).to_dict()["status"]
+            'compacted'
+        """
+        return {
+            "path": str(self.path),
+            "status": self.status.value,
+            "reason": self.reason,
+            "bytes_before": self.bytes_before,
+            "bytes_after": self.bytes_after,
+            "bytes_saved": self.bytes_saved,
+            "arrays": self.arrays,
+            "elapsed_sec": round(self.elapsed_sec, 3),
+        }
+
+
+class _CompactionCancelledError(Exception):
+    """Raised inside a compaction when the cancel event is set."""
+
+
+class _IoThrottle:
+    """Byte-rate limiter shared by the reads and writes of one compaction.
+
+    Tracks bytes transferred since creation and sleeps whenever the
+    transfer is ahead of the configured rate. Sleeping waits on the cancel
+    event, so stop() interrupts a throttled compaction immediately.
+    """
+
+    __slots__ = ("_rate", "_cancel", "_start", "_bytes")
+
+    def __init__(
+        self, max_bytes_per_sec: float | None, cancel: threading.Event | None
+    ) -> None:
+        self._rate = max_bytes_per_sec
+        self._cancel = cancel
+        self._start = time.monotonic()
+        self._bytes = 0
+
+    def consume(self, nbytes: int) -> None:
+        """Account for nbytes of I/O, sleeping to honor the rate.
+
+        Raises:
+            _CompactionCancelledError: If the cancel event is set.
+        """
+        if self._cancel is not None and self._cancel.is_set():
+            raise _CompactionCancelledError
+        self._bytes += nbytes
+        if not self._rate:
+            return
+        ahead = self._bytes / self._rate - (time.monotonic() - self._start)
+        if ahead <= 0:
+            return
+        if self._cancel is None:
+            time.sleep(ahead)
+        elif self._cancel.wait(ahead):
+            raise _CompactionCancelledError
+
+
+class _ThrottledFile(io.FileIO):
+    """Binary file whose writes are split into throttled chunks.
+
+    ASDF writes each block with a single write() of the whole buffer; this
+    wrapper meters it so large frames do not burst onto the card.
+    """
+
+    def __init__(self, path: Path, throttle: _IoThrottle) -> None:
+        super().__init__(path, "w")
+        self._throttle = throttle
+
+    def write(self, data: Any) -> int:
+        view = memoryview(data).cast("B")
+        written = 0
+        while written < len(view):
+            chunk = view[written : written + _IO_CHUNK_SIZE]
+            n = super().write(chunk)
+            if n is None:  # pragma: no cover - non-blocking files only
+                continue
+            written += n
+            self._throttle.consume(n)
+        return written
+
+
+def _iter_arrays(node: Any) -> Iterator[Any]:
+    """Yield array-like leaves of an ASDF tree in deterministic order."""
+    if isinstance(node, dict):
+        for key in sorted(node, key=str):
+            if key == _COMPACTION_KEY:
+                continue
+            yield from _iter_arrays(node[key])
+    elif isinstance(node, (list, tuple)):
+        for item in node:
+            yield from _iter_arrays(item)
+    elif hasattr(node, "__array__") and hasattr(node, "shape"):
+        yield node
+
+
+def _array_digests(tree: Any, throttle: _IoThrottle) -> list[str]:
+    """Hash dtype, shape and bytes of every array in a tree.
+
+    Reads are chunked through the throttle so verifying a large archive is
+    metered like the rewrite itself.
+    """
+    digests = []
+    for node in _iter_arrays(tree):
+        array = np.ascontiguousarray(node)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        buffer = memoryview(array).cast("B")
+        for offset in range(0, len(buffer), _IO_CHUNK_SIZE):
+            chunk = buffer[offset : offset + _IO_CHUNK_SIZE]
+            digest.update(chunk)
+            throttle.consume(len(chunk))
+        digests.append(digest.hexdigest())
+    return digests
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename by syncing its directory (POSIX only)."""
+    if not hasattr(os, "O_DIRECTORY"):  # pragma: no cover - Windows
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def archive_lock(path: Path) -> threading.Lock:
+    """Return the process-wide lock guarding writes to one archive.
+
+    Writers that modify an archive (the dashboard's per-frame af.update(),
+    Session.close()) hold it for the whole write. compact_archive() only
+    holds it while confirming the source is unchanged and swapping the
+    verified copy in, so a writer waits at most for a rename, never for a
+    throttled rewrite.
+
+    Args:
+        path: Archive path; aliases resolving to the same file share a lock.
+
+    Returns:
+        threading.Lock for the archive (the same object on every call).
+
+    Example:
+        >>> with archive_lock(path):
+        ...     with asdf.open(path, mode="rw") as af:
+        ...         af.update()
+    """
+    key = os.path.realpath(path)
+    with _archive_locks_guard:
+        return _archive_locks.setdefault(key, threading.Lock())
+
+
+def compact_archive(
+    path: Path,
+    *,
+    compression: str | None = DEFAULT_COMPACTION_COMPRESSION,
+    max_bytes_per_sec: float | None = None,
+    min_age_sec: float = 0.0,
+    cancel: threading.Event | None = None,
+) -> CompactionResult:
+    """Rewrite one ASDF archive contiguously, verify it, and swap it in.
+
+    The archive is skipped if it was modified within min_age_sec (still
+    being appended to) or if it was already compacted with the same codec
+    and has not gained arrays since. The original is only replaced after
+    the rewritten copy passes ASDF block checksum validation and every
+    array's content digest matches the source, and the swap is made under
+    archive_lock() so writers using the same lock are never overwritten.
+
+    Args:
+        path: ASDF archive to compact.
+        compression: Block codec from SUPPORTED_COMPRESSION, or None
+            (default) to store uncompressed (defragment only).
+        max_bytes_per_sec: Combined read/write budget, or None for no limit.
+        min_age_sec: Minimum time since last modification.
+        cancel: Event that aborts the compaction (original left untouched).
+
+    Returns:
+        CompactionResult. Errors are reported as FAILED, not raised, so a
+        single corrupt archive does not stop a background pass.
+
+    Raises:
+        ValueError: If compression is not a supported codec.
+
+    Example:
+        >>> result = compact_archive(Path("data/captures/session_20251231.asdf"))
+        >>> result.status, result.bytes_saved
+        (<CompactionStatus.COMPACTED: 'compacted'>, 48213504)
+    """
+    import asdf
+
+    if compression is not None and compression not in SUPPORTED_COMPRESSION:
+        raise ValueError(
+            f"compression must be one of {SUPPORTED_COMPRESSION} or None, "
+            f"got {compression!r}"
+        )
+    codec = compression or "none"
+    started = time.monotonic()
+    path = Path(path)
+
+    size_before = size_after = 0
+
+    def finish(
+        status: CompactionStatus, reason: str = "", arrays: int = 0
+    ) -> CompactionResult:
+        result = CompactionResult(
+            path,
+            status,
+            reason,
+            bytes_before=size_before,
+            bytes_after=size_after,
+            arrays=arrays,
+            elapsed_sec=time.monotonic() - started,
+        )
+        logger.debug(
+            "Archive compaction finished",
+            path=str(path),
+            status=status.value,
+            reason=reason,
+        )
+        return result
+
+    try:
+        before = path.stat()
+    except OSError as e:
+        return finish(CompactionStatus.FAILED, str(e))
+    size_before = size_after = before.st_size
+
+    if time.time() - before.st_mtime < min_age_sec:
+        return finish(CompactionStatus.SKIPPED, "recently modified")
+
+    tmp_path = path.with_name(f".{path.name}.compact.tmp")
+    throttle = _IoThrottle(max_bytes_per_sec, cancel)
+    try:
+        with asdf.open(path, memmap=True, lazy_load=True) as af:
+            previous = af.tree.get(_COMPACTION_KEY)
+            array_count = sum(1 for _ in _iter_arrays(af.tree))
+            if (
+                isinstance(previous, dict)
+                and previous.get("compression") == codec
+                and previous.get("arrays") == array_count
+            ):
+                return finish(CompactionStatus.SKIPPED, "already compacted")
+
+            source_digests = _array_digests(af.tree, throttle)
+            af.tree[_COMPACTION_KEY] = {
+                "compression": codec,
+                "arrays": array_count,
+                "bytes_before": before.st_size,
+                "compacted_at": datetime.now(UTC).isoformat(),
+            }
+            with _ThrottledFile(tmp_path, throttle) as out:
+                af.write_to(
+                    out,
+                    all_array_storage="internal",
+                    all_array_compression=compression,
+                )
+                out.flush()
+                os.fsync(out.fileno())
+
+        with asdf.open(tmp_path, lazy_load=False, validate_checksums=True) as copy:
+            if _array_digests(copy.tree, throttle) != source_digests:
+                raise ValueError("array digest mismatch after rewrite")
+
+        # Writers hold the lock for their whole update, so nothing can land
+        # between this check and the swap
+        with archive_lock(path):
+            current = path.stat()
+            if (current.st_mtime_ns, current.st_size) != (
+                before.st_mtime_ns,
+                before.st_size,
+            ):
+                tmp_path.unlink()
+                return finish(CompactionStatus.SKIPPED, "modified during compaction")
+
+            shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        _fsync_directory(path.parent)
+    except _CompactionCancelledError:
+        tmp_path.unlink(missing_ok=True)
+        return finish(CompactionStatus.SKIPPED, "cancelled")
+    except Exception as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.warning("Archive compaction failed", path=str(path), error=str(e))
+        return finish(CompactionStatus.FAILED, str(e))
+
+    size_after = path.stat().st_size
+    result = finish(CompactionStatus.COMPACTED, arrays=array_count)
+    logger.info(
+        "Archive compacted",
+        path=str(path),
+        compression=codec,
+        bytes_before=result.bytes_before,
+        bytes_after=result.bytes_after,
+        elapsed_sec=round(result.elapsed_sec, 2),
+    )
+    return result
+
+
+def _lower_thread_priority(niceness: int) -> None:
+    """Raise the calling thread's nice value (Linux only).
+
+    On Linux each thread has its own nice value, so this deprioritizes the
+    compaction thread without affecting capture or web threads. Elsewhere
+    setpriority() applies to the whole process, so it is not used.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    tid = threading.get_native_id()
+    try:
+        current = os.getpriority(os.PRIO_PROCESS, tid)
+        os.setpriority(os.PRIO_PROCESS, tid, max(current, niceness))
+    except OSError as e:
+        logger.debug("Could not lower compaction thread priority", error=str(e))
+
+
+class ArchiveCompactor:
+    """Periodically compacts completed archives on a low-priority thread.
+
+    Each pass scans the configured directories recursively for ``*.asdf``
+    files and runs compact_archive() on each one sequentially, sharing a
+    single byte-rate budget. Passes run on a dedicated daemon thread (not
+    the event loop) so the thread's scheduling priority can be lowered.
+
+    Example:
+        compactor = ArchiveCompactor(
+            [Path("data/captures")], max_bytes_per_sec=2 * 1024 * 1024
+        )
+        compactor.start()
+        ...
+        compactor.stop()
+        print(compactor.bytes_saved)
+    """
+
+    __slots__ = (
+        "_directories",
+        "_compression",
+        "_max_bytes_per_sec",
+        "_min_age_sec",
+        "_interval_sec",
+        "_startup_delay_sec",
+        "_niceness",
+        "_stop",
+        "_thread",
+        "_last_results",
+        "_archives_compacted",
+        "_bytes_saved",
+    )
+
+    def __init__(
+        self,
+        directories: Iterable[Path],
+        *,
+        compression: str | None = DEFAULT_COMPACTION_COMPRESSION,
+        max_bytes_per_sec: float | None = DEFAULT_COMPACTION_MAX_BYTES_PER_SEC,
+        min_age_sec: float = DEFAULT_COMPACTION_MIN_AGE_SEC,
+        interval_sec: float = DEFAULT_COMPACTION_INTERVAL_SEC,
+        startup_delay_sec: float = _DEFAULT_STARTUP_DELAY_SEC,
+        niceness: int = _LOW_PRIORITY_NICE,
+    ) -> None:
+        """Create a compactor (not started).
+
+        Args:
+            directories: Directories scanned recursively for archives.
+                Missing directories are ignored.
+            compression: Codec from SUPPORTED_COMPRESSION, or None.
+            max_bytes_per_sec: Combined read/write budget, or None.
+            min_age_sec: Archives modified more recently are left alone.
+            interval_sec: Delay between passes. Must be positive.
+            startup_delay_sec: Delay before the first pass after start().
+            niceness: Nice value for the background thread (Linux).
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If compression is unsupported or interval_sec is
+                not positive.
+
+        Example:
+            >>> ArchiveCompactor([Path("data/captures")], compression=None)
+        """
+        if compression is not None and compression not in SUPPORTED_COMPRESSION:
+            raise ValueError(
+                f"compression must be one of {SUPPORTED_COMPRESSION} or None, "
+                f"got {compression!r}"
+            )
+        if interval_sec <= 0:
+            raise ValueError(f"interval_sec must be positive, got {interval_sec}")
+        self._directories = [Path(d) for d in directories]
+        self._compression = compression
+        self._max_bytes_per_sec = max_bytes_per_sec
+        self._min_age_sec = min_age_sec
+        self._interval_sec = interval_sec
+        self._startup_delay_sec = startup_delay_sec
+        self._niceness = niceness
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_results: list[CompactionResult] = []
+        self._archives_compacted = 0
+        self._bytes_saved = 0
+
+    @property
+    def is_running(self) -> bool:
+        """True while the background thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def last_results(self) -> list[CompactionResult]:
+        """Results of the most recent completed pass."""
+        return list(self._last_results)
+
+    @property
+    def archives_compacted(self) -> int:
+        """Total archives compacted since creation."""
+        return self._archives_compacted
+
+    @property
+    def bytes_saved(self) -> int:
+        """Total bytes reclaimed since creation."""
+        return self._bytes_saved
+
+    def find_archives(self) -> list[Path]:
+        """List candidate archives under the configured directories.
+
+        Returns:
+            Sorted ``*.asdf`` paths, excluding hidden temporary files.
+        """
+        found: set[Path] = set()
+        for directory in self._directories:
+            if directory.is_dir():
+                found.update(
+                    p
+                    for p in directory.rglob("*.asdf")
+                    if p.is_file() and not p.name.startswith(".")
+                )
+        return sorted(found)
+
+    def run_once(self) -> list[CompactionResult]:
+        """Run one compaction pass synchronously on the calling thread.
+
+        Stops early (remaining archives untouched) if stop() is called.
+
+        Returns:
+            One CompactionResult per archive examined.
+
+        Example:
+            >>> [r.status for r in compactor.run_once()]
+            [<CompactionStatus.COMPACTED: 'compacted'>]
+        """
+        results: list[CompactionResult] = []
+        for path in self.find_archives():
+            if self._stop.is_set():
+                break
+            result = compact_archive(
+                path,
+                compression=self._compression,
+                max_bytes_per_sec=self._max_bytes_per_sec,
+                min_age_sec=self._min_age_sec,
+                cancel=self._stop,
+            )
+            results.append(result)
+            if result.status is CompactionStatus.COMPACTED:
+                self._archives_compacted += 1
+                self._bytes_saved += result.bytes_saved
+        self._last_results = results
+        return results
+
+    def start(self) -> None:
+        """Start the background thread. Idempotent.
+
+        Returns:
+            None.
+        """
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="archive-compactor", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "Archive compactor started",
+            directories=[str(d) for d in self._directories],
+            compression=self._compression or "none",
+            interval_sec=self._interval_sec,
+        )
+
+    def stop(self, timeout: float | None = 10.0) -> None:
+        """Signal the thread to stop and wait for it.
+
+        An in-progress compaction is abandoned at its next chunk and the
+        original archive left untouched.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread to exit.
+
+        Returns:
+            None.
+        """
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+            logger.info(
+                "Archive compactor stopped",
+                archives_compacted=self._archives_compacted,
+                bytes_saved=self._bytes_saved,
+            )
+
+    def _run(self) -> None:
+        """Background loop: lower priority, then compact every interval."""
+        _lower_thread_priority(self._niceness)
+        if self._stop.wait(self._startup_delay_sec):
+            return
+        while True:
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error("Archive compaction pass failed", error=str(e))
+            if self._stop.wait(self._interval_sec):
+                return
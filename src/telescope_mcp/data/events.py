@@ -0,0 +1,515 @@
+"""In-process publish/subscribe bus for live device telemetry.
+
+Dashboards used to poll /api/position and the motor endpoints, so every
+open browser tab cost its own sensor read and coordinate transform per
+poll. Here producers publish at their natural rate to an EventBus, and
+any number of consumers subscribe to what they need. Each subscription
+behaves like an asyncio queue with latest-value semantics: it holds at
+most one pending event per topic, so a slow consumer skips stale values
+instead of growing a backlog.
+
+Classes:
+    TelemetryEvent: One published value (topic, data, sequence, time)
+    EventBus: Topic-keyed latest values plus subscriber fan-out
+    Subscription: Latest-value queue returned by EventBus.subscribe()
+    EventPublisher: Async tasks polling device sources while anyone listens
+
+Example:
+    from telescope_mcp.data.events import EventBus, EventPublisher
+
+    bus = EventBus()
+    publisher = EventPublisher(bus)
+    publisher.add_source("position", read_position, rate_hz=10)
+    await publisher.start()
+
+    with bus.subscribe(["position"]) as subscription:
+        async for event in subscription:
+            print(event.topic, event.data)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+from telescope_mcp.drivers.config import DEFAULT_EVENT_RATE_HZ
+from telescope_mcp.observability import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "DEFAULT_EVENT_RATE_HZ",
+    "EventBus",
+    "EventPublisher",
+    "EventSource",
+    "Subscription",
+    "TelemetryEvent",
+]
+
+#: Async callable producing one event payload for a polled source.
+EventSource = Callable[[], Awaitable[dict[str, Any]]]
+
+
+@dataclass(frozen=True, slots=True)
+class TelemetryEvent:
+    """One value published on the bus.
+
+    Attributes:
+        topic: Topic name, e.g. "position" or "camera/0".
+        data: JSON-serializable payload.
+        seq: Bus-wide sequence number, increasing by one per publish.
+        timestamp_ns: time.monotonic_ns() at publish.
+    """
+
+    topic: str
+    data: dict[str, Any]
+    seq: int
+    timestamp_ns: int
+
+    def to_sse(self) -> bytes:
+        """Encode as one Server-Sent Events message.
+
+        Returns:
+            UTF-8 bytes with id (sequence), event (topic), and data (JSON)
+            fields, terminated by a blank line. Non-JSON values such as
+            datetimes are converted with str().
+
+        Example:
+            >>> event.to_sse()
+            b'id: 7\\nevent: position\\ndata: {"altitude": 45.0}\\n\\n'
+        """
+        data = json.dumps(self.data, default=str)
+        return f"id: {self.seq}\nevent: {self.topic}\ndata: {data}\n\n".encode()
+
+
+def _topic_matches(topic: str, topics: frozenset[str] | None) -> bool:
+    """True if topic is selected by a filter of names or "/"-prefixes.
+
+    "camera" selects "camera/0" and "camera/1"; None selects everything.
+    """
+    return topics is None or topic in topics or topic.split("/", 1)[0] in topics
+
+
+class Subscription:
+    """Latest-value queue of events for one consumer.
+
+    Holds at most one pending event per topic, delivered in the order the
+    topics first became pending. Publishing a newer value for a pending
+    topic replaces it and counts the old one in `coalesced`.
+
+    Created by EventBus.subscribe() inside a running event loop. Events
+    may be offered from any thread; get() must be awaited on that loop.
+    Use as a context manager (or call close()) to stop receiving.
+
+    Example:
+        with bus.subscribe(["position", "motor"]) as subscription:
+            event = await subscription.get()
+    """
+
+    __slots__ = (
+        "_bus",
+        "_topics",
+        "_loop",
+        "_lock",
+        "_pending",
+        "_wakeup",
+        "_closed",
+        "_coalesced",
+    )
+
+    def __init__(
+        self,
+        bus: EventBus,
+        topics: frozenset[str] | None,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """Create an empty subscription (use EventBus.subscribe())."""
+        self._bus = bus
+        self._topics = topics
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._pending: dict[str, TelemetryEvent] = {}
+        self._wakeup = asyncio.Event()
+        self._closed = False
+        self._coalesced = 0
+
+    @property
+    def topics(self) -> frozenset[str] | None:
+        """Topic filter, or None for all topics."""
+        return self._topics
+
+    @property
+    def coalesced(self) -> int:
+        """Events replaced by a newer value before they were consumed."""
+        return self._coalesced
+
+    @property
+    def closed(self) -> bool:
+        """True after close()."""
+        return self._closed
+
+    def __len__(self) -> int:
+        """Return the number of pending events (at most one per topic)."""
+        return len(self._pending)
+
+    def _offer(self, event: TelemetryEvent) -> None:
+        """Queue an event, replacing any pending value for its topic.
+
+        Called by EventBus.publish() from any thread.
+        """
+        if not _topic_matches(event.topic, self._topics):
+            return
+        with self._lock:
+            if self._closed:
+                return
+            if event.topic in self._pending:
+                self._coalesced += 1
+            self._pending[event.topic] = event
+        self._notify()
+
+    def _notify(self) -> None:
+        """Wake a waiting get(), hopping to the owning loop if needed."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._wakeup.set()
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def get_nowait(self) -> TelemetryEvent:
+        """Remove and return the oldest pending event without waiting.
+
+        Returns:
+            The pending event whose topic has waited longest.
+
+        Raises:
+            asyncio.QueueEmpty: If nothing is pending.
+        """
+        with self._lock:
+            if not self._pending:
+                raise asyncio.QueueEmpty
+            topic = next(iter(self._pending))
+            return self._pending.pop(topic)
+
+    async def get(self) -> TelemetryEvent:
+        """Wait for and return the next event.
+
+        Returns:
+            The pending event whose topic has waited longest.
+
+        Raises:
+            RuntimeError: If the subscription is closed.
+
+        Example:
+            >>> event = await asyncio.wait_for(subscription.get(), timeout=15)
+        """
+        while True:
+            if self._closed:
+                raise RuntimeError("Subscription is closed")
+            try:
+                return self.get_nowait()
+            except asyncio.QueueEmpty:
+                self._wakeup.clear()
+            # Re-check after clear(): an offer may have raced in between
+            if not self._pending and not self._closed:
+                await self._wakeup.wait()
+
+    def close(self) -> None:
+        """Stop receiving events and wake any waiting get().
+
+        Safe to call more than once.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._pending.clear()
+        self._bus._unsubscribe(self)
+        self._notify()
+
+    def __enter__(self) -> Subscription:
+        """Return self; the subscription closes on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the subscription."""
+        self.close()
+
+    def __aiter__(self) -> AsyncIterator[TelemetryEvent]:
+        """Iterate events until the subscription is closed."""
+        return self
+
+    async def __anext__(self) -> TelemetryEvent:
+        """Return the next event, or stop once closed."""
+        try:
+            return await self.get()
+        except RuntimeError:
+            raise StopAsyncIteration from None
+
+
+class EventBus:
+    """Topic-keyed fan-out of telemetry events to subscriptions.
+
+    Keeps the latest event per topic so a new subscriber can start from
+    current state, and offers every published event to each matching
+    subscription. publish() is thread-safe and never blocks on consumers,
+    so reader threads and stream loops can publish directly.
+
+    Example:
+        bus = EventBus()
+        bus.publish("motor", {"altitude_steps": 1200, "moving": True})
+        bus.latest("motor").data["altitude_steps"]  # 1200
+    """
+
+    __slots__ = ("_lock", "_latest", "_subscriptions", "_seq", "_listeners")
+
+    def __init__(self) -> None:
+        """Create a bus with no topics or subscribers."""
+        self._lock = threading.Lock()
+        self._latest: dict[str, TelemetryEvent] = {}
+        self._subscriptions: set[Subscription] = set()
+        self._seq = 0
+        # Per-loop events set while at least one subscription is open
+        self._listeners: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Event
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of open subscriptions."""
+        return len(self._subscriptions)
+
+    @property
+    def topics(self) -> list[str]:
+        """Topics published so far, in first-publish order."""
+        with self._lock:
+            return list(self._latest)
+
+    def latest(self, topic: str) -> TelemetryEvent | None:
+        """Return the most recent event for a topic, or None."""
+        return self._latest.get(topic)
+
+    def publish(self, topic: str, data: dict[str, Any]) -> TelemetryEvent:
+        """Publish a value to every matching subscription.
+
+        Args:
+            topic: Topic name; "/" separates an instance suffix
+                ("camera/0") that subscribers may filter by prefix.
+            data: JSON-serializable payload. Not copied; do not mutate
+                it after publishing.
+
+        Returns:
+            The published TelemetryEvent.
+
+        Raises:
+            No exceptions raised. Safe from any thread.
+
+        Example:
+            >>> bus.publish("position", {"altitude": 45.0, "azimuth": 180.0})
+        """
+        with self._lock:
+            self._seq += 1
+            event = TelemetryEvent(topic, data, self._seq, time.monotonic_ns())
+            self._latest[topic] = event
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription._offer(event)
+        return event
+
+    def subscribe(
+        self, topics: Iterable[str] | None = None, *, replay: bool = True
+    ) -> Subscription:
+        """Open a latest-value subscription on the running event loop.
+
+        Args:
+            topics: Topic names or "/"-prefixes to receive. None (or
+                empty) receives everything.
+            replay: Queue the latest event of each matching topic right
+                away, so consumers start from current state.
+
+        Returns:
+            Subscription to await events from; close it when done.
+
+        Raises:
+            RuntimeError: If called outside a running event loop.
+
+        Example:
+            >>> with bus.subscribe(["camera"]) as subscription:
+            ...     event = await subscription.get()  # camera/0, camera/1
+        """
+        loop = asyncio.get_running_loop()
+        selected = frozenset(topics) if topics else None
+        subscription = Subscription(self, selected, loop)
+        with self._lock:
+            self._subscriptions.add(subscription)
+            current = list(self._latest.values()) if replay else []
+            listening = self._listeners.get(loop)
+        for event in current:
+            subscription._offer(event)
+        if listening is not None:
+            listening.set()
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        """Forget a closed subscription (called by Subscription.close())."""
+        with self._lock:
+            self._subscriptions.discard(subscription)
+            if not self._subscriptions:
+                for listening in self._listeners.values():
+                    listening.clear()
+
+    async def wait_for_subscribers(self) -> None:
+        """Return once at least one subscription is open.
+
+        Business context: Producers pause here, so an idle dashboard
+        costs no device reads at all.
+
+        Example:
+            >>> await bus.wait_for_subscribers()
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            listening = self._listeners.setdefault(loop, asyncio.Event())
+            if self._subscriptions:
+                listening.set()
+        await listening.wait()
+
+
+class EventPublisher:
+    """Background tasks polling async sources into an EventBus.
+
+    Each source runs in its own task at its own rate against absolute
+    deadlines (no cumulative drift) and only while the bus has at least
+    one subscriber. However many consumers subscribe, each source is
+    read once per period. A failing source is counted and retried on
+    the next period.
+
+    Example:
+        publisher = EventPublisher(bus)
+        publisher.add_source("position", read_position, rate_hz=10)
+        await publisher.start()
+        ...
+        await publisher.stop()
+    """
+
+    __slots__ = ("_bus", "_sources", "_tasks", "_published", "_errors")
+
+    def __init__(self, bus: EventBus) -> None:
+        """Create a publisher with no sources (not started).
+
+        Args:
+            bus: Bus to publish into.
+        """
+        self._bus = bus
+        self._sources: dict[str, tuple[EventSource, float]] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+        self._published = 0
+        self._errors = 0
+
+    @property
+    def is_running(self) -> bool:
+        """True while source tasks are active."""
+        return any(not task.done() for task in self._tasks)
+
+    @property
+    def published(self) -> int:
+        """Number of events published by source tasks."""
+        return self._published
+
+    @property
+    def errors(self) -> int:
+        """Number of failed source reads."""
+        return self._errors
+
+    def add_source(
+        self, topic: str, fetch: EventSource, rate_hz: float = DEFAULT_EVENT_RATE_HZ
+    ) -> None:
+        """Register a polled source; takes effect at the next start().
+
+        Args:
+            topic: Topic the payloads are published under.
+            fetch: Async callable returning one payload dict.
+            rate_hz: Polling rate while subscribed. Must be positive.
+
+        Raises:
+            ValueError: If rate_hz is not positive.
+
+        Example:
+            >>> publisher.add_source("motor", read_motor_status, rate_hz=5)
+        """
+        if rate_hz <= 0:
+            raise ValueError(f"rate_hz must be positive, got {rate_hz}")
+        self._sources[topic] = (fetch, rate_hz)
+
+    async def start(self) -> None:
+        """Start one task per source. Idempotent while running.
+
+        Raises:
+            RuntimeError: If called without a running event loop.
+        """
+        if self.is_running:
+            return
+        self._tasks = [
+            asyncio.create_task(
+                self._run(topic, fetch, rate_hz), name=f"events-{topic}"
+            )
+            for topic, (fetch, rate_hz) in self._sources.items()
+        ]
+        logger.info("Event publisher started", topics=list(self._sources))
+
+    async def stop(self) -> None:
+        """Cancel source tasks and wait for them to exit.
+
+        Safe to call when not running.
+        """
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if tasks:
+            logger.info(
+                "Event publisher stopped",
+                published=self._published,
+                errors=self._errors,
+            )
+
+    async def _run(self, topic: str, fetch: EventSource, rate_hz: float) -> None:
+        """Poll one source against absolute deadlines while subscribed."""
+        period = 1.0 / rate_hz
+        loop = asyncio.get_running_loop()
+        next_deadline = loop.time()
+        while True:
+            if self._bus.subscriber_count == 0:
+                await self._bus.wait_for_subscribers()
+                next_deadline = loop.time()
+            try:
+                self._bus.publish(topic, await fetch())
+                self._published += 1
+            except Exception as e:
+                self._errors += 1
+                logger.debug("Event source failed", topic=topic, error=str(e))
+            next_deadline += period
+            delay = next_deadline - loop.time()
+            if delay < 0:
+                # Fell behind (slow device); resynchronize instead of bursting
+                next_deadline = loop.time()
+                delay = 0.0
+            await asyncio.sleep(delay)
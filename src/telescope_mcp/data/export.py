@@ -0,0 +1,504 @@
+"""Bulk export of ASDF archives to per-frame FITS or NPY files.
+
+Downstream stacking and photometry tools expect FITS. This module converts
+one or many archives into one file per frame, spreading the work across a
+process pool. Frames are read from memory-mapped ASDF blocks so workers
+stream pixel data from the page cache instead of materializing whole
+archives.
+
+Two archive layouts are understood:
+
+- Session files written by Session.close():
+  ``cameras/{camera}/frames`` is a list of arrays; per-camera ``settings``
+  and ``info`` supply the metadata, ``meta`` supplies target/session id.
+- Capture archives written by the web dashboard:
+  ``cameras/{camera}/{light,dark,flat,bias}`` is a list of
+  ``{"data": array, "meta": dict}`` entries.
+
+Output layout: ``output_dir/{archive_stem}/{camera}_{group}_{index:04d}.fits``
+(or ``.npy`` with a ``.json`` metadata sidecar).
+
+Example:
+    from telescope_mcp.data.export import ExportFormat, export_archives
+
+    summary = export_archives(
+        [Path("/data/2025/12/31")], Path("/data/export"), fmt=ExportFormat.FITS
+    )
+    print(f"{summary.frames} frames @ {summary.frames_per_second:.1f} fps")
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import time
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import asdf
+import numpy as np
+
+from telescope_mcp.observability import get_logger
+
+if TYPE_CHECKING:
+    from astropy.io.fits import Header
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "ExportFormat",
+    "ExportSummary",
+    "FrameRef",
+    "build_fits_header",
+    "collect_archives",
+    "export_archives",
+    "list_archive_frames",
+    "resolve_frame",
+]
+
+# Frames handed to a worker per task. Small enough to balance a single large
+# archive across workers, large enough to amortize opening the ASDF file.
+DEFAULT_CHUNK_SIZE = 16
+
+# Frame groups in capture archives written by the web dashboard
+_CAPTURE_GROUPS = ("light", "dark", "flat", "bias")
+
+# Session-file frame list key (Session.add_frame)
+_SESSION_FRAMES_KEY = "frames"
+
+# Frame metadata key -> (FITS keyword, comment). Exposure is converted to
+# seconds separately; width/height are implied by NAXIS1/NAXIS2.
+_FITS_KEYWORDS: Mapping[str, tuple[str, str]] = {
+    "timestamp": ("DATE-OBS", "UTC start of exposure"),
+    "gain": ("GAIN", "Sensor gain"),
+    "camera_name": ("INSTRUME", "Camera model"),
+    "camera_temp": ("CCD-TEMP", "Sensor temperature (C)"),
+    "bayer_pattern": ("BAYERPAT", "Bayer color filter pattern"),
+    "capture_mode": ("CAPMODE", "Capture pipeline"),
+}
+
+
+class ExportFormat(str, Enum):
+    """Output file formats for export_archives()."""
+
+    FITS = "fits"
+    NPY = "npy"
+
+
+@dataclass(frozen=True, slots=True)
+class FrameRef:
+    """Location of one frame inside an ASDF archive.
+
+    Attributes:
+        camera: Camera key under ``cameras``.
+        group: Frame list key ("frames" for sessions, or light/dark/flat/bias).
+        index: Position within the frame list.
+    """
+
+    camera: str
+    group: str
+    index: int
+
+
+@dataclass(slots=True)
+class ExportSummary:
+    """Result of an export run with throughput figures.
+
+    Attributes:
+        archives: Number of archives processed.
+        frames: Number of frames written.
+        bytes_read: Total pixel bytes streamed from archives.
+        elapsed_sec: Wall-clock duration of the export.
+        files: Paths of written frame files.
+        errors: Human-readable messages for frames/archives that failed.
+    """
+
+    archives: int = 0
+    frames: int = 0
+    bytes_read: int = 0
+    elapsed_sec: float = 0.0
+    files: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def frames_per_second(self) -> float:
+        """Frames written per second of wall-clock time."""
+        return self.frames / self.elapsed_sec if self.elapsed_sec > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Pixel data throughput in MB/s."""
+        if self.elapsed_sec <= 0:
+            return 0.0
+        return self.bytes_read / 1_000_000 / self.elapsed_sec
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable summary (file list omitted)."""
+        return {
+            "archives": self.archives,
+            "frames": self.frames,
+            "bytes_read": self.bytes_read,
+            "elapsed_sec": round(self.elapsed_sec, 3),
+            "frames_per_second": round(self.frames_per_second, 2),
+            "megabytes_per_second": round(self.megabytes_per_second, 2),
+            "errors": self.errors,
+        }
+
+
+def collect_archives(paths: Iterable[Path]) -> list[Path]:
+    """Expand files and directories into a sorted list of ASDF archives.
+
+    Directories are searched recursively for ``*.asdf``.
+
+    Args:
+        paths: Archive files and/or directories.
+
+    Returns:
+        Sorted, de-duplicated list of archive paths.
+
+    Raises:
+        FileNotFoundError: If a path does not exist.
+
+    Example:
+        >>> collect_archives([Path("/data/2025/12")])
+        [PosixPath('/data/2025/12/31/observation_m31_20251231_210000.asdf')]
+    """
+    archives: set[Path] = set()
+    for path in paths:
+        if path.is_dir():
+            archives.update(path.rglob("*.asdf"))
+        elif path.exists():
+            archives.add(path)
+        else:
+            raise FileNotFoundError(f"No such archive or directory: {path}")
+    return sorted(archives)
+
+
+def list_archive_frames(path: Path) -> list[FrameRef]:
+    """Enumerate frames in an archive without reading pixel data.
+
+    Args:
+        path: ASDF archive (session file or capture archive).
+
+    Returns:
+        FrameRef for every frame, ordered by camera, group, then index.
+
+    Raises:
+        OSError: If the file cannot be opened.
+        ValueError: If the file is not a valid ASDF archive.
+
+    Example:
+        >>> refs = list_archive_frames(Path("session_20251231.asdf"))
+        >>> refs[0]
+        FrameRef(camera='main', group='light', index=0)
+    """
+    refs: list[FrameRef] = []
+    with asdf.open(path, memmap=True, lazy_load=True) as af:
+        cameras = af.tree.get("cameras") or {}
+        for camera, node in cameras.items():
+            if not isinstance(node, Mapping):
+                continue
+            for group in (_SESSION_FRAMES_KEY, *_CAPTURE_GROUPS):
+                frames = node.get(group)
+                if frames:
+                    refs.extend(
+                        FrameRef(str(camera), group, i) for i in range(len(frames))
+                    )
+    return refs
+
+
+def _to_header_value(value: Any) -> str | int | float | bool | None:
+    """Coerce a metadata value into something a FITS card can hold."""
+    if isinstance(value, bool | int | float | str) or value is None:
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def build_fits_header(
+    meta: Mapping[str, Any],
+    *,
+    camera: str,
+    group: str,
+    archive_meta: Mapping[str, Any] | None = None,
+) -> Header:
+    """Build a FITS header from frame metadata.
+
+    Well-known keys map to conventional keywords (EXPTIME in seconds,
+    DATE-OBS, GAIN, INSTRUME, CCD-TEMP, BAYERPAT, RA/DEC, OBJCTALT/OBJCTAZ).
+    Remaining scalar metadata is preserved as HIERARCH cards so nothing
+    recorded at capture time is lost.
+
+    Args:
+        meta: Per-frame metadata (capture archive ``meta`` or session settings).
+        camera: Camera key, written as CAMERA.
+        group: Frame group, written as IMAGETYP.
+        archive_meta: Archive-level metadata (session ``meta``) for OBJECT
+            and session id.
+
+    Returns:
+        astropy.io.fits.Header ready to attach to a PrimaryHDU.
+
+    Example:
+        >>> hdr = build_fits_header({"exposure_us": 2_000_000}, camera="main",
+        ...                         group="light")
+        >>> hdr["EXPTIME"]
+        2.0
+    """
+    from astropy.io import fits
+
+    header = fits.Header()
+    header["CAMERA"] = (camera, "telescope-mcp camera key")
+    header["IMAGETYP"] = (
+        "Light Frame" if group in (_SESSION_FRAMES_KEY, "light") else group.title(),
+        "Frame type",
+    )
+
+    if "exposure_us" in meta:
+        header["EXPTIME"] = (float(meta["exposure_us"]) / 1e6, "Exposure (s)")
+
+    for key, (keyword, comment) in _FITS_KEYWORDS.items():
+        value = meta.get(key)
+        if value is not None:
+            header[keyword] = (_to_header_value(value), comment)
+
+    coordinates = meta.get("coordinates")
+    if isinstance(coordinates, Mapping):
+        for key, keyword in (
+            ("ra", "RA"),
+            ("dec", "DEC"),
+            ("altitude", "OBJCTALT"),
+            ("azimuth", "OBJCTAZ"),
+            ("ra_hms", "OBJCTRA"),
+            ("dec_dms", "OBJCTDEC"),
+        ):
+            if coordinates.get(key) is not None:
+                header[keyword] = _to_header_value(coordinates[key])
+
+    if archive_meta:
+        if archive_meta.get("target"):
+            header["OBJECT"] = (str(archive_meta["target"]), "Target name")
+        if archive_meta.get("session_id"):
+            header["HIERARCH SESSION_ID"] = str(archive_meta["session_id"])
+
+    mapped = {"exposure_us", "coordinates", "width", "height", *_FITS_KEYWORDS}
+    for key, value in meta.items():
+        if key in mapped or isinstance(value, Mapping | list | tuple):
+            continue
+        header[f"HIERARCH {key.upper()}"] = _to_header_value(value)
+
+    return header
+
+
+def resolve_frame(
+    tree: Mapping[str, Any], ref: FrameRef
+) -> tuple[Any, dict[str, Any], dict[str, Any]]:
+    """Locate a frame's array and metadata in an opened archive tree.
+
+    Args:
+        tree: ``AsdfFile.tree`` of a session file or capture archive.
+        ref: Frame location.
+
+    Returns:
+        Tuple of (array node, frame metadata, archive metadata). The array
+        is lazy/memory-mapped when the file was opened that way.
+
+    Raises:
+        KeyError: If the camera or group does not exist.
+        IndexError: If the index is out of range.
+
+    Example:
+        >>> with asdf.open(path, memmap=True) as af:
+        ...     data, meta, _ = resolve_frame(af.tree, FrameRef("main", "light", 0))
+    """
+    camera_node = tree["cameras"][ref.camera]
+    entry = camera_node[ref.group][ref.index]
+    if isinstance(entry, Mapping):
+        data = entry["data"]
+        meta = dict(entry.get("meta") or {})
+    else:
+        data = entry
+        meta = {
+            **dict(camera_node.get("info") or {}),
+            **dict(camera_node.get("settings") or {}),
+        }
+    archive_meta = dict(tree.get("meta") or tree.get("metadata") or {})
+    return data, meta, archive_meta
+
+
+def _write_frame(
+    frame: np.ndarray[Any, Any],
+    meta: dict[str, Any],
+    archive_meta: dict[str, Any],
+    ref: FrameRef,
+    destination: Path,
+    fmt: ExportFormat,
+) -> None:
+    """Write a single frame to ``destination`` in the requested format."""
+    if fmt is ExportFormat.FITS:
+        from astropy.io import fits
+
+        header = build_fits_header(
+            meta, camera=ref.camera, group=ref.group, archive_meta=archive_meta
+        )
+        fits.PrimaryHDU(data=frame, header=header).writeto(destination, overwrite=True)
+    else:
+        np.save(destination, frame)
+        sidecar = {"camera": ref.camera, "group": ref.group, **meta}
+        destination.with_suffix(".json").write_text(
+            json.dumps(sidecar, indent=2, default=str)
+        )
+
+
+def _export_chunk(
+    archive: str,
+    refs: list[FrameRef],
+    output_dir: str,
+    fmt: ExportFormat,
+    overwrite: bool,
+) -> tuple[list[str], int, list[str]]:
+    """Export a contiguous run of frames from one archive (worker entry).
+
+    Top-level so it can be pickled for ProcessPoolExecutor. Opens the
+    archive memory-mapped; each frame's pixels are paged in only while it
+    is being written.
+
+    Args:
+        archive: Archive path (string for cheap pickling).
+        refs: Frames to export from this archive.
+        output_dir: Directory receiving ``{archive_stem}/`` output.
+        fmt: Output format.
+        overwrite: Replace existing output files if True, else skip them.
+
+    Returns:
+        Tuple of (written file paths, pixel bytes read, error messages).
+    """
+    archive_path = Path(archive)
+    target_dir = Path(output_dir) / archive_path.stem
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    written: list[str] = []
+    errors: list[str] = []
+    bytes_read = 0
+
+    with asdf.open(archive_path, memmap=True, lazy_load=True) as af:
+        for ref in refs:
+            name = f"{ref.camera}_{ref.group}_{ref.index:04d}.{fmt.value}"
+            destination = target_dir / name
+            if destination.exists() and not overwrite:
+                continue
+            try:
+                data, meta, archive_meta = resolve_frame(af.tree, ref)
+                frame = np.asarray(data)
+                _write_frame(frame, meta, archive_meta, ref, destination, fmt)
+                bytes_read += frame.nbytes
+                written.append(str(destination))
+            except Exception as e:
+                errors.append(f"{archive_path.name}:{name}: {e}")
+    return written, bytes_read, errors
+
+
+def export_archives(
+    paths: Iterable[Path],
+    output_dir: Path,
+    *,
+    fmt: ExportFormat | str = ExportFormat.FITS,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    overwrite: bool = False,
+) -> ExportSummary:
+    """Export every frame in the given archives to per-frame files.
+
+    Frames are enumerated up front (metadata only), split into chunks of
+    ``chunk_size`` per archive, and distributed across a process pool so a
+    single large night archive is exported in parallel too.
+
+    Args:
+        paths: Archive files and/or directories (searched recursively).
+        output_dir: Destination root; one subdirectory per archive.
+        fmt: ExportFormat or its string value ("fits" or "npy").
+        workers: Process count. None uses os.cpu_count(); 1 exports
+            in-process without a pool.
+        chunk_size: Frames per worker task. Must be >= 1.
+        overwrite: Replace existing output files instead of skipping them.
+
+    Returns:
+        ExportSummary with file list, errors, and throughput.
+
+    Raises:
+        FileNotFoundError: If an input path does not exist.
+        ValueError: If fmt, workers, or chunk_size is invalid.
+
+    Example:
+        >>> summary = export_archives([Path("night.asdf")], Path("out"), workers=4)
+        >>> summary.to_dict()["frames_per_second"]
+        41.7
+    """
+    fmt = ExportFormat(fmt)
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+
+    start = time.monotonic()
+    archives = collect_archives(paths)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    summary = ExportSummary(archives=len(archives))
+
+    tasks: list[tuple[str, list[FrameRef]]] = []
+    for archive in archives:
+        try:
+            refs = list_archive_frames(archive)
+        except Exception as e:
+            summary.errors.append(f"{archive.name}: {e}")
+            continue
+        for i in range(0, len(refs), chunk_size):
+            tasks.append((str(archive), refs[i : i + chunk_size]))
+
+    max_workers = min(workers or os.cpu_count() or 1, max(len(tasks), 1))
+
+    def _collect(result: tuple[list[str], int, list[str]]) -> None:
+        written, bytes_read, errors = result
+        summary.files.extend(written)
+        summary.frames += len(written)
+        summary.bytes_read += bytes_read
+        summary.errors.extend(errors)
+
+    if max_workers == 1:
+        for archive_str, refs in tasks:
+            _collect(_export_chunk(archive_str, refs, str(output_dir), fmt, overwrite))
+    else:
+        # spawn: the server process is multi-threaded, so fork is unsafe
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+            futures = [
+                pool.submit(
+                    _export_chunk, archive_str, refs, str(output_dir), fmt, overwrite
+                )
+                for archive_str, refs in tasks
+            ]
+            for future in as_completed(futures):
+                try:
+                    _collect(future.result())
+                except Exception as e:
+                    summary.errors.append(str(e))
+
+    summary.files.sort()
+    summary.elapsed_sec = time.monotonic() - start
+    logger.info(
+        "Export complete",
+        archives=summary.archives,
+        frames=summary.frames,
+        workers=max_workers,
+        format=fmt.value,
+        frames_per_second=round(summary.frames_per_second, 2),
+        megabytes_per_second=round(summary.megabytes_per_second, 2),
+        errors=len(summary.errors),
+    )
+    return summary
@@ -0,0 +1,535 @@
+"""Background exposure sequences written straight into the active session.
+
+Capturing a sequence one MCP tool call per frame pays a round trip, base64
+and JSON encoding per frame, and the frames never reach the session file.
+ExposureSequence runs a list of steps (count x exposure x gain x frame
+type) back-to-back using the camera's pipelined burst capture and appends
+every raw frame to the SessionManager as it arrives, so one tool call can
+drive hundreds of frames at hardware speed.
+
+Classes:
+    FrameType: Light, dark, flat, or bias
+    SequenceStep: One block of identical exposures
+    SequenceState: Lifecycle state of a sequence
+    SequenceStatus: Progress snapshot for tools and dashboards
+    ExposureSequence: Async background runner
+
+Example:
+    from telescope_mcp.data import ExposureSequence, FrameType, SequenceStep
+
+    sequence = ExposureSequence(
+        camera,
+        sessions,
+        [
+            SequenceStep(count=100, exposure_us=2_000_000, gain=120),
+            SequenceStep(20, 2_000_000, 120, FrameType.DARK),
+        ],
+        interval_sec=0.5,
+    )
+    await sequence.start()
+    ...
+    print(sequence.status.frames_done)
+    await sequence.wait()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections.abc import Generator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from telescope_mcp.devices.camera import (
+    DEFAULT_PIPELINE_DEPTH,
+    CaptureAbortedError,
+    CaptureOptions,
+    CaptureResult,
+)
+from telescope_mcp.observability import get_logger
+
+if TYPE_CHECKING:
+    from telescope_mcp.data.session_manager import SessionManager
+    from telescope_mcp.devices.camera import Camera
+
+logger = get_logger(__name__)
+
+# Sensor formats a step may request; RAW16 keeps the full ADC depth
+_IMAGE_TYPES = ("RAW8", "RAW16", "RGB24")
+
+__all__ = [
+    "ExposureSequence",
+    "FrameType",
+    "SequenceState",
+    "SequenceStatus",
+    "SequenceStep",
+]
+
+
+class FrameType(str, Enum):
+    """Kind of frame captured by a sequence step.
+
+    Light frames are stored with Session.add_frame(); calibration frames
+    go to the session's "<type>_frames" calibration list.
+    """
+
+    LIGHT = "light"
+    DARK = "dark"
+    FLAT = "flat"
+    BIAS = "bias"
+
+
+class SequenceState(str, Enum):
+    """Lifecycle state of an ExposureSequence."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    ABORTED = "aborted"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True, slots=True)
+class SequenceStep:
+    """A block of identical exposures within a sequence.
+
+    Attributes:
+        count: Number of frames (>= 1).
+        exposure_us: Exposure time in microseconds (>= 1).
+        gain: Sensor gain (>= 0).
+        frame_type: Light or calibration frame type.
+        image_type: Sensor format ("RAW8", "RAW16", "RGB24").
+    """
+
+    count: int
+    exposure_us: int
+    gain: int
+    frame_type: FrameType = FrameType.LIGHT
+    image_type: str = "RAW16"
+
+    def __post_init__(self) -> None:
+        """Validate step parameters.
+
+        Raises:
+            ValueError: If count or exposure_us is below 1, gain is
+                negative, or image_type is unknown.
+        """
+        if self.count < 1:
+            raise ValueError(f"count must be >= 1, got {self.count}")
+        if self.exposure_us < 1:
+            raise ValueError(f"exposure_us must be >= 1, got {self.exposure_us}")
+        if self.gain < 0:
+            raise ValueError(f"gain must be >= 0, got {self.gain}")
+        if self.image_type not in _IMAGE_TYPES:
+            raise ValueError(
+                f"image_type must be one of {list(_IMAGE_TYPES)}, "
+                f"got {self.image_type!r}"
+            )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SequenceStep:
+        """Build a step from a JSON-style dict (MCP tool arguments).
+
+        Args:
+            data: Dict with count, exposure_us, gain, and optional
+                frame_type ("light", "dark", "flat", "bias") and
+                image_type ("RAW8", "RAW16", "RGB24").
+
+        Returns:
+            Validated SequenceStep.
+
+        Raises:
+            KeyError: If a required key is missing.
+            ValueError: If a value is invalid.
+
+        Example:
+            >>> SequenceStep.from_dict(
+            ...     {"count": 10, "exposure_us": 1000, "gain": 0, "frame_type": "bias"}
+            ... )
+        """
+        return cls(
+            count=int(data["count"]),
+            exposure_us=int(data["exposure_us"]),
+            gain=int(data["gain"]),
+            frame_type=FrameType(data.get("frame_type", FrameType.LIGHT)),
+            image_type=str(data.get("image_type", "RAW16")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SequenceStatus:
+    """Progress snapshot of an ExposureSequence.
+
+    Attributes:
+        sequence_id: Unique sequence identifier.
+        state: Current lifecycle state.
+        frames_total: Frames planned across all steps.
+        frames_done: Frames captured and stored so far.
+        step_index: Index of the step in progress (or last run).
+        started_at: UTC start time, None while pending.
+        finished_at: UTC end time, None until finished.
+        frames_per_second: Average storage rate since start.
+        error: Failure message when state is FAILED.
+    """
+
+    sequence_id: str
+    state: SequenceState
+    frames_total: int
+    frames_done: int
+    step_index: int
+    started_at: datetime | None
+    finished_at: datetime | None
+    frames_per_second: float
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable dict for tool responses."""
+        return {
+            "sequence_id": self.sequence_id,
+            "state": self.state.value,
+            "frames_total": self.frames_total,
+            "frames_done": self.frames_done,
+            "step_index": self.step_index,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "frames_per_second": round(self.frames_per_second, 2),
+            "error": self.error,
+        }
+
+
+class ExposureSequence:
+    """Async background runner capturing steps into the active session.
+
+    Each step runs as one Camera.burst(), so the next exposure starts while
+    the previous frame is handed over. Frames are requested unencoded
+    (format="raw", no overlay) and stored on the event loop thread, the
+    same thread other session writers use. Burst iteration runs on a
+    private one-thread executor so the event loop never blocks.
+
+    Example:
+        sequence = ExposureSequence(camera, sessions, steps, label="main")
+        await sequence.start()
+        sequence.abort()  # From a tool call or UI handler
+        status = await sequence.wait()
+    """
+
+    __slots__ = (
+        "_camera",
+        "_sessions",
+        "_steps",
+        "_interval_sec",
+        "_label",
+        "_depth",
+        "_sequence_id",
+        "_state",
+        "_frames_done",
+        "_step_index",
+        "_started_at",
+        "_finished_at",
+        "_started_monotonic",
+        "_finished_monotonic",
+        "_error",
+        "_abort_requested",
+        "_task",
+    )
+
+    def __init__(
+        self,
+        camera: Camera,
+        sessions: SessionManager,
+        steps: Sequence[SequenceStep],
+        *,
+        interval_sec: float = 0.0,
+        label: str | None = None,
+        depth: int = DEFAULT_PIPELINE_DEPTH,
+        sequence_id: str | None = None,
+    ) -> None:
+        """Create a sequence (not started).
+
+        Args:
+            camera: Connected Camera to capture with.
+            sessions: SessionManager receiving frames and events.
+            steps: Steps to run in order (at least one).
+            interval_sec: Minimum seconds between exposure starts; 0 runs
+                exposures back-to-back.
+            label: Camera key in the session file. Defaults to
+                "camera_<id>".
+            depth: Frames captured ahead of storage (see Camera.burst()).
+            sequence_id: Identifier; generated if None.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If steps is empty, interval_sec is negative, or
+                depth is less than 1.
+
+        Example:
+            >>> sequence = ExposureSequence(camera, sessions, steps, interval_sec=1)
+        """
+        if not steps:
+            raise ValueError("steps must contain at least one SequenceStep")
+        if interval_sec < 0:
+            raise ValueError(f"interval_sec must be >= 0, got {interval_sec}")
+        if depth < 1:
+            raise ValueError(f"depth must be >= 1, got {depth}")
+        self._camera = camera
+        self._sessions = sessions
+        self._steps = tuple(steps)
+        self._interval_sec = interval_sec
+        self._label = label or f"camera_{camera.config.camera_id}"
+        self._depth = depth
+        self._sequence_id = sequence_id or f"seq_{uuid.uuid4().hex[:8]}"
+        self._state = SequenceState.PENDING
+        self._frames_done = 0
+        self._step_index = 0
+        self._started_at: datetime | None = None
+        self._finished_at: datetime | None = None
+        self._started_monotonic = 0.0
+        self._finished_monotonic: float | None = None
+        self._error: str | None = None
+        self._abort_requested = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def sequence_id(self) -> str:
+        """Unique identifier of this sequence."""
+        return self._sequence_id
+
+    @property
+    def camera(self) -> Camera:
+        """Camera the sequence captures with."""
+        return self._camera
+
+    @property
+    def frames_total(self) -> int:
+        """Frames planned across all steps."""
+        return sum(step.count for step in self._steps)
+
+    @property
+    def is_running(self) -> bool:
+        """True while the background task is active."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def status(self) -> SequenceStatus:
+        """Current progress snapshot."""
+        elapsed = 0.0
+        if self._started_at is not None:
+            end = self._finished_monotonic
+            elapsed = (time.monotonic() if end is None else end) - (
+                self._started_monotonic
+            )
+        return SequenceStatus(
+            sequence_id=self._sequence_id,
+            state=self._state,
+            frames_total=self.frames_total,
+            frames_done=self._frames_done,
+            step_index=self._step_index,
+            started_at=self._started_at,
+            finished_at=self._finished_at,
+            frames_per_second=self._frames_done / elapsed if elapsed > 0 else 0.0,
+            error=self._error,
+        )
+
+    async def start(self) -> None:
+        """Start the sequence as a background task.
+
+        Returns:
+            None.
+
+        Raises:
+            RuntimeError: If the sequence was already started, or no event
+                loop is running.
+        """
+        if self._task is not None:
+            raise RuntimeError(f"Sequence {self._sequence_id} already started")
+        self._task = asyncio.create_task(
+            self._run(), name=f"sequence-{self._sequence_id}"
+        )
+
+    def abort(self) -> None:
+        """Stop the sequence after aborting the exposure in progress.
+
+        Safe from any thread and when not running. Frames already stored
+        stay in the session.
+
+        Returns:
+            None.
+        """
+        if self._abort_requested or self._state not in (
+            SequenceState.PENDING,
+            SequenceState.RUNNING,
+        ):
+            return
+        self._abort_requested = True
+        self._camera.stop_exposure()
+
+    async def wait(self) -> SequenceStatus:
+        """Wait for the sequence to finish.
+
+        Cancelling the waiter does not cancel the sequence.
+
+        Returns:
+            Final SequenceStatus.
+
+        Raises:
+            RuntimeError: If the sequence was never started.
+        """
+        if self._task is None:
+            raise RuntimeError(f"Sequence {self._sequence_id} not started")
+        await asyncio.shield(self._task)
+        return self.status
+
+    async def _run(self) -> None:
+        """Run all steps, then record the final state in the session."""
+        self._state = SequenceState.RUNNING
+        self._started_at = datetime.now(UTC)
+        self._started_monotonic = time.monotonic()
+        self._sessions.add_event(
+            "sequence_started",
+            sequence_id=self._sequence_id,
+            camera=self._label,
+            frames_total=self.frames_total,
+            steps=[
+                {
+                    "count": step.count,
+                    "exposure_us": step.exposure_us,
+                    "gain": step.gain,
+                    "frame_type": step.frame_type.value,
+                    "image_type": step.image_type,
+                }
+                for step in self._steps
+            ],
+        )
+        logger.info(
+            "Sequence started",
+            sequence_id=self._sequence_id,
+            camera=self._label,
+            frames_total=self.frames_total,
+        )
+
+        consumer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"sequence-{self._sequence_id}"
+        )
+        try:
+            for index, step in enumerate(self._steps):
+                if self._abort_requested:
+                    break
+                self._step_index = index
+                await self._run_step(step, consumer)
+            self._state = (
+                SequenceState.ABORTED
+                if self._abort_requested
+                else SequenceState.COMPLETED
+            )
+        except CaptureAbortedError:
+            self._state = SequenceState.ABORTED
+        except asyncio.CancelledError:
+            self._state = SequenceState.ABORTED
+            self._camera.stop_exposure()
+            raise
+        except Exception as e:
+            self._state = SequenceState.FAILED
+            self._error = str(e)
+            logger.warning(
+                "Sequence failed", sequence_id=self._sequence_id, error=str(e)
+            )
+        finally:
+            consumer.shutdown(wait=False)
+            self._finished_monotonic = time.monotonic()
+            self._finished_at = datetime.now(UTC)
+            self._sessions.add_event(
+                "sequence_finished",
+                sequence_id=self._sequence_id,
+                state=self._state.value,
+                frames_done=self._frames_done,
+                error=self._error,
+            )
+            logger.info(
+                "Sequence finished",
+                sequence_id=self._sequence_id,
+                state=self._state.value,
+                frames_done=self._frames_done,
+                fps=round(self.status.frames_per_second, 2),
+            )
+
+    async def _run_step(self, step: SequenceStep, consumer: ThreadPoolExecutor) -> None:
+        """Capture one step as a pipelined burst and store each frame.
+
+        All generator operations go through the single consumer thread, so
+        close() is naturally ordered after any next() still in flight.
+
+        Args:
+            step: Step to run.
+            consumer: One-thread executor iterating the burst.
+
+        Raises:
+            CaptureAbortedError: If abort() interrupted an exposure.
+            CameraError: If a capture fails.
+        """
+        options = CaptureOptions(
+            exposure_us=step.exposure_us,
+            gain=step.gain,
+            apply_overlay=False,
+            format="raw",
+            image_type=step.image_type,
+        )
+        max_fps = 1.0 / self._interval_sec if self._interval_sec else None
+        frames: Generator[CaptureResult, None, None] = self._camera.burst(
+            step.count, options, depth=self._depth, max_fps=max_fps
+        )
+        try:
+            while not self._abort_requested:
+                result = await asyncio.wrap_future(consumer.submit(next, frames, None))
+                if result is None:
+                    break
+                self._store(step, result)
+        finally:
+            closed = consumer.submit(frames.close)
+            if self._abort_requested:
+                # The pipeline may have started another exposure after abort()
+                self._camera.stop_exposure()
+            await asyncio.shield(asyncio.wrap_future(closed))
+
+    def _store(self, step: SequenceStep, result: CaptureResult) -> None:
+        """Append one captured frame to the active session.
+
+        Every frame carries its own metadata (exposure, gain, format,
+        capture time, step), so frames from different steps stay
+        distinguishable. Calibration frames use the same
+        {"data", "meta"} layout.
+
+        Args:
+            step: Step the frame belongs to.
+            result: Capture holding the raw sensor array.
+        """
+        assert result.raw is not None  # burst(format="raw") keeps the array
+        info = self._camera.info
+        meta = {
+            "exposure_us": result.exposure_us,
+            "gain": result.gain,
+            "image_type": result.image_type,
+            "timestamp": result.timestamp.isoformat(),
+            "camera_name": info.name if info else None,
+            "frame_type": step.frame_type.value,
+            "sequence_id": self._sequence_id,
+            "step_index": self._step_index,
+        }
+        if step.frame_type is FrameType.LIGHT:
+            self._sessions.add_frame(
+                self._label,
+                result.raw,
+                camera_info={"name": info.name} if info else None,
+                settings={"exposure_us": result.exposure_us, "gain": result.gain},
+                metadata=meta,
+            )
+        else:
+            self._sessions.add_calibration(
+                f"{step.frame_type.value}_frames", {"data": result.raw, "meta": meta}
+            )
+        self._frames_done += 1
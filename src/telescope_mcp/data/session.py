@@ -15,6 +15,8 @@ import asdf
 import numpy as np
 from numpy.typing import NDArray
 
+from telescope_mcp.data.compaction import archive_lock
+from telescope_mcp.data.telemetry import TelemetryColumns
 from telescope_mcp.observability import get_logger
 
 logger = get_logger(__name__)
@@ -122,6 +124,7 @@ class Session:
             "temperature": [],
             "focus_position": [],
         }
+        self._telemetry_columns = TelemetryColumns()
         self._calibration: dict[str, Any] = {
             "dark_frames": [],
             "flat_frames": [],
@@ -267,17 +270,25 @@ class Session:
         *,
         camera_info: dict[str, Any] | None = None,
         settings: dict[str, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
     ) -> None:
         """Add a captured frame to the session.
 
         Frames are grouped by camera identifier and stored with their
-        capture settings. Increments the frames_captured counter.
+        capture settings. camera_info and settings are merged into the
+        camera's entry (latest values win). When metadata is given the
+        frame is stored as {"data": frame, "meta": metadata}, the same
+        per-frame layout the web capture archive uses, so exports read
+        each frame's own exposure and timestamp. Increments the
+        frames_captured counter.
 
         Args:
             camera: Camera identifier ("main", "finder", etc.).
             frame: Image data as numpy array (uint8 or uint16).
             camera_info: Camera metadata (model, sensor_size, etc.). Optional.
             settings: Capture settings (gain, exposure_us, etc.). Optional.
+            metadata: Per-frame metadata (exposure_us, gain, timestamp,
+                image_type, ...). Optional.
 
         Returns:
             None.
@@ -302,12 +313,15 @@ class Session:
                 "settings": settings or {},
                 "frames": [],
             }
-        elif camera_info:
-            self._cameras[camera]["info"].update(camera_info)
-        elif settings:
-            self._cameras[camera]["settings"].update(settings)
+        else:
+            if camera_info:
+                self._cameras[camera]["info"].update(camera_info)
+            if settings:
+                self._cameras[camera]["settings"].update(settings)
 
-        self._cameras[camera]["frames"].append(frame)
+        self._cameras[camera]["frames"].append(
+            frame if metadata is None else {"data": frame, "meta": metadata}
+        )
         self._frames_captured += 1
 
     def add_telemetry(
@@ -342,6 +356,42 @@ class Session:
         entry = {"time": datetime.now(UTC).isoformat(), **data}
         self._telemetry[telemetry_type].append(entry)
 
+    def add_telemetry_sample(self, timestamp_ns: int, **values: float | None) -> None:
+        """Add a periodic telemetry sample to the columnar buffer.
+
+        Unlike add_telemetry(), samples are stored in preallocated numpy
+        columns (see TelemetryColumns) and written to ASDF as arrays under
+        telemetry/samples. Intended for high-rate periodic data from
+        TelemetryRecorder.
+
+        Args:
+            timestamp_ns: Monotonic timestamp in nanoseconds.
+            **values: Channel values (altitude, azimuth, temperature,
+                humidity, altitude_steps, azimuth_steps). Missing channels
+                are stored as NaN.
+
+        Returns:
+            None.
+
+        Raises:
+            RuntimeError: If session is already closed.
+            KeyError: If a keyword is not a known telemetry channel.
+
+        Example:
+            session.add_telemetry_sample(
+                time.monotonic_ns(), altitude=45.0, azimuth=180.0
+            )
+        """
+        if self._closed:
+            raise RuntimeError("Cannot add telemetry to a closed session")
+
+        self._telemetry_columns.append(timestamp_ns, **values)
+
+    @property
+    def telemetry_columns(self) -> TelemetryColumns:
+        """Columnar buffer holding periodic telemetry samples."""
+        return self._telemetry_columns
+
     def add_calibration(self, calibration_type: str, data: Any) -> None:
         """Add calibration data to the session.
 
@@ -387,7 +437,10 @@ class Session:
 
         Returns:
             Complete ASDF tree dict with keys: meta, cameras, telemetry,
-            calibration, observability.
+            calibration, observability. Periodic samples appear under
+            telemetry/samples as one numpy array per channel, with the
+            wall-clock anchor for their monotonic timestamps under
+            telemetry/samples_anchor (None if no samples were recorded).
 
         Raises:
             None. Always succeeds (empty lists for missing data).
@@ -411,7 +464,11 @@ class Session:
                 "location": self.location if self.location else None,
             },
             "cameras": self._cameras,
-            "telemetry": self._telemetry,
+            "telemetry": {
+                **self._telemetry,
+                "samples": self._telemetry_columns.to_arrays(),
+                "samples_anchor": self._telemetry_columns.epoch_anchor,
+            },
             "calibration": self._calibration,
             "observability": {
                 "logs": self._logs,
@@ -489,7 +546,8 @@ class Session:
         output_path = self._get_output_path()
 
         af = asdf.AsdfFile(tree)
-        af.write_to(output_path)
+        with archive_lock(output_path):
+            af.write_to(output_path)
 
         logger.info("Session written: %s", output_path)
         return output_path
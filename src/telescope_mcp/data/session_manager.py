@@ -291,6 +291,7 @@ class SessionManager:
         *,
         camera_info: dict[str, Any] | None = None,
         settings: dict[str, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
     ) -> None:
         """Add a captured frame to current session.
 
@@ -302,6 +303,8 @@ class SessionManager:
             frame: Image data as numpy array (uint8 or uint16).
             camera_info: Camera metadata (resolution, pixel size, etc.). Optional.
             settings: Capture settings (exposure, gain, etc.). Optional.
+            metadata: Per-frame metadata stored with the frame (see
+                Session.add_frame()). Optional.
 
         Returns:
             None.
@@ -320,7 +323,11 @@ class SessionManager:
         self._ensure_idle_session()
         assert self._active_session is not None
         self._active_session.add_frame(
-            camera, frame, camera_info=camera_info, settings=settings
+            camera,
+            frame,
+            camera_info=camera_info,
+            settings=settings,
+            metadata=metadata,
         )
 
     def add_telemetry(self, telemetry_type: str, **data: Any) -> None:
@@ -352,6 +359,31 @@ class SessionManager:
         assert self._active_session is not None
         self._active_session.add_telemetry(telemetry_type, **data)
 
+    def add_telemetry_sample(self, timestamp_ns: int, **values: float | None) -> None:
+        """Add a periodic columnar telemetry sample to current session.
+
+        Forwards to Session.add_telemetry_sample(). Because the sample goes
+        to whichever session is active, a TelemetryRecorder targeting the
+        manager follows session start/end without being reconfigured.
+
+        Args:
+            timestamp_ns: Monotonic timestamp in nanoseconds.
+            **values: Channel values (altitude, azimuth, temperature,
+                humidity, altitude_steps, azimuth_steps).
+
+        Returns:
+            None.
+
+        Raises:
+            KeyError: If a keyword is not a known telemetry channel.
+
+        Example:
+            sessions.add_telemetry_sample(time.monotonic_ns(), temperature=12.5)
+        """
+        self._ensure_idle_session()
+        assert self._active_session is not None
+        self._active_session.add_telemetry_sample(timestamp_ns, **values)
+
     def add_calibration(self, calibration_type: str, data: Any) -> None:
         """Add calibration data to current session.
 
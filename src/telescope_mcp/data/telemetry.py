@@ -0,0 +1,422 @@
+"""Columnar telemetry storage and background device sampling.
+
+Session.add_telemetry() stores one dict per sample with an ISO timestamp
+string, which is convenient for sparse events but roughly two orders of
+magnitude larger than necessary for periodic mount/environment data. This
+module keeps periodic samples in preallocated numpy columns that grow by
+doubling and are written to ASDF as plain arrays.
+
+Classes:
+    TelemetryColumns: Growable columnar buffer (one numpy array per channel)
+    TelemetrySink: Protocol for objects accepting columnar samples
+    TelemetryRecorder: Async background sampler over Sensor and Motor
+
+Example:
+    from telescope_mcp.data import SessionManager, TelemetryRecorder
+
+    sessions = SessionManager(data_dir=Path("/data/telescope"))
+    recorder = TelemetryRecorder(sessions, sensor=sensor, motor=motor, rate_hz=10)
+    await recorder.start()
+    ...
+    await recorder.stop()
+    sessions.end_session()  # telemetry/samples written as ASDF arrays
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from telescope_mcp.drivers.config import DEFAULT_TELEMETRY_RATE_HZ
+from telescope_mcp.drivers.motors.types import MotorType
+from telescope_mcp.observability import get_logger
+
+if TYPE_CHECKING:
+    from telescope_mcp.devices.motor import Motor
+    from telescope_mcp.devices.sensor import Sensor
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "DEFAULT_TELEMETRY_RATE_HZ",
+    "TELEMETRY_CHANNELS",
+    "TelemetryColumns",
+    "TelemetryRecorder",
+    "TelemetrySink",
+]
+
+# Initial column capacity (samples) before the first growth
+_DEFAULT_INITIAL_CAPACITY = 4096
+
+# Float channels recorded per sample, in column order. Motor steps are kept
+# as float64 so a missing axis can be stored as NaN; values are exact up
+# to 2**53 steps.
+TELEMETRY_CHANNELS: tuple[str, ...] = (
+    "altitude",
+    "azimuth",
+    "temperature",
+    "humidity",
+    "altitude_steps",
+    "azimuth_steps",
+)
+
+
+class TelemetryColumns:
+    """Growable columnar buffer for periodic telemetry samples.
+
+    Holds one int64 column of monotonic nanosecond timestamps plus one
+    float64 column per entry in TELEMETRY_CHANNELS. Columns are
+    preallocated and double in size when full, so appends are amortized
+    O(1) with no per-sample Python objects retained.
+
+    Monotonic time has no epoch and restarts at boot, so the first append
+    also records an epoch anchor: a time.time_ns()/time.monotonic_ns() pair
+    read together. Wall-clock time of a sample is
+    ``unix_ns + (timestamp_ns - monotonic_ns)``.
+
+    Thread-safe: appends and snapshots are guarded by a lock so the
+    recorder task and session close() can run on different threads.
+
+    Example:
+        columns = TelemetryColumns()
+        columns.append(time.monotonic_ns(), altitude=45.0, azimuth=180.0)
+        arrays = columns.to_arrays()
+        arrays["altitude"]  # array([45.])
+    """
+
+    __slots__ = ("_lock", "_size", "_timestamp_ns", "_channels", "_anchor")
+
+    def __init__(self, initial_capacity: int = _DEFAULT_INITIAL_CAPACITY) -> None:
+        """Preallocate empty columns.
+
+        Args:
+            initial_capacity: Number of samples to allocate up front. Columns
+                double when this is exceeded.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If initial_capacity is less than 1.
+
+        Example:
+            >>> columns = TelemetryColumns(initial_capacity=36_000)  # 1h @ 10Hz
+        """
+        if initial_capacity < 1:
+            raise ValueError(f"initial_capacity must be >= 1, got {initial_capacity}")
+        self._lock = threading.Lock()
+        self._size = 0
+        self._timestamp_ns: NDArray[np.int64] = np.empty(
+            initial_capacity, dtype=np.int64
+        )
+        self._channels: dict[str, NDArray[np.float64]] = {
+            name: np.empty(initial_capacity, dtype=np.float64)
+            for name in TELEMETRY_CHANNELS
+        }
+        self._anchor: tuple[int, int] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of samples recorded."""
+        return self._size
+
+    @property
+    def epoch_anchor(self) -> dict[str, int] | None:
+        """Wall-clock anchor for the monotonic timestamps.
+
+        Returns:
+            {"unix_ns": time.time_ns(), "monotonic_ns": time.monotonic_ns()}
+            read together at the first append, or None before any sample.
+
+        Example:
+            >>> anchor = columns.epoch_anchor
+            >>> unix_ns = anchor["unix_ns"] + (ts - anchor["monotonic_ns"])
+        """
+        with self._lock:
+            if self._anchor is None:
+                return None
+            unix_ns, monotonic_ns = self._anchor
+        return {"unix_ns": unix_ns, "monotonic_ns": monotonic_ns}
+
+    @property
+    def capacity(self) -> int:
+        """Currently allocated sample capacity (grows by doubling)."""
+        return int(self._timestamp_ns.shape[0])
+
+    def _grow(self) -> None:
+        """Double column capacity, preserving recorded samples.
+
+        Caller must hold the lock.
+        """
+        new_capacity = self.capacity * 2
+        timestamps = np.empty(new_capacity, dtype=np.int64)
+        timestamps[: self._size] = self._timestamp_ns[: self._size]
+        self._timestamp_ns = timestamps
+        for name, column in self._channels.items():
+            grown = np.empty(new_capacity, dtype=np.float64)
+            grown[: self._size] = column[: self._size]
+            self._channels[name] = grown
+
+    def append(self, timestamp_ns: int, **values: float | None) -> None:
+        """Append one sample.
+
+        Channels not supplied (or supplied as None) are stored as NaN, so a
+        recorder without a motor still produces aligned columns.
+
+        Args:
+            timestamp_ns: Monotonic timestamp in nanoseconds.
+            **values: Channel values keyed by TELEMETRY_CHANNELS names.
+
+        Returns:
+            None.
+
+        Raises:
+            KeyError: If a keyword is not a known telemetry channel.
+
+        Example:
+            >>> columns.append(time.monotonic_ns(), temperature=12.5)
+        """
+        unknown = set(values) - set(TELEMETRY_CHANNELS)
+        if unknown:
+            raise KeyError(f"Unknown telemetry channel(s): {sorted(unknown)}")
+
+        with self._lock:
+            if self._anchor is None:
+                self._anchor = (time.time_ns(), time.monotonic_ns())
+            if self._size == self.capacity:
+                self._grow()
+            index = self._size
+            self._timestamp_ns[index] = timestamp_ns
+            for name, column in self._channels.items():
+                value = values.get(name)
+                column[index] = math.nan if value is None else value
+            self._size += 1
+
+    def to_arrays(self) -> dict[str, NDArray[np.generic]]:
+        """Return trimmed copies of all columns.
+
+        The returned arrays are independent of the buffer, so recording can
+        continue while they are serialized.
+
+        Returns:
+            Dict with "timestamp_ns" (int64) and one float64 array per
+            channel, each of length len(self).
+
+        Example:
+            >>> arrays = columns.to_arrays()
+            >>> arrays["timestamp_ns"].dtype
+            dtype('int64')
+        """
+        with self._lock:
+            arrays: dict[str, NDArray[np.generic]] = {
+                "timestamp_ns": self._timestamp_ns[: self._size].copy()
+            }
+            for name, column in self._channels.items():
+                arrays[name] = column[: self._size].copy()
+        return arrays
+
+    def clear(self) -> None:
+        """Discard recorded samples and the anchor, keeping the capacity."""
+        with self._lock:
+            self._size = 0
+            self._anchor = None
+
+
+@runtime_checkable
+class TelemetrySink(Protocol):  # pragma: no cover
+    """Protocol for objects that accept columnar telemetry samples.
+
+    Implemented by Session and SessionManager; the recorder writes through
+    this interface so it follows session rotation automatically.
+    """
+
+    def add_telemetry_sample(self, timestamp_ns: int, **values: float | None) -> None:
+        """Record one columnar telemetry sample."""
+        ...
+
+
+class TelemetryRecorder:
+    """Background sampler writing Sensor/Motor state into a TelemetrySink.
+
+    Runs an asyncio task that samples at a fixed rate against absolute
+    deadlines (no cumulative drift). Each tick reads the sensor (altitude,
+    azimuth, temperature, humidity) and both motor positions; a missing or
+    failing device produces NaN for its channels rather than stopping the
+    recorder.
+
+    Example:
+        recorder = TelemetryRecorder(sessions, sensor=sensor, rate_hz=10)
+        await recorder.start()
+        await asyncio.sleep(60)
+        await recorder.stop()
+        print(recorder.samples_recorded)  # ~600
+    """
+
+    __slots__ = (
+        "_sink",
+        "_sensor",
+        "_motor",
+        "_rate_hz",
+        "_task",
+        "_samples_recorded",
+        "_errors",
+    )
+
+    def __init__(
+        self,
+        sink: TelemetrySink,
+        *,
+        sensor: Sensor | None = None,
+        motor: Motor | None = None,
+        rate_hz: float = DEFAULT_TELEMETRY_RATE_HZ,
+    ) -> None:
+        """Create a recorder (not started).
+
+        Args:
+            sink: Destination for samples (Session or SessionManager).
+            sensor: Connected Sensor device, or None to skip sensor channels.
+            motor: Connected Motor device, or None to skip step channels.
+            rate_hz: Sampling rate in Hz. Must be positive.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If rate_hz is not positive.
+
+        Example:
+            >>> recorder = TelemetryRecorder(session, motor=motor, rate_hz=2.0)
+        """
+        if rate_hz <= 0:
+            raise ValueError(f"rate_hz must be positive, got {rate_hz}")
+        self._sink = sink
+        self._sensor = sensor
+        self._motor = motor
+        self._rate_hz = rate_hz
+        self._task: asyncio.Task[None] | None = None
+        self._samples_recorded = 0
+        self._errors = 0
+
+    @property
+    def rate_hz(self) -> float:
+        """Configured sampling rate in Hz."""
+        return self._rate_hz
+
+    @property
+    def is_running(self) -> bool:
+        """True while the background sampling task is active."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def samples_recorded(self) -> int:
+        """Number of samples written to the sink since creation."""
+        return self._samples_recorded
+
+    @property
+    def errors(self) -> int:
+        """Number of device read failures encountered while sampling."""
+        return self._errors
+
+    async def start(self) -> None:
+        """Start the background sampling task.
+
+        Idempotent: calling start() on a running recorder does nothing.
+
+        Returns:
+            None.
+
+        Raises:
+            RuntimeError: If called without a running event loop.
+        """
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run(), name="telemetry-recorder")
+        logger.info("Telemetry recorder started", rate_hz=self._rate_hz)
+
+    async def stop(self) -> None:
+        """Stop the background task and wait for it to exit.
+
+        Safe to call when not running.
+
+        Returns:
+            None.
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        logger.info(
+            "Telemetry recorder stopped",
+            samples=self._samples_recorded,
+            errors=self._errors,
+        )
+
+    async def sample_once(self) -> None:
+        """Take one sample from the devices and write it to the sink.
+
+        Returns:
+            None.
+
+        Raises:
+            None. Device failures are counted and recorded as NaN.
+
+        Example:
+            >>> await recorder.sample_once()
+        """
+        timestamp_ns = time.monotonic_ns()
+        values: dict[str, float | None] = {}
+
+        if self._sensor is not None and self._sensor.connected:
+            try:
+                reading = await self._sensor.read()
+                values["altitude"] = reading.altitude
+                values["azimuth"] = reading.azimuth
+                values["temperature"] = reading.temperature
+                values["humidity"] = reading.humidity
+            except Exception as e:
+                self._errors += 1
+                logger.debug("Telemetry sensor read failed", error=str(e))
+
+        if self._motor is not None and self._motor.connected:
+            try:
+                values["altitude_steps"] = self._motor.get_status(
+                    MotorType.ALTITUDE
+                ).position_steps
+                values["azimuth_steps"] = self._motor.get_status(
+                    MotorType.AZIMUTH
+                ).position_steps
+            except Exception as e:
+                self._errors += 1
+                logger.debug("Telemetry motor read failed", error=str(e))
+
+        self._sink.add_telemetry_sample(timestamp_ns, **values)
+        self._samples_recorded += 1
+
+    async def _run(self) -> None:
+        """Sampling loop scheduled against absolute monotonic deadlines."""
+        period = 1.0 / self._rate_hz
+        loop = asyncio.get_running_loop()
+        next_deadline = loop.time()
+        while True:
+            try:
+                await self.sample_once()
+            except Exception as e:
+                # Sink failures (e.g. closed session) must not kill the task
+                self._errors += 1
+                logger.warning("Telemetry sample dropped", error=str(e))
+            next_deadline += period
+            delay = next_deadline - loop.time()
+            if delay < 0:
+                # Fell behind (slow device); resynchronize instead of bursting
+                next_deadline = loop.time()
+                delay = 0.0
+            await asyncio.sleep(delay)
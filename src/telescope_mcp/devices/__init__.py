@@ -2,8 +2,8 @@
 
 This module provides the public API for telescope device management:
 - Camera: Image capture with overlays, streaming, and recovery
-- CameraController: Multi-camera synchronization for alignment
-- CameraRegistry: Discovery and singleton management
+- CameraController: Multi-camera synchronization (pairs and N-camera groups)
+- CameraRegistry: Discovery, singleton management and hotplug monitoring
 - Motor: Stepper motor control for altitude/azimuth positioning
 - Sensor: Environmental (temperature, humidity) and positional (alt/az) data
 - CoordinateProvider: Automatic coordinate injection into frame metadata
@@ -28,6 +28,7 @@ from telescope_mcp.devices.camera import (
     CameraError,
     CameraHooks,
     CameraInfo,
+    CaptureAbortedError,
     CaptureCoordinates,
     CaptureOptions,
     CaptureResult,
@@ -44,12 +45,17 @@ from telescope_mcp.devices.camera import (
 )
 from telescope_mcp.devices.camera_controller import (
     CameraController,
+    GroupCaptureMember,
+    GroupCaptureResult,
+    GroupMemberResult,
     SyncCaptureConfig,
     SyncCaptureResult,
 )
 from telescope_mcp.devices.camera_registry import (
     CameraNotInRegistryError,
     CameraRegistry,
+    HotplugEvent,
+    HotplugEventKind,
     get_registry,
     init_registry,
     shutdown_registry,
@@ -74,13 +80,14 @@ from telescope_mcp.devices.sensor import (
 )
 
 __all__ = [
-    # Camera (19 exports)
+    # Camera (20 exports)
     "Camera",
     "CameraConfig",
     "CameraDisconnectedError",
     "CameraError",
     "CameraHooks",
     "CameraInfo",
+    "CaptureAbortedError",
     "CaptureCoordinates",
     "CaptureOptions",
     "CaptureResult",
@@ -94,13 +101,18 @@ __all__ = [
     "RecoveryStrategy",
     "StreamFrame",
     "SystemClock",
-    # Controller (3 exports)
+    # Controller (6 exports)
     "CameraController",
+    "GroupCaptureMember",
+    "GroupCaptureResult",
+    "GroupMemberResult",
     "SyncCaptureConfig",
     "SyncCaptureResult",
-    # Registry (5 exports)
+    # Registry (7 exports)
     "CameraNotInRegistryError",
     "CameraRegistry",
+    "HotplugEvent",
+    "HotplugEventKind",
     "get_registry",
     "init_registry",
     "shutdown_registry",
@@ -119,4 +131,4 @@ __all__ = [
     "Sensor",
     "SensorConfig",
     "SensorDeviceStatus",
-]  # Total: 39 exports
+]  # Total: 45 exports
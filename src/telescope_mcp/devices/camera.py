@@ -22,23 +22,32 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import queue
+import threading
 import time
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Callable, Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import (
     TYPE_CHECKING,
     Any,
     Literal,
     Protocol,
     TypedDict,
+    TypeVar,
     cast,
     runtime_checkable,
 )
 
 from telescope_mcp.observability import get_logger
+from telescope_mcp.utils.image import encode_image
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from telescope_mcp.drivers.cameras import CameraDriver, CameraInstance
     from telescope_mcp.observability import CameraStats
 
@@ -97,6 +106,12 @@ logger = get_logger(__name__)
 DEFAULT_STREAM_FPS: float = 30.0
 """Default maximum frames per second for video streaming."""
 
+DEFAULT_JPEG_QUALITY: int = 90
+"""JPEG quality used when CaptureResult.image_data is first accessed."""
+
+DEFAULT_PIPELINE_DEPTH: int = 2
+"""Frames captured ahead of the consumer in pipelined burst()/stream()."""
+
 
 # --- Protocols (Injectable Dependencies) ---
 
@@ -466,8 +481,10 @@ class CoordinateProvider(Protocol):  # pragma: no cover
                 self.lat = lat
                 self.lon = lon
 
-            def get_coordinates(self) -> CaptureCoordinates | None:
-                reading = self.sensor.read_sync()
+            def get_coordinates(
+                self, when: datetime | None = None
+            ) -> CaptureCoordinates | None:
+                reading = self.sensor.read_sync(when)
                 equatorial = altaz_to_radec(
                     reading.altitude, reading.azimuth,
                     lat=self.lat, lon=self.lon
@@ -483,10 +500,12 @@ class CoordinateProvider(Protocol):  # pragma: no cover
         camera = Camera(driver, config, coordinate_provider=provider)
     """
 
-    def get_coordinates(self) -> CaptureCoordinates | None:
-        """Get current telescope pointing coordinates.
+    def get_coordinates(
+        self, when: datetime | None = None
+    ) -> CaptureCoordinates | None:
+        """Get telescope pointing coordinates for a capture instant.
 
-        Called at capture time to read current telescope position and convert
+        Called at capture time to read telescope position and convert
         to both horizontal (ALT/AZ) and equatorial (RA/Dec) coordinates.
         Return None if coordinates unavailable (sensor error, not calibrated).
 
@@ -494,6 +513,11 @@ class CoordinateProvider(Protocol):  # pragma: no cover
         captured frame. Coordinates are captured at the moment of exposure,
         ensuring accurate positional metadata even during tracking.
 
+        Args:
+            when: Instant the frame was exposed (Camera passes the exposure
+                midpoint, UTC). None means now. Providers without history
+                may read the current position.
+
         Returns:
             CaptureCoordinates dict with altitude, azimuth, ra, dec, and
             formatted strings. None if coordinates unavailable.
@@ -517,14 +541,16 @@ class NullCoordinateProvider:
     without null checks.
     """
 
-    def get_coordinates(self) -> CaptureCoordinates | None:
+    def get_coordinates(
+        self, when: datetime | None = None
+    ) -> CaptureCoordinates | None:
         """Return None (no coordinates available).
 
         No-op implementation of CoordinateProvider protocol. Used as default
         when no sensor or encoder is configured for coordinates.
 
         Args:
-            None
+            when: Ignored.
 
         Returns:
             Always None, indicating no coordinates available.
@@ -663,34 +689,201 @@ class CaptureOptions:
         exposure_us: Exposure time in microseconds (None = use current)
         gain: Gain value (None = use current)
         apply_overlay: Whether to apply configured overlay
-        format: Output format ("jpeg" or "raw")
+        format: Encoding returned by CaptureResult.image_data
+            ("jpeg", "png", or "raw")
+        image_type: Sensor format ("RAW8", "RAW16", "RGB24"; None = driver
+            default)
     """
 
     exposure_us: int | None = None
     gain: int | None = None
     apply_overlay: bool = True
-    format: Literal["jpeg", "raw"] = "jpeg"
+    format: Literal["jpeg", "png", "raw"] = "jpeg"
+    image_type: str | None = None
 
 
 # --- Result Dataclasses ---
 
 
-@dataclass(slots=True)
 class CaptureResult:
     """Result of a frame capture.
 
-    Contains the image data and metadata about the capture settings.
+    Carries the unencoded sensor array (RAW8/RAW16/RGB24) plus capture
+    settings and metadata. Encoded bytes are produced on demand: the
+    image_data property yields JPEG at jpeg_quality, and encode() lets a
+    consumer pick another format (lossless PNG, raw bytes) or quality.
+    Each encoding is computed at most once per result and memoized, so a
+    frame saved to ASDF as an array never pays for a JPEG encode, and a
+    frame both previewed and streamed is encoded only once.
+
+    Results built from pre-encoded bytes (e.g. overlay renderings) return
+    those bytes from image_data unchanged; raw still holds the untouched
+    sensor frame when it was available.
+
+    Attributes:
+        raw: Sensor frame array, or None when only encoded bytes exist.
+        timestamp: When the frame was captured (UTC).
+        exposure_us: Exposure time used in microseconds.
+        gain: Gain value used.
+        width: Frame width in pixels (from raw when not given).
+        height: Frame height in pixels (from raw when not given).
+        format: Default encoding for image_data ("jpeg", "png", "raw").
+        metadata: Camera, timing, and coordinate metadata.
+        has_overlay: Whether image_data includes a rendered overlay.
+        image_type: Sensor format of raw ("RAW8", "RAW16", "RGB24").
+        jpeg_quality: Quality used by image_data for JPEG.
+
+    Example:
+        result = camera.capture_raw(exposure_us=2_000_000)
+        session.add_frame("main", result.raw)  # no encoding
+        preview = result.image_data  # JPEG, encoded now and cached
+        lossless = result.encode("png")  # 16-bit PNG for RAW16
     """
 
-    image_data: bytes
-    timestamp: datetime
-    exposure_us: int
-    gain: int
-    width: int | None = None
-    height: int | None = None
-    format: str = "jpeg"
-    metadata: dict[str, Any] = field(default_factory=dict)
-    has_overlay: bool = False
+    __slots__ = (
+        "raw",
+        "timestamp",
+        "exposure_us",
+        "gain",
+        "width",
+        "height",
+        "format",
+        "metadata",
+        "has_overlay",
+        "image_type",
+        "jpeg_quality",
+        "_encoded",
+        "_release",
+    )
+
+    def __init__(
+        self,
+        *,
+        timestamp: datetime,
+        exposure_us: int,
+        gain: int,
+        image_data: bytes | None = None,
+        raw: NDArray[Any] | None = None,
+        width: int | None = None,
+        height: int | None = None,
+        format: str = "jpeg",
+        metadata: dict[str, Any] | None = None,
+        has_overlay: bool = False,
+        image_type: str | None = None,
+        jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+    ) -> None:
+        """Create a capture result from a raw array and/or encoded bytes.
+
+        Args:
+            timestamp: Capture time.
+            exposure_us: Exposure time used in microseconds.
+            gain: Gain value used.
+            image_data: Already-encoded bytes in `format`, if any.
+            raw: Unencoded sensor array, if any.
+            width: Frame width; defaults to raw.shape[1].
+            height: Frame height; defaults to raw.shape[0].
+            format: Encoding image_data returns ("jpeg", "png", "raw").
+            metadata: Metadata dict (a new empty dict if None).
+            has_overlay: Whether image_data includes an overlay.
+            image_type: Sensor format name of raw.
+            jpeg_quality: JPEG quality 1-100 for lazily encoded image_data.
+
+        Raises:
+            ValueError: If neither image_data nor raw is provided.
+        """
+        if image_data is None and raw is None:
+            raise ValueError("CaptureResult requires image_data or raw")
+        self.raw = raw
+        self.timestamp = timestamp
+        self.exposure_us = exposure_us
+        self.gain = gain
+        self.width = width if width is not None or raw is None else raw.shape[1]
+        self.height = height if height is not None or raw is None else raw.shape[0]
+        self.format = format
+        self.metadata = metadata if metadata is not None else {}
+        self.has_overlay = has_overlay
+        self.image_type = image_type
+        self.jpeg_quality = jpeg_quality
+        self._encoded: dict[tuple[str, int], bytes] = {}
+        self._release: Callable[[], None] | None = None
+        if image_data is not None:
+            self._encoded[self._cache_key(format, None)] = image_data
+
+    def release(self) -> None:
+        """Hand a pooled raw buffer back to the driver.
+
+        Streams and bursts with reuse_buffers capture into driver-owned
+        buffers. After release() raw is None and the buffer is reused by a
+        later capture; encodings produced before the call stay valid.
+        No-op for results that own their array. Idempotent.
+
+        Example:
+            >>> jpeg = result.image_data
+            >>> result.release()  # jpeg is still usable
+        """
+        release, self._release = self._release, None
+        if release is not None:
+            self.raw = None
+            release()
+
+    @property
+    def image_data(self) -> bytes:
+        """Frame encoded in `format` (JPEG by default), memoized."""
+        return self.encode(self.format)
+
+    @property
+    def is_encoded(self) -> bool:
+        """True once image_data has been produced (or was supplied)."""
+        return self._cache_key(self.format, None) in self._encoded
+
+    def _cache_key(self, fmt: str, quality: int | None) -> tuple[str, int]:
+        """Memo key; quality only distinguishes JPEG encodings."""
+        if fmt != "jpeg":
+            return (fmt, 0)
+        return (fmt, self.jpeg_quality if quality is None else quality)
+
+    def encode(self, fmt: str = "jpeg", quality: int | None = None) -> bytes:
+        """Return the frame encoded as fmt, encoding at most once.
+
+        Args:
+            fmt: "jpeg", "png" (keeps 16-bit depth), or "raw" (array bytes).
+            quality: JPEG quality 1-100; None uses jpeg_quality. Ignored
+                for other formats.
+
+        Returns:
+            Encoded bytes. Repeated calls return the cached object.
+
+        Raises:
+            ValueError: If fmt is unsupported, or the result has no raw
+                array and fmt differs from the supplied encoding.
+
+        Example:
+            >>> jpeg = result.encode("jpeg", quality=70)
+            >>> jpeg is result.encode("jpeg", quality=70)
+            True
+        """
+        key = self._cache_key(fmt, quality)
+        cached = self._encoded.get(key)
+        if cached is not None:
+            return cached
+        if self.raw is None:
+            raise ValueError(
+                f"Cannot encode as {fmt!r}: result holds only "
+                f"pre-encoded {self.format!r} data"
+            )
+        data = encode_image(self.raw, fmt, key[1] or DEFAULT_JPEG_QUALITY)
+        self._encoded[key] = data
+        return data
+
+    def __repr__(self) -> str:
+        """Summarize settings and frame shape without dumping pixels."""
+        shape = None if self.raw is None else self.raw.shape
+        return (
+            f"CaptureResult(timestamp={self.timestamp!r}, "
+            f"exposure_us={self.exposure_us}, gain={self.gain}, "
+            f"image_type={self.image_type!r}, shape={shape}, "
+            f"format={self.format!r}, has_overlay={self.has_overlay})"
+        )
 
 
 @dataclass(slots=True)
@@ -907,6 +1100,22 @@ class CameraDisconnectedError(CameraError):
     pass
 
 
+class CaptureAbortedError(CameraError):
+    """Raised when an exposure is aborted via Camera.stop_exposure()."""
+
+    pass
+
+
+_T = TypeVar("_T")
+
+
+def _infer_image_type(frame: NDArray[Any]) -> str:
+    """Name the sensor format of a driver frame from its dtype and shape."""
+    if frame.ndim == 3:
+        return "RGB24"
+    return "RAW16" if frame.dtype.itemsize == 2 else "RAW8"
+
+
 # --- Camera Class ---
 
 
@@ -1024,6 +1233,9 @@ class Camera:
         self._overlay: OverlayConfig | None = None
         self._frame_count: int = 0
         self._streaming: bool = False
+        self._executor: ThreadPoolExecutor | None = None
+        self._abort_requested = threading.Event()
+        self._exposing = threading.Event()
 
     @property
     def config(self) -> CameraConfig:
@@ -1195,6 +1407,23 @@ class Camera:
         """
         return self._streaming
 
+    @property
+    def is_exposing(self) -> bool:
+        """Check whether a sensor exposure is in flight right now.
+
+        True only while the driver's capture call runs. Background work
+        that touches the USB bus (e.g. the registry's hotplug monitor)
+        checks this to avoid colliding with an active exposure.
+
+        Returns:
+            True during an exposure, False otherwise.
+
+        Example:
+            >>> if not any(c.is_exposing for c in cameras):
+            ...     registry.discover(refresh=True)
+        """
+        return self._exposing.is_set()
+
     def connect(self) -> CameraInfo:
         """Connect to camera and return camera info.
 
@@ -1313,6 +1542,7 @@ class Camera:
             finally:
                 self._instance = None
                 self._info = None
+                self._shutdown_executor()
 
                 # Fire hook
                 if self._hooks.on_disconnect:
@@ -1329,7 +1559,8 @@ class Camera:
                 If None, uses current settings with overlay applied.
 
         Returns:
-            CaptureResult with JPEG image data and capture metadata.
+            CaptureResult with the raw frame, lazily encoded image_data in
+            options.format, and capture metadata.
 
         Raises:
             CameraNotConnectedError: If camera is not connected.
@@ -1348,7 +1579,22 @@ class Camera:
             ))
         """
         opts = options or CaptureOptions()
-        result = self._capture_internal(opts.exposure_us, opts.gain)
+        result = self._capture_internal(opts.exposure_us, opts.gain, opts.image_type)
+        return self._finish_capture(result, opts)
+
+    def _finish_capture(
+        self, result: CaptureResult, opts: CaptureOptions
+    ) -> CaptureResult:
+        """Apply output format, on_capture hook, and overlay to a capture.
+
+        Args:
+            result: Freshly acquired capture.
+            opts: Options the capture was requested with.
+
+        Returns:
+            The result, or a new overlaid result if an overlay applies.
+        """
+        result.format = opts.format
 
         # Fire hook (before overlay)
         if self._hooks.on_capture:
@@ -1364,6 +1610,7 @@ class Camera:
         self,
         exposure_us: int | None = None,
         gain: int | None = None,
+        image_type: str | None = None,
     ) -> CaptureResult:
         """Capture a frame WITHOUT overlay (for ASDF/science data).
 
@@ -1374,9 +1621,12 @@ class Camera:
         Args:
             exposure_us: Exposure time in microseconds, or None to use current.
             gain: Gain value (0-100 typical), or None to use current.
+            image_type: Sensor format ("RAW8", "RAW16", "RGB24"), or None
+                for the driver default.
 
         Returns:
-            CaptureResult with raw JPEG image data (no overlay applied).
+            CaptureResult with the unmodified sensor array in raw (no
+            overlay applied, nothing encoded yet).
 
         Raises:
             CameraNotConnectedError: If camera is not connected.
@@ -1384,14 +1634,15 @@ class Camera:
 
         Example:
             # Capture for ASDF session storage
-            result = camera.capture_raw(exposure_us=1_000_000, gain=50)
-            session.add_frame(result.image_data, result.metadata)
+            result = camera.capture_raw(exposure_us=1_000_000, image_type="RAW16")
+            session.add_frame("main", result.raw, settings=result.metadata)
         """
         return self.capture(
             CaptureOptions(
                 exposure_us=exposure_us,
                 gain=gain,
                 apply_overlay=False,
+                image_type=image_type,
             )
         )
 
@@ -1440,7 +1691,7 @@ class Camera:
 
     def _build_capture_result(
         self,
-        image_data: bytes,
+        raw: NDArray[Any],
         exposure_us: int,
         gain: int,
         duration_ms: float,
@@ -1460,7 +1711,7 @@ class Camera:
         accurate positional metadata.
 
         Args:
-            image_data: Captured image as JPEG bytes.
+            raw: Captured sensor array from the driver.
             exposure_us: Exposure time used in microseconds.
             gain: Gain value used.
             duration_ms: Capture duration in milliseconds for performance
@@ -1479,7 +1730,7 @@ class Camera:
 
         Example:
             >>> result = camera._build_capture_result(
-            ...     jpeg_bytes, 100_000, 50, 150.5, {"recovered": True}
+            ...     frame, 100_000, 50, 150.5, {"recovered": True}
             ... )
             >>> assert result.metadata["recovered"] is True
             >>> # With coordinate provider configured:
@@ -1493,8 +1744,12 @@ class Camera:
             "capture_duration_ms": round(duration_ms, 1),
         }
 
-        # Inject coordinates if provider configured
-        coordinates = self._coordinate_provider.get_coordinates()
+        # Inject coordinates if provider configured, for mid-exposure rather
+        # than now (after readout)
+        timestamp = self._now()
+        coordinates = self._coordinate_provider.get_coordinates(
+            timestamp - timedelta(microseconds=exposure_us / 2)
+        )
         if coordinates:
             metadata["coordinates"] = dict(coordinates)
 
@@ -1502,21 +1757,21 @@ class Camera:
             metadata.update(extra_metadata)
 
         return CaptureResult(
-            image_data=image_data,
-            timestamp=self._now(),
+            raw=raw,
+            timestamp=timestamp,
             exposure_us=exposure_us,
             gain=gain,
-            width=self._info.max_width if self._info else None,
-            height=self._info.max_height if self._info else None,
-            format="jpeg",
             metadata=metadata,
-            has_overlay=False,
+            image_type=_infer_image_type(raw),
         )
 
     def _capture_internal(
         self,
         exposure_us: int | None = None,
         gain: int | None = None,
+        image_type: str | None = None,
+        *,
+        pooled: bool = False,
     ) -> CaptureResult:
         """Internal capture implementation handling settings, driver, recovery.
 
@@ -1538,7 +1793,7 @@ class Camera:
         measurement. Updates _current_gain/_current_exposure_us for state
         tracking. Records success/failure to observability. On exception, calls
         _recover_and_capture() using injected RecoveryStrategy. CaptureResult
-        includes raw JPEG with has_overlay=False - caller applies overlay if
+        holds the unencoded frame with has_overlay=False - caller applies overlay if
         needed.
 
         Args:
@@ -1547,10 +1802,14 @@ class Camera:
                 1 hour) but actual limits per camera model.
             gain: Gain value. None uses _current_gain. Typical 0-600 but varies
                 by model.
+            image_type: Sensor format passed to the driver's capture_array().
+            pooled: Capture into a driver-pooled buffer when the driver
+                offers capture_pooled(); the caller must release() the
+                result. Falls back to capture_array() otherwise.
 
         Returns:
-            CaptureResult with raw JPEG, timestamp (UTC), effective
-            exposure/gain, width/height, format="jpeg", metadata
+            CaptureResult with the raw sensor array, timestamp (UTC),
+            effective exposure/gain, width/height, metadata
             (camera_id/name/duration_ms), has_overlay=False.
 
         Raises:
@@ -1573,6 +1832,7 @@ class Camera:
 
         camera_id = self._config.camera_id
         start_time = self._clock.monotonic()
+        self._abort_requested.clear()
 
         # Apply settings using helper
         effective_exposure, effective_gain = self._apply_capture_settings(
@@ -1580,7 +1840,20 @@ class Camera:
         )
 
         try:
-            image_data = self._instance.capture(effective_exposure)
+            # Optional driver capability (ASI); other drivers allocate
+            capture_pooled = (
+                getattr(self._instance, "capture_pooled", None) if pooled else None
+            )
+            lease = None
+            self._exposing.set()
+            try:
+                if capture_pooled is not None:
+                    lease = capture_pooled(effective_exposure, image_type)
+                    frame = lease.array
+                else:
+                    frame = self._instance.capture_array(effective_exposure, image_type)
+            finally:
+                self._exposing.clear()
             duration_ms = (self._clock.monotonic() - start_time) * 1000
 
             # Record successful capture stats
@@ -1596,16 +1869,19 @@ class Camera:
                 camera_id=camera_id,
                 exposure_us=effective_exposure,
                 gain=effective_gain,
-                size_bytes=len(image_data),
+                size_bytes=frame.nbytes,
                 duration_ms=round(duration_ms, 1),
             )
 
-            return self._build_capture_result(
-                image_data=image_data,
+            result = self._build_capture_result(
+                raw=frame,
                 exposure_us=effective_exposure,
                 gain=effective_gain,
                 duration_ms=duration_ms,
             )
+            if lease is not None:
+                result._release = lease.release
+            return result
         except Exception as e:
             duration_ms = (self._clock.monotonic() - start_time) * 1000
 
@@ -1618,6 +1894,14 @@ class Camera:
                     error_type=type(e).__name__,
                 )
 
+            # A deliberate abort is not a disconnect - skip recovery
+            if self._abort_requested.is_set():
+                self._abort_requested.clear()
+                logger.info("Exposure aborted", camera_id=camera_id)
+                raise CaptureAbortedError(
+                    f"Exposure aborted on camera {camera_id}"
+                ) from e
+
             logger.warning(
                 "Capture failed, attempting recovery",
                 camera_id=camera_id,
@@ -1630,6 +1914,7 @@ class Camera:
                 exposure_us=effective_exposure,
                 gain=effective_gain,
                 original_error=e,
+                image_type=image_type,
             )
 
     def _recover_and_capture(
@@ -1637,6 +1922,7 @@ class Camera:
         exposure_us: int,
         gain: int,
         original_error: Exception,
+        image_type: str | None = None,
     ) -> CaptureResult:
         """Hardware recovery and retry after disconnect during capture.
 
@@ -1656,7 +1942,7 @@ class Camera:
 
         Implementation details: Calls recovery_strategy.attempt_recovery() (may
         take seconds for USB reset), reconnects via connect(), retries
-        _instance.capture(). Clears stale instance before recovery. Metadata
+        _instance.capture_array(). Clears stale instance before recovery. Metadata
         includes "recovered_from_error": original_error type name. Fires
         on_camera_disconnected() hook after successful recovery for
         notification/logging. Records recovery stats via get_camera_stats().
@@ -1671,6 +1957,7 @@ class Camera:
             original_error: Exception that triggered recovery (typically
                 CameraError or USB error). Chained in CameraDisconnectedError if
                 recovery fails via `from original_error`.
+            image_type: Sensor format for the retry capture.
 
         Returns:
             CaptureResult with successfully captured image after recovery.
@@ -1733,7 +2020,7 @@ class Camera:
         try:
             self.connect()
             logger.info("Camera recovered successfully", camera_id=camera_id)
-            return self._retry_capture_after_recovery(exposure_us, gain)
+            return self._retry_capture_after_recovery(exposure_us, gain, image_type)
         except Exception as e:
             if self._hooks.on_error:
                 self._hooks.on_error(e)
@@ -1745,6 +2032,7 @@ class Camera:
         self,
         exposure_us: int,
         gain: int,
+        image_type: str | None = None,
     ) -> CaptureResult:
         """Capture frame after successful recovery reconnection.
 
@@ -1761,6 +2049,7 @@ class Camera:
             exposure_us: Exposure time in microseconds. Should match the
                 original failed capture settings.
             gain: Gain value. Should match original settings.
+            image_type: Sensor format. Should match original settings.
 
         Returns:
             CaptureResult with recovered=True in metadata, indicating frame
@@ -1783,7 +2072,11 @@ class Camera:
             )
 
         start_time = self._clock.monotonic()
-        image_data = self._instance.capture(exposure_us)
+        self._exposing.set()
+        try:
+            frame = self._instance.capture_array(exposure_us, image_type)
+        finally:
+            self._exposing.clear()
         duration_ms = (self._clock.monotonic() - start_time) * 1000
 
         # Record recovered capture
@@ -1795,7 +2088,7 @@ class Camera:
             )
 
         return self._build_capture_result(
-            image_data=image_data,
+            raw=frame,
             exposure_us=exposure_us,
             gain=gain,
             duration_ms=duration_ms,
@@ -1840,6 +2133,8 @@ class Camera:
         self,
         options: CaptureOptions | None = None,
         max_fps: float = DEFAULT_STREAM_FPS,
+        *,
+        pipelined: bool = False,
     ) -> Iterator[StreamFrame]:
         """Yield continuous frames for live view and monitoring.
 
@@ -1857,12 +2152,16 @@ class Camera:
         bandwidth and CPU usage (lower FPS).
 
         Implementation details: Uses Python generator (yield) for memory
-        efficiency - only one frame in memory at a time. Rate limiting uses
-        injected clock's sleep() for testability. Captures via self.capture()
-        which applies settings, overlay, and fires hooks. The actual frame rate
-        may be lower than max_fps if exposure time + processing time exceeds
-        the frame interval. For 30 fps with overlays, keep exposure under 25ms.
-        Generator cleanup (finally block) ensures _streaming flag is reset.
+        efficiency - only one frame in memory at a time. Frames are captured
+        into driver-pooled buffers where the driver supports it and released
+        once encoded, so streaming allocates no full-resolution frame per
+        capture; on_capture hooks must copy raw to keep it. Rate limiting
+        uses injected clock's sleep() for testability. Each frame goes
+        through the same settings, overlay, and hooks as capture(). The
+        actual frame rate may be lower than max_fps if exposure time +
+        processing time exceeds the frame interval. For 30 fps with
+        overlays, keep exposure under 25ms. Generator cleanup (finally block)
+        ensures _streaming flag is reset.
 
         Args:
             options: Capture options applied to each frame. If None, uses current
@@ -1872,6 +2171,9 @@ class Camera:
                 limited by min(max_fps, 1/(exposure_time + processing_time)).
                 Common values: 30 fps for smooth live view, 10-15 fps for
                 bandwidth-limited situations, 5 fps for long exposures.
+            pipelined: Overlap the next exposure with encoding, overlay, and
+                hooks of the previous frame (see burst()). Frames are still
+                delivered in order; on_capture fires on a worker thread.
 
         Yields:
             StreamFrame with image data (JPEG bytes), timestamp, sequence number
@@ -1918,25 +2220,33 @@ class Camera:
         self._streaming = True
         self._frame_count = 0
 
+        if pipelined:
+            try:
+                for result in self._pipeline(
+                    None, opts, DEFAULT_PIPELINE_DEPTH, min_interval, pooled=True
+                ):
+                    if not self._streaming:
+                        break
+                    yield self._emit_stream_frame(result)
+                    self._frame_count += 1
+            finally:
+                self._streaming = False
+            return
+
         try:
             while self._streaming:
                 start = self._clock.monotonic()
 
-                # Capture frame
-                result = self.capture(opts)
-
-                frame = StreamFrame(
-                    image_data=result.image_data,
-                    timestamp=result.timestamp,
-                    sequence_number=self._frame_count,
-                    exposure_us=result.exposure_us,
-                    gain=result.gain,
-                    has_overlay=result.has_overlay,
+                # Only encoded bytes leave, so the buffer is reused at once
+                captured = self._capture_internal(
+                    opts.exposure_us, opts.gain, opts.image_type, pooled=True
                 )
-
-                # Fire hook
-                if self._hooks.on_stream_frame:
-                    self._hooks.on_stream_frame(frame)
+                try:
+                    frame = self._emit_stream_frame(
+                        self._finish_capture(captured, opts)
+                    )
+                finally:
+                    captured.release()
 
                 yield frame
 
@@ -1990,12 +2300,207 @@ class Camera:
         """
         self._streaming = False
 
+    def _emit_stream_frame(self, result: CaptureResult) -> StreamFrame:
+        """Wrap a capture as the next StreamFrame and fire on_stream_frame.
+
+        Args:
+            result: Capture for the current frame.
+
+        Returns:
+            StreamFrame numbered with the current frame count.
+        """
+        frame = StreamFrame(
+            image_data=result.image_data,
+            timestamp=result.timestamp,
+            sequence_number=self._frame_count,
+            exposure_us=result.exposure_us,
+            gain=result.gain,
+            has_overlay=result.has_overlay,
+        )
+        if self._hooks.on_stream_frame:
+            self._hooks.on_stream_frame(frame)
+        return frame
+
+    def burst(
+        self,
+        count: int | None,
+        options: CaptureOptions | None = None,
+        *,
+        depth: int = DEFAULT_PIPELINE_DEPTH,
+        max_fps: float | None = None,
+        reuse_buffers: bool = False,
+    ) -> Generator[CaptureResult, None, None]:
+        """Capture a pipelined burst, overlapping exposure with processing.
+
+        Exposure and readout run back-to-back on this camera's worker
+        thread: as soon as frame N is read out, exposure N+1 starts. Frame
+        N is meanwhile encoded (options.format), passed to on_capture, and
+        overlaid on a separate processing thread, then delivered to the
+        caller. Short-exposure bursts (focusing, planetary) therefore run
+        at close to the sensor's readout rate instead of paying for
+        encoding and consumer work between exposures.
+
+        At most depth frames are captured ahead of the consumer; when the
+        caller falls behind, acquisition pauses instead of buffering
+        unbounded full-resolution frames. Results are always yielded in
+        capture order.
+
+        Business context: Lucky imaging and focus runs take hundreds of
+        short frames; serial capture-then-encode roughly halves the frame
+        rate when JPEG encoding takes as long as the exposure.
+
+        Args:
+            count: Number of frames to capture, or None to continue until
+                the generator is closed.
+            options: Capture options applied to every frame. If None, uses
+                current settings with overlay applied.
+            depth: Maximum frames captured but not yet consumed (>= 1).
+            max_fps: Optional cap on exposure start rate; None captures as
+                fast as the camera allows.
+            reuse_buffers: Capture into driver-pooled buffers and release
+                each frame when the next one is requested, so long bursts
+                allocate no full-resolution frame per capture. Each
+                result's raw is then None after the loop moves on; copy it
+                to keep pixels. Encoded data stays valid.
+
+        Yields:
+            CaptureResult per frame, in capture order, already encoded in
+            options.format (except "raw", which stays unencoded).
+
+        Raises:
+            CameraNotConnectedError: If camera is not connected.
+            ValueError: If count is negative or depth/max_fps not positive.
+            CameraError: If a capture fails; frames already captured before
+                the failure are delivered first.
+
+        Example:
+            >>> opts = CaptureOptions(exposure_us=5_000, apply_overlay=False)
+            >>> for result in camera.burst(200, opts):
+            ...     scores.append(sharpness(result.raw))
+
+        Note:
+            Closing the generator early lets the exposure in progress finish
+            and discards frames not yet delivered. The on_capture hook runs
+            on the processing thread, not the caller's.
+        """
+        if self._instance is None:
+            raise CameraNotConnectedError("Camera is not connected")
+        if count is not None and count < 0:
+            raise ValueError(f"count must be >= 0, got {count}")
+        if depth < 1:
+            raise ValueError(f"depth must be >= 1, got {depth}")
+        if max_fps is not None and max_fps <= 0:
+            raise ValueError(f"max_fps must be positive, got {max_fps}")
+
+        opts = options or CaptureOptions()
+        min_interval = 1.0 / max_fps if max_fps else 0.0
+        return self._pipeline(count, opts, depth, min_interval, pooled=reuse_buffers)
+
+    def _pipeline(
+        self,
+        count: int | None,
+        opts: CaptureOptions,
+        depth: int,
+        min_interval: float,
+        *,
+        pooled: bool = False,
+    ) -> Generator[CaptureResult, None, None]:
+        """Run acquisition and processing stages for burst()/stream().
+
+        Acquisition occupies the per-camera executor (so async calls on this
+        camera queue behind it) and hands each raw capture to a one-thread
+        processing executor. The caller receives futures in a FIFO queue,
+        which keeps delivery ordered; a semaphore bounds frames in flight.
+
+        Args:
+            count: Frames to capture, or None for unbounded.
+            opts: Capture options for every frame.
+            depth: Maximum frames captured but not yet delivered.
+            min_interval: Minimum seconds between exposure starts.
+            pooled: Capture into pooled buffers, releasing each frame when
+                the consumer asks for the next one.
+
+        Yields:
+            Processed CaptureResult objects in capture order.
+        """
+        camera_id = self._config.camera_id
+        slots = threading.Semaphore(depth)
+        stop = threading.Event()
+        ready: queue.SimpleQueue[Future[tuple[CaptureResult, CaptureResult]] | None] = (
+            queue.SimpleQueue()
+        )
+        processor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"camera-{camera_id}-process"
+        )
+
+        def process(
+            captured: CaptureResult,
+        ) -> tuple[CaptureResult, CaptureResult]:
+            result = self._finish_capture(captured, opts)
+            if result.format != "raw":
+                result.encode(result.format)  # Encode off the caller's thread
+            # The overlay may return a new result; the lease stays on captured
+            return captured, result
+
+        def acquire() -> None:
+            captured = 0
+            next_start = self._clock.monotonic()
+            try:
+                while count is None or captured < count:
+                    slots.acquire()
+                    if stop.is_set():
+                        return
+                    if min_interval:
+                        delay = next_start - self._clock.monotonic()
+                        if delay > 0:
+                            self._clock.sleep(delay)
+                        next_start = max(
+                            next_start + min_interval, self._clock.monotonic()
+                        )
+                    result = self._capture_internal(
+                        opts.exposure_us, opts.gain, opts.image_type, pooled=pooled
+                    )
+                    ready.put(processor.submit(process, result))
+                    captured += 1
+            except BaseException as e:
+                failed: Future[tuple[CaptureResult, CaptureResult]] = Future()
+                failed.set_exception(e)
+                ready.put(failed)
+            finally:
+                ready.put(None)
+
+        acquisition = self._get_executor().submit(acquire)
+        delivered = 0
+        try:
+            while (item := ready.get()) is not None:
+                captured, result = item.result()
+                slots.release()
+                delivered += 1
+                try:
+                    yield result
+                finally:
+                    if pooled:
+                        result.raw = None  # An overlay result aliases the buffer
+                        captured.release()
+        finally:
+            stop.set()
+            slots.release()  # Wake acquisition if it is waiting for a slot
+            if not acquisition.cancel():
+                acquisition.result()
+            processor.shutdown(wait=True, cancel_futures=True)
+            logger.debug(
+                "Pipelined capture finished",
+                camera_id=camera_id,
+                frames=delivered,
+                depth=depth,
+            )
+
     def _apply_overlay(self, result: CaptureResult) -> CaptureResult:
         """Apply configured overlay using injected renderer.
 
         Delegates overlay rendering to the injected OverlayRenderer and
-        returns a new CaptureResult with the rendered image. Original
-        result is not modified.
+        returns a new CaptureResult with the rendered image, encoded in
+        the result's requested format. Original result is not modified.
 
         Business context: Separates overlay rendering from capture logic,
         enabling different overlay strategies (crosshairs, grids, platesolve
@@ -2017,20 +2522,22 @@ class Camera:
             >>> overlaid = camera._apply_overlay(result)  # If overlay configured
 
         Note:
-            Returns original result unchanged if no overlay is configured.
+            Returns original result unchanged if no overlay is configured
+            or the requested format is "raw" (unencoded sensor data).
         """
-        if not self._overlay:
+        if not self._overlay or result.format == "raw":
             return result
 
-        # Delegate to injected renderer
+        # Renderers return the same encoding they are given
         rendered_data = self._renderer.render(
-            result.image_data,
+            result.encode(result.format),
             self._overlay,
             self._info,
         )
 
         return CaptureResult(
             image_data=rendered_data,
+            raw=result.raw,
             timestamp=result.timestamp,
             exposure_us=result.exposure_us,
             gain=result.gain,
@@ -2039,6 +2546,8 @@ class Camera:
             format=result.format,
             metadata={**result.metadata, "overlay_type": self._overlay.overlay_type},
             has_overlay=True,
+            image_type=result.image_type,
+            jpeg_quality=result.jpeg_quality,
         )
 
     def set_control(self, name: str, value: int) -> None:
@@ -2234,6 +2743,271 @@ class Camera:
                 self._hooks.on_error(e)
             raise CameraError(f"Failed to set {name}={value}: {e}") from e
 
+    # --- Async API ---
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return this camera's single-worker executor, creating it lazily.
+
+        One worker per camera serializes SDK calls on the camera handle
+        (the ASI SDK is not safe for concurrent calls on one handle) while
+        letting different cameras expose in parallel.
+
+        Returns:
+            ThreadPoolExecutor with one thread named camera-{id}.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f"camera-{self._config.camera_id}",
+            )
+        return self._executor
+
+    def _shutdown_executor(self) -> None:
+        """Release the worker thread without waiting for queued work."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, func: Callable[..., _T], *args: Any) -> Future[_T]:
+        """Queue blocking work on this camera's worker thread.
+
+        Work submitted here is serialized with capture_async() and the
+        async control methods, so callers that drive the camera from
+        their own threads (e.g. CameraController) never overlap an SDK
+        call on the same handle.
+
+        Args:
+            func: Synchronous callable, typically using this camera.
+            *args: Positional arguments for func.
+
+        Returns:
+            Future resolving to func's return value.
+
+        Example:
+            >>> camera.submit(camera.capture_raw, 100_000).result()
+        """
+        return self._get_executor().submit(func, *args)
+
+    async def _run_blocking(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking camera call on the per-camera executor.
+
+        Args:
+            func: Bound synchronous Camera method.
+            *args: Positional arguments for func.
+
+        Returns:
+            func's return value.
+
+        Raises:
+            Whatever func raises.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(func, *args)
+        )
+
+    async def capture_async(
+        self, options: CaptureOptions | None = None
+    ) -> CaptureResult:
+        """Capture a frame without blocking the event loop.
+
+        Runs capture() (exposure wait, readout, encoding, recovery) on this
+        camera's worker thread so other coroutines - MCP tool calls, motor
+        stops, position queries - keep running during long exposures.
+
+        Cancelling the awaiting task aborts the exposure via stop_exposure()
+        if it has started, or drops it from the queue if it has not. The
+        worker finishes unwinding in the background; later calls on this
+        camera queue behind it.
+
+        Args:
+            options: Capture options (exposure, gain, overlay, format).
+                If None, uses current settings with overlay applied.
+
+        Returns:
+            CaptureResult, identical to capture().
+
+        Raises:
+            CameraNotConnectedError: If camera is not connected.
+            CaptureAbortedError: If stop_exposure() was called from elsewhere.
+            CameraError: If capture fails.
+            asyncio.CancelledError: If the awaiting task is cancelled.
+
+        Example:
+            >>> task = asyncio.create_task(
+            ...     camera.capture_async(CaptureOptions(exposure_us=30_000_000))
+            ... )
+            >>> task.cancel()  # Aborts the 30 s exposure
+        """
+        if self._instance is None:
+            raise CameraNotConnectedError("Camera is not connected")
+
+        work = self._get_executor().submit(self._capture_encoded, options)
+        try:
+            return await asyncio.wrap_future(work)
+        except asyncio.CancelledError:
+            if not work.cancel() and work.running():
+                self.stop_exposure()
+            raise
+
+    def _capture_encoded(self, options: CaptureOptions | None) -> CaptureResult:
+        """Capture and encode on the worker so image_data never blocks a loop.
+
+        Args:
+            options: Capture options passed to capture().
+
+        Returns:
+            CaptureResult with image_data already memoized (unless RAW).
+        """
+        result = self.capture(options)
+        if result.format != "raw":
+            result.encode(result.format)
+        return result
+
+    async def stream_async(
+        self,
+        options: CaptureOptions | None = None,
+        max_fps: float = DEFAULT_STREAM_FPS,
+    ) -> AsyncIterator[StreamFrame]:
+        """Yield continuous frames without blocking the event loop.
+
+        Async counterpart of stream(): each frame is captured with
+        capture_async() and rate limiting uses asyncio.sleep(). Ends when
+        stop_stream() is called or the generator is closed; closing during
+        an exposure aborts it.
+
+        Args:
+            options: Capture options applied to each frame.
+            max_fps: Maximum frames per second.
+
+        Yields:
+            StreamFrame per captured frame, sequence numbers from 0.
+
+        Raises:
+            CameraNotConnectedError: If camera is not connected.
+            CameraError: If capture fails during streaming.
+
+        Example:
+            >>> async for frame in camera.stream_async(max_fps=10):
+            ...     await websocket.send_bytes(frame.image_data)
+            ...     if frame.sequence_number >= 99:
+            ...         camera.stop_stream()
+        """
+        if self._instance is None:
+            raise CameraNotConnectedError("Camera is not connected")
+
+        opts = options or CaptureOptions()
+        min_interval = 1.0 / max_fps
+        self._streaming = True
+        self._frame_count = 0
+
+        try:
+            while self._streaming:
+                start = self._clock.monotonic()
+                result = await self.capture_async(opts)
+                yield self._emit_stream_frame(result)
+                self._frame_count += 1
+
+                elapsed = self._clock.monotonic() - start
+                if elapsed < min_interval:
+                    await asyncio.sleep(min_interval - elapsed)
+        finally:
+            self._streaming = False
+
+    def stop_exposure(self) -> None:
+        """Abort the exposure in progress, from any thread.
+
+        Signals the driver to stop the current exposure. The blocked
+        capture() then raises CaptureAbortedError instead of entering
+        disconnect recovery. No-op if not connected.
+
+        Business context: Lets users abandon a long exposure (clouds, wrong
+        target) immediately instead of waiting up to a minute, and lets
+        cancelled MCP tool calls release the camera.
+
+        Returns:
+            None.
+
+        Raises:
+            None. Driver errors are logged.
+
+        Example:
+            >>> camera.stop_exposure()  # From a UI handler or another task
+        """
+        instance = self._instance
+        if instance is None:
+            return
+        self._abort_requested.set()
+        try:
+            instance.stop_exposure()
+        except Exception as e:
+            logger.warning(
+                "Failed to stop exposure",
+                camera_id=self._config.camera_id,
+                error=str(e),
+            )
+
+    async def set_control_async(self, name: str, value: int) -> None:
+        """Async set_control() on the camera's worker thread.
+
+        Queues behind any exposure in progress on this camera.
+
+        Args:
+            name: Control name (e.g., "Gain").
+            value: Integer value.
+
+        Raises:
+            CameraNotConnectedError: If not connected.
+            CameraError: If the driver rejects the control or value.
+        """
+        await self._run_blocking(self.set_control, name, value)
+
+    async def get_control_async(self, name: str) -> int:
+        """Async get_control() on the camera's worker thread.
+
+        Args:
+            name: Control name (e.g., "Temperature").
+
+        Returns:
+            Current integer value.
+
+        Raises:
+            CameraNotConnectedError: If not connected.
+            CameraError: If the query fails.
+        """
+        return await self._run_blocking(self.get_control, name)
+
+    async def get_control_info_async(self, name: str) -> dict[str, Any]:
+        """Async get_control_info() on the camera's worker thread.
+
+        Args:
+            name: Control name.
+
+        Returns:
+            Driver control dict (control, value, auto, ...).
+
+        Raises:
+            CameraNotConnectedError: If not connected.
+            CameraError: If the query fails.
+        """
+        return await self._run_blocking(self.get_control_info, name)
+
+    async def set_control_info_async(self, name: str, value: int) -> dict[str, Any]:
+        """Async set_control_info() on the camera's worker thread.
+
+        Args:
+            name: Control name.
+            value: Integer value (driver may clamp).
+
+        Returns:
+            Driver result dict with the value actually applied.
+
+        Raises:
+            CameraNotConnectedError: If not connected.
+            CameraError: If setting fails.
+        """
+        return await self._run_blocking(self.set_control_info, name, value)
+
     # Context manager support
 
     def __enter__(self) -> Camera:
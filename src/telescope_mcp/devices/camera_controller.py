@@ -17,11 +17,13 @@ Example:
     ))
 
     # result.secondary_frame captured at midpoint of primary
+    print(controller.timing_stats.get_summary("finder/main").p95_abs_error_us)
 """
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -31,15 +33,20 @@ if TYPE_CHECKING:
 
 # Import Clock from camera module to avoid duplication
 from telescope_mcp.devices.camera import Clock, SystemClock
+from telescope_mcp.observability import TimingStats, get_logger
 
 __all__ = [
     # Constants
     "TIMING_THRESHOLD_GOOD_MS",
     "TIMING_THRESHOLD_ACCEPTABLE_MS",
     "TIMING_THRESHOLD_POOR_MS",
+    "DEFAULT_SPIN_THRESHOLD_SEC",
     # Dataclasses
     "SyncCaptureConfig",
     "SyncCaptureResult",
+    "GroupCaptureMember",
+    "GroupMemberResult",
+    "GroupCaptureResult",
     # Exceptions
     "CameraControllerError",
     "CameraNotFoundError",
@@ -49,6 +56,8 @@ __all__ = [
 ]
 
 
+logger = get_logger(__name__)
+
 # --- Timing Thresholds ---
 # Named constants for synchronization quality assessment
 TIMING_THRESHOLD_GOOD_MS: float = 50.0
@@ -60,6 +69,13 @@ TIMING_THRESHOLD_ACCEPTABLE_MS: float = 200.0
 TIMING_THRESHOLD_POOR_MS: float = 500.0
 """Timing error above this may cause platesolve failures."""
 
+DEFAULT_SPIN_THRESHOLD_SEC: float = 0.002
+"""Final stretch of a scheduled start that is spin-waited instead of slept.
+
+OS sleep overshoots by up to a scheduler tick; sleeping until this close
+to the deadline and spinning the rest keeps start error sub-millisecond.
+"""
+
 
 @dataclass
 class SyncCaptureConfig:
@@ -138,6 +154,99 @@ class SyncCaptureResult:
         return self.timing_error_us / 1000.0
 
 
+@dataclass
+class GroupCaptureMember:
+    """One camera in a synchronized capture group.
+
+    Attributes:
+        camera: Registered camera name
+        exposure_us: Exposure time in microseconds
+        gain: Optional gain override
+    """
+
+    camera: str
+    exposure_us: int
+    gain: int | None = None
+
+
+@dataclass
+class GroupMemberResult:
+    """Per-camera result of a synchronized group capture.
+
+    Attributes:
+        frame: Capture result for this camera
+        start: When this camera's exposure started
+        ideal_offset_us: Scheduled start relative to the reference camera
+        actual_offset_us: Measured start relative to the reference camera
+        timing_error_us: actual - ideal (positive = late); 0 for reference
+    """
+
+    frame: CaptureResult
+    start: datetime
+    ideal_offset_us: int
+    actual_offset_us: int
+    timing_error_us: int
+
+    @property
+    def timing_error_ms(self) -> float:
+        """Timing error in milliseconds.
+
+        Returns:
+            timing_error_us / 1000.
+
+        Example:
+            >>> result.members["guide"].timing_error_ms
+            0.12
+        """
+        return self.timing_error_us / 1000.0
+
+
+@dataclass
+class GroupCaptureResult:
+    """Result of a synchronized capture across N cameras.
+
+    Attributes:
+        reference: Name of the camera with the longest exposure, which
+            started first and defines offset 0
+        members: Camera name -> GroupMemberResult, in request order
+    """
+
+    reference: str
+    members: dict[str, GroupMemberResult]
+
+    @property
+    def max_abs_timing_error_us(self) -> int:
+        """Worst absolute timing error across the group.
+
+        Returns:
+            Largest |timing_error_us| of any member (0 for one camera).
+
+        Example:
+            >>> if result.max_abs_timing_error_us > 1000:
+            ...     logger.warning("Group sync degraded")
+        """
+        return max(abs(m.timing_error_us) for m in self.members.values())
+
+
+@dataclass
+class _ScheduledCapture:
+    """Mutable per-camera state for one scheduled capture run."""
+
+    name: str
+    camera: Camera
+    exposure_us: int
+    gain: int | None
+    offset_us: int = 0
+    result: CaptureResult | None = None
+    error: Exception | None = None
+    start_mono: float = 0.0
+    start_wall: datetime | None = None
+
+    def actual_offset_us(self, reference: _ScheduledCapture) -> int:
+        """Measured start of this capture relative to reference, in µs."""
+        return int((self.start_mono - reference.start_mono) * 1_000_000)
+
+
 class CameraControllerError(Exception):
     """Base exception for controller operations."""
 
@@ -239,13 +348,16 @@ class CameraController:
     require precise timing across multiple devices.
 
     Thread Safety:
-        Sync capture uses threads internally but the controller
-        itself is not thread-safe for concurrent operations.
+        Sync capture runs each camera on that Camera's own worker thread
+        (Camera.submit), so it is serialized with the camera's async
+        captures and control calls. The controller itself is not
+        thread-safe for concurrent operations.
 
     Example:
         controller = CameraController({
             "finder": finder_camera,
             "main": main_camera,
+            "guide": guide_camera,
         })
 
         # Synchronized capture for alignment
@@ -257,12 +369,22 @@ class CameraController:
         ))
 
         print(f"Timing error: {result.timing_error_ms:.1f}ms")
+
+        # All three cameras centered on the same instant
+        group = controller.sync_capture_group([
+            GroupCaptureMember("finder", 10_000_000),
+            GroupCaptureMember("main", 2_000_000),
+            GroupCaptureMember("guide", 500_000),
+        ])
     """
 
     def __init__(
         self,
         cameras: dict[str, Camera] | None = None,
         clock: Clock | None = None,
+        *,
+        spin_threshold_sec: float = DEFAULT_SPIN_THRESHOLD_SEC,
+        timing_stats: TimingStats | None = None,
     ) -> None:
         """Create controller with cameras and optional clock.
 
@@ -279,12 +401,17 @@ class CameraController:
                 Cameras should typically be connected before adding.
             clock: Clock implementation for timing (default: SystemClock).
                 Inject MockClock for testing sync_capture timing logic.
+            spin_threshold_sec: Final seconds before the secondary start
+                that are spin-waited on clock.monotonic() rather than
+                slept. Use 0 with clocks that only advance on sleep().
+            timing_stats: Collector for sync timing error (default: a new
+                TimingStats). Inject a shared one to aggregate controllers.
 
         Returns:
             None. Controller ready for add_camera() or sync_capture().
 
         Raises:
-            No exceptions raised. Empty cameras dict is valid initial state.
+            ValueError: If spin_threshold_sec is negative.
 
         Example:
             >>> # Production usage
@@ -295,8 +422,14 @@ class CameraController:
             >>> # Testing with mock clock
             >>> controller = CameraController(clock=MockClock())
         """
+        if spin_threshold_sec < 0:
+            raise ValueError(
+                f"spin_threshold_sec must be >= 0, got {spin_threshold_sec}"
+            )
         self._cameras: dict[str, Camera] = cameras or {}
         self._clock = clock or SystemClock()
+        self._spin_threshold_sec = spin_threshold_sec
+        self._timing_stats = timing_stats or TimingStats()
 
     def add_camera(
         self,
@@ -398,6 +531,43 @@ class CameraController:
         """
         return list(self._cameras.keys())
 
+    @property
+    def timing_stats(self) -> TimingStats:
+        """Running statistics of sync_capture timing error.
+
+        Each sync_capture records its timing_error_us under
+        "<primary>/<secondary>", giving mean, stddev, p95 and max error
+        across repeated alignment captures. The running summary is also
+        logged after every capture ("Sync capture timing").
+
+        Returns:
+            TimingStats shared by all sync captures on this controller.
+
+        Example:
+            >>> summary = controller.timing_stats.get_summary("finder/main")
+            >>> summary.p95_abs_error_us < 1000
+            True
+        """
+        return self._timing_stats
+
+    def _wait_until(self, deadline: float) -> None:
+        """Block until clock.monotonic() reaches deadline.
+
+        Sleeps until spin_threshold_sec before the deadline, then spins
+        on the clock so the wake-up is not delayed by scheduler jitter.
+
+        Args:
+            deadline: Target time on the controller clock (seconds).
+        """
+        clock = self._clock
+        spin = self._spin_threshold_sec
+        while True:
+            remaining = deadline - clock.monotonic()
+            if remaining <= 0:
+                return
+            if remaining > spin:
+                clock.sleep(remaining - spin)
+
     def calculate_sync_timing(
         self,
         primary_exposure_us: int,
@@ -463,6 +633,10 @@ class CameraController:
             config: Sync capture configuration with camera names, exposure
                 times (microseconds), and optional gain overrides.
 
+        The secondary is scheduled from the primary's recorded start on its
+        camera's worker thread using sleep followed by a short spin, and
+        each result's timing error is added to timing_stats.
+
         Returns:
             SyncCaptureResult with both frames, timing measurements, and
             timing_error_ms for quality assessment (< 50ms is good).
@@ -490,153 +664,251 @@ class CameraController:
             config.primary_exposure_us,
             config.secondary_exposure_us,
         )
-        delay_seconds = delay_us / 1_000_000.0
-
-        # Results storage
-        primary_result: CaptureResult | None = None
-        secondary_result: CaptureResult | None = None
-        primary_error: Exception | None = None
-        secondary_error: Exception | None = None
-
-        # Timing tracking
-        primary_start_mono: float = 0.0
-        secondary_start_mono: float = 0.0
-        primary_start_wall: datetime | None = None
-        secondary_start_wall: datetime | None = None
-
-        def capture_primary() -> None:
-            """Thread worker for primary camera capture (starts immediately).
-
-            Records timestamps and captures primary frame. Exceptions stored
-            in primary_error for main thread handling via nonlocal.
-
-            Business context: Primary camera (typically long-exposure finder)
-            starts immediately while secondary waits. Timestamps enable
-            timing error calculation for platesolve quality assessment.
-
-            Implementation:
-                1. Record monotonic timestamp (for delay calculation)
-                2. Record wall-clock timestamp (for metadata/logs)
-                3. Call capture_raw with configured exposure/gain
-                4. Store result or exception via nonlocal
-
-            Args:
-                Uses enclosing scope: primary_cam, config, self._clock.
-                Modifies via nonlocal: primary_result, primary_error,
-                    primary_start_mono, primary_start_wall.
-
-            Returns:
-                None. Results stored in enclosing scope variables.
-
-            Raises:
-                No exceptions raised; all caught and stored in primary_error.
-            """
-            nonlocal \
-                primary_result, \
-                primary_error, \
-                primary_start_mono, \
-                primary_start_wall
-            try:
-                primary_start_mono = self._clock.monotonic()
-                primary_start_wall = datetime.now(UTC)
-                primary_result = primary_cam.capture_raw(
-                    exposure_us=config.primary_exposure_us,
-                    gain=config.primary_gain,
-                )
-            except Exception as e:
-                primary_error = e
-
-        def capture_secondary() -> None:
-            """Thread worker for secondary camera capture (waits for delay).
-
-            Sleeps for calculated delay to center exposures, then captures.
-            Exceptions stored in secondary_error for main thread via nonlocal.
-
-            Business context: Secondary camera (typically fast guide/main)
-            waits until its exposure would be temporally centered within
-            the primary's exposure, minimizing star position drift.
-
-            Implementation:
-                1. Sleep for calculated delay_seconds
-                2. Record monotonic timestamp (for actual delay measurement)
-                3. Record wall-clock timestamp (for metadata/logs)
-                4. Call capture_raw with configured exposure/gain
-                5. Store result or exception via nonlocal
-
-            Args:
-                Uses enclosing scope: secondary_cam, config, delay_seconds,
-                    self._clock.
-                Modifies via nonlocal: secondary_result, secondary_error,
-                    secondary_start_mono, secondary_start_wall.
 
-            Returns:
-                None. Results stored in enclosing scope variables.
-
-            Raises:
-                No exceptions raised; all caught and stored in secondary_error.
-            """
-            nonlocal \
-                secondary_result, \
-                secondary_error, \
-                secondary_start_mono, \
-                secondary_start_wall
-            try:
-                # Wait for the calculated delay
-                self._clock.sleep(delay_seconds)
-
-                secondary_start_mono = self._clock.monotonic()
-                secondary_start_wall = datetime.now(UTC)
-                secondary_result = secondary_cam.capture_raw(
-                    exposure_us=config.secondary_exposure_us,
-                    gain=config.secondary_gain,
-                )
-            except Exception as e:
-                secondary_error = e
-
-        # Start both captures - primary immediately, secondary after delay
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            primary_future = executor.submit(capture_primary)
-            secondary_future = executor.submit(capture_secondary)
-
-            # Wait for both to complete
-            primary_future.result()
-            secondary_future.result()
+        primary = _ScheduledCapture(
+            config.primary, primary_cam, config.primary_exposure_us, config.primary_gain
+        )
+        secondary = _ScheduledCapture(
+            config.secondary,
+            secondary_cam,
+            config.secondary_exposure_us,
+            config.secondary_gain,
+            offset_us=delay_us,
+        )
+        self._run_schedule([primary, secondary])
 
         # Check for errors (use structured exceptions with context)
-        if primary_error:
-            raise SyncCaptureError(
-                f"Primary capture failed: {primary_error}",
-                camera_role="primary",
-                original_error=primary_error,
-            ) from primary_error
-        if secondary_error:
-            raise SyncCaptureError(
-                f"Secondary capture failed: {secondary_error}",
-                camera_role="secondary",
-                original_error=secondary_error,
-            ) from secondary_error
-        if primary_result is None or secondary_result is None:
+        for role, item in (("primary", primary), ("secondary", secondary)):
+            if item.error:
+                raise SyncCaptureError(
+                    f"{role.capitalize()} capture failed: {item.error}",
+                    camera_role=role,
+                    original_error=item.error,
+                ) from item.error
+        if primary.result is None or secondary.result is None:
             raise SyncCaptureError(
                 "Capture returned None unexpectedly",
-                camera_role="primary" if primary_result is None else "secondary",
+                camera_role="primary" if primary.result is None else "secondary",
             )
 
         # Timing is guaranteed non-None here: set before capture_raw in try block,
         # and any exception would have been caught and raised above
-        assert primary_start_wall is not None  # for type checker
-        assert secondary_start_wall is not None  # for type checker
+        assert primary.start_wall is not None  # for type checker
+        assert secondary.start_wall is not None  # for type checker
 
-        # Calculate actual timing
-        actual_delay_seconds = secondary_start_mono - primary_start_mono
-        actual_delay_us = int(actual_delay_seconds * 1_000_000)
+        actual_delay_us = secondary.actual_offset_us(primary)
         timing_error_us = actual_delay_us - delay_us
+        self._record_timing(f"{config.primary}/{config.secondary}", timing_error_us)
 
         return SyncCaptureResult(
-            primary_frame=primary_result,
-            secondary_frame=secondary_result,
-            primary_start=primary_start_wall,
-            secondary_start=secondary_start_wall,
+            primary_frame=primary.result,
+            secondary_frame=secondary.result,
+            primary_start=primary.start_wall,
+            secondary_start=secondary.start_wall,
             ideal_secondary_start_us=delay_us,
             actual_secondary_start_us=actual_delay_us,
             timing_error_us=timing_error_us,
         )
+
+    def calculate_group_timing(self, exposures_us: Mapping[str, int]) -> dict[str, int]:
+        """Calculate start offsets that align every exposure midpoint.
+
+        Generalizes calculate_sync_timing to any number of cameras: the
+        longest exposure starts at offset 0 and every other camera starts
+        (longest / 2) - (own / 2) later.
+
+        Args:
+            exposures_us: Camera name -> exposure time in microseconds.
+                Must be non-empty with positive values.
+
+        Returns:
+            Camera name -> start offset in microseconds after the longest
+            exposure starts (0 for the longest).
+
+        Raises:
+            ValueError: If empty or any exposure is not positive.
+
+        Example:
+            >>> controller.calculate_group_timing(
+            ...     {"finder": 10_000_000, "main": 2_000_000, "guide": 500_000}
+            ... )
+            {'finder': 0, 'main': 4000000, 'guide': 4750000}
+        """
+        if not exposures_us:
+            raise ValueError("exposures_us must not be empty")
+        for name, exposure_us in exposures_us.items():
+            if exposure_us <= 0:
+                raise ValueError(
+                    f"exposure_us for '{name}' must be positive, got {exposure_us}"
+                )
+        longest_half = max(exposures_us.values()) // 2
+        return {
+            name: longest_half - exposure_us // 2
+            for name, exposure_us in exposures_us.items()
+        }
+
+    def sync_capture_group(
+        self, members: Sequence[GroupCaptureMember]
+    ) -> GroupCaptureResult:
+        """Capture on any number of cameras with exposure midpoints aligned.
+
+        The camera with the longest exposure (first listed on ties) starts
+        immediately and is the reference; every other camera starts on its
+        own worker at the offset from calculate_group_timing, so all
+        exposures are centered on the same instant. All members run in
+        parallel, so adding a guide camera costs no extra latency.
+
+        Timeline for 10s finder, 2s main, 0.5s guide::
+
+            finder: |==========10s==========|
+            main:        |===2s===|
+            guide:          |.5|
+                    ^    ^   ^
+                    0    4s  4.75s
+
+        Args:
+            members: Cameras to capture, each with its own exposure and
+                optional gain. Names must be unique.
+
+        Returns:
+            GroupCaptureResult with one GroupMemberResult per camera and
+            the reference camera name. Each member's timing error is also
+            recorded in timing_stats under "<reference>/<name>".
+
+        Raises:
+            ValueError: If members is empty, names repeat, or an exposure
+                is not positive.
+            CameraNotFoundError: If a camera name is not registered.
+            SyncCaptureError: If any capture fails. camera_role is the
+                failing camera's name.
+
+        Example:
+            >>> result = controller.sync_capture_group([
+            ...     GroupCaptureMember("finder", 10_000_000),
+            ...     GroupCaptureMember("main", 2_000_000, gain=120),
+            ...     GroupCaptureMember("guide", 500_000),
+            ... ])
+            >>> result.max_abs_timing_error_us < 1000
+            True
+        """
+        names = [member.camera for member in members]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate camera in group: {names}")
+        offsets = self.calculate_group_timing(
+            {member.camera: member.exposure_us for member in members}
+        )
+        plan = [
+            _ScheduledCapture(
+                member.camera,
+                self.get_camera(member.camera),
+                member.exposure_us,
+                member.gain,
+                offset_us=offsets[member.camera],
+            )
+            for member in members
+        ]
+        # Reference (offset 0, longest exposure) goes first
+        plan.sort(key=lambda item: item.offset_us)
+        reference = plan[0]
+
+        self._run_schedule(plan)
+
+        for item in plan:
+            if item.error:
+                raise SyncCaptureError(
+                    f"Capture failed on '{item.name}': {item.error}",
+                    camera_role=item.name,
+                    original_error=item.error,
+                ) from item.error
+            if item.result is None:
+                raise SyncCaptureError(
+                    f"Capture on '{item.name}' returned None unexpectedly",
+                    camera_role=item.name,
+                )
+
+        results: dict[str, GroupMemberResult] = {}
+        for item in plan:
+            assert item.result is not None  # for type checker
+            assert item.start_wall is not None  # for type checker
+            actual_offset_us = item.actual_offset_us(reference)
+            timing_error_us = actual_offset_us - item.offset_us
+            if item is not reference:
+                self._record_timing(f"{reference.name}/{item.name}", timing_error_us)
+            results[item.name] = GroupMemberResult(
+                frame=item.result,
+                start=item.start_wall,
+                ideal_offset_us=item.offset_us,
+                actual_offset_us=actual_offset_us,
+                timing_error_us=timing_error_us,
+            )
+        # Report in the caller's order
+        return GroupCaptureResult(
+            reference=reference.name,
+            members={name: results[name] for name in names},
+        )
+
+    def _record_timing(self, name: str, error_us: int) -> None:
+        """Record a sync timing error and log the running summary.
+
+        Logged at WARNING when the error exceeds TIMING_THRESHOLD_POOR_MS,
+        so degraded alignment shows up without polling timing_stats.
+
+        Args:
+            name: Operation label ("<reference>/<camera>").
+            error_us: Signed start error in microseconds.
+        """
+        self._timing_stats.record(name, error_us)
+        summary = self._timing_stats.get_summary(name)
+        poor = abs(error_us) > TIMING_THRESHOLD_POOR_MS * 1000
+        (logger.warning if poor else logger.info)(
+            "Sync capture timing",
+            cameras=name,
+            error_us=error_us,
+            count=summary.count,
+            mean_abs_error_us=round(summary.mean_abs_error_us, 1),
+            p95_abs_error_us=round(summary.p95_abs_error_us, 1),
+            max_abs_error_us=round(summary.max_abs_error_us, 1),
+        )
+
+    def _run_schedule(self, plan: list[_ScheduledCapture]) -> None:
+        """Run scheduled captures in parallel on the cameras' own workers.
+
+        Each capture is queued with Camera.submit(), so it never overlaps
+        another SDK call on the same handle. plan[0] is the reference and
+        starts immediately. Each other entry waits for the reference's
+        recorded start, then sleeps+spins until its offset so worker
+        wake-up latency does not add error. Results, errors and start times
+        are stored on the plan entries.
+
+        Args:
+            plan: Captures to run; plan[0] must have offset 0.
+        """
+        reference = plan[0]
+        reference_started = threading.Event()
+
+        def run(item: _ScheduledCapture) -> None:
+            """Worker body: wait for the scheduled start, then capture.
+
+            Exceptions are stored on the item for the calling thread.
+            """
+            try:
+                if item is not reference:
+                    reference_started.wait()
+                    self._wait_until(reference.start_mono + item.offset_us / 1e6)
+                item.start_mono = self._clock.monotonic()
+                item.start_wall = datetime.now(UTC)
+                if item is reference:
+                    reference_started.set()
+                item.result = item.camera.capture_raw(
+                    exposure_us=item.exposure_us,
+                    gain=item.gain,
+                )
+            except Exception as e:
+                item.error = e
+            finally:
+                if item is reference:
+                    reference_started.set()
+
+        futures = [item.camera.submit(run, item) for item in plan]
+        for future in futures:
+            future.result()
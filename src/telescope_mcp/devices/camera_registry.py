@@ -1,9 +1,10 @@
 """Camera registry with discovery and singleton management.
 
 This module provides CameraRegistry for centralized camera access:
-- Discovery of connected cameras
+- Discovery of connected cameras (TTL-cached)
 - Singleton Camera instances per camera_id
 - Automatic recovery from disconnects
+- Optional background hotplug monitor with subscriber notifications
 
 Follows SOLID principles:
 - Single Responsibility: Registry manages camera lifecycle only
@@ -25,10 +26,18 @@ Example:
         camera.connect()
         result = camera.capture()
     # All cameras disconnected on exit
+
+Hotplug Example:
+    registry.subscribe(lambda event: print(event.kind, event.camera_id))
+    registry.start_monitor(interval_sec=5.0)  # pre-opens attached cameras
 """
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from enum import Enum
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -44,6 +53,81 @@ from telescope_mcp.devices.camera import (
     OverlayRenderer,
     SystemClock,
 )
+from telescope_mcp.observability import get_logger
+
+logger = get_logger(__name__)
+
+#: Seconds a discovery result is served from memory before discover()
+#: re-scans the bus. None disables expiry (cache until refresh=True).
+DEFAULT_DISCOVERY_TTL_SEC: float = 30.0
+
+#: Seconds between hotplug monitor scans. Low frequency on purpose: each
+#: scan is a USB enumeration.
+DEFAULT_HOTPLUG_INTERVAL_SEC: float = 5.0
+
+
+class HotplugEventKind(str, Enum):
+    """Change detected between two discovery scans."""
+
+    ATTACHED = "attached"
+    DETACHED = "detached"
+
+
+@dataclass(frozen=True)
+class HotplugEvent:
+    """A camera appeared on or disappeared from the bus.
+
+    Attributes:
+        kind: ATTACHED or DETACHED
+        camera_id: Camera index from discovery
+        info: CameraInfo from the scan that saw it (last known if detached)
+    """
+
+    kind: HotplugEventKind
+    camera_id: int
+    info: CameraInfo | None = None
+
+
+HotplugCallback = Callable[[HotplugEvent], None]
+"""Subscriber signature; called on the scanning thread."""
+
+
+def _device_identity(info: CameraInfo) -> tuple[str, int, int, bool]:
+    """Return what distinguishes one physical camera model from another.
+
+    Discovery indices are positional: unplugging camera 0 renumbers the
+    others, so an index alone does not say which device is behind it.
+    """
+    return (info.name, info.max_width, info.max_height, info.is_color)
+
+
+def _diff_discovery(
+    previous: Mapping[int, CameraInfo], current: Mapping[int, CameraInfo]
+) -> list[HotplugEvent]:
+    """Return attach/detach events between two discovery results.
+
+    An index whose device identity changed (e.g. renumbering after an
+    unplug) is reported as DETACHED for the old device and ATTACHED for
+    the new one, so subscribers never keep a camera_id bound to the wrong
+    device.
+    """
+
+    def gone(cam_id: int, info: CameraInfo, other: Mapping[int, CameraInfo]) -> bool:
+        return cam_id not in other or (
+            _device_identity(other[cam_id]) != _device_identity(info)
+        )
+
+    events = [
+        HotplugEvent(HotplugEventKind.DETACHED, cam_id, info)
+        for cam_id, info in previous.items()
+        if gone(cam_id, info, current)
+    ]
+    events.extend(
+        HotplugEvent(HotplugEventKind.ATTACHED, cam_id, info)
+        for cam_id, info in current.items()
+        if gone(cam_id, info, previous)
+    )
+    return events
 
 
 class CameraNotInRegistryError(Exception):
@@ -117,8 +201,9 @@ class RecoveryStrategy:
 
         Returns:
             True if camera_id found in post-rescan discovery (available for
-            reconnection). False if camera not found or driver raised exceptions
-            during discovery.
+            reconnection) with the same device behind it. False if camera not
+            found, the index now belongs to a different device (renumbering
+            after an unplug), or driver raised exceptions during discovery.
 
         Raises:
             None. Catches all exceptions during discover() and returns False.
@@ -135,7 +220,8 @@ class RecoveryStrategy:
             ...     print("Camera still unavailable")
         """
         cameras = self._registry.discover(refresh=True)
-        return camera_id in cameras
+        info = cameras.get(camera_id)
+        return info is not None and self._registry._is_bound_device(camera_id, info)
 
 
 class NullRecoveryStrategy:
@@ -195,13 +281,18 @@ class CameraRegistry:
     """Centralized camera discovery and singleton management.
 
     Provides:
-    - Camera discovery with caching
+    - Camera discovery with TTL caching
     - Singleton Camera instances per camera_id
     - Automatic cleanup via context manager
     - Injectable dependencies (renderer, clock, hooks) for created cameras
+    - Optional hotplug monitor (attach/detach events, pre-open)
 
     Thread Safety:
-        Not thread-safe. Use external synchronization if needed.
+        All registry state (discovery cache, subscribers, Camera instances
+        and their device bindings) is guarded by one re-entrant lock, so
+        the hotplug monitor can evict and pre-open cameras while tools call
+        get() from other threads. The registry connects and disconnects its
+        cameras under that lock; subscriber callbacks run outside it.
 
     Example:
         with CameraRegistry(driver) as registry:
@@ -218,6 +309,8 @@ class CameraRegistry:
         clock: Clock | None = None,
         hooks: CameraHooks | None = None,
         coordinate_provider: CoordinateProvider | None = None,
+        *,
+        discovery_ttl_sec: float | None = DEFAULT_DISCOVERY_TTL_SEC,
     ) -> None:
         """Create registry with driver and optional dependencies.
 
@@ -237,12 +330,14 @@ class CameraRegistry:
             coordinate_provider: Provider for telescope pointing coordinates
                 passed to created cameras. When provided, coordinates are
                 automatically injected into every CaptureResult.
+            discovery_ttl_sec: Seconds discover() serves cached results
+                before re-scanning. None caches until refresh=True.
 
         Returns:
             None. Registry initialized, ready for discover().
 
         Raises:
-            No exceptions raised.
+            ValueError: If discovery_ttl_sec is negative.
 
         Example:
             from telescope_mcp.drivers.cameras import DigitalTwinCameraDriver
@@ -258,7 +353,20 @@ class CameraRegistry:
         self._coordinate_provider = coordinate_provider
 
         self._cameras: dict[int, Camera] = {}
+        # Device identity each Camera was created for, by camera_id
+        self._bound: dict[int, tuple[str, int, int, bool]] = {}
+        if discovery_ttl_sec is not None and discovery_ttl_sec < 0:
+            raise ValueError(
+                f"discovery_ttl_sec must be >= 0 or None, got {discovery_ttl_sec}"
+            )
         self._discovery_cache: dict[int, CameraInfo] | None = None
+        self._discovery_ttl_sec = discovery_ttl_sec
+        self._discovered_at: float = 0.0
+        # Guards the discovery cache, subscribers, _cameras and _bound
+        self._lock = threading.RLock()
+        self._subscribers: list[HotplugCallback] = []
+        self._monitor_thread: threading.Thread | None = None
+        self._monitor_stop = threading.Event()
         self._recovery_strategy: RecoveryStrategy | None = None
 
     @property
@@ -298,7 +406,12 @@ class CameraRegistry:
         """Discover connected cameras.
 
         Scans for available cameras using the driver and caches results.
-        Subsequent calls return cached results unless refresh=True.
+        Subsequent calls return cached results (a memory lookup, no USB
+        traffic) until discovery_ttl_sec elapses or refresh=True. When a
+        re-scan finds cameras added or removed, subscribers receive
+        HotplugEvents. Cameras from get() whose device left their index
+        are disconnected and dropped, so the next get() opens the device
+        now at that index.
 
         Args:
             refresh: Force re-discovery ignoring cache. Defaults to False.
@@ -315,13 +428,16 @@ class CameraRegistry:
                 print(f"Camera {cam_id}: {info.name} "
                       f"({info.max_width}x{info.max_height})")
         """
-        if self._discovery_cache is None or refresh:
-            raw = self._driver.get_connected_cameras()
-            self._discovery_cache = {}
+        with self._lock:
+            previous = self._discovery_cache
+            if previous is not None and not refresh and not self._cache_expired():
+                return previous
 
+            raw = self._driver.get_connected_cameras()
+            cache: dict[int, CameraInfo] = {}
             for cam_id, info in raw.items():
                 # Convert dict to CameraInfo (all drivers return dicts)
-                self._discovery_cache[cam_id] = CameraInfo(
+                cache[cam_id] = CameraInfo(
                     camera_id=cam_id,
                     name=info.get("name", f"Camera {cam_id}"),
                     max_width=info.get("max_width", 0),
@@ -331,8 +447,226 @@ class CameraRegistry:
                     supported_bins=info.get("supported_bins", [1]),
                     controls=info.get("controls", {}),
                 )
+            self._discovery_cache = cache
+            self._discovered_at = self._clock.monotonic()
+
+        if previous is not None:
+            events = _diff_discovery(previous, cache)
+            self._evict_detached(events)
+            self._notify(events)
+        return cache
+
+    def _evict_detached(self, events: list[HotplugEvent]) -> None:
+        """Disconnect and forget Cameras whose device was detached."""
+        for event in events:
+            if event.kind is not HotplugEventKind.DETACHED:
+                continue
+            with self._lock:
+                camera = self._cameras.pop(event.camera_id, None)
+            if camera is None:
+                continue
+            logger.info("Evicted detached camera", camera_id=event.camera_id)
+            if camera.is_connected:
+                try:
+                    camera.disconnect()
+                except Exception as e:
+                    logger.warning(
+                        "Failed to disconnect detached camera",
+                        camera_id=event.camera_id,
+                        error=str(e),
+                    )
+
+    def _is_bound_device(self, camera_id: int, info: CameraInfo) -> bool:
+        """Return False if camera_id's Camera was created for another device."""
+        with self._lock:
+            bound = self._bound.get(camera_id)
+        return bound is None or bound == _device_identity(info)
+
+    def _cache_expired(self) -> bool:
+        """Return True if the discovery cache is older than the TTL."""
+        ttl = self._discovery_ttl_sec
+        return ttl is not None and self._clock.monotonic() - self._discovered_at >= ttl
+
+    def subscribe(self, callback: HotplugCallback) -> Callable[[], None]:
+        """Register a callback for camera attach/detach events.
+
+        Callbacks run on the thread that performed the scan (the monitor
+        thread, or the caller of discover(refresh=True)). Exceptions are
+        logged and do not affect other subscribers.
+
+        Args:
+            callback: Called with a HotplugEvent for each change.
+
+        Returns:
+            Function that removes the subscription when called.
+
+        Example:
+            >>> unsubscribe = registry.subscribe(print)
+            >>> unsubscribe()
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            """Remove this subscription (idempotent)."""
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def _notify(self, events: list[HotplugEvent]) -> None:
+        """Deliver hotplug events to subscribers, isolating failures."""
+        if not events:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for event in events:
+            logger.info(
+                "Camera hotplug", kind=event.kind.value, camera_id=event.camera_id
+            )
+            for callback in subscribers:
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.warning(
+                        "Hotplug subscriber failed",
+                        camera_id=event.camera_id,
+                        error=str(e),
+                    )
+
+    @property
+    def is_monitoring(self) -> bool:
+        """Whether the background hotplug monitor thread is running.
+
+        Returns:
+            True between start_monitor() and stop_monitor().
+
+        Example:
+            >>> registry.start_monitor()
+            >>> registry.is_monitoring
+            True
+        """
+        thread = self._monitor_thread
+        return thread is not None and thread.is_alive()
 
-        return self._discovery_cache
+    def start_monitor(
+        self,
+        interval_sec: float = DEFAULT_HOTPLUG_INTERVAL_SEC,
+        *,
+        pre_open: bool = True,
+    ) -> None:
+        """Start a low-frequency background scan for plug/unplug events.
+
+        Every interval_sec the monitor calls scan_once(), which refreshes
+        the discovery cache (so discover() stays a memory lookup) and
+        publishes changes to subscribers. Scans are skipped while any
+        registry camera is mid-exposure so enumeration never competes with
+        a capture. With pre_open, attached cameras are connected right
+        away, which also reopens a registry camera that dropped off the
+        bus during a USB reset before its next capture fails.
+
+        Args:
+            interval_sec: Seconds between scans. Must be positive.
+            pre_open: Connect cameras as soon as they attach.
+
+        Raises:
+            ValueError: If interval_sec is not positive.
+
+        Example:
+            >>> registry.start_monitor(interval_sec=10.0)
+            >>> registry.stop_monitor()
+        """
+        if interval_sec <= 0:
+            raise ValueError(f"interval_sec must be positive, got {interval_sec}")
+        if self.is_monitoring:
+            return
+        self._monitor_stop.clear()
+        self._monitor_thread = threading.Thread(
+            target=self._monitor_loop,
+            args=(interval_sec, pre_open),
+            name="camera-hotplug",
+            daemon=True,
+        )
+        self._monitor_thread.start()
+        logger.info("Camera hotplug monitor started", interval_sec=interval_sec)
+
+    def stop_monitor(self, timeout: float | None = 5.0) -> None:
+        """Stop the hotplug monitor and wait for its thread to exit.
+
+        Safe to call when the monitor is not running.
+
+        Args:
+            timeout: Seconds to wait for the thread (None waits forever).
+
+        Example:
+            >>> registry.stop_monitor()
+        """
+        thread, self._monitor_thread = self._monitor_thread, None
+        self._monitor_stop.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _monitor_loop(self, interval_sec: float, pre_open: bool) -> None:
+        """Monitor thread body: scan every interval until stopped."""
+        while not self._monitor_stop.wait(interval_sec):
+            self.scan_once(pre_open=pre_open)
+
+    def scan_once(self, *, pre_open: bool = True) -> list[HotplugEvent]:
+        """Run one hotplug scan (the monitor calls this every interval).
+
+        Args:
+            pre_open: Connect cameras reported as attached.
+
+        Returns:
+            Events detected by this scan. Empty if nothing changed, or if
+            the scan was deferred (a camera is exposing) or failed.
+
+        Example:
+            >>> for event in registry.scan_once():
+            ...     print(event.kind, event.camera_id)
+        """
+        with self._lock:
+            cameras = list(self._cameras.values())
+        if any(camera.is_exposing for camera in cameras):
+            logger.debug("Hotplug scan deferred, exposure in progress")
+            return []
+
+        with self._lock:
+            previous = self._discovery_cache
+        try:
+            current = self.discover(refresh=True)
+        except Exception as e:
+            logger.warning("Hotplug scan failed", error=str(e))
+            return []
+        if previous is None:
+            return []  # First scan is the baseline, not an attach event
+        events = _diff_discovery(previous, current)
+
+        if pre_open:
+            for event in events:
+                if event.kind is HotplugEventKind.ATTACHED:
+                    self._pre_open(event.camera_id)
+        return events
+
+    def _pre_open(self, camera_id: int) -> None:
+        """Connect an attached camera, logging instead of raising."""
+        try:
+            # Held across reconnect so a concurrent get() never sees (or
+            # connects) a half-reopened camera
+            with self._lock:
+                camera = self.get(camera_id)
+                if camera.is_connected:
+                    # Handle predates the camera dropping off the bus
+                    camera.disconnect()
+                camera.connect()
+            logger.info("Pre-opened attached camera", camera_id=camera_id)
+        except Exception as e:
+            logger.warning(
+                "Failed to pre-open attached camera",
+                camera_id=camera_id,
+                error=str(e),
+            )
 
     def get(
         self,
@@ -361,50 +695,51 @@ class CameraRegistry:
             camera = registry.get(0, auto_connect=True)
             result = camera.capture()
         """
-        # Ensure discovery has been run
-        if self._discovery_cache is None:
-            self.discover()
-
-        # Validate camera exists - cache is now guaranteed non-None
+        # Ensure discovery has been run; re-scan for unknown IDs only once
+        # the cache has expired (a hotplugged camera may have appeared).
+        # Scans run outside the lock so subscriber callbacks never hold it.
         cache = self._discovery_cache
-        assert cache is not None  # Set by discover() above
-        if camera_id not in cache:
-            raise CameraNotInRegistryError(
-                f"Camera {camera_id} not found. " f"Available: {list(cache.keys())}"
-            )
-
-        # Get or create singleton
-        if camera_id not in self._cameras:
-            # Use name from discovery if not provided
-            if name is None:
-                name = cache[camera_id].name
-
-            config = CameraConfig(
-                camera_id=camera_id,
-                name=name,
-            )
-
-            # Create recovery strategy lazily (needs self reference)
-            if self._recovery_strategy is None:
-                self._recovery_strategy = RecoveryStrategy(self)
-
-            camera = Camera(
-                driver=self._driver,
-                config=config,
-                renderer=self._renderer,
-                clock=self._clock,
-                hooks=self._hooks,
-                recovery=self._recovery_strategy,
-                coordinate_provider=self._coordinate_provider,
-            )
+        if cache is None or (camera_id not in cache and self._cache_expired()):
+            self.discover(refresh=True)
+
+        with self._lock:
+            # Re-read: a concurrent scan may have replaced the cache
+            cache = self._discovery_cache or {}
+            if camera_id not in cache:
+                raise CameraNotInRegistryError(
+                    f"Camera {camera_id} not found. Available: {list(cache.keys())}"
+                )
 
-            self._cameras[camera_id] = camera
+            # Get or create singleton
+            camera = self._cameras.get(camera_id)
+            if camera is None:
+                # Use name from discovery if not provided
+                if name is None:
+                    name = cache[camera_id].name
 
-        camera = self._cameras[camera_id]
+                config = CameraConfig(
+                    camera_id=camera_id,
+                    name=name,
+                )
 
-        if auto_connect and not camera.is_connected:
-            camera.connect()
+                # Create recovery strategy lazily (needs self reference)
+                if self._recovery_strategy is None:
+                    self._recovery_strategy = RecoveryStrategy(self)
+
+                camera = Camera(
+                    driver=self._driver,
+                    config=config,
+                    renderer=self._renderer,
+                    clock=self._clock,
+                    hooks=self._hooks,
+                    recovery=self._recovery_strategy,
+                    coordinate_provider=self._coordinate_provider,
+                )
+                self._cameras[camera_id] = camera
+                self._bound[camera_id] = _device_identity(cache[camera_id])
 
+            if auto_connect and not camera.is_connected:
+                camera.connect()
         return camera
 
     def has(self, camera_id: int) -> bool:
@@ -426,7 +761,8 @@ class CameraRegistry:
             if not registry.has(0):
                 camera = registry.get(0, auto_connect=True)
         """
-        return camera_id in self._cameras
+        with self._lock:
+            return camera_id in self._cameras
 
     def remove(self, camera_id: int) -> Camera | None:
         """Remove a camera from the registry.
@@ -448,7 +784,9 @@ class CameraRegistry:
             camera.disconnect()
             registry.remove(0)  # Free from registry
         """
-        return self._cameras.pop(camera_id, None)
+        with self._lock:
+            self._bound.pop(camera_id, None)
+            return self._cameras.pop(camera_id, None)
 
     @property
     def camera_ids(self) -> list[int]:
@@ -494,7 +832,8 @@ class CameraRegistry:
             ...     camera = registry.get(cam_id)
             ...     print(f"Camera {cam_id}: connected={camera.is_connected}")
         """
-        return list(self._cameras.keys())
+        with self._lock:
+            return list(self._cameras.keys())
 
     @property
     def discovered_ids(self) -> list[int]:
@@ -543,18 +882,19 @@ class CameraRegistry:
             >>> if set(registry.discovered_ids) == set(expected):
             ...     print("All cameras present")
         """
-        if self._discovery_cache is None:
-            return []
-        return list(self._discovery_cache.keys())
+        with self._lock:
+            if self._discovery_cache is None:
+                return []
+            return list(self._discovery_cache.keys())
 
     def clear(self) -> None:
         """Disconnect all cameras and clear registry (graceful shutdown).
 
-        Iterates through all Camera instances, disconnects each (releasing USB
-        resources), then clears registry and discovery cache. Safe to call
-        multiple times (idempotent). Errors during disconnect silently ignored
-        for best-effort cleanup. Called automatically by __exit__ for context
-        manager cleanup.
+        Stops the hotplug monitor, then iterates through all Camera instances,
+        disconnects each (releasing USB resources), and clears registry and
+        discovery cache. Safe to call multiple times (idempotent). Errors
+        during disconnect silently ignored for best-effort cleanup. Called
+        automatically by __exit__ for context manager cleanup.
 
         Business context: Essential for graceful application shutdown releasing
         exclusive camera resources (USB handles, driver allocations) so other
@@ -595,15 +935,18 @@ class CameraRegistry:
             >>> # Safe to call multiple times
             >>> registry.clear()  # No-op, no errors
         """
-        for camera in self._cameras.values():
-            if camera.is_connected:
-                try:
-                    camera.disconnect()
-                except Exception:  # noqa: S110
-                    pass  # Best effort cleanup - ignore disconnect failures
-
-        self._cameras.clear()
-        self._discovery_cache = None
+        self.stop_monitor()
+        with self._lock:
+            for camera in self._cameras.values():
+                if camera.is_connected:
+                    try:
+                        camera.disconnect()
+                    except Exception:  # noqa: S110
+                        pass  # Best effort cleanup - ignore disconnect failures
+
+            self._cameras.clear()
+            self._bound.clear()
+            self._discovery_cache = None
 
     # Context manager support
 
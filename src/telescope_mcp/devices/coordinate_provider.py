@@ -35,7 +35,7 @@ from typing import TYPE_CHECKING
 
 from telescope_mcp.devices.camera import CaptureCoordinates
 from telescope_mcp.observability import get_logger
-from telescope_mcp.utils.coordinates import altaz_to_radec
+from telescope_mcp.utils.coordinates import CoordinateTransformer, TransformMode
 
 if TYPE_CHECKING:
     from telescope_mcp.devices.sensor import Sensor
@@ -241,6 +241,10 @@ class SensorCoordinateProvider:
     coordinates (RA/Dec) for the configured observer location. Designed for
     injection into Camera instances for automatic coordinate capture.
 
+    With a sensor that buffers its stream, coordinates describe the
+    requested capture instant (interpolated from history) rather than
+    the moment metadata is assembled.
+
     Thread Safety:
         get_coordinates() performs BLOCKING I/O via Sensor.read_sync().
         In async contexts, wrap the call:
@@ -263,7 +267,7 @@ class SensorCoordinateProvider:
         print(f"RA: {coords['ra_hms']}, Dec: {coords['dec_dms']}")
     """
 
-    __slots__ = ("_sensor", "_location")
+    __slots__ = ("_sensor", "_location", "_transformer")
 
     def __init__(
         self,
@@ -272,6 +276,8 @@ class SensorCoordinateProvider:
         lon: float | None = None,
         elevation: float = 0.0,
         location: LocationConfig | None = None,
+        *,
+        mode: TransformMode | str = TransformMode.FAST,
     ) -> None:
         """Create sensor-based coordinate provider.
 
@@ -291,13 +297,18 @@ class SensorCoordinateProvider:
             elevation: Observer elevation in meters (if not using location).
             location: LocationConfig (alternative to lat/lon/elevation params).
                 If provided, lat/lon/elevation params are ignored.
+            mode: Transform engine. FAST (default) tags a frame in tens of
+                microseconds and is accurate to FAST_MODE_TOLERANCE_ARCSEC,
+                well below the IMU's pointing error; ASTROPY for reference
+                accuracy.
 
         Returns:
             None
 
         Raises:
             ValueError: If creating LocationConfig from lat/lon/elevation and
-                values are out of valid range (validation in LocationConfig).
+                values are out of valid range (validation in LocationConfig),
+                or mode is not a TransformMode value.
 
         Example:
             # Using explicit params
@@ -317,6 +328,14 @@ class SensorCoordinateProvider:
                 lon=lon if lon is not None else 0.0,
                 elevation=elevation,
             )
+        # Built once per provider: the location never changes, and per-call
+        # construction of astropy frames dominated capture tagging cost
+        self._transformer = CoordinateTransformer(
+            self._location.lat,
+            self._location.lon,
+            self._location.elevation,
+            mode=mode,
+        )
 
     @property
     def location(self) -> LocationConfig:
@@ -345,17 +364,25 @@ class SensorCoordinateProvider:
         """
         return self._location
 
-    def get_coordinates(self) -> CaptureCoordinates | None:
-        """Get current telescope pointing coordinates and environment from sensor.
+    def get_coordinates(
+        self, when: datetime | None = None
+    ) -> CaptureCoordinates | None:
+        """Get telescope pointing coordinates and environment from sensor.
 
         Reads ALT/AZ, temperature, and humidity from sensor synchronously,
-        converts ALT/AZ to RA/Dec using current time and configured observer
-        location. Returns None if sensor not connected or read fails.
+        converts ALT/AZ to RA/Dec for the capture instant and configured
+        observer location. Buffered sensors are interpolated to that
+        instant; others are read live. Returns None if sensor not
+        connected or read fails.
 
         Business context: Called at capture time to inject coordinates and
         environmental data into frame metadata. Data captured at moment of
         exposure for accurate positional and atmospheric conditions.
 
+        Args:
+            when: Capture instant to describe (Camera passes mid-exposure).
+                None means now.
+
         Returns:
             CaptureCoordinates with ALT/AZ, RA/Dec, temperature, humidity,
             or None if unavailable.
@@ -374,22 +401,17 @@ class SensorCoordinateProvider:
             return None
 
         try:
+            capture_time = when if when is not None else datetime.now(UTC)
+
             # Use public sync read method (avoids accessing private _instance)
-            reading = self._sensor.read_sync()
+            reading = self._sensor.read_sync(capture_time)
             if reading is None:
                 logger.debug("Sensor read returned None")
                 return None
 
-            capture_time = datetime.now(UTC)
-
             # Convert ALT/AZ to RA/Dec
-            equatorial = altaz_to_radec(
-                altitude=reading.altitude,
-                azimuth=reading.azimuth,
-                lat=self._location.lat,
-                lon=self._location.lon,
-                elevation=self._location.elevation,
-                obstime=capture_time,
+            equatorial = self._transformer.altaz_to_radec(
+                reading.altitude, reading.azimuth, capture_time
             )
 
             return CaptureCoordinates(
@@ -22,10 +22,14 @@ Example:
         reading = await sensor.read()
         print(f"ALT {reading.altitude:.2f}, AZ {reading.azimuth:.2f}")
 
-        # Read with averaging
+        # Read with averaging (instant when the driver buffers samples)
         avg = await sensor.read(samples=10)
 
-        # Or read for duration
+        # Orientation during an exposure window
+        during = await sensor.read_between(exposure_start, exposure_end)
+
+        # Or read for duration (instant once a streaming driver has
+        # buffered that much; wait=False never blocks)
         reading = await sensor.read_for(duration_ms=1000)
 
         sensor.calibrate(true_altitude=45.0, true_azimuth=180.0)
@@ -37,8 +41,8 @@ Example:
 from __future__ import annotations
 
 import asyncio
-import math
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, TypedDict
@@ -48,7 +52,9 @@ from telescope_mcp.observability import get_logger
 if TYPE_CHECKING:
     from telescope_mcp.drivers.sensors import (
         AvailableSensor,
+        BufferedSensorInstance,
         SensorDriver,
+        SensorHistory,
         SensorInstance,
         SensorReading,
     )
@@ -58,6 +64,8 @@ logger = get_logger(__name__)
 DEFAULT_SAMPLE_RATE_HZ = 10.0
 STATUS_SETTLE_DELAY_SEC = 0.1  # Delay after STOP command before STATUS query
 _SAMPLE_RATE_PATTERN = re.compile(r"Sample Rate:\s*(\d+)\s*Hz")
+# Newest sample older than this many intervals means the stream stalled
+_STALE_SAMPLE_INTERVALS = 5
 
 __all__ = [
     "Sensor",
@@ -275,6 +283,54 @@ class Sensor:
         """
         return self._sample_rate_hz
 
+    @property
+    def history(self) -> SensorHistory | None:
+        """Get the driver's buffered sample history, if it keeps one.
+
+        Streaming drivers (Arduino) record every received sample in a
+        SensorHistory; on-demand drivers (digital twin) do not.
+
+        Business context: Lets callers choose instant, history-backed
+        reads (position smoothing, frame tagging) when the data already
+        exists, and fall back to polling otherwise.
+
+        Args:
+            None
+
+        Returns:
+            SensorHistory of the connected instance, or None when not
+            connected or the driver does not buffer samples.
+
+        Raises:
+            None
+
+        Example:
+            >>> if sensor.history is not None:
+            ...     stats = sensor.history.stats(window_ns=1_000_000_000)
+        """
+        from telescope_mcp.drivers.sensors.history import (
+            SensorHistory as SensorHistoryType,
+        )
+
+        history = getattr(self._instance, "history", None) if self.connected else None
+        return history if isinstance(history, SensorHistoryType) else None
+
+    def _buffered_instance(self) -> BufferedSensorInstance | None:
+        """Get the connected instance if it serves reads from its history.
+
+        Returns:
+            The instance when connected and it implements
+            BufferedSensorInstance, else None (read live instead).
+        """
+        from telescope_mcp.drivers.sensors.types import (
+            BufferedSensorInstance as BufferedSensorInstanceType,
+        )
+
+        instance = self._instance if self.connected else None
+        if isinstance(instance, BufferedSensorInstanceType):
+            return instance
+        return None
+
     def get_available_sensors(self) -> list[AvailableSensor]:
         """Enumerate all sensors available through the configured driver.
 
@@ -481,7 +537,7 @@ class Sensor:
         self._connect_time = None
         logger.info("Sensor disconnected")
 
-    async def read(self, samples: int = 1) -> SensorReading:
+    async def read(self, samples: int = 1, *, wait: bool = True) -> SensorReading:
         """Read sensor values with optional averaging.
 
         Reads one or more samples from the sensor and returns a single
@@ -492,8 +548,17 @@ class Sensor:
         reduce noise for precise positioning. Astrophotography typically
         uses 5-10 samples for stable star tracking.
 
+        When the driver buffers its stream (see history), the average is
+        served from the newest buffered samples. If fewer than `samples`
+        are buffered yet, only the missing ones are waited for (or none,
+        with wait=False); a stream that stopped delivering samples is
+        reported rather than averaged. Drivers without history collect
+        the samples at the sample rate.
+
         Args:
             samples: Number of readings to average. Default 1.
+            wait: For buffering drivers, wait for missing samples to
+                arrive. False averages whatever is buffered right now.
 
         Returns:
             SensorReading with:
@@ -507,7 +572,8 @@ class Sensor:
                 - raw_values: "averaged_N_samples" if samples > 1
 
         Raises:
-            RuntimeError: If sensor not connected.
+            RuntimeError: If sensor not connected, or its buffered
+                stream has stalled.
             ValueError: If samples < 1.
 
         Example:
@@ -526,22 +592,246 @@ class Sensor:
         if samples == 1:
             return await self._read_single()
 
-        return await self._read_averaged(samples)
+        instance = self._buffered_instance()
+        if instance is None:
+            return await self._read_averaged(samples)
+
+        history = instance.history
+        if wait:
+            await self._wait_for_samples(history, samples)
+        if len(history) == 0:
+            return await self._read_single()
+        self._require_fresh(history)
+        return instance.read_average(samples)
+
+    async def _wait_for_samples(self, history: SensorHistory, samples: int) -> None:
+        """Sleep until `samples` samples are buffered, waiting only for the gap.
+
+        Sleeps for the expected arrival time of the missing samples and
+        re-checks, giving up after twice the expected time plus a second
+        so a stalled stream cannot block the caller indefinitely.
+
+        Args:
+            history: Driver history to watch.
+            samples: Target sample count (capped at history capacity).
+
+        Returns:
+            None. Callers average whatever is buffered afterwards.
+
+        Raises:
+            None.
+
+        Example:
+            >>> # Internal use by read(samples=N) with 3 of N buffered
+            >>> await sensor._wait_for_samples(sensor.history, 20)
+        """
+        target = min(samples, history.capacity)
+        missing = target - len(history)
+        if missing <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 2.0 * missing / self._sample_rate_hz + 1.0
+        while missing > 0 and loop.time() < deadline:
+            await asyncio.sleep(missing / self._sample_rate_hz)
+            missing = target - len(history)
+
+    async def _wait_for_span(self, history: SensorHistory, duration_ms: int) -> None:
+        """Sleep until the buffered stream covers `duration_ms` and is current.
+
+        Each sample stands for one sample interval, so a history whose
+        samples cover less than the duration sleeps for the uncovered
+        remainder and re-checks until covered. A stream whose newest
+        sample is stale is waited on too, but only for a second: a
+        stalled stream will not fill the window. Otherwise gives up
+        after twice the duration plus a second, like _wait_for_samples().
+
+        Args:
+            history: Driver history to watch.
+            duration_ms: Stream duration the caller wants to average
+                (at most the history span, checked by read_for()).
+
+        Returns:
+            None. A window still partly uncovered at the deadline is
+            logged and averaged as buffered.
+
+        Raises:
+            None. Staleness left at the deadline is reported by
+            _require_fresh().
+
+        Example:
+            >>> # Internal use by read_for(2000) one second after connect
+            >>> await sensor._wait_for_span(sensor.history, 2000)  # ~1 s
+        """
+        interval_ns = round(1e9 / self._sample_rate_hz)
+        span_ns = duration_ms * 1_000_000
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 2.0 * span_ns / 1e9 + 1.0
+        stall_deadline = deadline
+        while True:
+            oldest, newest = history.oldest_ns, history.newest_ns
+            if oldest is None or newest is None:
+                missing_ns = span_ns
+            else:
+                missing_ns = span_ns - (newest - oldest) - interval_ns
+                if not self._is_stale(history):
+                    if missing_ns <= 0:
+                        return
+                    stall_deadline = deadline
+                elif stall_deadline == deadline:
+                    stall_deadline = min(deadline, loop.time() + 1.0)
+            if loop.time() >= stall_deadline:
+                break
+            await asyncio.sleep(max(missing_ns, interval_ns) / 1e9)
+        if missing_ns > 0:
+            logger.warning(
+                "Sensor stream shorter than requested window",
+                duration_ms=duration_ms,
+                missing_ms=missing_ns // 1_000_000,
+            )
+
+    def _is_stale(self, history: SensorHistory) -> bool:
+        """Whether the newest buffered sample is too old to count as current.
+
+        Args:
+            history: Driver history to check.
+
+        Returns:
+            True if the history is empty or its newest sample is older
+            than _STALE_SAMPLE_INTERVALS sample intervals.
 
-    def read_sync(self) -> SensorReading | None:
+        Raises:
+            None.
+
+        Example:
+            >>> sensor._is_stale(sensor.history)  # reader thread running
+            False
+        """
+        newest = history.newest_ns
+        if newest is None:
+            return True
+        stale_ns = _STALE_SAMPLE_INTERVALS * 1e9 / self._sample_rate_hz
+        return time.monotonic_ns() - newest > stale_ns
+
+    def _require_fresh(self, history: SensorHistory) -> None:
+        """Refuse to serve a buffered window from a stalled stream.
+
+        Business context: A reader thread that stopped receiving (cable
+        pulled, firmware hung) leaves its last samples in history;
+        averaging them would report an old orientation as current.
+
+        Args:
+            history: Non-empty driver history about to be averaged.
+
+        Returns:
+            None.
+
+        Raises:
+            RuntimeError: If the newest sample is stale.
+
+        Example:
+            >>> sensor._require_fresh(sensor.history)  # streaming: no error
+        """
+        if self._is_stale(history):
+            assert history.newest_ns is not None
+            age_s = (time.monotonic_ns() - history.newest_ns) / 1e9
+            raise RuntimeError(
+                f"Sensor stream stalled: newest sample is {age_s:.1f} s old"
+            )
+
+    async def read_at(self, when: datetime) -> SensorReading:
+        """Read the orientation at a past instant from buffered history.
+
+        Interpolates between the buffered samples surrounding `when`.
+        Drivers without history (or before the first sample) fall back to
+        a live single read.
+
+        Business context: Frame metadata should describe where the
+        telescope pointed during the exposure, not when the metadata was
+        assembled after readout.
+
+        Args:
+            when: Wall-clock instant (naive values treated as UTC).
+
+        Returns:
+            Interpolated SensorReading, or the current reading on fallback.
+
+        Raises:
+            RuntimeError: If sensor not connected, or its buffered
+                stream has stalled.
+
+        Example:
+            >>> mid = capture_end - timedelta(seconds=exposure_sec / 2)
+            >>> reading = await sensor.read_at(mid)
+        """
+        if not self._connected or self._instance is None:
+            raise RuntimeError("Sensor not connected. Call connect() first.")
+
+        instance = self._buffered_instance()
+        if instance is not None and len(instance.history) > 0:
+            self._require_fresh(instance.history)
+            return instance.read_at(when)
+        return await self._read_single()
+
+    async def read_between(self, start: datetime, end: datetime) -> SensorReading:
+        """Average the buffered samples received between two instants.
+
+        Drivers without history (or before the first sample) fall back to
+        a live single read.
+
+        Business context: The mean orientation over an exposure window is
+        the pointing that best describes a long-exposure frame.
+
+        Args:
+            start: Window start (naive values treated as UTC).
+            end: Window end, inclusive.
+
+        Returns:
+            Averaged SensorReading stamped with the window midpoint, or the
+            current reading on fallback.
+
+        Raises:
+            RuntimeError: If sensor not connected, or its buffered
+                stream has stalled.
+            ValueError: If end precedes start.
+
+        Example:
+            >>> reading = await sensor.read_between(exposure_start, exposure_end)
+        """
+        if not self._connected or self._instance is None:
+            raise RuntimeError("Sensor not connected. Call connect() first.")
+        if end < start:
+            raise ValueError("end must not precede start")
+
+        instance = self._buffered_instance()
+        if instance is not None and len(instance.history) > 0:
+            self._require_fresh(instance.history)
+            return instance.read_between(start, end)
+        return await self._read_single()
+
+    def read_sync(self, when: datetime | None = None) -> SensorReading | None:
         """Read a single sensor value synchronously (blocking).
 
         Performs blocking I/O to read from sensor. Use in sync contexts
-        or when wrapped in run_in_executor for async contexts.
+        or when wrapped in run_in_executor for async contexts. With `when`
+        and a driver that buffers its stream (see history), the reading is
+        interpolated to that instant like read_at(), after the same
+        staleness check.
 
         Business context: Used by SensorCoordinateProvider for coordinate
         injection during camera capture, where sync access is required.
 
+        Args:
+            when: Instant the reading should describe (naive values treated
+                as UTC). None, or a driver without history, reads the
+                current value.
+
         Returns:
-            SensorReading with current sensor values, or None if not connected.
+            SensorReading with current (or interpolated) sensor values, or
+            None if not connected.
 
         Raises:
-            None. Returns None if sensor not connected or read fails.
+            None. Returns None if sensor not connected, its buffered stream
+            has stalled, or read fails.
 
         Example:
             >>> reading = sensor.read_sync()
@@ -551,6 +841,10 @@ class Sensor:
         if not self._connected or self._instance is None:
             return None
         try:
+            instance = self._buffered_instance()
+            if when is not None and instance is not None and len(instance.history):
+                self._require_fresh(instance.history)
+                return instance.read_at(when)
             return self._instance.read()
         except Exception as e:
             logger.warning("Sync read failed", error=str(e))
@@ -619,9 +913,11 @@ class Sensor:
     def _average_readings(self, readings: list[SensorReading]) -> SensorReading:
         """Compute component-wise average of multiple readings.
 
-        Averages accelerometer and magnetometer vectors component-wise.
-        Uses circular mean for azimuth to handle 0°/360° wraparound correctly.
-        Altitude, temperature, and humidity are arithmetically averaged.
+        Packs the readings into one SensorReadingBatch and averages its
+        columns vectorized. Accelerometer and magnetometer vectors are
+        averaged component-wise, azimuth with the circular mean to handle
+        0°/360° wraparound correctly. Altitude, temperature, and humidity
+        are arithmetically averaged. No per-reading dicts are built.
 
         Business context: Reduces noise in sensor readings. Multiple samples
         averaged together provide more stable orientation measurements,
@@ -643,68 +939,44 @@ class Sensor:
             >>> averaged = sensor._average_readings(readings)
             >>> # Less noisy than single reading
         """
-        from telescope_mcp.drivers.sensors.types import (
-            AccelerometerData,
-            MagnetometerData,
-        )
-        from telescope_mcp.drivers.sensors.types import (
-            SensorReading as SensorReadingType,
-        )
+        from telescope_mcp.drivers.sensors.types import SensorReadingBatch
 
-        n = len(readings)
-        if n == 0:
+        if not readings:
             raise ValueError("No readings to average")
-        if n == 1:
+        if len(readings) == 1:
             return readings[0]
+        return SensorReadingBatch.from_readings(readings).mean()
 
-        avg_accel: AccelerometerData = {
-            "aX": sum(r.accelerometer["aX"] for r in readings) / n,
-            "aY": sum(r.accelerometer["aY"] for r in readings) / n,
-            "aZ": sum(r.accelerometer["aZ"] for r in readings) / n,
-        }
-        avg_mag: MagnetometerData = {
-            "mX": sum(r.magnetometer["mX"] for r in readings) / n,
-            "mY": sum(r.magnetometer["mY"] for r in readings) / n,
-            "mZ": sum(r.magnetometer["mZ"] for r in readings) / n,
-        }
-
-        # Average azimuth using circular mean to handle 0°/360° wraparound
-        az_rad = [math.radians(r.azimuth) for r in readings]
-        avg_sin = sum(math.sin(a) for a in az_rad) / n
-        avg_cos = sum(math.cos(a) for a in az_rad) / n
-        avg_azimuth = math.degrees(math.atan2(avg_sin, avg_cos)) % 360
-
-        return SensorReadingType(
-            accelerometer=avg_accel,
-            magnetometer=avg_mag,
-            altitude=sum(r.altitude for r in readings) / n,
-            azimuth=avg_azimuth,
-            temperature=sum(r.temperature for r in readings) / n,
-            humidity=sum(r.humidity for r in readings) / n,
-            timestamp=readings[-1].timestamp,
-            raw_values=f"averaged_{n}_samples",
-        )
-
-    async def read_for(self, duration_ms: int) -> SensorReading:
+    async def read_for(self, duration_ms: int, *, wait: bool = True) -> SensorReading:
         """Read sensor for a time duration, averaging all samples.
 
-        Calculates number of samples based on duration and sample rate,
-        then collects and averages them. Convenient for time-based
-        averaging without manual sample calculation.
+        For drivers that buffer their stream (see history), averages the
+        samples received during the last duration_ms, waiting only for
+        the part of the window not yet buffered (or not at all with
+        wait=False). The duration must fit in the history, and a stream
+        that stopped delivering samples is reported rather than averaged.
+        Other drivers calculate a sample count from the duration and
+        sample rate and collect them live.
 
         Business context: Used for timed calibrations and environment
         monitoring. "Read for 5 seconds" is more intuitive than calculating
         samples manually. Common in telescope auto-calibration sequences.
+        With a streaming sensor that has been connected for longer than
+        the duration, the result is instant.
 
         Args:
             duration_ms: Collection time in milliseconds.
+            wait: For buffering drivers, wait until the stream covers the
+                duration. False averages whatever part is buffered now.
 
         Returns:
             SensorReading with averaged values over the duration.
 
         Raises:
-            ValueError: If duration_ms < 1.
-            RuntimeError: If sensor not connected.
+            ValueError: If duration_ms < 1, or longer than the buffered
+                history can hold (capacity / sample rate).
+            RuntimeError: If sensor not connected, or its buffered
+                stream has stalled.
 
         Example:
             >>> # Read for 2 seconds for stable average
@@ -714,8 +986,23 @@ class Sensor:
         if duration_ms < 1:
             raise ValueError("duration_ms must be >= 1")
 
+        instance = self._buffered_instance()
+        if instance is not None:
+            history = instance.history
+            span_ms = history.capacity * 1000.0 / self._sample_rate_hz
+            if duration_ms > span_ms:
+                raise ValueError(
+                    f"duration_ms {duration_ms} exceeds the {span_ms:.0f} ms "
+                    "of stream the sensor history holds"
+                )
+            if wait:
+                await self._wait_for_span(history, duration_ms)
+            if len(history) > 0:
+                self._require_fresh(history)
+                return instance.read_window(duration_ms)
+
         samples = max(1, int(duration_ms / 1000.0 * self._sample_rate_hz))
-        return await self.read(samples=samples)
+        return await self.read(samples=samples, wait=wait)
 
     def calibrate(self, true_altitude: float, true_azimuth: float) -> None:
         """Calibrate sensor to a known true telescope position.
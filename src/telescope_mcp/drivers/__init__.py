@@ -13,6 +13,9 @@ Serial Protocols:
     serial-based drivers (sensors, motors) without hardware.
 
     from telescope_mcp.drivers import SerialPort, PortEnumerator
+
+    RecordingSerialPort captures a live port's traffic to a file and
+    ReplaySerialPort plays it back into the same injection hooks.
 """
 
 from telescope_mcp.drivers import asi_sdk, config, motors, sensors
@@ -25,7 +28,12 @@ from telescope_mcp.drivers.config import (
     use_digital_twin,
     use_hardware,
 )
-from telescope_mcp.drivers.serial import PortEnumerator, SerialPort
+from telescope_mcp.drivers.serial import (
+    PortEnumerator,
+    RecordingSerialPort,
+    ReplaySerialPort,
+    SerialPort,
+)
 
 __all__ = [
     # Submodules
@@ -44,4 +52,6 @@ __all__ = [
     # Serial protocols (for testing)
     "SerialPort",
     "PortEnumerator",
+    "RecordingSerialPort",
+    "ReplaySerialPort",
 ]
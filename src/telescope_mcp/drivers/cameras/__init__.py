@@ -30,7 +30,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from types import TracebackType
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from telescope_mcp.drivers.cameras.asi import (
     ASICameraDriver,
@@ -49,6 +49,9 @@ from telescope_mcp.drivers.cameras.twin import (
     create_file_camera,
 )
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
 
 @runtime_checkable
 class CameraInstance(Protocol):  # pragma: no cover
@@ -204,6 +207,38 @@ class CameraInstance(Protocol):  # pragma: no cover
         """
         ...
 
+    def capture_array(
+        self, exposure_us: int, image_type: str | None = None
+    ) -> NDArray[Any]:
+        """Capture a single frame as an unencoded numpy array.
+
+        Same exposure semantics as capture() without the JPEG step, so the
+        caller decides whether, when, and how to encode the frame.
+
+        Business context: Science frames must keep full bit depth and
+        should not pay for a JPEG encode nobody reads. Camera stores this
+        array in CaptureResult.raw and encodes previews lazily.
+
+        Args:
+            exposure_us: Exposure time in microseconds.
+            image_type: "RAW8", "RAW16", or "RGB24". None uses the
+                driver default (RAW8 for hardware).
+
+        Returns:
+            (H, W) uint8 for RAW8, (H, W) uint16 for RAW16, or
+            (H, W, 3) uint8 BGR for RGB24.
+
+        Raises:
+            ValueError: If exposure_us or image_type is invalid.
+            RuntimeError: If capture fails or times out.
+
+        Example:
+            >>> frame = camera.capture_array(5_000_000, "RAW16")
+            >>> frame.dtype
+            dtype('uint16')
+        """
+        ...
+
     def close(self) -> None:
         """Close camera and release hardware resources.
 
@@ -845,17 +845,78 @@ class DigitalTwinCameraInstance:
             with open("frame.jpg", "wb") as f:
                 f.write(frame)
         """
+        # Lazy import cv2 to avoid Python 3.13 cv2.typing bug at module load
+        import cv2 as _cv2
+
+        img = self._capture_frame(exposure_us)
+        _, jpeg = _cv2.imencode(
+            ".jpg", img, [_cv2.IMWRITE_JPEG_QUALITY, _DEFAULT_JPEG_QUALITY]
+        )
+        return bytes(jpeg.tobytes())
+
+    def capture_array(
+        self, exposure_us: int, image_type: str | None = None
+    ) -> NDArray[Any]:
+        """Capture a frame as an unencoded array in the requested format.
+
+        Produces the same scene as capture() without the JPEG round trip.
+        The BGR source image is converted to mimic the hardware formats:
+        RAW8 is luminance, RAW16 is luminance scaled to the full 16-bit
+        range, RGB24 is the BGR image itself.
+
+        Args:
+            exposure_us: Exposure time in microseconds (see capture()).
+            image_type: "RAW8", "RAW16", "RGB24", or None for RGB24.
+
+        Returns:
+            (H, W) uint8, (H, W) uint16, or (H, W, 3) uint8 BGR array.
+
+        Raises:
+            ValueError: If image_type is not a supported format.
+
+        Example:
+            >>> frame = instance.capture_array(100_000, "RAW16")
+            >>> frame.dtype, frame.shape
+            (dtype('uint16'), (1080, 1920))
+        """
+        if image_type not in (None, "RAW8", "RAW16", "RGB24"):
+            raise ValueError(
+                f"image_type must be RAW8, RAW16, or RGB24, got {image_type!r}"
+            )
+
+        img = self._capture_frame(exposure_us)
+        if image_type is None or image_type == "RGB24":
+            return img
+
+        # Lazy import cv2 to avoid Python 3.13 cv2.typing bug at module load
+        import cv2 as _cv2
+
+        mono: NDArray[Any] = _cv2.cvtColor(img, _cv2.COLOR_BGR2GRAY)
+        if image_type == "RAW16":
+            # 0-255 -> 0-65535 so the high byte matches the 8-bit frame
+            return mono.astype(np.uint16) * 257
+        return mono
+
+    def _capture_frame(self, exposure_us: int) -> NDArray[Any]:
+        """Produce the BGR frame for the configured image source.
+
+        Args:
+            exposure_us: Exposure time (synthetic mode renders it).
+
+        Returns:
+            BGR uint8 image array at camera resolution.
+        """
         import time
 
         source = self._config.image_source
         capture_start = time.monotonic()
 
         if source == ImageSource.FILE:
-            data = self._capture_from_file()
+            img = self._capture_from_file()
         elif source == ImageSource.DIRECTORY:
-            data = self._capture_from_directory()
+            img = self._capture_from_directory()
         else:
-            data = self._capture_synthetic(exposure_us)
+            img = self._capture_synthetic(exposure_us)
 
         capture_elapsed = time.monotonic() - capture_start
 
@@ -865,15 +926,14 @@ class DigitalTwinCameraInstance:
             source=source.value,
             exposure_us=exposure_us,
             capture_elapsed_ms=round(capture_elapsed * 1000, 1),
-            jpeg_size_kb=round(len(data) / 1024, 1),
         )
-        return data
+        return img
 
-    def _capture_from_file(self) -> bytes:
+    def _capture_from_file(self) -> NDArray[Any]:
         """Load and return image from configured file path.
 
         Reads the image file specified in config.image_path, resizes it
-        to match camera resolution if needed, and returns JPEG bytes.
+        to match camera resolution if needed, and returns the BGR array.
         Falls back to synthetic generation if file is missing or unreadable.
 
         Business context: Single-file mode useful for testing specific scenarios
@@ -885,7 +945,7 @@ class DigitalTwinCameraInstance:
             None. Uses self._config.image_path.
 
         Returns:
-            JPEG-encoded image bytes at camera resolution.
+            BGR uint8 image array at camera resolution.
 
         Raises:
             None. File errors trigger synthetic fallback.
@@ -916,12 +976,9 @@ class DigitalTwinCameraInstance:
         # Resize to match camera resolution if needed
         img = self._resize_to_camera(img)
 
-        _, jpeg = _cv2.imencode(
-            ".jpg", img, [_cv2.IMWRITE_JPEG_QUALITY, _DEFAULT_JPEG_QUALITY]
-        )
-        return jpeg.tobytes()
+        return img
 
-    def _capture_from_directory(self) -> bytes:
+    def _capture_from_directory(self) -> NDArray[Any]:
         """Load next image from directory and advance index.
 
         Returns the next image in the sorted file list, then advances
@@ -937,7 +994,7 @@ class DigitalTwinCameraInstance:
             None. Uses _image_files and _image_index state.
 
         Returns:
-            JPEG-encoded image bytes at camera resolution.
+            BGR uint8 image array at camera resolution.
 
         Raises:
             None. Empty directory or read errors trigger synthetic fallback.
@@ -977,10 +1034,7 @@ class DigitalTwinCameraInstance:
         # Resize to match camera resolution
         img = self._resize_to_camera(img)
 
-        _, jpeg = _cv2.imencode(
-            ".jpg", img, [_cv2.IMWRITE_JPEG_QUALITY, _DEFAULT_JPEG_QUALITY]
-        )
-        return jpeg.tobytes()
+        return img
 
     def _resize_to_camera(self, img: NDArray[Any]) -> NDArray[Any]:
         """Resize image to match camera resolution.
@@ -1018,7 +1072,7 @@ class DigitalTwinCameraInstance:
 
         return img
 
-    def _capture_synthetic(self, exposure_us: int) -> bytes:
+    def _capture_synthetic(self, exposure_us: int) -> NDArray[Any]:
         """Generate a synthetic test pattern image.
 
         Creates a test image with grid lines, center crosshair, diagnostic
@@ -1034,7 +1088,7 @@ class DigitalTwinCameraInstance:
             exposure_us: Exposure time displayed on the test pattern.
 
         Returns:
-            JPEG-encoded image bytes at camera resolution.
+            BGR uint8 image array at camera resolution.
 
         Raises:
             None. Synthetic generation always succeeds.
@@ -1105,11 +1159,7 @@ class DigitalTwinCameraInstance:
             noise = np.random.randint(0, noise_level + 1, img.shape, dtype=np.uint8)
             img = _cv2.add(img, noise)
 
-        # Encode as JPEG
-        _, jpeg = _cv2.imencode(
-            ".jpg", img, [_cv2.IMWRITE_JPEG_QUALITY, _DEFAULT_JPEG_QUALITY]
-        )
-        return jpeg.tobytes()
+        return img
 
     def stop_exposure(self) -> None:
         """Stop an in-progress exposure (no-op for digital twin).
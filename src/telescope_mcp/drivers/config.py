@@ -41,12 +41,35 @@ DEFAULT_I2C_ADDRESS = 0x68  # MPU-6050/ICM-20948 default address
 # Default serial settings for stepper motor controller
 DEFAULT_MOTOR_BAUD_RATE = 115200
 
+# Default periodic telemetry sampling rate (Hz); 0 disables the recorder
+DEFAULT_TELEMETRY_RATE_HZ = 1.0
+
+# Default live event rate (Hz) for position/motor on /api/events, the Arduino
+# stream rate; 0 disables
+DEFAULT_EVENT_RATE_HZ = 10.0
+
+# Default archive compaction: hourly contiguous rewrite capped at 4 MiB/s of
+# combined read+write I/O; an interval of 0 disables the background
+# compactor. Compression is opt-in: compressed blocks cannot be
+# memory-mapped, so exports and frame downloads would decompress whole frames
+DEFAULT_COMPACTION_INTERVAL_SEC = 3600.0
+DEFAULT_COMPACTION_COMPRESSION: str | None = None
+DEFAULT_COMPACTION_MAX_BYTES_PER_SEC = 4.0 * 1024 * 1024
+
+# Default astropy Earth orientation handling: offline, because the rig
+# usually has no network and a download attempt stalls the first transform
+DEFAULT_IERS_OFFLINE = True
+
 #: Type alias for observer location dict with lat/lon/alt keys.
 #: lat: Latitude in decimal degrees [-90, 90]. Positive=North.
 #: lon: Longitude in decimal degrees [-180, 180]. Positive=East.
 #: alt: Altitude in meters above sea level. Default 0.
 LocationDict = dict[str, float]
 
+#: Observer location used for coordinate conversion when none is configured
+#: (Austin, TX).
+DEFAULT_LOCATION: LocationDict = {"lat": 30.2672, "lon": -97.7431, "alt": 0.0}
+
 
 class DriverMode(Enum):
     """Driver mode selection."""
@@ -96,6 +119,21 @@ class DriverConfig:
         motor_baud_rate: Baud rate for motor serial communication.
         sensor_i2c_bus: I2C bus number for IMU sensor.
         sensor_i2c_address: I2C address of IMU (0x68 for MPU-6050/ICM-20948).
+        telemetry_rate_hz: Periodic sensor/motor sampling rate recorded into
+            the active session's columnar telemetry (0 disables).
+        event_rate_hz: Rate at which sensor position and motor status are
+            published to live /api/events subscribers (0 disables).
+        compaction_interval_sec: Delay between background archive compaction
+            passes (0 disables).
+        compaction_compression: Block codec for compacted archives ("zlib",
+            "bzp2", "lz4"), or None (default) to defragment without
+            compressing so frames stay memory-mappable.
+        compaction_max_bytes_per_sec: Combined read/write I/O budget for
+            compaction so live captures are not starved.
+        iers_offline: Stop astropy from downloading IERS Earth orientation
+            tables; use the bundled or previously cached table instead.
+        iers_table_path: Local IERS-A/IERS-B file to use when offline
+            (None = astropy cache or bundled table).
     """
 
     mode: DriverMode = DriverMode.DIGITAL_TWIN
@@ -121,6 +159,19 @@ class DriverConfig:
     sensor_i2c_bus: int = DEFAULT_I2C_BUS
     sensor_i2c_address: int = DEFAULT_I2C_ADDRESS
 
+    # Telemetry settings
+    telemetry_rate_hz: float = DEFAULT_TELEMETRY_RATE_HZ
+    event_rate_hz: float = DEFAULT_EVENT_RATE_HZ
+
+    # Archive compaction settings
+    compaction_interval_sec: float = DEFAULT_COMPACTION_INTERVAL_SEC
+    compaction_compression: str | None = DEFAULT_COMPACTION_COMPRESSION
+    compaction_max_bytes_per_sec: float = DEFAULT_COMPACTION_MAX_BYTES_PER_SEC
+
+    # Astropy IERS settings
+    iers_offline: bool = DEFAULT_IERS_OFFLINE
+    iers_table_path: Path | None = None
+
 
 class DriverFactory:
     """Factory for creating drivers based on configuration.
@@ -484,6 +535,8 @@ def _copy_config_with_mode(mode: DriverMode) -> DriverConfig:
         motor_baud_rate=factory.config.motor_baud_rate,
         sensor_i2c_bus=factory.config.sensor_i2c_bus,
         sensor_i2c_address=factory.config.sensor_i2c_address,
+        iers_offline=factory.config.iers_offline,
+        iers_table_path=factory.config.iers_table_path,
     )
 
 
@@ -46,6 +46,9 @@ Testing:
 
     controller = SerialMotorController._create_with_serial(mock)
     controller.move(MotorType.ALTITUDE, 1000)
+
+    Field sessions recorded with record_to= replay through the same hook
+    with drivers.serial.ReplaySerialPort.
 """
 
 from __future__ import annotations
@@ -53,6 +56,7 @@ from __future__ import annotations
 import threading
 import time
 from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from telescope_mcp.drivers.motors.types import (
@@ -62,7 +66,11 @@ from telescope_mcp.drivers.motors.types import (
     MotorStatus,
     MotorType,
 )
-from telescope_mcp.drivers.serial import PortEnumerator, SerialPort
+from telescope_mcp.drivers.serial import (
+    PortEnumerator,
+    RecordingSerialPort,
+    SerialPort,
+)
 from telescope_mcp.observability import get_logger
 
 if TYPE_CHECKING:
@@ -146,7 +154,13 @@ class SerialMotorController:
     Thread-safe: Uses lock for serial communication.
     """
 
-    def __init__(self, port: str, baudrate: int = DEFAULT_BAUDRATE) -> None:
+    def __init__(
+        self,
+        port: str,
+        baudrate: int = DEFAULT_BAUDRATE,
+        *,
+        record_to: str | Path | None = None,
+    ) -> None:
         """Open serial connection to motor controller.
 
         Creates serial connection and initializes controller state.
@@ -158,6 +172,8 @@ class SerialMotorController:
         Args:
             port: Serial port (e.g., /dev/ttyACM0).
             baudrate: Serial baud rate (default 9600).
+            record_to: Record all serial traffic to this file with
+                RecordingSerialPort, for later replay (default None).
 
         Returns:
             None. Controller connected and ready.
@@ -178,6 +194,8 @@ class SerialMotorController:
             raise RuntimeError("pyserial not installed. Run: pdm add pyserial")
         except Exception as e:
             raise RuntimeError(f"Failed to open serial port {port}: {e}")
+        if record_to is not None:
+            serial_port = RecordingSerialPort(serial_port, record_to)
 
         self._init_with_serial(serial_port, port)
         logger.info("Motor controller connected", port=port)
@@ -804,8 +822,13 @@ class SerialMotorController:
         """
         self._is_open = False
 
-        if self._serial and self._serial.is_open:
-            self._serial.close()
+        # Close even if the device already dropped (is_open False): a
+        # RecordingSerialPort wrapper must still finish its file
+        if self._serial:
+            try:
+                self._serial.close()
+            except Exception as e:
+                logger.warning("Error closing serial port", error=str(e))
 
         logger.info("Motor controller closed", port=self._port)
 
@@ -924,7 +947,12 @@ class SerialMotorDriver:
             controller = driver.open(controllers[0]["port"])
     """
 
-    def __init__(self, baudrate: int = DEFAULT_BAUDRATE) -> None:
+    def __init__(
+        self,
+        baudrate: int = DEFAULT_BAUDRATE,
+        *,
+        record_to: str | Path | None = None,
+    ) -> None:
         """Initialize driver with baud rate for motor controller.
 
         Sets up driver configuration without opening any serial ports.
@@ -940,6 +968,9 @@ class SerialMotorDriver:
         Args:
             baudrate: Serial baud rate for controller communication.
                 Defaults to 9600 (DEFAULT_BAUDRATE).
+            record_to: Record the opened controller's serial traffic to
+                this file for replay (default None). Each open() that
+                finds the file present writes a numbered sibling instead.
 
         Returns:
             None. Driver initialized, ready for open().
@@ -954,6 +985,7 @@ class SerialMotorDriver:
             ...     motor = driver.open(controllers[0]['port'])
         """
         self._baudrate = baudrate
+        self._record_to = record_to
         self._controller: SerialMotorController | None = None
         self._port_enumerator: PortEnumerator | None = None
 
@@ -997,6 +1029,7 @@ class SerialMotorDriver:
         """
         driver = cls.__new__(cls)
         driver._baudrate = baudrate
+        driver._record_to = None
         driver._controller = None
         driver._port_enumerator = port_enumerator
         return driver
@@ -1114,7 +1147,9 @@ class SerialMotorDriver:
         else:
             port = controller_id
 
-        self._controller = SerialMotorController(port, self._baudrate)
+        self._controller = SerialMotorController(
+            port, self._baudrate, record_to=self._record_to
+        )
         return self._controller
 
     def _open_with_serial(
@@ -4,10 +4,15 @@ This module provides abstractions for orientation sensors (IMUs) that
 report telescope pointing direction. Key components:
 
 - SensorReading: Complete sensor reading with accelerometer, magnetometer, etc.
+- SensorReadingBatch: Many readings in one numpy array (vectorized mean)
 - SensorDriver: Protocol for sensor driver implementations
 - SensorInstance: Protocol for connected sensor instances
 - AvailableSensor: TypedDict for discovered sensor descriptors
 - validate_position: Helper to validate altitude/azimuth ranges
+- SensorHistory: Time-indexed ring buffer of raw streamed samples
+- HistoryStats: Windowed mean/variance result from SensorHistory
+- OrientationFilter: Per-sample smoothing of accelerometer/magnetometer vectors
+- MagnetometerCalibration: Hard/soft-iron correction from fit_ellipsoid()
 - DigitalTwinSensorDriver: Simulated sensor for testing
 - DigitalTwinSensorConfig: Configuration dataclass for digital twin
 - ArduinoSensorDriver: Real hardware driver for Arduino Nano BLE33 Sense
@@ -43,6 +48,12 @@ from telescope_mcp.drivers.sensors.arduino import (
     ArduinoSensorDriver,
     ArduinoSensorInstance,
 )
+from telescope_mcp.drivers.sensors.fusion import OrientationFilter
+from telescope_mcp.drivers.sensors.history import HistoryStats, SensorHistory
+from telescope_mcp.drivers.sensors.magnetometer import (
+    MagnetometerCalibration,
+    fit_ellipsoid,
+)
 from telescope_mcp.drivers.sensors.twin import (
     DigitalTwinSensorConfig,
     DigitalTwinSensorDriver,
@@ -50,9 +61,11 @@ from telescope_mcp.drivers.sensors.twin import (
 )
 from telescope_mcp.drivers.sensors.types import (
     AvailableSensor,
+    BufferedSensorInstance,
     SensorDriver,
     SensorInstance,
     SensorReading,
+    SensorReadingBatch,
     validate_position,
 )
 
@@ -62,13 +75,22 @@ from telescope_mcp.drivers.serial import PortEnumerator, SerialPort
 __all__ = [
     # Data classes
     "SensorReading",
+    "SensorReadingBatch",
     # Protocols
     "SensorInstance",
+    "BufferedSensorInstance",
     "SensorDriver",
     # Type definitions
     "AvailableSensor",
     # Validation helpers
     "validate_position",
+    # Sample history
+    "SensorHistory",
+    "HistoryStats",
+    # Orientation fusion
+    "OrientationFilter",
+    "MagnetometerCalibration",
+    "fit_ellipsoid",
     # Serial protocols (re-exported from drivers.serial)
     "SerialPort",
     "PortEnumerator",
@@ -10,7 +10,20 @@ Hardware: Arduino Nano BLE33 Sense
 Serial Protocol:
 - Baud rate: 115200
 - Output format: aX\\taY\\taZ\\tmX\\tmY\\tmZ\\ttemp\\thumidity\\r\\n
-- Commands: RESET, STATUS, CALIBRATE, STOP, START
+- Binary format (after BINARY command): 34-byte frames of sync 0xAA 0x55,
+  uint16 sequence, six float32 IMU channels, int16 temperature/humidity in
+  hundredths, CRC-16/CCITT-FALSE. Sequence gaps count lost frames.
+- Commands: RESET, STATUS, CALIBRATE, STOP, START, BINARY, ASCII, RATE <hz>
+- Sample rate: 10 Hz after power-up, set with RATE (1-100 Hz). The rate
+  in effect is read back from STATUS and RATE replies.
+
+Altitude and azimuth come from an OrientationFilter that the reader
+thread updates with every sample, with azimuth tilt-compensated.
+start_magnetometer_sweep()/finish_magnetometer_sweep() fit a hard-iron
+offset and soft-iron matrix to raw samples gathered while the mount
+slews; the correction is applied to the field vector on every read.
+Passing record_to captures all serial traffic with RecordingSerialPort;
+replay it through _create_with_serial() with ReplaySerialPort.
 
 Example:
     from telescope_mcp.drivers.sensors import ArduinoSensorDriver
@@ -48,13 +61,32 @@ Testing:
 
 from __future__ import annotations
 
+import binascii
 import math
+import re
 import threading
 import time
+from collections.abc import Sequence
 from datetime import UTC, datetime
+from pathlib import Path
 from types import TracebackType
 from typing import TypedDict
 
+import numpy as np
+from numpy.typing import NDArray
+
+from telescope_mcp.drivers.sensors.fusion import (
+    OrientationFilter,
+    tilt_compensated_heading,
+)
+from telescope_mcp.drivers.sensors.history import (
+    SensorHistory,
+    monotonic_ns_at,
+)
+from telescope_mcp.drivers.sensors.magnetometer import (
+    MagnetometerCalibration,
+    MagnetometerSweep,
+)
 from telescope_mcp.drivers.sensors.types import (
     AccelerometerData,
     AvailableSensor,
@@ -72,8 +104,16 @@ __all__ = [
     "ArduinoSensorInfo",
     "ArduinoSensorStatus",
     "ArduinoAvailableSensor",
+    "ArduinoLinkStats",
+    "BINARY_FRAME_SIZE",
+    "encode_binary_frame",
 ]
-from telescope_mcp.drivers.serial import PortEnumerator, SerialPort, list_serial_ports
+from telescope_mcp.drivers.serial import (
+    PortEnumerator,
+    RecordingSerialPort,
+    SerialPort,
+    list_serial_ports,
+)
 from telescope_mcp.observability import get_logger
 
 logger = get_logger(__name__)
@@ -81,7 +121,148 @@ logger = get_logger(__name__)
 # Protocol constants for Arduino serial data format
 _FULL_FORMAT_FIELDS = 8  # aX, aY, aZ, mX, mY, mZ, temp, humidity
 _LEGACY_FORMAT_FIELDS = 6  # aX, aZ, aY, mX, mZ, mY (note different order)
-_ARDUINO_SAMPLE_RATE_HZ = 10.0  # Fixed sample rate for Arduino BLE33 firmware
+_ARDUINO_SAMPLE_RATE_HZ = 10.0  # Firmware sample rate after power-up
+_MIN_SAMPLE_RATE_HZ = 1  # Firmware RATE command limits
+_MAX_SAMPLE_RATE_HZ = 100
+# STATUS line or RATE reply reporting the rate the firmware is running at
+_SAMPLE_RATE_LINE = re.compile(r"(?:OK: )?Sample Rate:\s*(\d+)\s*Hz")
+_RESPONSE_PREFIXES = ("INFO:", "OK:", "ERROR:", "CMD:", "===", "---")
+_MAX_PENDING_BYTES = 4096  # Drop an unterminated partial line beyond this
+_RX_LOG_INTERVAL_SEC = 10.0  # Minimum spacing of reader throughput logs
+_RX_STARTUP_LOG_LINES = 5  # Lines logged individually after open
+
+# Binary frame protocol (firmware BINARY command), little-endian:
+#   sync 0xAA 0x55 | seq u16 | aX aY aZ mX mY mZ f32 | temp, humidity i16
+#   (hundredths) | CRC-16/CCITT-FALSE u16 over seq..humidity
+# 0xAA never appears in the ASCII output, so frames and text lines can be
+# separated in one stream.
+_BINARY_SYNC = b"\xaa\x55"
+_BINARY_FRAME = np.dtype(
+    [
+        ("sync", "S2"),
+        ("seq", "<u2"),
+        ("imu", "<f4", (6,)),
+        ("env", "<i2", (2,)),
+        ("crc", "<u2"),
+    ]
+)
+BINARY_FRAME_SIZE = _BINARY_FRAME.itemsize  # 34 bytes vs ~50 for ASCII
+_BINARY_ENV_SCALE = 100.0
+# A forward gap this large is a sequence restart (firmware reboot), not loss
+_SEQ_RESTART_GAP = 32768
+_CRC_INIT = 0xFFFF
+_NON_TEXT = re.compile(r"[^\t\x20-\x7e]")  # Bytes never sent in ASCII output
+
+
+def encode_binary_frame(seq: int, values: Sequence[float]) -> bytes:
+    """Pack one sample the way the firmware does in BINARY mode.
+
+    Business context: Documents the wire format in executable form and
+    lets tests, the digital twin, and replay tools produce frames
+    without hardware.
+
+    Args:
+        seq: Frame sequence counter (wraps at 65536).
+        values: Eight channel values: aX, aY, aZ, mX, mY, mZ, temperature,
+            humidity. Environment values are rounded to hundredths.
+
+    Returns:
+        BINARY_FRAME_SIZE bytes including sync word and CRC.
+
+    Raises:
+        ValueError: If values does not have eight entries.
+
+    Example:
+        >>> frame = encode_binary_frame(7, [0.5, 0, 0.87, 30, 0, 40, 22.5, 55])
+        >>> len(frame) == BINARY_FRAME_SIZE
+        True
+    """
+    if len(values) != _FULL_FORMAT_FIELDS:
+        raise ValueError(
+            f"Expected {_FULL_FORMAT_FIELDS} channel values, got {len(values)}"
+        )
+    frame = np.zeros(1, dtype=_BINARY_FRAME)
+    frame["sync"] = _BINARY_SYNC
+    frame["seq"] = seq % 65536
+    frame["imu"] = values[:6]
+    frame["env"] = np.round(np.asarray(values[6:]) * _BINARY_ENV_SCALE)
+    data = frame.tobytes()
+    frame["crc"] = binascii.crc_hqx(data[2:-2], _CRC_INIT)
+    return frame.tobytes()
+
+
+def _split_frames(buffer: bytes) -> tuple[NDArray[np.void], bytes, bytes, int]:
+    """Separate binary frames from text in a received byte stream.
+
+    Runs of back-to-back frames are viewed in place through a numpy
+    structured dtype; only the CRC check touches each frame in Python.
+
+    Args:
+        buffer: Unconsumed bytes from previous calls plus the new chunk.
+
+    Returns:
+        Tuple (frames, text, rest, corrupt): valid frames as a structured
+        array, text bytes between frames, the unconsumed tail (a partial
+        frame or an unterminated text line), and the number of sync words
+        whose frame failed the CRC check.
+
+    Raises:
+        No exceptions raised.
+
+    Example:
+        >>> frames, text, rest, corrupt = _split_frames(pending + chunk)
+    """
+    runs: list[NDArray[np.void]] = []
+    text: list[bytes] = []
+    corrupt = 0
+    pos = 0
+    while True:
+        start = buffer.find(_BINARY_SYNC, pos)
+        if start < 0:
+            end = buffer.rfind(b"\n", pos) + 1
+            if end > 0:
+                text.append(buffer[pos:end])
+                pos = end
+            break
+        text.append(buffer[pos:start])
+        count = (len(buffer) - start) // BINARY_FRAME_SIZE
+        if count == 0:
+            pos = start
+            break
+        run = np.frombuffer(buffer, _BINARY_FRAME, count=count, offset=start)
+        good = 0
+        for frame in run:
+            offset = start + good * BINARY_FRAME_SIZE + 2
+            if frame["sync"] != _BINARY_SYNC or binascii.crc_hqx(
+                buffer[offset : offset + BINARY_FRAME_SIZE - 4], _CRC_INIT
+            ) != int(frame["crc"]):
+                break
+            good += 1
+        if good == 0:
+            # Not a valid frame here; resynchronize one byte further on
+            corrupt += 1
+            pos = start + 1
+            continue
+        runs.append(run[:good])
+        pos = start + good * BINARY_FRAME_SIZE
+    frames = np.concatenate(runs) if runs else np.zeros(0, dtype=_BINARY_FRAME)
+    return frames, b"".join(text), buffer[pos:], corrupt
+
+
+class ArduinoLinkStats(TypedDict):
+    """Serial link counters for the Arduino sample stream.
+
+    Keys:
+        protocol: "binary" once frames have been received, else "ascii".
+        frames_received: Valid binary frames decoded.
+        frames_lost: Frames missing according to sequence-number gaps.
+        frames_corrupt: Sync words whose frame failed the CRC check.
+    """
+
+    protocol: str
+    frames_received: int
+    frames_lost: int
+    frames_corrupt: int
 
 
 class ArduinoSensorInfo(TypedDict):
@@ -162,6 +343,7 @@ class ArduinoSensorInstance:
         baudrate: int = 115200,
         *,
         startup_delay: float = 0.5,
+        record_to: str | Path | None = None,
     ) -> None:
         """Open serial connection to Arduino sensor.
 
@@ -177,6 +359,8 @@ class ArduinoSensorInstance:
             baudrate: Serial baud rate (default 115200).
             startup_delay: Seconds to wait for first reading after
                 connection (default 0.5). Set to 0 for faster tests.
+            record_to: Record all serial traffic to this file with
+                RecordingSerialPort, for later replay (default None).
 
         Returns:
             None. Instance connected and reading data.
@@ -198,11 +382,16 @@ class ArduinoSensorInstance:
             raise RuntimeError("pyserial not installed. Run: pdm add pyserial")
         except Exception as e:
             raise RuntimeError(f"Failed to open serial port {port}: {e}")
+        if record_to is not None:
+            serial_port = RecordingSerialPort(serial_port, record_to)
 
         self._init_with_serial(serial_port, port)
 
-        # Start background reader and wait for first reading
+        # Start background reader and wait for first reading. The firmware
+        # keeps a RATE setting across host reconnects, so ask for it; the
+        # reader picks the rate out of the STATUS reply.
         self._start_reader()
+        self._send_command("STATUS", wait_response=False)
         if startup_delay > 0:
             time.sleep(startup_delay)
 
@@ -289,6 +478,16 @@ class ArduinoSensorInstance:
         self._raw_values: str = ""
         self._last_update: datetime | None = None
 
+        # Timestamped raw samples (filled by background thread, own lock)
+        self._history = SensorHistory()
+
+        # Smoothed IMU vectors behind read() (updated per sample, under _lock)
+        self._fusion = OrientationFilter()
+
+        # Hard/soft-iron correction applied per read; sweep collects samples
+        self._mag_calibration: MagnetometerCalibration | None = None
+        self._mag_sweep: MagnetometerSweep | None = None
+
         # Calibration parameters
         self._cal_alt_scale = 1.0
         self._cal_alt_offset = 0.0
@@ -302,6 +501,13 @@ class ArduinoSensorInstance:
         # Background reader state
         self._stop_reading = False
         self._reader_thread: threading.Thread | None = None
+        self._rx_pending = b""  # Unconsumed tail of the last serial chunk
+        self._last_seq: int | None = None  # Binary frame sequence tracking
+        self._binary_rx = False  # Firmware sending binary frames
+        self._frames_received = 0
+        self._frames_lost = 0
+        self._frames_corrupt = 0
+        self._sample_rate_hz = _ARDUINO_SAMPLE_RATE_HZ  # From firmware replies
 
     def _start_reader(self) -> None:
         """Start the background reader thread for continuous data.
@@ -340,7 +546,8 @@ class ArduinoSensorInstance:
         Updates internal state (accelerometer, magnetometer, temperature,
         humidity) if line contains valid tab-separated sensor values.
         Handles both 8-value (full format) and 6-value (legacy IMU-only)
-        data formats. Ignores command responses and malformed lines.
+        data formats. Ignores command responses and malformed lines, but
+        takes the sample rate from STATUS and RATE replies.
 
         Business context: The Arduino streams sensor data continuously.
         This method is the core parser that converts raw serial strings
@@ -376,8 +583,13 @@ class ArduinoSensorInstance:
         if not line:
             return False
 
+        rate = _SAMPLE_RATE_LINE.match(line)
+        if rate is not None:
+            self._sample_rate_hz = float(rate.group(1))
+            return False
+
         # Skip command responses
-        if line.startswith(("INFO:", "OK:", "ERROR:", "CMD:", "===", "---")):
+        if line.startswith(_RESPONSE_PREFIXES):
             return False
 
         values = line.split("\t")
@@ -404,6 +616,7 @@ class ArduinoSensorInstance:
                     self._humidity = humidity
                     self._raw_values = line
                     self._last_update = datetime.now(UTC)
+                self._record_sample(accel, mag, temp, humidity)
                 return True
 
             elif len(values) == _LEGACY_FORMAT_FIELDS:
@@ -423,6 +636,8 @@ class ArduinoSensorInstance:
                     self._magnetometer = legacy_mag
                     self._raw_values = line
                     self._last_update = datetime.now(UTC)
+                    temp, humidity = self._temperature, self._humidity
+                self._record_sample(legacy_accel, legacy_mag, temp, humidity)
                 return True
 
         except (ValueError, UnicodeDecodeError) as e:
@@ -438,20 +653,292 @@ class ArduinoSensorInstance:
         )
         return False
 
+    def _record_sample(
+        self,
+        accel: AccelerometerData,
+        mag: MagnetometerData,
+        temperature: float,
+        humidity: float,
+    ) -> None:
+        """Append one parsed sample to the timestamped history ring.
+
+        Business context: The ring keeps the recent stream so averaged
+        reads, position smoothing, and frame tagging can use samples that
+        already arrived instead of waiting for new ones.
+
+        Args:
+            accel: Parsed accelerometer vector.
+            mag: Parsed magnetometer vector.
+            temperature: Temperature in Celsius (last known for legacy lines).
+            humidity: Relative humidity in % (last known for legacy lines).
+
+        Returns:
+            None. Sample stamped with time.monotonic_ns() and fed to the
+            orientation filter.
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> # Called by _parse_line() after each valid data line
+            >>> instance._record_sample(accel, mag, 22.5, 55.0)
+        """
+        t_ns = time.monotonic_ns()
+        values = (
+            accel["aX"],
+            accel["aY"],
+            accel["aZ"],
+            mag["mX"],
+            mag["mY"],
+            mag["mZ"],
+            temperature,
+            humidity,
+        )
+        self._history.append(values, t_ns)
+        with self._lock:
+            self._fusion.update(np.array([values]), np.array([t_ns]))
+            if self._mag_sweep is not None:
+                self._mag_sweep.add(values[3:6])
+
+    def _ingest(self, data: bytes) -> tuple[list[str], int]:
+        """Split received bytes into samples and publish them in batches.
+
+        Binary frames (firmware BINARY mode) are decoded in place and
+        published as one batch. Text between frames is split into lines:
+        full-format data lines are converted to floats by a single numpy
+        call and published with one state-lock and one history-lock
+        acquisition. Anything else (command responses, legacy 6-field
+        lines, malformed data) goes through _parse_line() individually.
+        A partial frame or unterminated line is kept for the next call,
+        so the stream may switch protocols at any point.
+
+        Business context: At higher firmware output rates a line-at-a-time
+        parser with per-line dicts, float() calls, and locking burns a core
+        and drops data; batch parsing keeps the cost per serial wake-up.
+
+        Args:
+            data: Bytes read from the serial port (any framing).
+
+        Returns:
+            Tuple (lines, parsed): the complete text lines in the chunk and
+            the number of samples (lines or frames) published.
+
+        Raises:
+            No exceptions raised. Malformed lines and frames are skipped.
+
+        Example:
+            >>> lines, parsed = instance._ingest(serial.read(serial.in_waiting))
+        """
+        frames, text, tail, corrupt = _split_frames(self._rx_pending + data)
+        if len(tail) > _MAX_PENDING_BYTES:
+            logger.debug("Dropping unterminated serial data", size=len(tail))
+            tail = b""
+        self._rx_pending = tail
+        self._frames_corrupt += corrupt
+
+        lines = [c.decode(errors="replace").strip() for c in text.split(b"\n")]
+        if lines and not lines[-1]:
+            lines.pop()
+        rows: list[str] = []
+        parsed = 0
+        for line in lines:
+            if line.count("\t") == _FULL_FORMAT_FIELDS - 1:
+                rows.append(line)
+            elif line:
+                parsed += self._parse_line(line)
+        if rows:
+            parsed += self._publish_rows(rows)
+        if len(frames):
+            parsed += self._publish_frames(frames)
+        return lines, parsed
+
+    def _publish_rows(self, rows: list[str]) -> int:
+        """Parse full-format lines in bulk and publish them as one batch.
+
+        Args:
+            rows: Lines with eight tab-separated fields.
+
+        Returns:
+            Number of rows published. A malformed value anywhere in the
+            batch falls back to per-line parsing to isolate it.
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> instance._publish_rows(["0.5\t0.0\t0.87\t30\t0\t40\t22.5\t55"])
+            1
+        """
+        try:
+            values = np.array("\t".join(rows).split("\t"), dtype=np.float64).reshape(
+                len(rows), _FULL_FORMAT_FIELDS
+            )
+        except ValueError:
+            return sum(self._parse_line(row) for row in rows)
+        self._publish_batch(values, rows[-1])
+        return len(rows)
+
+    def _publish_frames(self, frames: NDArray[np.void]) -> int:
+        """Publish decoded binary frames and account for sequence gaps.
+
+        A backwards jump in the u16 sequence (forward gap of half the
+        counter range or more) means the firmware restarted counting,
+        e.g. after a reboot, and resynchronizes instead of counting
+        ~65k lost frames. reset() and set_binary_output() clear the
+        tracked sequence so the next frame starts a fresh count.
+
+        Args:
+            frames: Valid frames from _split_frames().
+
+        Returns:
+            Number of frames published.
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> frames, _, _, _ = _split_frames(chunk)
+            >>> instance._publish_frames(frames)
+        """
+        seqs = frames["seq"].astype(np.int64)
+        previous = seqs[:1] - 1 if self._last_seq is None else [self._last_seq]
+        gaps = (np.diff(seqs, prepend=previous) - 1) % 65536
+        restarts = gaps >= _SEQ_RESTART_GAP
+        if restarts.any():
+            logger.info("Binary frame sequence restarted", seq=int(seqs[restarts][0]))
+            gaps[restarts] = 0
+        lost = int(gaps.sum())
+        if lost:
+            logger.debug("Binary frames lost", count=lost, seq=int(seqs[-1]))
+        self._frames_lost += lost
+        self._frames_received += len(frames)
+        self._last_seq = int(seqs[-1])
+        self._binary_rx = True
+
+        values = np.empty((len(frames), _FULL_FORMAT_FIELDS), dtype=np.float64)
+        values[:, :6] = frames["imu"]
+        values[:, 6:] = frames["env"] / _BINARY_ENV_SCALE
+        self._publish_batch(values, f"binary_frame_{self._last_seq}")
+        return len(frames)
+
+    def _publish_batch(self, values: NDArray[np.float64], raw_values: str) -> None:
+        """Record a batch of samples in history and update the latest state.
+
+        Timestamps are spread evenly from the previous sample (at most one
+        interval at the firmware's sample rate per sample back) to now,
+        since a chunk holds
+        everything received since the last wake-up. Every sample in the
+        batch also steps the orientation filter.
+
+        Args:
+            values: Array of shape (n, 8) in HISTORY_CHANNELS order.
+            raw_values: Description of the newest sample for raw_values.
+
+        Returns:
+            None.
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> instance._publish_batch(values, rows[-1])
+        """
+        n = len(values)
+        now_ns = time.monotonic_ns()
+        span_ns = round(n * 1e9 / self._sample_rate_hz)
+        start_ns = max(self._history.newest_ns or 0, now_ns - span_ns)
+        start_ns = min(start_ns, now_ns)
+        times = start_ns + (now_ns - start_ns) * np.arange(1, n + 1) // n
+        self._history.extend(values, times)
+
+        ax, ay, az, mx, my, mz, temp, humidity = (float(v) for v in values[-1])
+        with self._lock:
+            self._fusion.update(values, times)
+            if self._mag_sweep is not None:
+                self._mag_sweep.add(values[:, 3:6])
+            self._accelerometer = {"aX": ax, "aY": ay, "aZ": az}
+            self._magnetometer = {"mX": mx, "mY": my, "mZ": mz}
+            self._temperature = temp
+            self._humidity = humidity
+            self._raw_values = raw_values
+            self._last_update = datetime.now(UTC)
+
+    @property
+    def link_stats(self) -> ArduinoLinkStats:
+        """Counters describing the serial sample stream.
+
+        Business context: Sequence gaps reveal samples dropped on the USB
+        link or by the host, which ASCII output cannot show.
+
+        Returns:
+            ArduinoLinkStats with protocol and frame counters.
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> instance.set_binary_output(True)
+            >>> instance.link_stats["frames_lost"]
+            0
+        """
+        return ArduinoLinkStats(
+            protocol="binary" if self._frames_received else "ascii",
+            frames_received=self._frames_received,
+            frames_lost=self._frames_lost,
+            frames_corrupt=self._frames_corrupt,
+        )
+
+    def set_binary_output(self, enabled: bool = True) -> None:
+        """Switch the firmware between binary frames and ASCII lines.
+
+        The reader decodes both formats at any time, so switching needs
+        no coordination; ASCII remains the firmware default and fallback.
+
+        Business context: Binary frames are ~30% smaller than ASCII lines
+        and need no text parsing, which leaves headroom for higher sample
+        rates on the same 115200 baud link and reports lost samples.
+
+        Args:
+            enabled: True sends BINARY, False sends ASCII.
+
+        Returns:
+            None.
+
+        Raises:
+            RuntimeError: If sensor is closed.
+
+        Example:
+            >>> instance.set_binary_output(True)
+        """
+        if not self._is_open:
+            raise RuntimeError("Sensor is closed")
+        self._send_command("BINARY" if enabled else "ASCII", wait_response=False)
+        self._binary_rx = enabled
+        self._last_seq = None
+        logger.info("Sensor output protocol set", binary=enabled, port=self._port)
+
     def _read_loop(self) -> None:
         """Background thread loop for continuous sensor data reading.
 
-        Continuously reads lines from serial port and parses sensor data
-        until stop flag set or port closed. Updates internal state with
-        each valid reading.
+        Continuously reads serial data and parses sensor samples until
+        stop flag set or port closed. Updates internal state with each
+        batch of valid readings.
 
         Business context: Continuous reading ensures sensor data is always
         fresh. Daemon thread terminates automatically when main program
         exits, preventing resource leaks.
 
-        Implementation: Loops while _stop_reading is False and _is_open.
-        Reads until newline, decodes, and calls parse_line(). Catches
-        exceptions to prevent thread crash, logs warnings.
+        Implementation: Blocks in read_until() for the next line, then
+        drains everything else already received (in_waiting) and hands
+        the chunk to _ingest(). At 10 Hz this is one line per wake-up; at
+        higher rates each wake-up handles a batch. Binary frames rarely
+        contain a newline, so in binary mode the loop instead blocks for
+        one byte and takes whatever else has arrived (read(max(1,
+        in_waiting))), waking per chunk rather than per read timeout.
+        The first few lines are
+        logged individually, afterwards throughput is logged at most every
+        _RX_LOG_INTERVAL_SEC. Catches exceptions to prevent thread crash,
+        logs warnings.
 
         Args:
             No arguments. Uses instance state.
@@ -468,29 +955,48 @@ class ArduinoSensorInstance:
         """
         logger.info("Sensor reader thread started", port=self._port)
         lines_read = 0
+        samples_parsed = 0
+        next_log = time.monotonic() + _RX_LOG_INTERVAL_SEC
         while not self._stop_reading and self._is_open:
             try:
-                # Use \n as terminator - Arduino Nano 33 BLE (ARM) sends \n only,
-                # unlike AVR Arduinos which send \r\n
-                raw_bytes = self._serial.read_until(b"\n")
-                line = raw_bytes.decode().strip()
-                lines_read += 1
-                if lines_read <= 5 or lines_read % 100 == 0:
+                if self._binary_rx:
+                    raw_bytes = self._serial.read(max(1, self._serial.in_waiting))
+                else:
+                    # Use \n as terminator - Arduino Nano 33 BLE (ARM) sends \n
+                    # only, unlike AVR Arduinos which send \r\n
+                    raw_bytes = self._serial.read_until(b"\n")
+                    waiting = self._serial.in_waiting
+                    if waiting > 0:
+                        raw_bytes += self._serial.read(waiting)
+                lines, parsed = self._ingest(raw_bytes)
+                for offset, line in enumerate(lines):
+                    line_num = lines_read + offset + 1
+                    if line_num > _RX_STARTUP_LOG_LINES:
+                        break
                     logger.info(
                         "Serial data received",
-                        line_num=lines_read,
-                        raw_len=len(raw_bytes),
+                        line_num=line_num,
                         line_preview=line[:80] if line else "<empty>",
                     )
-                parsed = self._parse_line(line)
-                if parsed and lines_read <= 5:
-                    logger.info("Successfully parsed sensor data", line_num=lines_read)
+                lines_read += len(lines)
+                samples_parsed += parsed
+                if time.monotonic() >= next_log:
+                    next_log = time.monotonic() + _RX_LOG_INTERVAL_SEC
+                    logger.info(
+                        "Sensor reader throughput",
+                        lines_read=lines_read,
+                        samples_parsed=samples_parsed,
+                    )
             except Exception as e:
                 if self._is_open:
                     logger.warning(
                         "Sensor read error", error=str(e), line_num=lines_read
                     )
-        logger.info("Sensor reader thread stopped", lines_read=lines_read)
+        logger.info(
+            "Sensor reader thread stopped",
+            lines_read=lines_read,
+            samples_parsed=samples_parsed,
+        )
 
     def get_info(self) -> SensorInfo:
         """Get Arduino sensor hardware information and capabilities.
@@ -532,7 +1038,7 @@ class ArduinoSensorInstance:
             port=self._port,
         )
 
-    def _calculate_altitude(self) -> float:
+    def _calculate_altitude(self, accel: AccelerometerData | None = None) -> float:
         """Calculate altitude from accelerometer tilt data.
 
         Uses 3-axis accelerometer to compute telescope altitude (elevation)
@@ -548,7 +1054,8 @@ class ArduinoSensorInstance:
         (scale, offset). Returns 0 if accelerometer data is zero.
 
         Args:
-            No arguments. Uses internal _accelerometer dict and calibration.
+            accel: Accelerometer vector to convert. Defaults to the latest
+                _accelerometer (e.g. pass a history average instead).
 
         Returns:
             float: Altitude in degrees (0-90), after calibration applied.
@@ -562,13 +1069,33 @@ class ArduinoSensorInstance:
             >>> 25 < alt < 35  # ~30 degrees
             True
         """
-        if self._accelerometer is None:
+        if accel is None:
+            accel = self._accelerometer
+        if accel is None:
             return 0.0
+        return self._altitude_from(accel["aX"], accel["aY"], accel["aZ"])
+
+    def _altitude_from(self, ax: float, ay: float, az: float) -> float:
+        """Calibrated altitude for one gravity vector given as scalars.
 
-        ax = self._accelerometer["aX"]
-        ay = self._accelerometer["aY"]
-        az = self._accelerometer["aZ"]
+        Shared by _calculate_altitude() and the array paths, which take
+        channels straight from a tuple or row without building a dict.
 
+        Args:
+            ax: Accelerometer X in g.
+            ay: Accelerometer Y in g.
+            az: Accelerometer Z in g.
+
+        Returns:
+            Altitude in degrees after tilt and altitude calibration; 0.0
+            if ay and az are both zero.
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> instance._altitude_from(0.5, 0.0, 0.87)  # ~30 degrees
+        """
         if ay == 0 and az == 0:
             return 0.0
 
@@ -582,22 +1109,35 @@ class ArduinoSensorInstance:
         # Apply transform
         return self._cal_alt_scale * calibrated + self._cal_alt_offset
 
-    def _calculate_azimuth(self) -> float:
+    def _calculate_azimuth(
+        self,
+        mag: MagnetometerData | None = None,
+        accel: AccelerometerData | None = None,
+    ) -> float:
         """Calculate azimuth from magnetometer compass data.
 
-        Uses 2-axis magnetometer reading to compute telescope azimuth
-        (heading/bearing). Applies calibration scaling and offset.
+        Uses the magnetometer reading to compute telescope azimuth
+        (heading/bearing), tilt-compensated with the accelerometer when
+        one is given. Applies the hard/soft-iron correction from
+        finish_magnetometer_sweep(), then calibration scaling and offset.
 
         Business context: Telescope azimuth determines east-west pointing.
         Magnetometer provides absolute heading reference independent of
         mount mechanics.
 
-        Implementation: Uses atan2(mY, mX) for heading, normalizes to 0-360,
-        then applies azimuth transform (scale, offset) with modulo 360.
-        Returns 0 if magnetometer data is zero.
+        Implementation: Corrects the vector with W (m - b) when an
+        ellipsoid calibration is set (one 3x3 product; affine, so it is
+        equally valid for averaged or filtered vectors). Uses
+        tilt_compensated_heading() (atan2(mY, mX) when level or without
+        accelerometer data), normalizes to 0-360, then applies azimuth
+        transform (scale, offset) with modulo 360. Returns 0 if
+        magnetometer data is zero.
 
         Args:
-            No arguments. Uses internal _magnetometer dict and calibration.
+            mag: Magnetometer vector to convert. Defaults to the latest
+                _magnetometer (e.g. pass a history average instead).
+            accel: Gravity vector for tilt compensation. None uses the
+                uncompensated heading.
 
         Returns:
             float: Azimuth in degrees (0-360), north=0, east=90.
@@ -611,25 +1151,80 @@ class ArduinoSensorInstance:
             >>> az == 0.0  # Pointing magnetic north
             True
         """
-        if self._magnetometer is None:
+        if mag is None:
+            mag = self._magnetometer
+        if mag is None:
             return 0.0
+        gravity = None if accel is None else (accel["aX"], accel["aY"], accel["aZ"])
+        return self._azimuth_from(mag["mX"], mag["mY"], mag["mZ"], gravity)
+
+    def _azimuth_from(
+        self,
+        mx: float,
+        my: float,
+        mz: float,
+        gravity: tuple[float, float, float] | None = None,
+    ) -> float:
+        """Calibrated azimuth for one field vector given as scalars.
 
-        mx = self._magnetometer["mX"]
-        my = self._magnetometer["mY"]
+        Shared by _calculate_azimuth() and the array paths, which take
+        channels straight from a tuple or row without building a dict.
 
+        Args:
+            mx: Magnetometer X in µT.
+            my: Magnetometer Y in µT.
+            mz: Magnetometer Z in µT.
+            gravity: (aX, aY, aZ) for tilt compensation, or None for the
+                uncompensated heading.
+
+        Returns:
+            Azimuth in degrees (0-360) after the ellipsoid correction and
+            azimuth calibration; 0.0 if mx and my are both zero.
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> instance._azimuth_from(30.0, 0.0, 40.0)  # magnetic north
+            0.0
+        """
         if mx == 0 and my == 0:
             return 0.0
 
-        # Heading from magnetometer
-        heading = math.atan2(my, mx) * (180 / math.pi)
+        calibration = self._mag_calibration
+        if calibration is not None:
+            mx, my, mz = (float(v) for v in calibration.apply((mx, my, mz)))
 
-        # Normalize to 0-360
-        if heading < 0:
-            heading += 360
+        # Heading from magnetometer, projected onto the horizontal plane
+        if gravity is None:
+            heading = math.degrees(math.atan2(my, mx)) % 360
+        else:
+            heading = tilt_compensated_heading(*gravity, mx, my, mz)
 
         # Apply transform
         return (self._cal_az_scale * heading + self._cal_az_offset) % 360
 
+    def _fused_vectors(self) -> tuple[AccelerometerData, MagnetometerData] | None:
+        """Filtered accelerometer and magnetometer vectors.
+
+        Must be called with _lock held.
+
+        Returns:
+            Tuple (accel, mag) from the orientation filter, falling back
+            to the latest raw vectors before the filter has a sample.
+            None if no data has been received.
+
+        Raises:
+            No exceptions raised.
+        """
+        fused = self._fusion.estimate()
+        if fused is None:
+            if self._accelerometer is None or self._magnetometer is None:
+                return None
+            return self._accelerometer, self._magnetometer
+        ax, ay, az, mx, my, mz = (float(v) for v in fused)
+        return {"aX": ax, "aY": ay, "aZ": az}, {"mX": mx, "mY": my, "mZ": mz}
+
     def read(self) -> SensorReading:
         """Read current sensor values from the background reader cache.
 
@@ -639,18 +1234,19 @@ class ArduinoSensorInstance:
 
         Business context: Core sensor operation for telescope orientation.
         Values are continuously updated by background thread at sensor's
-        native rate (~10Hz). Callers get latest available data without
-        serial I/O latency.
+        native rate (~10Hz). Altitude and azimuth come from the fused
+        estimate that thread maintains, so callers get low-noise pointing
+        with little lag and without serial I/O latency or re-averaging.
 
         Args:
             No arguments.
 
         Returns:
             SensorReading: Dataclass containing:
-                - accelerometer: dict with aX, aY, aZ in g's
-                - magnetometer: dict with mX, mY, mZ in µT
-                - altitude: Calibrated altitude (0-90°)
-                - azimuth: Calibrated azimuth (0-360°)
+                - accelerometer: dict with aX, aY, aZ in g's (latest sample)
+                - magnetometer: dict with mX, mY, mZ in µT (latest sample)
+                - altitude: Calibrated altitude (0-90°), fused
+                - azimuth: Calibrated tilt-compensated azimuth (0-360°), fused
                 - temperature: Ambient temperature (°C)
                 - humidity: Relative humidity (%)
                 - timestamp: datetime of reading (UTC)
@@ -670,20 +1266,214 @@ class ArduinoSensorInstance:
             raise RuntimeError("Sensor is closed")
 
         with self._lock:
-            if self._accelerometer is None or self._magnetometer is None:
+            fused = self._fused_vectors()
+            raw_accel, raw_mag = self._accelerometer, self._magnetometer
+            if fused is None or raw_accel is None or raw_mag is None:
                 raise RuntimeError("No sensor data available yet")
+            accel, mag = fused
 
             return SensorReading(
-                accelerometer=self._accelerometer,
-                magnetometer=self._magnetometer,
-                altitude=self._calculate_altitude(),
-                azimuth=self._calculate_azimuth(),
+                accelerometer=raw_accel,
+                magnetometer=raw_mag,
+                altitude=self._calculate_altitude(accel),
+                azimuth=self._calculate_azimuth(mag, accel),
                 temperature=self._temperature,
                 humidity=self._humidity,
                 timestamp=self._last_update or datetime.now(UTC),
                 raw_values=self._raw_values,
             )
 
+    @property
+    def history(self) -> SensorHistory:
+        """Timestamped ring of raw samples received by the reader thread.
+
+        Business context: Exposes the recent sample stream for queries by
+        time range, interpolation, and windowed statistics without extra
+        serial I/O.
+
+        Returns:
+            SensorHistory holding monotonic ns timestamps plus the eight
+            raw channels (aX, aY, aZ, mX, mY, mZ, temperature, humidity).
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> stats = instance.history.stats(window_ns=2_000_000_000)
+            >>> print(f"aX noise: {stats.variance[0] ** 0.5:.4f} g")
+        """
+        return self._history
+
+    def _reading_from_values(
+        self, values: NDArray[np.float64], t_ns: int, raw_values: str
+    ) -> SensorReading:
+        """Build a calibrated SensorReading from eight raw channel values.
+
+        Altitude and azimuth are derived from the given (averaged or
+        interpolated) vectors, so averaging happens before the nonlinear
+        angle math and azimuth needs no wraparound handling.
+
+        Args:
+            values: Channel values in HISTORY_CHANNELS order.
+            t_ns: Monotonic timestamp the values represent.
+            raw_values: Description stored in SensorReading.raw_values.
+
+        Returns:
+            SensorReading with calibration applied, stamped with t_ns
+            (its datetime is only built if a caller asks for it).
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> reading = instance._reading_from_values(stats.mean, t, "avg")
+        """
+        ax, ay, az, mx, my, mz = values[:6].tolist()
+        return SensorReading.from_values(
+            values,
+            self._altitude_from(ax, ay, az),
+            self._azimuth_from(mx, my, mz, (ax, ay, az)),
+            t_ns,
+            raw_values,
+        )
+
+    def _require_history(self) -> None:
+        """Raise RuntimeError unless the sensor is open with buffered samples.
+
+        Raises:
+            RuntimeError: If closed or no sample received yet.
+        """
+        if not self._is_open:
+            raise RuntimeError("Sensor is closed")
+        if len(self._history) == 0:
+            raise RuntimeError("No sensor data available yet")
+
+    def read_average(self, samples: int) -> SensorReading:
+        """Average the newest buffered samples without waiting for new data.
+
+        Business context: Noise reduction for pointing without the latency
+        of collecting fresh samples; at 10 Hz a 20-sample average is
+        already in the buffer two seconds after open().
+
+        Args:
+            samples: Number of newest samples to average. Fewer are used
+                when fewer are buffered (see raw_values).
+
+        Returns:
+            SensorReading from the mean raw vectors, stamped with the
+            newest sample time. raw_values is "averaged_N_samples".
+
+        Raises:
+            RuntimeError: If sensor is closed or no data received yet.
+            ValueError: If samples < 1.
+
+        Example:
+            >>> reading = instance.read_average(20)  # last ~2 s at 10 Hz
+        """
+        self._require_history()
+        stats = self._history.stats(samples=samples)
+        return self._reading_from_values(
+            stats.mean, stats.end_ns, f"averaged_{stats.count}_samples"
+        )
+
+    def read_window(self, duration_ms: float) -> SensorReading:
+        """Average the buffered samples from the last duration_ms of stream.
+
+        The window ends at the newest sample, so it always holds at least
+        one sample and never blocks waiting for more.
+
+        Business context: Time-based smoothing ("average the last 2 s")
+        served from samples the reader thread already received, instead
+        of spending the duration collecting them.
+
+        Args:
+            duration_ms: Window length in milliseconds, ending at the
+                newest buffered sample.
+
+        Returns:
+            SensorReading from the mean raw vectors, stamped with the
+            newest sample time. raw_values is "averaged_N_samples".
+
+        Raises:
+            RuntimeError: If sensor is closed or no data received yet.
+            ValueError: If duration_ms <= 0.
+
+        Example:
+            >>> reading = instance.read_window(2000)  # last 2 s of stream
+        """
+        if duration_ms <= 0:
+            raise ValueError(f"duration_ms must be > 0, got {duration_ms}")
+        self._require_history()
+        stats = self._history.stats(window_ns=round(duration_ms * 1_000_000))
+        return self._reading_from_values(
+            stats.mean, stats.end_ns, f"averaged_{stats.count}_samples"
+        )
+
+    def read_at(self, when: datetime) -> SensorReading:
+        """Return the reading interpolated to a wall-clock instant.
+
+        Business context: Tags a frame with the orientation at its
+        exposure time rather than at whatever moment metadata is built.
+
+        Args:
+            when: Instant to interpolate to (naive values treated as UTC).
+                Instants outside the buffered range clamp to the nearest
+                sample.
+
+        Returns:
+            SensorReading interpolated between the surrounding samples,
+            timestamped with when. raw_values is "interpolated".
+
+        Raises:
+            RuntimeError: If sensor is closed or no data received yet.
+
+        Example:
+            >>> mid = end - timedelta(microseconds=exposure_us / 2)
+            >>> reading = instance.read_at(mid)
+        """
+        self._require_history()
+        t_ns = monotonic_ns_at(when)
+        return self._reading_from_values(self._history.at(t_ns), t_ns, "interpolated")
+
+    def read_between(self, start: datetime, end: datetime) -> SensorReading:
+        """Average the buffered samples received between two instants.
+
+        Falls back to interpolating at the midpoint when no sample lies
+        inside the range (exposures shorter than the sample interval).
+
+        Business context: A long exposure integrates light over its whole
+        duration; the mean orientation over that window is the pointing
+        that best describes the frame.
+
+        Args:
+            start: Range start (naive values treated as UTC).
+            end: Range end, inclusive. Must not precede start.
+
+        Returns:
+            SensorReading from the mean raw vectors, stamped with the range
+            midpoint. raw_values is "averaged_N_samples" or "interpolated".
+
+        Raises:
+            RuntimeError: If sensor is closed or no data received yet.
+            ValueError: If end precedes start.
+
+        Example:
+            >>> reading = instance.read_between(exposure_start, exposure_end)
+        """
+        self._require_history()
+        t0_ns, t1_ns = monotonic_ns_at(start), monotonic_ns_at(end)
+        if t1_ns < t0_ns:
+            raise ValueError("end must not precede start")
+        mid_ns = (t0_ns + t1_ns) // 2
+        times, values = self._history.between(t0_ns, t1_ns)
+        if len(times) == 0:
+            return self._reading_from_values(
+                self._history.at(mid_ns), mid_ns, "interpolated"
+            )
+        return self._reading_from_values(
+            values.mean(axis=0), mid_ns, f"averaged_{len(times)}_samples"
+        )
+
     def calibrate(
         self,
         true_altitude: float,
@@ -729,8 +1519,11 @@ class ArduinoSensorInstance:
         validate_position(true_altitude, true_azimuth)
 
         # Get current calculated values (before transform)
-        current_alt = self._calculate_altitude()
-        current_az = self._calculate_azimuth()
+        with self._lock:
+            fused = self._fused_vectors()
+        accel, mag = fused if fused is not None else (None, None)
+        current_alt = self._calculate_altitude(accel)
+        current_az = self._calculate_azimuth(mag, accel)
 
         # Calculate offsets
         self._cal_alt_offset = true_altitude - current_alt
@@ -804,6 +1597,7 @@ class ArduinoSensorInstance:
                 - CALIBRATE: Trigger magnetometer calibration mode
                 - STOP: Pause continuous sensor output
                 - START: Resume continuous sensor output
+                - RATE <hz>: Set the firmware sample rate
             wait_response: If True (default), blocks until response received
                 or timeout. If False, returns immediately after sending.
             timeout: Maximum seconds to wait for response. Default 5.0.
@@ -844,7 +1638,9 @@ class ArduinoSensorInstance:
 
         while (time.time() - start_time) < timeout:
             if self._serial.in_waiting:
-                line = self._serial.readline().decode().strip()
+                line = self._serial.readline().decode(errors="replace").strip()
+                # Binary frames may precede the reply; keep only its text
+                line = _NON_TEXT.split(line)[-1]
                 response_lines.append(line)
 
                 # Check for end markers
@@ -883,13 +1679,17 @@ class ArduinoSensorInstance:
             >>> instance.calibrate(45.0, 180.0)  # Recalibrate
         """
         self._send_command("RESET", timeout=5.0)
+        self._last_seq = None  # Firmware may restart its frame counter
+        with self._lock:
+            self._fusion.reset()
 
     def get_status(self) -> SensorStatus:
         """Get current Arduino sensor status including calibration state.
 
         Sends STATUS command to Arduino and returns parsed response along
         with connection state and calibration information. Useful for
-        health monitoring and diagnostics.
+        health monitoring and diagnostics. The reported sample rate
+        refreshes get_sample_rate().
 
         Business context: Long-running observatory sessions need real-time
         sensor health data. This method exposes both Python-side state
@@ -918,7 +1718,10 @@ class ArduinoSensorInstance:
             ...     print("Sensor needs calibration")
         """
         # Send status command to verify Arduino is responding
-        self._send_command("STATUS", timeout=3.0)
+        response = self._send_command("STATUS", timeout=3.0)
+        rate = _SAMPLE_RATE_LINE.search(response)
+        if rate is not None:
+            self._sample_rate_hz = float(rate.group(1))
 
         # Return protocol-compatible SensorStatus
         # Store extra Arduino-specific info for internal use
@@ -932,16 +1735,17 @@ class ArduinoSensorInstance:
     def get_sample_rate(self) -> float:
         """Get sensor sample rate in Hz.
 
-        Returns the fixed sample rate of the Arduino BLE33 firmware.
+        Returns the rate the firmware last reported (STATUS or RATE reply),
+        or the 10 Hz power-up default before any report arrived.
         Used by device layer to calculate timing for averaged reads.
 
-        Business context: Arduino BLE33 Sense firmware streams sensor data
-        at a fixed 10 Hz rate. This rate is determined by the firmware,
-        not configurable at runtime. Device layer needs this to properly
-        space multi-sample reads.
+        Business context: The firmware streams at 10 Hz after power-up and
+        can be switched with set_sample_rate(). Device layer needs the
+        actual rate to properly space multi-sample reads, and the reader
+        uses it to timestamp batched samples.
 
         Returns:
-            float: Always 10.0 Hz for Arduino BLE33 firmware.
+            float: Sample rate in Hz.
 
         Raises:
             No exceptions raised.
@@ -951,7 +1755,44 @@ class ArduinoSensorInstance:
             >>> instance.get_sample_rate()
             10.0
         """
-        return _ARDUINO_SAMPLE_RATE_HZ
+        return self._sample_rate_hz
+
+    def set_sample_rate(self, rate_hz: int) -> None:
+        """Set the firmware sample rate.
+
+        Sends RATE; the firmware switches immediately and confirms the new
+        rate, which the reader also records.
+
+        Business context: Faster sampling fills the history sooner for
+        averaged and time-indexed reads; 10 Hz is plenty for a slowly
+        moving mount and keeps the serial link quiet.
+
+        Args:
+            rate_hz: Samples per second, 1-100. Above ~50 Hz prefer
+                set_binary_output(True) to leave link headroom.
+
+        Returns:
+            None.
+
+        Raises:
+            RuntimeError: If sensor is closed.
+            ValueError: If rate_hz is outside the firmware's range.
+
+        Example:
+            >>> instance.set_sample_rate(50)
+            >>> instance.get_sample_rate()
+            50.0
+        """
+        if not _MIN_SAMPLE_RATE_HZ <= rate_hz <= _MAX_SAMPLE_RATE_HZ:
+            raise ValueError(
+                f"rate_hz must be {_MIN_SAMPLE_RATE_HZ}-{_MAX_SAMPLE_RATE_HZ}, "
+                f"got {rate_hz}"
+            )
+        if not self._is_open:
+            raise RuntimeError("Sensor is closed")
+        self._send_command(f"RATE {rate_hz}", wait_response=False)
+        self._sample_rate_hz = float(rate_hz)
+        logger.info("Sensor sample rate set", rate_hz=rate_hz, port=self._port)
 
     def calibrate_magnetometer(self) -> str:
         """Run Arduino magnetometer hard-iron calibration routine.
@@ -987,7 +1828,110 @@ class ArduinoSensorInstance:
             OffsetY: -5.2
             OffsetZ: 8.1
         """
-        return self._send_command("CALIBRATE", timeout=15.0)
+        response = self._send_command("CALIBRATE", timeout=15.0)
+        with self._lock:
+            self._fusion.reset()  # Offsets changed; don't glide from old field
+            # An ellipsoid fit describes the old raw frame; it no longer applies
+            self._mag_calibration = None
+        return response
+
+    def start_magnetometer_sweep(self) -> None:
+        """Begin collecting raw magnetometer samples for an ellipsoid fit.
+
+        Every sample the reader thread receives from now on is kept until
+        finish_magnetometer_sweep(). Slew the mount through a full turn in
+        azimuth at three or more altitudes meanwhile; at 10 Hz a few minutes
+        of slewing gathers thousands of samples. Calling again restarts
+        the sweep.
+
+        Business context: Steel in the mount both offsets (hard iron) and
+        distorts (soft iron) the field the sensor sees. The firmware's
+        CALIBRATE only removes offsets, leaving azimuth errors of several
+        degrees that vary around the sky and cost corrective slews.
+
+        Args:
+            No arguments.
+
+        Returns:
+            None. Collection runs in the background reader thread.
+
+        Raises:
+            RuntimeError: If sensor is closed.
+
+        Example:
+            >>> instance.start_magnetometer_sweep()
+            >>> # ... slew 360° in azimuth at altitudes 10°, 35° and 60° ...
+            >>> calibration = instance.finish_magnetometer_sweep()
+        """
+        if not self._is_open:
+            raise RuntimeError("Sensor is closed")
+        with self._lock:
+            self._mag_sweep = MagnetometerSweep()
+        logger.info("Magnetometer sweep started")
+
+    def finish_magnetometer_sweep(self) -> MagnetometerCalibration:
+        """Stop the sweep, fit an ellipsoid, and apply the result.
+
+        Fits hard-iron offset and soft-iron matrix to the collected raw
+        samples with one vectorized least-squares solve (fit_ellipsoid()).
+        The correction takes effect on the next read(), read_average(),
+        etc. and replaces any previous ellipsoid calibration. Position
+        calibration offsets (calibrate()) are kept; re-run calibrate()
+        against a known star afterwards if azimuth shifted.
+
+        Returns:
+            MagnetometerCalibration with soft_iron (3x3), hard_iron,
+            field_strength, rms_residual and sample count.
+
+        Raises:
+            RuntimeError: If no sweep is in progress.
+            ValueError: If too few samples were collected or they do not
+                span an ellipsoid (e.g. only one altitude). The previous
+                calibration stays in effect.
+
+        Example:
+            >>> calibration = instance.finish_magnetometer_sweep()
+            >>> print(f"Residual {calibration.rms_residual:.2f} µT")
+        """
+        with self._lock:
+            sweep, self._mag_sweep = self._mag_sweep, None
+        if sweep is None:
+            raise RuntimeError("No magnetometer sweep in progress")
+        calibration = sweep.fit()
+        self.set_magnetometer_calibration(calibration)
+        logger.info(
+            "Magnetometer ellipsoid calibrated",
+            samples=calibration.samples,
+            field_strength=calibration.field_strength,
+            rms_residual=calibration.rms_residual,
+        )
+        return calibration
+
+    @property
+    def magnetometer_calibration(self) -> MagnetometerCalibration | None:
+        """Hard/soft-iron correction applied to headings, or None."""
+        return self._mag_calibration
+
+    def set_magnetometer_calibration(
+        self, calibration: MagnetometerCalibration | None
+    ) -> None:
+        """Install a previously fitted ellipsoid calibration, or clear it.
+
+        Business context: The fit depends on the mount, not the session,
+        so a stored result can be restored at startup without a sweep.
+
+        Args:
+            calibration: Result of fit_ellipsoid(), or None for raw
+                headings.
+
+        Returns:
+            None. Applies from the next read.
+
+        Example:
+            >>> instance.set_magnetometer_calibration(saved_calibration)
+        """
+        with self._lock:
+            self._mag_calibration = calibration
 
     def stop_output(self) -> None:
         """Stop the continuous sensor data output stream.
@@ -1071,8 +2015,13 @@ class ArduinoSensorInstance:
         if self._reader_thread is not None and self._reader_thread.is_alive():
             self._reader_thread.join(timeout=1.0)
 
-        if self._serial and self._serial.is_open:
-            self._serial.close()
+        # Close even if the device already dropped (is_open False): a
+        # RecordingSerialPort wrapper must still finish its file
+        if self._serial:
+            try:
+                self._serial.close()
+            except Exception as e:
+                logger.warning("Error closing serial port", error=str(e))
 
         logger.info("Arduino sensor closed", port=self._port)
 
@@ -1108,7 +2057,14 @@ class ArduinoSensorDriver:
         sensors = driver.get_available_sensors()
     """
 
-    def __init__(self, baudrate: int = 115200) -> None:
+    def __init__(
+        self,
+        baudrate: int = 115200,
+        *,
+        binary_output: bool = False,
+        sample_rate_hz: int | None = None,
+        record_to: str | Path | None = None,
+    ) -> None:
         """Initialize Arduino sensor driver with baud rate.
 
         Sets up driver configuration without opening any serial ports.
@@ -1123,6 +2079,13 @@ class ArduinoSensorDriver:
         Args:
             baudrate: Serial baud rate for Arduino communication.
                 Defaults to 115200 (Arduino Nano BLE33 default).
+            binary_output: Switch opened sensors to the compact binary
+                frame protocol. Default False keeps ASCII output.
+            sample_rate_hz: Firmware sample rate (1-100 Hz) to set on
+                opened sensors. None keeps the firmware's current rate.
+            record_to: Record opened sensors' serial traffic to this file
+                for replay (default None). Each open() that finds the
+                file present writes a numbered sibling instead.
 
         Returns:
             None. Driver initialized, ready for open().
@@ -1137,6 +2100,9 @@ class ArduinoSensorDriver:
             ...     instance = driver.open(sensors[0]['port'])
         """
         self._baudrate = baudrate
+        self._binary_output = binary_output
+        self._sample_rate_hz = sample_rate_hz
+        self._record_to = record_to
         self._instance: ArduinoSensorInstance | None = None
         self._port_enumerator: PortEnumerator | None = None
         self._serial_factory: type | None = None
@@ -1183,6 +2149,9 @@ class ArduinoSensorDriver:
         """
         driver = cls.__new__(cls)
         driver._baudrate = baudrate
+        driver._binary_output = False
+        driver._sample_rate_hz = None
+        driver._record_to = None
         driver._instance = None
         driver._port_enumerator = port_enumerator
         driver._serial_factory = serial_factory
@@ -1362,7 +2331,13 @@ class ArduinoSensorDriver:
         else:
             port = sensor_id
 
-        self._instance = ArduinoSensorInstance(port, self._baudrate)
+        self._instance = ArduinoSensorInstance(
+            port, self._baudrate, record_to=self._record_to
+        )
+        if self._binary_output:
+            self._instance.set_binary_output(True)
+        if self._sample_rate_hz is not None:
+            self._instance.set_sample_rate(self._sample_rate_hz)
         return self._instance
 
     def _open_with_serial(
@@ -1394,6 +2369,10 @@ class ArduinoSensorDriver:
         self._instance = ArduinoSensorInstance._create_with_serial(
             serial_port, port_name, start_reader=False
         )
+        if self._binary_output:
+            self._instance.set_binary_output(True)
+        if self._sample_rate_hz is not None:
+            self._instance.set_sample_rate(self._sample_rate_hz)
         return self._instance
 
     def close(self) -> None:
@@ -0,0 +1,213 @@
+"""Orientation fusion for streamed accelerometer and magnetometer samples.
+
+Single IMU samples jitter by a few tenths of a degree, so pointing
+consumers used to smooth by averaging several polled readings, trading
+noise for seconds of lag. OrientationFilter instead runs once per sample
+in the driver's reader thread, at the native stream rate, and keeps a
+low-noise estimate of the gravity and magnetic field vectors that any
+read can use directly.
+
+The filter is a steady-state Kalman filter (alpha-beta form) with a
+constant-rate model per vector component. Gains follow from a time
+constant and the actual sample spacing; the rate term tracks steady
+slews without the lag of a plain moving average. The firmware streams
+no gyroscope, so the rate estimate takes the place of the gyro branch
+of a classic complementary filter.
+
+Angles are derived from the filtered vectors, after smoothing, so
+averaging never has to deal with azimuth wraparound.
+tilt_compensated_heading() projects the magnetic field onto the
+horizontal plane before taking the heading, so pointing the tube up or
+down does not swing the azimuth.
+
+Example:
+    from telescope_mcp.drivers.sensors.fusion import OrientationFilter
+
+    fusion = OrientationFilter(time_constant_s=1.0)
+    fusion.update(values[:, :6], t_ns)  # batch from the reader thread
+    ax, ay, az, mx, my, mz = fusion.estimate()
+    heading = tilt_compensated_heading(ax, ay, az, mx, my, mz)
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numpy.typing import NDArray
+
+__all__ = [
+    "FUSION_CHANNELS",
+    "DEFAULT_TIME_CONSTANT_S",
+    "OrientationFilter",
+    "tilt_compensated_heading",
+]
+
+# Filtered channels, a prefix of HISTORY_CHANNELS
+FUSION_CHANNELS: tuple[str, ...] = ("aX", "aY", "aZ", "mX", "mY", "mZ")
+
+# ~4x less noise than one sample at 10 Hz, no steady-state lag on slews
+DEFAULT_TIME_CONSTANT_S = 1.0
+
+_MIN_STEP_NS = 1_000_000  # Floor for dt when batch timestamps coincide
+_RESTART_TIME_CONSTANTS = 5.0  # Re-seed after a gap this many tau long
+
+
+def tilt_compensated_heading(
+    ax: float, ay: float, az: float, mx: float, my: float, mz: float
+) -> float:
+    """Magnetic heading of the sensor X axis, corrected for tilt.
+
+    Projects both the X axis (along the tube) and the magnetic field onto
+    the plane perpendicular to gravity and measures the angle between
+    them. With the sensor level this reduces to atan2(mY, mX), so the
+    convention matches the uncompensated heading.
+
+    Business context: On an alt-az mount the sensor pitches with the
+    tube. The uncompensated heading mixes the vertical field component
+    into X as the tube rises, shifting azimuth by tens of degrees at high
+    altitudes.
+
+    Args:
+        ax: Accelerometer X in g.
+        ay: Accelerometer Y in g.
+        az: Accelerometer Z in g.
+        mx: Magnetometer X in µT.
+        my: Magnetometer Y in µT.
+        mz: Magnetometer Z in µT.
+
+    Returns:
+        Heading in degrees, 0-360. Falls back to atan2(mY, mX) when the
+        accelerometer vector is zero, and returns 0.0 when the horizontal
+        projection vanishes (tube pointing at the zenith).
+
+    Raises:
+        No exceptions raised.
+
+    Example:
+        >>> round(tilt_compensated_heading(0.5, 0.0, 0.87, 30.0, 0.0, 40.0), 6)
+        0.0
+    """
+    norm = math.sqrt(ax * ax + ay * ay + az * az)
+    if norm == 0.0:
+        east, north = my, mx
+    else:
+        ux, uy, uz = ax / norm, ay / norm, az / norm
+        up_component = mx * ux + my * uy + mz * uz
+        # det[x, m, u] and x·m - (x·u)(m·u): sin and cos of the projected angle
+        east = my * uz - mz * uy
+        north = mx - ux * up_component
+    if east == 0.0 and north == 0.0:
+        return 0.0
+    return math.degrees(math.atan2(east, north)) % 360.0
+
+
+class OrientationFilter:
+    """Alpha-beta (steady-state Kalman) filter over raw IMU vectors.
+
+    Tracks a value and a rate for each of the six FUSION_CHANNELS. Per
+    sample, with dt the spacing to the previous one:
+
+    - predict: x += v * dt
+    - correct: x += alpha * r, v += beta * r / dt, with r = z - x
+    - alpha = 1 - exp(-dt / tau), beta = alpha² / (2 - alpha)
+
+    The beta choice (Benedict-Bordner) gives a well-damped response, so
+    a stopped slew settles without ringing. The first sample, and any
+    sample after a gap of several time constants, re-seeds the estimate.
+
+    Note:
+        This class is NOT thread-safe. The owner serializes update()
+        and estimate() (ArduinoSensorInstance uses its state lock).
+    """
+
+    def __init__(self, time_constant_s: float = DEFAULT_TIME_CONSTANT_S) -> None:
+        """Create an empty filter.
+
+        Args:
+            time_constant_s: Smoothing time constant tau in seconds.
+                Larger values reduce noise further; the rate term keeps
+                steady slews from lagging either way.
+
+        Raises:
+            ValueError: If time_constant_s is not positive.
+
+        Example:
+            >>> fusion = OrientationFilter(time_constant_s=0.5)
+        """
+        if time_constant_s <= 0:
+            raise ValueError("time_constant_s must be positive")
+        self._tau_ns = time_constant_s * 1e9
+        self._value = np.zeros(len(FUSION_CHANNELS))
+        self._rate = np.zeros(len(FUSION_CHANNELS))  # Units per nanosecond
+        self._t_ns: int | None = None
+
+    @property
+    def time_constant_s(self) -> float:
+        """Smoothing time constant in seconds."""
+        return self._tau_ns / 1e9
+
+    @property
+    def last_ns(self) -> int | None:
+        """Monotonic timestamp of the last sample, or None before any."""
+        return self._t_ns
+
+    def reset(self) -> None:
+        """Discard the estimate so the next sample re-seeds the filter.
+
+        Business context: Called when the sensor's reference changes
+        abruptly (device reset, magnetometer recalibration), where
+        gliding from the old estimate would only add lag.
+        """
+        self._t_ns = None
+        self._rate[:] = 0.0
+
+    def update(self, values: NDArray[np.float64], t_ns: NDArray[np.int64]) -> None:
+        """Feed a batch of samples in chronological order.
+
+        Args:
+            values: Array of shape (k, 6) or wider; the first six columns
+                are taken in FUSION_CHANNELS order.
+            t_ns: Monotonic timestamps, shape (k,), non-decreasing.
+
+        Returns:
+            None. estimate() reflects the last sample afterwards.
+
+        Raises:
+            ValueError: If values and t_ns lengths differ.
+
+        Example:
+            >>> fusion.update(values, times)  # values.shape == (k, 8)
+        """
+        if len(values) != len(t_ns):
+            raise ValueError("values and t_ns must have the same length")
+        restart_ns = _RESTART_TIME_CONSTANTS * self._tau_ns
+        value, rate = self._value, self._rate
+        for row, t in zip(values, t_ns.tolist(), strict=True):
+            sample = row[: len(FUSION_CHANNELS)]
+            if self._t_ns is None or t - self._t_ns > restart_ns:
+                value[:] = sample
+                rate[:] = 0.0
+            else:
+                dt = max(t - self._t_ns, _MIN_STEP_NS)
+                alpha = -math.expm1(-dt / self._tau_ns)
+                beta = alpha * alpha / (2.0 - alpha)
+                value += rate * dt
+                residual = sample - value
+                value += alpha * residual
+                rate += (beta / dt) * residual
+            self._t_ns = t
+
+    def estimate(self) -> NDArray[np.float64] | None:
+        """Current filtered vectors.
+
+        Returns:
+            Copy of shape (6,) in FUSION_CHANNELS order, or None before
+            the first sample.
+
+        Example:
+            >>> ax, ay, az, mx, my, mz = fusion.estimate()
+        """
+        if self._t_ns is None:
+            return None
+        return self._value.copy()
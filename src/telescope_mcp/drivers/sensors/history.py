@@ -0,0 +1,444 @@
+"""Time-indexed ring buffer of raw sensor samples.
+
+Sensor drivers that stream continuously (the Arduino reader thread) push
+every parsed line into a SensorHistory. Consumers then query what has
+already been received instead of polling the device again:
+
+- latest(n): the most recent n samples
+- between(t0, t1): all samples inside a monotonic time range
+- at(t): a sample linearly interpolated to an arbitrary instant
+- stats(): mean and variance over the last n samples or a time window
+
+Samples are stored as monotonic nanoseconds (time.monotonic_ns) plus the
+eight raw channels in HISTORY_CHANNELS order. Storage is preallocated
+once; append() records one sample and extend() a parsed batch under a
+single lock. monotonic_ns_at() and datetime_at() map
+between wall-clock datetimes and the monotonic timeline.
+
+Example:
+    from telescope_mcp.drivers.sensors.history import SensorHistory
+
+    history = SensorHistory(capacity=600)
+    history.append([0.5, 0.0, 0.87, 30.0, 0.0, 40.0, 22.5, 55.0])
+    times, values = history.latest(10)
+    stats = history.stats(window_ns=2_000_000_000)
+    print(stats.mean[0], stats.variance[0])
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import numpy as np
+from numpy.typing import NDArray
+
+__all__ = [
+    "HISTORY_CHANNELS",
+    "DEFAULT_HISTORY_CAPACITY",
+    "HistoryStats",
+    "SensorHistory",
+    "monotonic_ns_at",
+    "datetime_at",
+]
+
+# Column order of the value array: accelerometer, magnetometer, environment
+HISTORY_CHANNELS: tuple[str, ...] = (
+    "aX",
+    "aY",
+    "aZ",
+    "mX",
+    "mY",
+    "mZ",
+    "temperature",
+    "humidity",
+)
+
+# ~100 seconds at the Arduino's 10 Hz stream rate
+DEFAULT_HISTORY_CAPACITY = 1024
+
+_NUM_CHANNELS = len(HISTORY_CHANNELS)
+
+
+def monotonic_ns_at(when: datetime) -> int:
+    """Map a wall-clock datetime onto the time.monotonic_ns() timeline.
+
+    Uses the current offset between the wall clock and the monotonic
+    clock, so the result is accurate for instants near "now" (seconds to
+    minutes) and unaffected by later NTP adjustments of recorded samples.
+
+    Args:
+        when: Wall-clock instant. Naive datetimes are treated as UTC.
+
+    Returns:
+        Monotonic nanoseconds corresponding to when.
+
+    Raises:
+        None.
+
+    Example:
+        >>> t_ns = monotonic_ns_at(datetime.now(UTC))
+        >>> abs(t_ns - time.monotonic_ns()) < 10_000_000
+        True
+    """
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    offset_ns = time.time_ns() - time.monotonic_ns()
+    return round(when.timestamp() * 1e9) - offset_ns
+
+
+def datetime_at(t_ns: int) -> datetime:
+    """Map a time.monotonic_ns() value back to a UTC datetime.
+
+    Inverse of monotonic_ns_at(), using the current clock offset.
+
+    Args:
+        t_ns: Monotonic nanoseconds, e.g. a SensorHistory timestamp.
+
+    Returns:
+        Timezone-aware UTC datetime.
+
+    Raises:
+        None.
+
+    Example:
+        >>> datetime_at(time.monotonic_ns()).tzinfo is UTC
+        True
+    """
+    offset_ns = time.time_ns() - time.monotonic_ns()
+    return datetime.fromtimestamp((t_ns + offset_ns) / 1e9, UTC)
+
+
+@dataclass(frozen=True)
+class HistoryStats:
+    """Mean and variance of buffered samples over a window.
+
+    Attributes:
+        count: Number of samples in the window.
+        mean: Per-channel mean, shape (8,), HISTORY_CHANNELS order.
+        variance: Per-channel population variance, shape (8,).
+        start_ns: Monotonic timestamp of the oldest sample in the window.
+        end_ns: Monotonic timestamp of the newest sample in the window.
+    """
+
+    count: int
+    mean: NDArray[np.float64]
+    variance: NDArray[np.float64]
+    start_ns: int
+    end_ns: int
+
+
+class SensorHistory:
+    """Preallocated, thread-safe ring of timestamped raw sensor samples.
+
+    One writer (the driver's reader thread) appends while any number of
+    readers query. Every query returns copies, so results stay valid
+    after the writer moves on.
+
+    Implementation: Each sample is written twice, at slot i and slot
+    i + capacity of arrays sized 2 * capacity. The newest `len(self)`
+    samples are therefore always one contiguous, chronologically ordered
+    slice, so range lookups are a binary search on a view with no
+    re-ordering copy.
+
+    Business context: The Arduino streams ~10 samples per second whether
+    or not anyone reads them. Keeping the recent stream lets position
+    smoothing, averaged reads, and frame tagging use data that already
+    arrived instead of waiting for new samples.
+
+    Example:
+        >>> history = SensorHistory(capacity=4)
+        >>> for i in range(6):
+        ...     history.append([float(i)] * 8, t_ns=i * 100)
+        >>> history.latest(2)[0].tolist()
+        [400, 500]
+        >>> float(history.at(450)[0])
+        4.5
+    """
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_CAPACITY) -> None:
+        """Allocate storage for capacity samples.
+
+        Args:
+            capacity: Maximum number of samples retained. Oldest samples
+                are overwritten once full.
+
+        Raises:
+            ValueError: If capacity < 2 (interpolation needs two samples).
+
+        Example:
+            >>> SensorHistory(capacity=600).capacity
+            600
+        """
+        if capacity < 2:
+            raise ValueError(f"capacity must be >= 2, got {capacity}")
+        self._capacity = capacity
+        self._times = np.zeros(2 * capacity, dtype=np.int64)
+        self._values = np.zeros((2 * capacity, _NUM_CHANNELS), dtype=np.float64)
+        self._next = 0  # slot for the next append, in [0, capacity)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of samples retained."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        """Number of samples currently buffered (at most capacity)."""
+        return self._count
+
+    @property
+    def oldest_ns(self) -> int | None:
+        """Monotonic timestamp of the oldest buffered sample, or None."""
+        with self._lock:
+            if self._count == 0:
+                return None
+            return int(self._times[self._window().start])
+
+    @property
+    def newest_ns(self) -> int | None:
+        """Monotonic timestamp of the newest buffered sample, or None."""
+        with self._lock:
+            if self._count == 0:
+                return None
+            return int(self._times[self._next + self._capacity - 1])
+
+    def append(self, values: Sequence[float], t_ns: int | None = None) -> None:
+        """Record one sample.
+
+        Args:
+            values: Eight channel values in HISTORY_CHANNELS order.
+            t_ns: Monotonic timestamp in nanoseconds. Defaults to
+                time.monotonic_ns(). Must not precede the newest sample.
+
+        Raises:
+            ValueError: If values does not have eight entries or t_ns is
+                older than the newest buffered sample.
+
+        Example:
+            >>> history.append([0.5, 0.0, 0.87, 30.0, 0.0, 40.0, 22.5, 55.0])
+        """
+        if len(values) != _NUM_CHANNELS:
+            raise ValueError(
+                f"Expected {_NUM_CHANNELS} channel values, got {len(values)}"
+            )
+        if t_ns is None:
+            t_ns = time.monotonic_ns()
+        with self._lock:
+            i = self._next
+            if self._count and t_ns < self._times[i + self._capacity - 1]:
+                raise ValueError("Sample timestamps must be non-decreasing")
+            self._times[i] = self._times[i + self._capacity] = t_ns
+            self._values[i] = self._values[i + self._capacity] = values
+            self._next = (i + 1) % self._capacity
+            self._count = min(self._count + 1, self._capacity)
+
+    def extend(self, values: NDArray[np.float64], t_ns: NDArray[np.int64]) -> None:
+        """Record a batch of samples under a single lock acquisition.
+
+        Business context: The Arduino reader parses everything received
+        since its last wake-up at once; publishing the batch in one step
+        keeps lock traffic independent of the sample rate.
+
+        Args:
+            values: Array of shape (k, 8) in HISTORY_CHANNELS order.
+            t_ns: Monotonic timestamps, shape (k,), non-decreasing and
+                not older than the newest buffered sample. When k exceeds
+                capacity only the newest capacity samples are kept.
+
+        Raises:
+            ValueError: If shapes disagree or timestamps go backwards.
+
+        Example:
+            >>> history.extend(batch, np.array([t0, t1, t2]))
+        """
+        values = np.asarray(values, dtype=np.float64)
+        t_ns = np.asarray(t_ns, dtype=np.int64)
+        if values.ndim != 2 or values.shape[1] != _NUM_CHANNELS:
+            raise ValueError(f"Expected shape (k, {_NUM_CHANNELS}), got {values.shape}")
+        if t_ns.shape != (len(values),):
+            raise ValueError("t_ns must have one timestamp per sample")
+        if len(values) == 0:
+            return
+        if np.any(np.diff(t_ns) < 0):
+            raise ValueError("Sample timestamps must be non-decreasing")
+        values, t_ns = values[-self._capacity :], t_ns[-self._capacity :]
+        n = len(values)
+        with self._lock:
+            if self._count and t_ns[0] < self._times[self._next + self._capacity - 1]:
+                raise ValueError("Sample timestamps must be non-decreasing")
+            slots = (self._next + np.arange(n)) % self._capacity
+            self._times[slots] = self._times[slots + self._capacity] = t_ns
+            self._values[slots] = self._values[slots + self._capacity] = values
+            self._next = (self._next + n) % self._capacity
+            self._count = min(self._count + n, self._capacity)
+
+    def clear(self) -> None:
+        """Discard all buffered samples (storage is kept)."""
+        with self._lock:
+            self._next = 0
+            self._count = 0
+
+    def _window(self) -> slice:
+        """Return the slice holding buffered samples, oldest first.
+
+        Caller must hold self._lock.
+        """
+        end = self._next + self._capacity
+        return slice(end - self._count, end)
+
+    def latest(
+        self, n: int | None = None
+    ) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+        """Return the newest n samples in chronological order.
+
+        Args:
+            n: Number of samples. None returns everything buffered. Fewer
+                are returned when fewer are buffered.
+
+        Returns:
+            Tuple (times_ns, values) with shapes (k,) and (k, 8).
+
+        Raises:
+            ValueError: If n < 1.
+
+        Example:
+            >>> times, values = history.latest(10)
+            >>> values[:, 0].mean()  # mean aX
+        """
+        if n is not None and n < 1:
+            raise ValueError(f"n must be >= 1, got {n}")
+        with self._lock:
+            window = self._window()
+            start = window.start if n is None else max(window.start, window.stop - n)
+            return (
+                self._times[start : window.stop].copy(),
+                self._values[start : window.stop].copy(),
+            )
+
+    def between(
+        self, t0_ns: int, t1_ns: int
+    ) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+        """Return all samples with t0_ns <= timestamp <= t1_ns.
+
+        Args:
+            t0_ns: Range start, monotonic nanoseconds.
+            t1_ns: Range end (inclusive), monotonic nanoseconds.
+
+        Returns:
+            Tuple (times_ns, values) in chronological order; empty arrays
+            when no sample falls inside the range.
+
+        Raises:
+            ValueError: If t1_ns < t0_ns.
+
+        Example:
+            >>> now = time.monotonic_ns()
+            >>> times, values = history.between(now - 1_000_000_000, now)
+        """
+        if t1_ns < t0_ns:
+            raise ValueError("t1_ns must be >= t0_ns")
+        with self._lock:
+            window = self._window()
+            times = self._times[window]
+            lo = int(np.searchsorted(times, t0_ns, side="left"))
+            hi = int(np.searchsorted(times, t1_ns, side="right"))
+            return (
+                times[lo:hi].copy(),
+                self._values[window][lo:hi].copy(),
+            )
+
+    def at(self, t_ns: int) -> NDArray[np.float64]:
+        """Return channel values linearly interpolated to t_ns.
+
+        Instants before the oldest or after the newest sample clamp to
+        that sample rather than extrapolating.
+
+        Args:
+            t_ns: Query instant, monotonic nanoseconds.
+
+        Returns:
+            Array of shape (8,) in HISTORY_CHANNELS order.
+
+        Raises:
+            LookupError: If no samples are buffered.
+
+        Example:
+            >>> values = history.at(monotonic_ns_at(exposure_midpoint))
+        """
+        with self._lock:
+            if self._count == 0:
+                raise LookupError("No samples buffered")
+            window = self._window()
+            times = self._times[window]
+            values = self._values[window]
+            hi = int(np.searchsorted(times, t_ns, side="left"))
+            if hi == 0:
+                return values[0].copy()
+            if hi == len(times):
+                return values[-1].copy()
+            t_lo, t_hi = int(times[hi - 1]), int(times[hi])
+            if t_hi == t_lo:
+                return values[hi].copy()
+            frac = (t_ns - t_lo) / (t_hi - t_lo)
+            result: NDArray[np.float64] = values[hi - 1] + frac * (
+                values[hi] - values[hi - 1]
+            )
+            return result
+
+    def stats(
+        self,
+        *,
+        samples: int | None = None,
+        window_ns: int | None = None,
+        end_ns: int | None = None,
+    ) -> HistoryStats:
+        """Compute per-channel mean and variance over a window.
+
+        The window is either the newest `samples` samples or the samples
+        in [end_ns - window_ns, end_ns]; end_ns defaults to the newest
+        sample. With neither argument every buffered sample is used.
+
+        Args:
+            samples: Window size in samples.
+            window_ns: Window length in nanoseconds.
+            end_ns: Window end for window_ns (monotonic nanoseconds).
+
+        Returns:
+            HistoryStats for the selected samples.
+
+        Raises:
+            ValueError: If both samples and window_ns are given, or either
+                is not positive.
+            LookupError: If the window contains no samples.
+
+        Example:
+            >>> stats = history.stats(window_ns=2_000_000_000)
+            >>> noise_ax = float(np.sqrt(stats.variance[0]))
+        """
+        if samples is not None and window_ns is not None:
+            raise ValueError("Pass samples or window_ns, not both")
+        if window_ns is not None:
+            if window_ns <= 0:
+                raise ValueError(f"window_ns must be > 0, got {window_ns}")
+            if end_ns is None:
+                with self._lock:
+                    if self._count == 0:
+                        raise LookupError("No samples buffered")
+                    end_ns = int(self._times[self._next + self._capacity - 1])
+            times, values = self.between(end_ns - window_ns, end_ns)
+        else:
+            times, values = self.latest(samples)
+        if len(times) == 0:
+            raise LookupError("No samples in window")
+        return HistoryStats(
+            count=len(times),
+            mean=values.mean(axis=0),
+            variance=values.var(axis=0),
+            start_ns=int(times[0]),
+            end_ns=int(times[-1]),
+        )
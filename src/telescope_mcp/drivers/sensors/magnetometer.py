@@ -0,0 +1,281 @@
+"""Magnetometer hard-iron/soft-iron calibration by ellipsoid fitting.
+
+A magnetometer in a clean environment, turned through all orientations,
+traces a sphere centred on the origin whose radius is the local field
+strength. Ferrous parts on the mount distort this: magnetised steel
+shifts the centre (hard iron) and soft steel squashes and tilts the
+sphere into an ellipsoid (soft iron). A heading taken from the raw
+vector then wobbles by several degrees as the mount turns, which a
+single scale/offset on the azimuth cannot remove.
+
+fit_ellipsoid() fits the general quadric to thousands of samples with
+one vectorized least-squares solve and returns a MagnetometerCalibration
+holding the hard-iron vector b and a symmetric 3x3 soft-iron matrix W.
+Applying it, m' = W (m - b), maps the ellipsoid back onto a sphere of
+the field strength. The correction is affine, so it commutes with the
+averaging and filtering done before the heading is computed: drivers
+apply it once per read, to the already-smoothed vector.
+
+MagnetometerSweep accumulates raw samples while the mount slews. Sweeps
+in azimuth at a single altitude trace only a ring, which does not pin
+down an ellipsoid. Two rings do not either: every quadric through both
+rings fits equally well (the sphere plus any multiple of the product of
+the two ring planes), so the fit follows the noise and the residual
+still looks good. Sweep at three or more altitudes, spread as widely as
+the mount allows.
+
+Example:
+    from telescope_mcp.drivers.sensors.magnetometer import fit_ellipsoid
+
+    calibration = fit_ellipsoid(mag_samples)  # shape (n, 3), µT
+    mx, my, mz = calibration.apply(raw_mag)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+__all__ = [
+    "MIN_CALIBRATION_SAMPLES",
+    "MAX_SWEEP_SAMPLES",
+    "MagnetometerCalibration",
+    "MagnetometerSweep",
+    "fit_ellipsoid",
+]
+
+# Nine quadric parameters; ask for enough samples to average out noise
+MIN_CALIBRATION_SAMPLES = 100
+
+# ~1 hour at 10 Hz; bounds memory if a sweep is never finished
+MAX_SWEEP_SAMPLES = 36_000
+
+# Smallest/largest principal spread below this means the samples lie
+# near a plane (e.g. an azimuth sweep at one altitude)
+_MIN_COVERAGE_RATIO = 0.15
+
+# The design matrix's weakest direction must rise this far above the fit
+# noise, or the samples leave the ellipsoid undetermined (e.g. an azimuth
+# sweep at only two altitudes). Two-ring sweeps score about 1, usable
+# three-ring sweeps 2 or more.
+_MIN_CONSTRAINT_SNR = 2.0
+
+
+@dataclass(frozen=True, eq=False)
+class MagnetometerCalibration:
+    """Hard-iron offset and soft-iron matrix from an ellipsoid fit.
+
+    Attributes:
+        soft_iron: Symmetric 3x3 matrix W mapping the centred ellipsoid
+            onto a sphere.
+        hard_iron: Ellipsoid centre b in µT, shape (3,).
+        field_strength: Radius of the corrected sphere in µT.
+        rms_residual: RMS deviation of corrected sample magnitudes from
+            field_strength in µT; a quality measure for the sweep.
+        samples: Number of samples used in the fit.
+    """
+
+    soft_iron: NDArray[np.float64]
+    hard_iron: NDArray[np.float64]
+    field_strength: float
+    rms_residual: float
+    samples: int
+
+    def apply(self, mag: ArrayLike) -> NDArray[np.float64]:
+        """Correct one vector or a batch of vectors.
+
+        Args:
+            mag: Raw magnetometer values in µT, shape (3,) or (n, 3).
+
+        Returns:
+            Corrected values W (m - b), same shape as mag.
+
+        Raises:
+            No exceptions raised for well-shaped input.
+
+        Example:
+            >>> mx, my, mz = calibration.apply((31.0, -4.2, 40.5))
+        """
+        centred = np.asarray(mag, dtype=np.float64) - self.hard_iron
+        return centred @ self.soft_iron.T
+
+    def to_dict(self) -> dict[str, object]:
+        """JSON-friendly view for status reports and persistence.
+
+        Returns:
+            Dict with soft_iron (nested lists), hard_iron (list),
+            field_strength, rms_residual and samples.
+
+        Example:
+            >>> json.dumps(calibration.to_dict())
+        """
+        return {
+            "soft_iron": self.soft_iron.tolist(),
+            "hard_iron": self.hard_iron.tolist(),
+            "field_strength": self.field_strength,
+            "rms_residual": self.rms_residual,
+            "samples": self.samples,
+        }
+
+
+def fit_ellipsoid(samples: ArrayLike) -> MagnetometerCalibration:
+    """Fit an ellipsoid to magnetometer samples by linear least squares.
+
+    Solves x'Qx + 2g'x = 1 for the symmetric matrix Q and vector g in a
+    single lstsq call over an (n, 9) design matrix, after centring and
+    scaling the samples for conditioning. The solve is rejected when the
+    design matrix's smallest singular value (per sample) is not well
+    above the algebraic residual, i.e. when some combination of the nine
+    parameters is set by noise rather than data. The centre is b = -Q⁻¹g, and
+    the soft-iron matrix is the symmetric square root of the normalised
+    quadric, scaled so the corrected sphere's radius is the geometric
+    mean of the ellipsoid's semi-axes (volume preserving).
+
+    Business context: Replaces the firmware's offset-only calibration for
+    mounts whose steel also distorts the field shape, which otherwise
+    shows up as azimuth error that varies around the sky.
+
+    Args:
+        samples: Raw magnetometer values in µT, shape (n, 3).
+
+    Returns:
+        MagnetometerCalibration for the fitted ellipsoid.
+
+    Raises:
+        ValueError: If samples is not (n, 3), has fewer than
+            MIN_CALIBRATION_SAMPLES rows, lies near a plane, leaves the
+            fit undetermined (fewer than three altitude rings), or does
+            not describe an ellipsoid.
+
+    Example:
+        >>> calibration = fit_ellipsoid(sweep.samples())
+        >>> print(f"{calibration.rms_residual:.2f} µT residual")
+    """
+    mag = np.asarray(samples, dtype=np.float64)
+    if mag.ndim != 2 or mag.shape[1] != 3:
+        raise ValueError(f"samples must have shape (n, 3), got {mag.shape}")
+    if len(mag) < MIN_CALIBRATION_SAMPLES:
+        raise ValueError(
+            f"Need at least {MIN_CALIBRATION_SAMPLES} samples, got {len(mag)}"
+        )
+
+    mean = mag.mean(axis=0)
+    spread = np.linalg.svd(mag - mean, compute_uv=False)
+    if spread[-1] < _MIN_COVERAGE_RATIO * spread[0]:
+        raise ValueError(
+            "Samples lie near a plane; sweep in azimuth at three or more altitudes"
+        )
+    scale = float(np.sqrt(np.mean(np.sum((mag - mean) ** 2, axis=1))))
+    x, y, z = ((mag - mean) / scale).T
+
+    design = np.column_stack(
+        (x * x, y * y, z * z, 2 * x * y, 2 * x * z, 2 * y * z, 2 * x, 2 * y, 2 * z)
+    )
+    p, _, _, singular = np.linalg.lstsq(design, np.ones(len(mag)), rcond=None)
+    noise = np.linalg.norm(design @ p - 1.0) / np.sqrt(len(mag) - len(p))
+    weakest = singular[-1] / np.sqrt(len(mag))
+    if weakest * np.linalg.norm(p) <= _MIN_CONSTRAINT_SNR * noise:
+        raise ValueError(
+            "Samples do not determine the ellipsoid; sweep in azimuth at "
+            "three or more altitudes"
+        )
+    quadric = np.array(
+        [[p[0], p[3], p[4]], [p[3], p[1], p[5]], [p[4], p[5], p[2]]],
+    )
+    try:
+        centre = -np.linalg.solve(quadric, p[6:])
+    except np.linalg.LinAlgError:
+        raise ValueError("Samples do not describe an ellipsoid") from None
+    # (x - c)'Q(x - c) = 1 + c'Qc; normalise so the right side is 1
+    shape = quadric / (1.0 + centre @ quadric @ centre)
+    eigenvalues, eigenvectors = np.linalg.eigh(shape)
+    if eigenvalues[0] <= 0:
+        raise ValueError("Samples do not describe an ellipsoid")
+
+    # Back to µT: semi-axes scale by `scale`, centre shifts by `mean`
+    semi_axes = scale / np.sqrt(eigenvalues)
+    field_strength = float(np.exp(np.mean(np.log(semi_axes))))
+    soft_iron = (eigenvectors * (field_strength / semi_axes)) @ eigenvectors.T
+    hard_iron = mean + scale * centre
+
+    magnitudes = np.linalg.norm((mag - hard_iron) @ soft_iron.T, axis=1)
+    residual = float(np.sqrt(np.mean((magnitudes - field_strength) ** 2)))
+    return MagnetometerCalibration(
+        soft_iron=soft_iron,
+        hard_iron=hard_iron,
+        field_strength=field_strength,
+        rms_residual=residual,
+        samples=len(mag),
+    )
+
+
+class MagnetometerSweep:
+    """Accumulates raw magnetometer samples during a calibration sweep.
+
+    Batches are stored as they arrive and concatenated once at fit
+    time, so collection costs one list append per batch in the reader
+    path. Collection stops silently at MAX_SWEEP_SAMPLES.
+
+    Note:
+        This class is NOT thread-safe. The owner serializes add() and
+        samples() (ArduinoSensorInstance uses its state lock).
+    """
+
+    def __init__(self, max_samples: int = MAX_SWEEP_SAMPLES) -> None:
+        """Start an empty sweep.
+
+        Args:
+            max_samples: Cap on stored samples.
+
+        Example:
+            >>> sweep = MagnetometerSweep()
+        """
+        self._max_samples = max_samples
+        self._batches: list[NDArray[np.float64]] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of samples collected so far."""
+        return self._count
+
+    def add(self, mag: ArrayLike) -> None:
+        """Store a batch of raw samples.
+
+        Args:
+            mag: Magnetometer values in µT, shape (3,) or (k, 3). Copied.
+
+        Returns:
+            None.
+
+        Example:
+            >>> sweep.add(values[:, 3:6])
+        """
+        batch = np.array(mag, dtype=np.float64, ndmin=2)
+        room = self._max_samples - self._count
+        if room <= 0:
+            return
+        batch = batch[:room]
+        self._batches.append(batch)
+        self._count += len(batch)
+
+    def samples(self) -> NDArray[np.float64]:
+        """All collected samples in arrival order, shape (n, 3)."""
+        if not self._batches:
+            return np.empty((0, 3))
+        return np.concatenate(self._batches)
+
+    def fit(self) -> MagnetometerCalibration:
+        """Fit an ellipsoid to the collected samples.
+
+        Returns:
+            MagnetometerCalibration from fit_ellipsoid().
+
+        Raises:
+            ValueError: As fit_ellipsoid() (too few samples, poor coverage).
+
+        Example:
+            >>> calibration = sweep.fit()
+        """
+        return fit_ellipsoid(self.samples())
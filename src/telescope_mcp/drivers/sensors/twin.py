@@ -1,7 +1,9 @@
 """Digital twin sensor driver for testing without hardware.
 
 Provides simulated IMU sensor responses for development and testing.
-Supports configurable position, noise, drift, and calibration behavior.
+Supports configurable position, noise, drift, and calibration behavior,
+including simulated hard/soft-iron distortion of the magnetometer so the
+ellipsoid calibration sweep can be exercised without hardware.
 
 Example:
     from telescope_mcp.drivers.sensors import DigitalTwinSensorDriver
@@ -19,10 +21,15 @@ import math
 import random
 import time
 from dataclasses import dataclass
-from datetime import UTC, datetime
 from types import TracebackType
 from typing import TypedDict
 
+import numpy as np
+
+from telescope_mcp.drivers.sensors.magnetometer import (
+    MagnetometerCalibration,
+    MagnetometerSweep,
+)
 from telescope_mcp.drivers.sensors.types import (
     AvailableSensor,
     SensorInfo,
@@ -114,6 +121,9 @@ class DigitalTwinSensorConfig:
         temp_noise_std: Standard deviation of temperature noise (°C).
         humidity_noise_std: Standard deviation of humidity noise (%RH).
         sample_rate_hz: Simulated sensor sample rate.
+        mag_hard_iron: Simulated hard-iron offset added to the field (µT).
+        mag_soft_iron: Simulated soft-iron matrix applied to the field,
+            as three rows. Identity means no distortion.
     """
 
     initial_altitude: float = 45.0
@@ -127,6 +137,12 @@ class DigitalTwinSensorConfig:
     temp_noise_std: float = 0.1  # °C - temperature noise
     humidity_noise_std: float = 0.5  # %RH - humidity noise
     sample_rate_hz: float = 10.0
+    mag_hard_iron: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    mag_soft_iron: tuple[tuple[float, float, float], ...] = (
+        (1.0, 0.0, 0.0),
+        (0.0, 1.0, 0.0),
+        (0.0, 0.0, 1.0),
+    )
 
     def __repr__(self) -> str:
         """Return concise config representation for logging and debugging.
@@ -219,6 +235,10 @@ class DigitalTwinSensorInstance:
         self._mag_offset_y = 0.0
         self._mag_offset_z = 0.0
 
+        # Ellipsoid (hard/soft-iron) calibration and in-progress sweep
+        self._mag_calibration: MagnetometerCalibration | None = None
+        self._mag_sweep: MagnetometerSweep | None = None
+
         self._is_open = True
 
         logger.debug(
@@ -329,37 +349,48 @@ class DigitalTwinSensorInstance:
         ay = math.cos(alt_rad) * random.gauss(_ACCEL_Y_FACTOR, _ACCEL_NOISE_XY)
         az = random.gauss(0, _ACCEL_NOISE_Z)
 
-        # Generate magnetometer values from azimuth
-        # Simplified: assume horizontal field, magnetic north = 0°
+        # Generate magnetometer values from azimuth, magnetic north = 0°.
+        # Pitching the tube tilts the vertical component into X, then the
+        # configured hard/soft iron distorts the field the sensor sees.
         az_rad = math.radians(raw_azimuth)
-        mx = _MAG_FIELD_STRENGTH * math.cos(az_rad) + random.gauss(0, _MAG_NOISE_XY)
-        my = _MAG_FIELD_STRENGTH * math.sin(az_rad) + random.gauss(0, _MAG_NOISE_XY)
-        mz = random.gauss(_MAG_VERTICAL, _MAG_VERTICAL_NOISE)
+        north = _MAG_FIELD_STRENGTH * math.cos(az_rad)
+        field = np.array(
+            [
+                north * math.cos(alt_rad) - _MAG_VERTICAL * math.sin(alt_rad),
+                _MAG_FIELD_STRENGTH * math.sin(az_rad),
+                north * math.sin(alt_rad) + _MAG_VERTICAL * math.cos(alt_rad),
+            ]
+        )
+        field = np.asarray(self._config.mag_soft_iron) @ field
+        mx = field[0] + self._config.mag_hard_iron[0] + random.gauss(0, _MAG_NOISE_XY)
+        my = field[1] + self._config.mag_hard_iron[1] + random.gauss(0, _MAG_NOISE_XY)
+        mz = (
+            field[2]
+            + self._config.mag_hard_iron[2]
+            + random.gauss(0, _MAG_VERTICAL_NOISE)
+        )
 
-        # Apply mag calibration
+        # Apply mag calibration: firmware-style offsets, then ellipsoid fit
         mx -= self._mag_offset_x
         my -= self._mag_offset_y
         mz -= self._mag_offset_z
+        if self._mag_sweep is not None:
+            self._mag_sweep.add((mx, my, mz))
+        if self._mag_calibration is not None:
+            mx, my, mz = (float(v) for v in self._mag_calibration.apply((mx, my, mz)))
+        else:
+            mx, my, mz = float(mx), float(my), float(mz)
 
         # Environmental noise (configurable)
         temp = self._config.temperature + random.gauss(0, self._config.temp_noise_std)
         hum = self._config.humidity + random.gauss(0, self._config.humidity_noise_std)
 
-        # Build raw string (matching Arduino output format)
-        raw = (
-            f"{ax:.2f}\t{ay:.2f}\t{az:.2f}\t"
-            f"{mx:.2f}\t{my:.2f}\t{mz:.2f}\t{temp:.2f}\t{hum:.2f}"
-        )
-
-        return SensorReading(
-            accelerometer={"aX": ax, "aY": ay, "aZ": az},
-            magnetometer={"mX": mx, "mY": my, "mZ": mz},
-            altitude=calibrated_alt,
-            azimuth=calibrated_az,
-            temperature=temp,
-            humidity=hum,
-            timestamp=datetime.now(UTC),
-            raw_values=raw,
+        # raw_values is formatted in the Arduino layout only if accessed
+        return SensorReading.from_values(
+            (ax, ay, az, mx, my, mz, temp, hum),
+            calibrated_alt,
+            calibrated_az,
+            time.monotonic_ns(),
         )
 
     def set_position(self, altitude: float, azimuth: float) -> None:
@@ -500,6 +531,7 @@ class DigitalTwinSensorInstance:
         self._mag_offset_x = random.gauss(0, _MAG_OFFSET_RANGE)
         self._mag_offset_y = random.gauss(0, _MAG_OFFSET_RANGE)
         self._mag_offset_z = random.gauss(0, _MAG_OFFSET_RANGE)
+        self._mag_calibration = None  # Fitted to the old offsets
 
         logger.debug(
             "Magnetometer calibrated",
@@ -514,6 +546,93 @@ class DigitalTwinSensorInstance:
             offset_z=self._mag_offset_z,
         )
 
+    def start_magnetometer_sweep(self) -> None:
+        """Begin collecting magnetometer samples for an ellipsoid fit.
+
+        Every read() from now on stores its raw magnetometer vector until
+        finish_magnetometer_sweep(). Drive set_position() through a full
+        azimuth turn at three or more altitudes meanwhile, as the real mount
+        would slew. Calling again restarts the sweep.
+
+        Business context: Mirrors ArduinoSensorInstance so calibration
+        workflows and their tools can be tested against simulated
+        hard/soft-iron distortion (DigitalTwinSensorConfig.mag_hard_iron,
+        mag_soft_iron).
+
+        Args:
+            No arguments.
+
+        Returns:
+            None.
+
+        Raises:
+            RuntimeError: If sensor has been closed.
+
+        Example:
+            >>> twin.start_magnetometer_sweep()
+            >>> for alt in (10.0, 60.0):
+            ...     for az in range(0, 360, 2):
+            ...         twin.set_position(alt, az)
+            ...         twin.read()
+            >>> calibration = twin.finish_magnetometer_sweep()
+        """
+        if not self._is_open:
+            raise RuntimeError("Sensor is closed")
+        self._mag_sweep = MagnetometerSweep()
+
+    def finish_magnetometer_sweep(self) -> MagnetometerCalibration:
+        """Stop the sweep, fit an ellipsoid, and apply the result.
+
+        Subsequent reads report magnetometer vectors corrected by the fit,
+        W (m - b), which lie on a sphere of the field strength.
+
+        Returns:
+            MagnetometerCalibration with soft_iron (3x3), hard_iron,
+            field_strength, rms_residual and sample count.
+
+        Raises:
+            RuntimeError: If no sweep is in progress.
+            ValueError: If too few samples were collected or they do not
+                span an ellipsoid. The previous calibration stays.
+
+        Example:
+            >>> calibration = twin.finish_magnetometer_sweep()
+            >>> calibration.hard_iron  # ≈ config.mag_hard_iron
+        """
+        sweep, self._mag_sweep = self._mag_sweep, None
+        if sweep is None:
+            raise RuntimeError("No magnetometer sweep in progress")
+        self._mag_calibration = sweep.fit()
+
+        logger.debug(
+            "Magnetometer ellipsoid calibrated",
+            samples=self._mag_calibration.samples,
+            rms_residual=self._mag_calibration.rms_residual,
+        )
+
+        return self._mag_calibration
+
+    @property
+    def magnetometer_calibration(self) -> MagnetometerCalibration | None:
+        """Hard/soft-iron correction applied to readings, or None."""
+        return self._mag_calibration
+
+    def set_magnetometer_calibration(
+        self, calibration: MagnetometerCalibration | None
+    ) -> None:
+        """Install a previously fitted ellipsoid calibration, or clear it.
+
+        Args:
+            calibration: Result of fit_ellipsoid(), or None.
+
+        Returns:
+            None. Applies from the next read().
+
+        Example:
+            >>> twin.set_magnetometer_calibration(saved_calibration)
+        """
+        self._mag_calibration = calibration
+
     def reset(self) -> None:
         """Reset sensor to initial uncalibrated state.
 
@@ -546,6 +665,8 @@ class DigitalTwinSensorInstance:
         self._mag_offset_x = 0.0
         self._mag_offset_y = 0.0
         self._mag_offset_z = 0.0
+        self._mag_calibration = None
+        self._mag_sweep = None
         self._start_time = time.monotonic()
 
         logger.debug("Sensor reset")
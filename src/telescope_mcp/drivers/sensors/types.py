@@ -10,8 +10,10 @@ Types defined here:
 - SensorInfo: TypedDict for sensor hardware information (type, name, port)
 - SensorStatus: TypedDict for sensor operational status (connected, calibrated)
 - AvailableSensor: TypedDict for discovered sensor descriptors (id, type, name)
-- SensorReading: Dataclass for complete sensor readings with all data
+- SensorReading: Compact slotted sensor reading with lazy dict/datetime views
+- SensorReadingBatch: Many readings backed by one numpy array
 - SensorInstance: Protocol for connected sensor instances (read, calibrate, close)
+- BufferedSensorInstance: SensorInstance that serves reads from its sample history
 - SensorDriver: Protocol for sensor drivers (open, close, get_available_sensors)
 - validate_position: Helper function to validate altitude/azimuth ranges
 
@@ -29,22 +31,41 @@ Example:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime
 from typing import Protocol, TypedDict, runtime_checkable
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from telescope_mcp.drivers.sensors.history import (
+    HISTORY_CHANNELS,
+    SensorHistory,
+    datetime_at,
+    monotonic_ns_at,
+)
+
 __all__ = [
     "AccelerometerData",
     "MagnetometerData",
     "SensorReading",
+    "SensorReadingBatch",
+    "READING_COLUMNS",
     "SensorInfo",
     "SensorStatus",
     "AvailableSensor",
     "SensorInstance",
+    "BufferedSensorInstance",
     "SensorDriver",
     "validate_position",
 ]
 
+# SensorReadingBatch columns: raw channels, then the derived angles
+READING_COLUMNS: tuple[str, ...] = (*HISTORY_CHANNELS, "altitude", "azimuth")
+_ALTITUDE_COLUMN = len(HISTORY_CHANNELS)
+_AZIMUTH_COLUMN = _ALTITUDE_COLUMN + 1
+
 
 class AccelerometerData(TypedDict):
     """3-axis accelerometer readings in g units.
@@ -165,10 +186,18 @@ def validate_position(altitude: float, azimuth: float) -> None:
         raise ValueError(msg)
 
 
-@dataclass
 class SensorReading:
     """A single sensor reading with all data.
 
+    Stored compactly: one tuple of the six IMU channels, four float
+    slots and a monotonic timestamp. The accelerometer/magnetometer
+    dicts, the wall-clock datetime and the raw_values string are built
+    on access, so drivers and high-rate consumers that only need angles
+    or arrays never allocate them.
+
+    The keyword constructor keeps the original dataclass signature;
+    from_values() is the allocation-light path used by drivers.
+
     Attributes:
         accelerometer: 3-axis accelerometer data (aX, aY, aZ) in g.
         magnetometer: 3-axis magnetometer data (mX, mY, mZ) in µT.
@@ -177,17 +206,180 @@ class SensorReading:
         temperature: Temperature in Celsius.
         humidity: Relative humidity in %RH (0-100).
         timestamp: When reading was taken (UTC).
+        t_ns: When reading was taken, on the time.monotonic_ns() clock.
         raw_values: Raw tab-separated string (for compatibility).
     """
 
-    accelerometer: AccelerometerData
-    magnetometer: MagnetometerData
-    altitude: float  # 0-90°
-    azimuth: float  # 0-360°
-    temperature: float
-    humidity: float  # 0-100 %RH
-    timestamp: datetime
-    raw_values: str = ""
+    __slots__ = (
+        "_imu",
+        "altitude",
+        "azimuth",
+        "temperature",
+        "humidity",
+        "_t_ns",
+        "_timestamp",
+        "_raw_values",
+    )
+
+    def __init__(
+        self,
+        accelerometer: AccelerometerData,
+        magnetometer: MagnetometerData,
+        altitude: float,  # 0-90°
+        azimuth: float,  # 0-360°
+        temperature: float,
+        humidity: float,  # 0-100 %RH
+        timestamp: datetime,
+        raw_values: str = "",
+    ) -> None:
+        """Create a reading from dicts and a wall-clock timestamp.
+
+        Args:
+            accelerometer: aX, aY, aZ in g.
+            magnetometer: mX, mY, mZ in µT.
+            altitude: Altitude in degrees.
+            azimuth: Azimuth in degrees.
+            temperature: Temperature in Celsius.
+            humidity: Relative humidity in %RH.
+            timestamp: When the reading was taken.
+            raw_values: Raw sensor string.
+
+        Example:
+            >>> reading = SensorReading(accel, mag, 45.0, 180.0, 20.0, 50.0, now)
+        """
+        self._imu: tuple[float, ...] = (
+            accelerometer["aX"],
+            accelerometer["aY"],
+            accelerometer["aZ"],
+            magnetometer["mX"],
+            magnetometer["mY"],
+            magnetometer["mZ"],
+        )
+        self.altitude = altitude
+        self.azimuth = azimuth
+        self.temperature = temperature
+        self.humidity = humidity
+        self._t_ns: int | None = None
+        self._timestamp: datetime | None = timestamp
+        self._raw_values: str | None = raw_values
+
+    @classmethod
+    def from_values(
+        cls,
+        values: Iterable[float],
+        altitude: float,
+        azimuth: float,
+        t_ns: int,
+        raw_values: str | None = None,
+    ) -> SensorReading:
+        """Create a reading from channel values and a monotonic timestamp.
+
+        Business context: The fast path for drivers and batch consumers.
+        No dicts, datetime or string are created until someone asks for
+        the compatibility views.
+
+        Args:
+            values: Eight floats in HISTORY_CHANNELS order (aX, aY, aZ,
+                mX, mY, mZ, temperature, humidity), e.g. a numpy row.
+            altitude: Altitude in degrees.
+            azimuth: Azimuth in degrees.
+            t_ns: time.monotonic_ns() of the sample.
+            raw_values: Raw sensor string, or None to format the channel
+                values in the Arduino's tab-separated layout on access.
+
+        Returns:
+            SensorReading whose timestamp is derived from t_ns.
+
+        Raises:
+            ValueError: If values does not hold eight channels.
+
+        Example:
+            >>> reading = SensorReading.from_values(row, 45.0, 180.0, t_ns)
+        """
+        channels = [float(v) for v in values]
+        if len(channels) != len(HISTORY_CHANNELS):
+            raise ValueError(
+                f"Expected {len(HISTORY_CHANNELS)} channel values, got {len(channels)}"
+            )
+        reading = cls.__new__(cls)
+        reading._imu = tuple(channels[:6])
+        reading.altitude = float(altitude)
+        reading.azimuth = float(azimuth)
+        reading.temperature = channels[6]
+        reading.humidity = channels[7]
+        reading._t_ns = int(t_ns)
+        reading._timestamp = None
+        reading._raw_values = raw_values
+        return reading
+
+    @property
+    def accelerometer(self) -> AccelerometerData:
+        """Accelerometer vector as a new dict (aX, aY, aZ in g)."""
+        ax, ay, az = self._imu[:3]
+        return {"aX": ax, "aY": ay, "aZ": az}
+
+    @property
+    def magnetometer(self) -> MagnetometerData:
+        """Magnetometer vector as a new dict (mX, mY, mZ in µT)."""
+        mx, my, mz = self._imu[3:]
+        return {"mX": mx, "mY": my, "mZ": mz}
+
+    @property
+    def t_ns(self) -> int:
+        """Sample time on the time.monotonic_ns() clock."""
+        if self._t_ns is None:
+            assert self._timestamp is not None
+            self._t_ns = monotonic_ns_at(self._timestamp)
+        return self._t_ns
+
+    @property
+    def timestamp(self) -> datetime:
+        """Sample time as a UTC datetime, converted once on first access."""
+        if self._timestamp is None:
+            assert self._t_ns is not None
+            self._timestamp = datetime_at(self._t_ns)
+        return self._timestamp
+
+    @property
+    def raw_values(self) -> str:
+        """Raw tab-separated sensor string."""
+        if self._raw_values is None:
+            self._raw_values = "\t".join(f"{v:.2f}" for v in self.channels())
+        return self._raw_values
+
+    def channels(self) -> tuple[float, ...]:
+        """Channel values in HISTORY_CHANNELS order, without dicts.
+
+        Returns:
+            Tuple (aX, aY, aZ, mX, mY, mZ, temperature, humidity).
+
+        Example:
+            >>> ax, ay, az, mx, my, mz, temp, hum = reading.channels()
+        """
+        return (*self._imu, self.temperature, self.humidity)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare all values, timestamps and raw strings."""
+        if not isinstance(other, SensorReading):
+            return NotImplemented
+        return (
+            self.channels() == other.channels()
+            and (self.altitude, self.azimuth) == (other.altitude, other.azimuth)
+            and self.timestamp == other.timestamp
+            and self.raw_values == other.raw_values
+        )
+
+    __hash__ = None  # type: ignore[assignment]  # Mutable, like the dataclass
+
+    def __repr__(self) -> str:
+        """Return a constructor-like representation for debugging."""
+        return (
+            f"SensorReading(altitude={self.altitude!r}, azimuth={self.azimuth!r}, "
+            f"accelerometer={self.accelerometer!r}, "
+            f"magnetometer={self.magnetometer!r}, "
+            f"temperature={self.temperature!r}, humidity={self.humidity!r}, "
+            f"t_ns={self.t_ns!r})"
+        )
 
     def __str__(self) -> str:
         """Return human-readable string representation.
@@ -217,6 +409,155 @@ class SensorReading:
         )
 
 
+class SensorReadingBatch:
+    """Many sensor readings held in one numpy array.
+
+    Columns follow READING_COLUMNS: the eight HISTORY_CHANNELS, then
+    altitude and azimuth. Timestamps are monotonic nanoseconds. Indexing
+    yields SensorReading objects on demand; reductions such as mean()
+    run vectorized over the whole batch.
+
+    Business context: Averaging, telemetry recording and other
+    high-rate consumers previously held lists of readings, each with two
+    dicts and a datetime. A batch costs one row per sample.
+
+    Example:
+        >>> batch = SensorReadingBatch.from_readings(readings)
+        >>> averaged = batch.mean()
+        >>> batch.azimuth.max()
+    """
+
+    __slots__ = ("_values", "_t_ns", "_last_timestamp")
+
+    def __init__(self, values: ArrayLike, t_ns: ArrayLike) -> None:
+        """Wrap arrays of readings.
+
+        Args:
+            values: Shape (n, 10) in READING_COLUMNS order.
+            t_ns: Monotonic timestamps, shape (n,).
+
+        Raises:
+            ValueError: If the shapes do not match READING_COLUMNS or
+                each other.
+
+        Example:
+            >>> batch = SensorReadingBatch(np.zeros((5, 10)), times)
+        """
+        self._values = np.asarray(values, dtype=np.float64)
+        self._t_ns = np.asarray(t_ns, dtype=np.int64)
+        if self._values.ndim != 2 or self._values.shape[1] != len(READING_COLUMNS):
+            raise ValueError(
+                f"values must have shape (n, {len(READING_COLUMNS)}), "
+                f"got {self._values.shape}"
+            )
+        if self._t_ns.shape != (len(self._values),):
+            raise ValueError("values and t_ns must have the same length")
+        # Wall-clock time of the newest source reading, when it had one
+        self._last_timestamp: datetime | None = None
+
+    @classmethod
+    def from_readings(cls, readings: Sequence[SensorReading]) -> SensorReadingBatch:
+        """Pack readings into one array without touching their dict views.
+
+        Args:
+            readings: Readings in chronological order.
+
+        Returns:
+            SensorReadingBatch of len(readings) rows. The last reading's
+            original timestamp, if it was built with one, is kept for
+            mean().
+
+        Example:
+            >>> batch = SensorReadingBatch.from_readings([r1, r2, r3])
+        """
+        values = np.array(
+            [(*r.channels(), r.altitude, r.azimuth) for r in readings],
+            dtype=np.float64,
+        ).reshape(len(readings), len(READING_COLUMNS))
+        batch = cls(values, np.array([r.t_ns for r in readings], dtype=np.int64))
+        if readings:
+            batch._last_timestamp = readings[-1]._timestamp
+        return batch
+
+    @property
+    def values(self) -> NDArray[np.float64]:
+        """Underlying (n, 10) array in READING_COLUMNS order."""
+        return self._values
+
+    @property
+    def t_ns(self) -> NDArray[np.int64]:
+        """Monotonic timestamps, shape (n,)."""
+        return self._t_ns
+
+    @property
+    def altitude(self) -> NDArray[np.float64]:
+        """Altitude column view."""
+        return self._values[:, _ALTITUDE_COLUMN]
+
+    @property
+    def azimuth(self) -> NDArray[np.float64]:
+        """Azimuth column view."""
+        return self._values[:, _AZIMUTH_COLUMN]
+
+    def __len__(self) -> int:
+        """Number of readings."""
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> SensorReading:
+        """Materialize one reading (negative indices allowed)."""
+        row = self._values[index]
+        return SensorReading.from_values(
+            row[: len(HISTORY_CHANNELS)],
+            row[_ALTITUDE_COLUMN],
+            row[_AZIMUTH_COLUMN],
+            int(self._t_ns[index]),
+        )
+
+    def __iter__(self) -> Iterator[SensorReading]:
+        """Materialize readings in order."""
+        return (self[i] for i in range(len(self)))
+
+    def mean(self, raw_values: str | None = None) -> SensorReading:
+        """Average all readings into one.
+
+        Channels, altitude, temperature and humidity are averaged
+        arithmetically; azimuth uses the circular mean so 350° and 10°
+        average to 0°, not 180°.
+
+        Args:
+            raw_values: Description for the result. Defaults to
+                "averaged_N_samples".
+
+        Returns:
+            SensorReading stamped with the last reading's time: its
+            original timestamp when the batch came from readings that
+            had one (from_readings()), else derived from t_ns.
+
+        Raises:
+            ValueError: If the batch is empty.
+
+        Example:
+            >>> SensorReadingBatch.from_readings(readings).mean().azimuth
+        """
+        n = len(self)
+        if n == 0:
+            raise ValueError("No readings to average")
+        means = self._values.mean(axis=0)
+        azimuth_rad = np.radians(self.azimuth)
+        azimuth = math.degrees(
+            math.atan2(np.sin(azimuth_rad).mean(), np.cos(azimuth_rad).mean())
+        )
+        reading = SensorReading.from_values(
+            means[: len(HISTORY_CHANNELS)],
+            means[_ALTITUDE_COLUMN],
+            azimuth % 360,
+            int(self._t_ns[-1]),
+            raw_values if raw_values is not None else f"averaged_{n}_samples",
+        )
+        reading._timestamp = self._last_timestamp
+        return reading
+
+
 @runtime_checkable
 class SensorInstance(Protocol):  # pragma: no cover
     """Protocol for connected sensor instances.
@@ -269,7 +610,7 @@ class SensorInstance(Protocol):  # pragma: no cover
         and detect drift. Enables closed-loop pointing correction.
 
         Returns:
-            SensorReading dataclass containing:
+            SensorReading containing:
             - accelerometer: {aX, aY, aZ} in g units
             - magnetometer: {mX, mY, mZ} in µT
             - altitude: Calculated altitude in degrees (0-90)
@@ -419,6 +760,85 @@ class SensorInstance(Protocol):  # pragma: no cover
         ...
 
 
+@runtime_checkable
+class BufferedSensorInstance(SensorInstance, Protocol):  # pragma: no cover
+    """Protocol for sensor instances that buffer their sample stream.
+
+    Streaming drivers (ArduinoSensorInstance) record every received sample
+    in a SensorHistory and answer averaged and time-indexed reads from it
+    without further I/O. On-demand drivers (digital twin) do not.
+
+    Business context: Lets the device layer serve smoothing and frame
+    tagging instantly from data already received, and fall back to live
+    polling only for drivers that keep no history.
+    """
+
+    @property
+    def history(self) -> SensorHistory:
+        """Timestamped ring of the raw samples received so far."""
+        ...
+
+    def read_average(self, samples: int) -> SensorReading:
+        """Average the newest buffered samples without waiting.
+
+        Args:
+            samples: Number of newest samples to average.
+
+        Returns:
+            SensorReading stamped with the newest sample time.
+
+        Raises:
+            RuntimeError: If closed or no sample received yet.
+            ValueError: If samples < 1.
+        """
+        ...
+
+    def read_window(self, duration_ms: float) -> SensorReading:
+        """Average the buffered samples from the last duration_ms of stream.
+
+        Args:
+            duration_ms: Window length ending at the newest sample.
+
+        Returns:
+            SensorReading stamped with the newest sample time.
+
+        Raises:
+            RuntimeError: If closed or no sample received yet.
+            ValueError: If duration_ms <= 0.
+        """
+        ...
+
+    def read_at(self, when: datetime) -> SensorReading:
+        """Interpolate the buffered samples to a wall-clock instant.
+
+        Args:
+            when: Instant to interpolate to (naive values treated as UTC).
+
+        Returns:
+            SensorReading timestamped with when.
+
+        Raises:
+            RuntimeError: If closed or no sample received yet.
+        """
+        ...
+
+    def read_between(self, start: datetime, end: datetime) -> SensorReading:
+        """Average the buffered samples received between two instants.
+
+        Args:
+            start: Range start (naive values treated as UTC).
+            end: Range end, inclusive.
+
+        Returns:
+            SensorReading stamped with the range midpoint.
+
+        Raises:
+            RuntimeError: If closed or no sample received yet.
+            ValueError: If end precedes start.
+        """
+        ...
+
+
 @runtime_checkable
 class SensorDriver(Protocol):  # pragma: no cover
     """Protocol for sensor drivers.
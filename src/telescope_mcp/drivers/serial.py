@@ -10,6 +10,23 @@ Protocols:
 
 Functions:
     list_serial_ports: Wrapper for pyserial port enumeration with graceful fallback
+    read_serial_recording: Load a capture written by RecordingSerialPort
+
+Record and replay:
+    RecordingSerialPort wraps a live port and logs every byte the driver
+    read or wrote, with its monotonic time, to a compact binary file.
+    ReplaySerialPort feeds the recorded reads back, at the recorded pace
+    scaled by a speed factor or as fast as the driver consumes them, so
+    field issues reproduce and parser/controller throughput can be
+    benchmarked on real traffic without the telescope attached.
+
+    File format: the 8-byte magic b"TMCPSER1" followed by records of a
+    13-byte little-endian header (direction b"R"/b"W", uint64 ns since
+    recording start, uint32 payload length) and the payload. A truncated
+    final record (process killed mid-write) is ignored when loading.
+    Each open writes a new file: if the requested path exists, a
+    numbered sibling (imu-1.tmcpser, imu-2.tmcpser, ...) is used, so a
+    driver reconnecting with the same record_to keeps earlier captures.
 
 Example:
     # For testing - create mock implementations
@@ -29,6 +46,11 @@ Example:
     # Inject mock into driver
     instance = SomeDriver._create_with_serial(MockSerialPort())
 
+    # Capture a session in the field, replay it on a desk
+    sensor = ArduinoSensorInstance("/dev/ttyACM0", record_to="imu.tmcpser")
+    replay = ReplaySerialPort("imu.tmcpser", speed=10.0)
+    instance = ArduinoSensorInstance._create_with_serial(replay, start_reader=True)
+
 Testing:
     The protocols enable unit testing without hardware by allowing
     injection of mock serial ports that simulate device responses.
@@ -39,7 +61,21 @@ Testing:
 
 from __future__ import annotations
 
-from typing import Any, Protocol, runtime_checkable
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Literal, Protocol, runtime_checkable
+
+# File magic for serial recordings (format version 1)
+RECORDING_MAGIC = b"TMCPSER1"
+
+# Record header: direction (b"R"/b"W"), ns since start, payload length
+_RECORD_HEADER = struct.Struct("<cQI")
+
+# Recordings are flushed at least this often so a crash loses little
+_RECORDING_FLUSH_INTERVAL_NS = 1_000_000_000
 
 
 @runtime_checkable
@@ -170,6 +206,27 @@ class SerialPort(Protocol):  # pragma: no cover
         """
         ...
 
+    def read(self, size: int = 1) -> bytes:
+        """Read up to size bytes, blocking until they arrive or timeout.
+
+        Business context: Streaming drivers drain everything already
+        received (size=in_waiting) in one call instead of one
+        read_until() per line, which keeps up with high output rates.
+
+        Args:
+            size: Maximum number of bytes to read.
+
+        Returns:
+            Bytes read. Fewer than size (possibly empty) on timeout.
+
+        Raises:
+            SerialException: If port is closed or hardware error occurs.
+
+        Example:
+            >>> data = serial.read(serial.in_waiting)
+        """
+        ...
+
     def readline(self) -> bytes:
         """Read a complete line ending with newline character.
 
@@ -354,8 +411,420 @@ def list_serial_ports() -> list[Any]:  # pragma: no cover
         return []
 
 
+@dataclass(frozen=True, slots=True)
+class SerialRecord:
+    """One read or write captured by RecordingSerialPort.
+
+    Attributes:
+        direction: "R" for bytes returned to the driver, "W" for bytes
+            the driver wrote.
+        t_ns: Nanoseconds since the recording started, taken when the
+            call returned.
+        data: The bytes read or written.
+    """
+
+    direction: Literal["R", "W"]
+    t_ns: int
+    data: bytes
+
+
+def read_serial_recording(path: str | Path) -> list[SerialRecord]:
+    """Load every record from a serial recording file.
+
+    Business context: Lets tests and analysis scripts inspect a field
+    capture (command sequence, timing gaps, byte counts) directly, and
+    backs ReplaySerialPort.
+
+    Args:
+        path: File written by RecordingSerialPort.
+
+    Returns:
+        Records in the order they were captured. A truncated final
+        record is dropped.
+
+    Raises:
+        ValueError: If the file does not start with RECORDING_MAGIC or
+            holds an unknown record direction.
+        OSError: If the file cannot be read.
+
+    Example:
+        >>> records = read_serial_recording("imu.tmcpser")
+        >>> sum(len(r.data) for r in records if r.direction == "R")
+        48211
+    """
+    raw = Path(path).read_bytes()
+    if not raw.startswith(RECORDING_MAGIC):
+        raise ValueError(f"{path} is not a serial recording")
+    records: list[SerialRecord] = []
+    offset = len(RECORDING_MAGIC)
+    header_size = _RECORD_HEADER.size
+    while offset + header_size <= len(raw):
+        direction, t_ns, length = _RECORD_HEADER.unpack_from(raw, offset)
+        offset += header_size
+        if offset + length > len(raw):
+            break
+        if direction not in (b"R", b"W"):
+            raise ValueError(f"Unknown record direction {direction!r} in {path}")
+        records.append(
+            SerialRecord(direction.decode(), t_ns, raw[offset : offset + length])
+        )
+        offset += length
+    return records
+
+
+def _create_unique(path: Path) -> tuple[Path, BinaryIO]:
+    """Create path, or its first free numbered sibling, for writing.
+
+    Uses exclusive creation, so two recorders started at once (or a
+    file appearing between checks) never share or truncate a file.
+
+    Args:
+        path: Preferred file path.
+
+    Returns:
+        Tuple (path actually created, file opened "xb").
+
+    Raises:
+        OSError: If the file cannot be created for another reason.
+
+    Example:
+        >>> _create_unique(Path("imu.tmcpser"))[0]  # imu.tmcpser exists
+        PosixPath('imu-1.tmcpser')
+    """
+    candidate, counter = path, 0
+    while True:
+        try:
+            return candidate, candidate.open("xb")
+        except FileExistsError:
+            counter += 1
+            candidate = path.with_name(f"{path.stem}-{counter}{path.suffix}")
+
+
+class RecordingSerialPort:
+    """SerialPort wrapper that logs all traffic to a recording file.
+
+    Every call is delegated to the wrapped port; non-empty reads and all
+    writes are appended to the file with the time the call returned.
+    Only bytes the driver actually received are recorded, so data
+    discarded by reset_input_buffer() never appears in the capture.
+    The file is flushed at least once a second while traffic flows, so
+    a crash or power loss in the field costs at most about a second.
+
+    Note:
+        Thread-safe for recording: the Arduino reader thread and command
+        writes on the caller's thread may overlap, so appends to the file
+        are serialized with a lock. Threading guarantees of the I/O
+        itself are those of the wrapped port.
+
+    Example:
+        port = serial.Serial("/dev/ttyACM0", 115200, timeout=1.0)
+        recorder = RecordingSerialPort(port, "imu.tmcpser")
+        instance = ArduinoSensorInstance._create_with_serial(recorder)
+    """
+
+    def __init__(self, port: SerialPort, path: str | Path) -> None:
+        """Wrap a port and start a new recording file.
+
+        Args:
+            port: Open port to delegate to.
+            path: Recording file. Never overwritten: if it exists, the
+                first free numbered sibling (stem-1.suffix, ...) is
+                created instead; see the path property.
+
+        Returns:
+            None.
+
+        Raises:
+            OSError: If the file cannot be created.
+
+        Example:
+            >>> recorder = RecordingSerialPort(port, "motor.tmcpser")
+        """
+        self._port = port
+        self._path, self._file = _create_unique(Path(path))
+        self._file.write(RECORDING_MAGIC)
+        self._lock = threading.Lock()
+        self._start_ns = time.monotonic_ns()
+        self._flushed_ns = self._start_ns
+        self._records = 0
+
+    @property
+    def path(self) -> Path:
+        """Recording file actually written (may be a numbered sibling)."""
+        return self._path
+
+    @property
+    def records(self) -> int:
+        """Number of records written so far."""
+        return self._records
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the wrapped port is open."""
+        return self._port.is_open
+
+    @property
+    def in_waiting(self) -> int:
+        """Bytes waiting in the wrapped port."""
+        return self._port.in_waiting
+
+    def _record(self, direction: bytes, data: bytes) -> None:
+        """Append one record, flushing periodically; dropped once closed."""
+        with self._lock:
+            if self._file.closed:
+                return
+            now_ns = time.monotonic_ns()
+            t_ns = now_ns - self._start_ns
+            self._file.write(_RECORD_HEADER.pack(direction, t_ns, len(data)))
+            self._file.write(data)
+            self._records += 1
+            if now_ns - self._flushed_ns >= _RECORDING_FLUSH_INTERVAL_NS:
+                self._file.flush()
+                self._flushed_ns = now_ns
+
+    def read_until(self, expected: bytes = b"\n", size: int | None = None) -> bytes:
+        """Delegate read_until() and record the bytes returned."""
+        data = self._port.read_until(expected, size)
+        if data:
+            self._record(b"R", data)
+        return data
+
+    def read(self, size: int = 1) -> bytes:
+        """Delegate read() and record the bytes returned."""
+        data = self._port.read(size)
+        if data:
+            self._record(b"R", data)
+        return data
+
+    def readline(self) -> bytes:
+        """Delegate readline() and record the bytes returned."""
+        data = self._port.readline()
+        if data:
+            self._record(b"R", data)
+        return data
+
+    def write(self, data: bytes) -> int | None:
+        """Delegate write() and record the bytes sent."""
+        written = self._port.write(data)
+        self._record(b"W", bytes(data if written is None else data[:written]))
+        return written
+
+    def reset_input_buffer(self) -> None:
+        """Delegate reset_input_buffer(); discarded bytes are not recorded."""
+        self._port.reset_input_buffer()
+
+    def flush(self) -> None:
+        """Push buffered records to disk without closing.
+
+        Example:
+            >>> recorder.flush()  # before copying the file off the Pi
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Close the wrapped port, then finish the recording file.
+
+        The file is closed even if closing the port raises (e.g. the
+        device was unplugged); the port's exception still propagates.
+        Safe to call multiple times.
+        """
+        try:
+            self._port.close()
+        finally:
+            with self._lock:
+                if not self._file.closed:
+                    self._file.close()
+
+
+class ReplaySerialPort:
+    """SerialPort that plays back the reads of a recording.
+
+    Recorded reads are concatenated into the device's output stream and
+    each chunk becomes available at its recorded time divided by speed;
+    read methods then consume that stream with pyserial's blocking and
+    timeout semantics. Writes are captured in writes for comparison with
+    recorded_writes rather than driving the playback, so a replay is
+    deterministic in content even when the driver's commands differ.
+
+    reset_input_buffer() is a no-op: the recording holds only bytes the
+    driver consumed, which is exactly what it should receive again.
+
+    Note:
+        Thread-safe: buffer updates are serialized with a lock so the
+        Arduino reader thread and command calls can share the port.
+        Blocked reads wait on a condition of that lock, which close()
+        notifies.
+
+    Example:
+        replay = ReplaySerialPort("motor.tmcpser", speed=None)
+        controller = SerialMotorController._create_with_serial(replay)
+        controller.move(MotorType.ALTITUDE, 1000)
+        assert replay.writes == replay.recorded_writes
+    """
+
+    def __init__(
+        self,
+        recording: str | Path | list[SerialRecord],
+        *,
+        speed: float | None = 1.0,
+        timeout: float = 1.0,
+    ) -> None:
+        """Load a recording and start the playback clock.
+
+        Args:
+            recording: Recording file, or records from
+                read_serial_recording().
+            speed: Playback rate relative to the recording (2.0 = twice
+                as fast). None or 0 makes all data available at once, to
+                benchmark parsing at full speed.
+            timeout: Seconds a read may block waiting for data, as the
+                timeout of serial.Serial.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If speed is negative or the file is not a
+                recording.
+            OSError: If the file cannot be read.
+
+        Example:
+            >>> replay = ReplaySerialPort("imu.tmcpser", speed=10.0)
+        """
+        if speed is not None and speed < 0:
+            raise ValueError(f"speed must be non-negative, got {speed}")
+        records = (
+            read_serial_recording(recording)
+            if isinstance(recording, (str, Path))
+            else recording
+        )
+        self._reads = [r for r in records if r.direction == "R"]
+        self._recorded_writes = [r.data for r in records if r.direction == "W"]
+        self._speed = speed or None
+        self._timeout = timeout
+        self._buffer = bytearray()
+        self._next = 0
+        self._writes: list[bytes] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._open = True
+        self._start_ns = time.monotonic_ns()
+
+    @property
+    def is_open(self) -> bool:
+        """False after close()."""
+        return self._open
+
+    @property
+    def exhausted(self) -> bool:
+        """True once every recorded read has been released and consumed."""
+        with self._lock:
+            return self._next == len(self._reads) and not self._buffer
+
+    @property
+    def writes(self) -> list[bytes]:
+        """Bytes written by the driver during replay, one entry per call."""
+        with self._lock:
+            return list(self._writes)
+
+    @property
+    def recorded_writes(self) -> list[bytes]:
+        """Bytes written by the driver when the recording was made."""
+        return list(self._recorded_writes)
+
+    def _due_ns(self, index: int) -> int:
+        """Monotonic time at which recorded read `index` is released."""
+        if self._speed is None:
+            return self._start_ns
+        return self._start_ns + int(self._reads[index].t_ns / self._speed)
+
+    def _release(self) -> int | None:
+        """Move due reads into the buffer; return next due time or None.
+
+        Caller holds the lock.
+        """
+        now = time.monotonic_ns()
+        while self._next < len(self._reads):
+            due = self._due_ns(self._next)
+            if due > now:
+                return due
+            self._buffer += self._reads[self._next].data
+            self._next += 1
+        return None
+
+    @property
+    def in_waiting(self) -> int:
+        """Bytes released so far and not yet read."""
+        with self._lock:
+            self._release()
+            return len(self._buffer)
+
+    def _read(self, expected: bytes | None, size: int | None) -> bytes:
+        """Block until expected/size is satisfied or the timeout expires.
+
+        Returns whatever is buffered on timeout, like pyserial. Once the
+        recording is exhausted an empty read still waits out the timeout,
+        so polling drivers do not spin. close() wakes a waiting read,
+        which then returns what is buffered.
+        """
+        deadline = time.monotonic_ns() + int(self._timeout * 1e9)
+        with self._lock:
+            while True:
+                next_due = self._release()
+                end = None
+                if expected is not None:
+                    found = self._buffer.find(expected)
+                    if found >= 0:
+                        end = found + len(expected)
+                if size is not None and len(self._buffer) >= size:
+                    end = size if end is None else min(end, size)
+                now = time.monotonic_ns()
+                if end is None and (now >= deadline or not self._open):
+                    end = len(self._buffer)
+                if end is not None:
+                    data = bytes(self._buffer[:end])
+                    del self._buffer[:end]
+                    return data
+                wake = deadline if next_due is None else min(next_due, deadline)
+                self._wakeup.wait(max(wake - now, 0) / 1e9)
+
+    def read_until(self, expected: bytes = b"\n", size: int | None = None) -> bytes:
+        """Read up to and including expected, or size bytes, or timeout."""
+        return self._read(expected, size)
+
+    def read(self, size: int = 1) -> bytes:
+        """Read size bytes, or fewer on timeout."""
+        return self._read(None, size)
+
+    def readline(self) -> bytes:
+        """Read one line ending in b"\\n", or a partial line on timeout."""
+        return self._read(b"\n", None)
+
+    def write(self, data: bytes) -> int:
+        """Capture written bytes in writes."""
+        with self._lock:
+            self._writes.append(bytes(data))
+        return len(data)
+
+    def reset_input_buffer(self) -> None:
+        """No-op; recorded reads are exactly what the driver consumed."""
+
+    def close(self) -> None:
+        """Stop playback; blocked reads return immediately."""
+        with self._lock:
+            self._open = False
+            self._wakeup.notify_all()
+
+
 __all__ = [
     "SerialPort",
     "PortEnumerator",
     "list_serial_ports",
+    "RECORDING_MAGIC",
+    "SerialRecord",
+    "RecordingSerialPort",
+    "ReplaySerialPort",
+    "read_serial_recording",
 ]
@@ -42,6 +42,8 @@ from telescope_mcp.observability.logging import (
 from telescope_mcp.observability.stats import (
     CameraStats,
     StatsSummary,
+    TimingStats,
+    TimingSummary,
 )
 
 __all__ = [
@@ -54,4 +56,6 @@ __all__ = [
     # Statistics
     "CameraStats",
     "StatsSummary",
+    "TimingStats",
+    "TimingSummary",
 ]
@@ -5,6 +5,7 @@ Provides metrics collection for camera operations including:
 - Timing statistics (min, max, avg, p95)
 - Error categorization
 - Rolling windows for recent performance
+- Scheduling error of synchronized captures (TimingStats)
 
 Thread-safe for concurrent camera access.
 
@@ -690,6 +691,211 @@ class CameraStats:
         }
 
 
+# =============================================================================
+# Synchronization Timing
+# =============================================================================
+
+
+@dataclass
+class TimingSummary:
+    """Running statistics of scheduling error for one timed operation.
+
+    Errors are signed microseconds (positive = late, negative = early).
+    Windowed fields cover the most recent window_size samples; count and
+    max_abs_error_us are all-time.
+
+    Attributes:
+        name: Operation label (e.g., "finder/main")
+        count: Total samples recorded
+        mean_error_us: Mean signed error over the window
+        stddev_error_us: Standard deviation of error over the window
+        mean_abs_error_us: Mean absolute error over the window
+        p95_abs_error_us: 95th percentile absolute error over the window
+        max_abs_error_us: Largest absolute error ever recorded
+        last_error_us: Most recent sample
+    """
+
+    name: str
+    count: int = 0
+    mean_error_us: float = 0.0
+    stddev_error_us: float = 0.0
+    mean_abs_error_us: float = 0.0
+    p95_abs_error_us: float = 0.0
+    max_abs_error_us: float = 0.0
+    last_error_us: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert timing summary to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with all TimingSummary fields.
+
+        Example:
+            >>> stats.get_summary("finder/main").to_dict()["p95_abs_error_us"]
+            180.0
+        """
+        return {
+            "name": self.name,
+            "count": self.count,
+            "mean_error_us": self.mean_error_us,
+            "stddev_error_us": self.stddev_error_us,
+            "mean_abs_error_us": self.mean_abs_error_us,
+            "p95_abs_error_us": self.p95_abs_error_us,
+            "max_abs_error_us": self.max_abs_error_us,
+            "last_error_us": self.last_error_us,
+        }
+
+
+class TimingStats:
+    """Thread-safe running statistics of timing error per named operation.
+
+    Used by CameraController to track how far each synchronized capture
+    started from its ideal time, so drift in scheduling precision shows
+    up in diagnostics instead of only in individual results.
+
+    Usage:
+        stats = TimingStats()
+        stats.record("finder/main", error_us=120)
+        summary = stats.get_summary("finder/main")
+        print(f"p95: {summary.p95_abs_error_us:.0f}us")
+    """
+
+    def __init__(self, window_size: int = DEFAULT_STATS_WINDOW_SIZE) -> None:
+        """Initialize an empty timing statistics container.
+
+        Args:
+            window_size: Samples retained per operation for windowed
+                statistics (mean, stddev, percentiles).
+
+        Raises:
+            None.
+
+        Example:
+            >>> stats = TimingStats(window_size=200)
+        """
+        self._window_size = window_size
+        self._samples: dict[str, deque[float]] = {}
+        self._counts: dict[str, int] = {}
+        self._max_abs: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, error_us: float) -> None:
+        """Record one timing error sample.
+
+        Args:
+            name: Operation label; created on first use.
+            error_us: Signed error in microseconds (actual - ideal).
+
+        Raises:
+            None.
+
+        Example:
+            >>> stats.record("finder/main", -35)
+        """
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self._window_size)
+            samples.append(float(error_us))
+            self._counts[name] = self._counts.get(name, 0) + 1
+            self._max_abs[name] = max(self._max_abs.get(name, 0.0), abs(error_us))
+
+    def get_summary(self, name: str) -> TimingSummary:
+        """Compute the summary for one operation.
+
+        Args:
+            name: Operation label. Unknown names return an empty summary.
+
+        Returns:
+            TimingSummary snapshot.
+
+        Raises:
+            None.
+
+        Example:
+            >>> stats.get_summary("finder/main").count
+            12
+        """
+        with self._lock:
+            samples = list(self._samples.get(name, ()))
+            count = self._counts.get(name, 0)
+            max_abs = self._max_abs.get(name, 0.0)
+
+        if not samples:
+            return TimingSummary(name=name, count=count, max_abs_error_us=max_abs)
+
+        n = len(samples)
+        mean = sum(samples) / n
+        variance = sum((x - mean) ** 2 for x in samples) / n
+        abs_errors = sorted(abs(x) for x in samples)
+        return TimingSummary(
+            name=name,
+            count=count,
+            mean_error_us=mean,
+            stddev_error_us=variance**0.5,
+            mean_abs_error_us=sum(abs_errors) / n,
+            p95_abs_error_us=_percentile(abs_errors, 95),
+            max_abs_error_us=max_abs,
+            last_error_us=samples[-1],
+        )
+
+    def get_all_summaries(self) -> dict[str, TimingSummary]:
+        """Get summaries for every operation recorded so far.
+
+        Returns:
+            Dictionary mapping operation label to TimingSummary.
+
+        Raises:
+            None.
+
+        Example:
+            >>> list(stats.get_all_summaries())
+            ['finder/main']
+        """
+        with self._lock:
+            names = list(self._samples)
+        return {name: self.get_summary(name) for name in names}
+
+    def reset(self, name: str | None = None) -> None:
+        """Clear samples for one operation, or all when name is None.
+
+        Args:
+            name: Operation label to clear; unknown names are a no-op.
+
+        Raises:
+            None.
+
+        Example:
+            >>> stats.reset()
+        """
+        with self._lock:
+            names = list(self._samples) if name is None else [name]
+            for key in names:
+                self._samples.pop(key, None)
+                self._counts.pop(key, None)
+                self._max_abs.pop(key, None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export all timing summaries for serialization.
+
+        Returns:
+            {"operations": {name: TimingSummary fields}, "timestamp": ISO8601}
+
+        Raises:
+            None.
+
+        Example:
+            >>> json.dumps(stats.to_dict())
+        """
+        return {
+            "operations": {
+                name: summary.to_dict()
+                for name, summary in self.get_all_summaries().items()
+            },
+            "timestamp": _utc_now().isoformat(),
+        }
+
+
 def _percentile(sorted_data: list[float], p: float) -> float:
     """Calculate a percentile value from pre-sorted data.
 
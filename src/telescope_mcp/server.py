@@ -13,7 +13,11 @@ from mcp.server.stdio import stdio_server
 
 from telescope_mcp.observability import configure_logging, get_logger
 from telescope_mcp.tools import cameras, motors, position, sessions
-from telescope_mcp.web.app import configure_camera_defaults, create_app
+from telescope_mcp.web.app import (
+    _init_transforms,
+    configure_camera_defaults,
+    create_app,
+)
 
 logger = get_logger(__name__)
 
@@ -36,7 +40,8 @@ _dashboard = DashboardState()
 def create_server(mode: Literal["hardware", "digital_twin"] = "digital_twin") -> Server:
     """Create and configure the MCP server for AI agent telescope control.
 
-    Initializes the camera registry with the configured driver
+    Initializes the camera registry with the configured driver, starts
+    coordinate transform warm-up in the background (offline IERS data),
     and registers all MCP tools (cameras, motors, position, sessions).
     Business context: Central server configuration that exposes telescope
     hardware to AI agents via Model Context Protocol. Enables Claude and
@@ -66,7 +71,8 @@ def create_server(mode: Literal["hardware", "digital_twin"] = "digital_twin") ->
     from telescope_mcp.drivers.config import get_factory
 
     # Configure driver mode
-    if mode.lower() == "hardware":
+    hardware = mode.lower() == "hardware"
+    if hardware:
         from telescope_mcp.drivers.config import use_hardware
 
         use_hardware()
@@ -75,8 +81,14 @@ def create_server(mode: Literal["hardware", "digital_twin"] = "digital_twin") ->
         logger.info("Using DIGITAL_TWIN mode (simulated cameras)")
 
     driver = get_factory().create_camera_driver()
-    init_registry(driver)
+    registry = init_registry(driver)
     logger.info(f"Initialized camera registry with {type(driver).__name__}")
+    if hardware:
+        # Detect plug/unplug in the background and pre-open new cameras
+        registry.start_monitor()
+
+    # Load IERS tables and astropy state now, not on the first tagged capture
+    _init_transforms()
 
     # Register tool handlers
     cameras.register(server)
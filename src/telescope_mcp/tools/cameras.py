@@ -4,6 +4,7 @@ Uses the device layer with CameraRegistry for hardware abstraction.
 Supports both real ASI cameras and digital twin simulation.
 """
 
+import asyncio
 import base64
 import json
 from dataclasses import asdict
@@ -12,14 +13,25 @@ from typing import TYPE_CHECKING, Any
 from mcp.server import Server
 from mcp.types import TextContent, Tool
 
+from telescope_mcp.data import ExposureSequence, SequenceStep
 from telescope_mcp.devices import CaptureOptions, get_registry
+from telescope_mcp.drivers.config import get_session_manager
 from telescope_mcp.observability import get_logger
 
 if TYPE_CHECKING:
+    from telescope_mcp.data import SessionManager
     from telescope_mcp.devices import CameraRegistry
 
 logger = get_logger(__name__)
 
+# Sequences started through start_sequence, keyed by sequence_id (oldest
+# first); finished ones beyond _MAX_FINISHED_SEQUENCES are dropped
+_sequences: dict[str, ExposureSequence] = {}
+_MAX_FINISHED_SEQUENCES = 16
+
+# Seconds abort_sequence waits for the sequence to wind down
+_ABORT_WAIT_SEC = 10.0
+
 
 # Tool definitions
 TOOLS = [
@@ -113,6 +125,93 @@ TOOLS = [
             "required": ["camera_id", "control"],
         },
     ),
+    Tool(
+        name="start_sequence",
+        description=(
+            "Capture a sequence of frames in the background, storing every "
+            "frame in the active session. Returns a sequence_id immediately; "
+            "poll get_sequence_status for progress."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "camera_id": {
+                    "type": "integer",
+                    "description": "Camera ID (0 for finder, 1 for main)",
+                },
+                "steps": {
+                    "type": "array",
+                    "minItems": 1,
+                    "description": "Blocks of identical exposures, run in order",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "count": {"type": "integer", "minimum": 1},
+                            "exposure_us": {"type": "integer", "minimum": 1},
+                            "gain": {"type": "integer", "minimum": 0},
+                            "frame_type": {
+                                "type": "string",
+                                "enum": ["light", "dark", "flat", "bias"],
+                                "default": "light",
+                            },
+                            "image_type": {
+                                "type": "string",
+                                "enum": ["RAW8", "RAW16", "RGB24"],
+                                "default": "RAW16",
+                            },
+                        },
+                        "required": ["count", "exposure_us", "gain"],
+                    },
+                },
+                "interval_sec": {
+                    "type": "number",
+                    "minimum": 0,
+                    "description": (
+                        "Minimum seconds between exposure starts (0 = back-to-back)"
+                    ),
+                    "default": 0,
+                },
+                "label": {
+                    "type": "string",
+                    "description": (
+                        "Camera key in the session file (default camera_<id>)"
+                    ),
+                },
+            },
+            "required": ["camera_id", "steps"],
+        },
+    ),
+    Tool(
+        name="get_sequence_status",
+        description="Get progress of a capture sequence",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sequence_id": {
+                    "type": "string",
+                    "description": "Sequence ID (default: most recent sequence)",
+                },
+            },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="abort_sequence",
+        description=(
+            "Abort a running capture sequence. Frames already captured stay "
+            "in the session."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sequence_id": {
+                    "type": "string",
+                    "description": "Sequence ID (default: most recent sequence)",
+                },
+            },
+            "required": [],
+        },
+    ),
 ]
 
 
@@ -129,6 +228,8 @@ def register(server: Server) -> None:
     - capture_frame: Take a single exposure
     - set_camera_control: Adjust camera settings
     - get_camera_control: Read camera settings
+    - start_sequence / get_sequence_status / abort_sequence: Background
+      multi-frame capture into the active session
 
     Args:
         server: MCP Server instance to register tools with. Must be
@@ -191,7 +292,8 @@ def register(server: Server) -> None:
 
         Args:
             name: Tool name from TOOLS definitions (list_cameras, get_camera_info,
-                capture_frame, set_camera_control, get_camera_control).
+                capture_frame, set_camera_control, get_camera_control,
+                start_sequence, get_sequence_status, abort_sequence).
             arguments: Dict of arguments matching tool's inputSchema. Keys and
                 types validated by MCP framework before this handler.
 
@@ -232,6 +334,17 @@ def register(server: Server) -> None:
                 arguments["camera_id"],
                 arguments["control"],
             )
+        elif name == "start_sequence":
+            return await _start_sequence(
+                arguments["camera_id"],
+                arguments["steps"],
+                arguments.get("interval_sec", 0.0),
+                arguments.get("label"),
+            )
+        elif name == "get_sequence_status":
+            return await _get_sequence_status(arguments.get("sequence_id"))
+        elif name == "abort_sequence":
+            return await _abort_sequence(arguments.get("sequence_id"))
         else:
             return [
                 TextContent(
@@ -385,7 +498,8 @@ async def _capture_frame(
 
     Takes a single exposure with the specified settings and returns
     the image data encoded for transmission. Auto-connects to the
-    camera if not already connected.
+    camera if not already connected. The exposure runs on the camera's
+    worker thread; cancelling the tool call aborts it.
 
     The image is returned as base64-encoded JPEG suitable for display
     in web interfaces or saving to files. Metadata includes capture
@@ -417,8 +531,9 @@ async def _capture_frame(
         registry = registry or get_registry()
         camera = registry.get(camera_id, auto_connect=True)
 
-        # Capture with specified settings
-        capture_result = camera.capture(
+        # Capture on the camera's worker thread so the event loop stays
+        # responsive (stop_motors, get_position) during long exposures
+        capture_result = await camera.capture_async(
             CaptureOptions(
                 exposure_us=exposure_us,
                 gain=gain,
@@ -491,7 +606,7 @@ async def _set_camera_control(
         control_name = control.replace("ASI_", "")
 
         # Set control via Camera method (raises CameraNotConnectedError)
-        result_dict = camera.set_control_info(control_name, value)
+        result_dict = await camera.set_control_info_async(control_name, value)
         result_dict["camera_id"] = camera_id
 
         return [TextContent(type="text", text=json.dumps(result_dict, indent=2))]
@@ -547,7 +662,7 @@ async def _get_camera_control(
         control_name = control.replace("ASI_", "")
 
         # Get control via Camera method (raises CameraNotConnectedError)
-        result_dict = camera.get_control_info(control_name)
+        result_dict = await camera.get_control_info_async(control_name)
         result_dict["camera_id"] = camera_id
 
         return [TextContent(type="text", text=json.dumps(result_dict, indent=2))]
@@ -559,3 +674,169 @@ async def _get_camera_control(
                 text=json.dumps({"error": "internal", "message": str(e)}),
             )
         ]
+
+
+def _error(error: str, message: str) -> list[TextContent]:
+    """Build a JSON error response."""
+    return [
+        TextContent(
+            type="text",
+            text=json.dumps({"error": error, "message": message}),
+        )
+    ]
+
+
+def _find_sequence(sequence_id: str | None) -> ExposureSequence | None:
+    """Look up a sequence by ID, or the most recently started one."""
+    if sequence_id is None:
+        return next(reversed(_sequences.values()), None)
+    return _sequences.get(sequence_id)
+
+
+def _prune_sequences() -> None:
+    """Forget the oldest finished sequences beyond _MAX_FINISHED_SEQUENCES.
+
+    Running sequences are always kept so they stay abortable.
+    """
+    finished = [seq_id for seq_id, seq in _sequences.items() if not seq.is_running]
+    for seq_id in finished[: max(0, len(finished) - _MAX_FINISHED_SEQUENCES)]:
+        del _sequences[seq_id]
+
+
+async def _start_sequence(
+    camera_id: int,
+    steps: list[dict[str, Any]],
+    interval_sec: float = 0.0,
+    label: str | None = None,
+    *,
+    registry: "CameraRegistry | None" = None,
+    manager: "SessionManager | None" = None,
+) -> list[TextContent]:
+    """Start a background capture sequence on a camera.
+
+    Replaces one capture_frame call per frame: the sequence runs the steps
+    back-to-back with pipelined capture and stores raw frames directly in
+    the active session (light frames as camera frames, others in the
+    matching "<type>_frames" calibration list). Returns immediately.
+
+    Only one sequence may run per camera at a time. The status of the
+    last _MAX_FINISHED_SEQUENCES finished sequences stays queryable.
+
+    Args:
+        camera_id: Zero-based camera index (0=finder, 1=main).
+        steps: List of {"count", "exposure_us", "gain", "frame_type",
+            "image_type"} dicts.
+        interval_sec: Minimum seconds between exposure starts.
+        label: Camera key in the session file (default camera_<id>).
+        registry: Optional CameraRegistry for dependency injection (testing).
+        manager: Optional SessionManager for dependency injection (testing).
+
+    Returns:
+        List with single TextContent containing the initial status JSON
+        (sequence_id, state, frames_total, ...). Returns JSON error
+        "invalid_argument" for bad steps, "busy" if the camera already
+        runs a sequence, or "internal" on other failures.
+
+    Raises:
+        None. Exceptions caught and returned as error text.
+
+    Example:
+        >>> result = await _start_sequence(
+        ...     1, [{"count": 100, "exposure_us": 2_000_000, "gain": 120}]
+        ... )
+        >>> seq_id = json.loads(result[0].text)["sequence_id"]
+    """
+    try:
+        parsed = [SequenceStep.from_dict(step) for step in steps]
+    except (KeyError, TypeError, ValueError) as e:
+        return _error("invalid_argument", f"Invalid sequence step: {e}")
+
+    try:
+        for existing in _sequences.values():
+            if existing.is_running and existing.camera.config.camera_id == camera_id:
+                return _error(
+                    "busy",
+                    f"Camera {camera_id} is running sequence {existing.sequence_id}",
+                )
+
+        registry = registry or get_registry()
+        camera = registry.get(camera_id, auto_connect=True)
+        sequence = ExposureSequence(
+            camera,
+            manager or get_session_manager(),
+            parsed,
+            interval_sec=interval_sec,
+            label=label,
+        )
+        await sequence.start()
+        _sequences[sequence.sequence_id] = sequence
+        _prune_sequences()
+
+        return [TextContent(type="text", text=json.dumps(sequence.status.to_dict()))]
+    except ValueError as e:
+        return _error("invalid_argument", str(e))
+    except Exception as e:
+        logger.exception("Error starting sequence")
+        return _error("internal", str(e))
+
+
+async def _get_sequence_status(sequence_id: str | None = None) -> list[TextContent]:
+    """Report progress of a capture sequence.
+
+    Args:
+        sequence_id: Sequence to query; None selects the most recent.
+
+    Returns:
+        List with single TextContent containing status JSON:
+        {"sequence_id", "state", "frames_total", "frames_done",
+         "step_index", "started_at", "finished_at", "frames_per_second",
+         "error"}. Returns JSON error "not_found" for unknown IDs.
+
+    Raises:
+        None.
+
+    Example:
+        >>> result = await _get_sequence_status("seq_1a2b3c4d")
+        >>> json.loads(result[0].text)["frames_done"]
+        42
+    """
+    sequence = _find_sequence(sequence_id)
+    if sequence is None:
+        return _error("not_found", f"No sequence {sequence_id or '(none started)'}")
+    return [TextContent(type="text", text=json.dumps(sequence.status.to_dict()))]
+
+
+async def _abort_sequence(sequence_id: str | None = None) -> list[TextContent]:
+    """Abort a running capture sequence.
+
+    Stops the exposure in progress and waits briefly for the sequence to
+    wind down. Frames already stored remain in the session.
+
+    Args:
+        sequence_id: Sequence to abort; None selects the most recent.
+
+    Returns:
+        List with single TextContent containing the status JSON after the
+        abort (state "aborted", or the final state if it had already
+        finished). Returns JSON error "not_found" for unknown IDs.
+
+    Raises:
+        None.
+
+    Example:
+        >>> result = await _abort_sequence("seq_1a2b3c4d")
+        >>> json.loads(result[0].text)["state"]
+        'aborted'
+    """
+    sequence = _find_sequence(sequence_id)
+    if sequence is None:
+        return _error("not_found", f"No sequence {sequence_id or '(none started)'}")
+
+    sequence.abort()
+    try:
+        await asyncio.wait_for(sequence.wait(), timeout=_ABORT_WAIT_SEC)
+    except TimeoutError:
+        logger.warning(
+            "Sequence still stopping after abort", sequence_id=sequence.sequence_id
+        )
+    return [TextContent(type="text", text=json.dumps(sequence.status.to_dict()))]
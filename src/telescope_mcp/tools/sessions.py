@@ -4,6 +4,7 @@ Provides tools to start, end, and query telescope sessions.
 Sessions are the core abstraction for telescope data storage.
 """
 
+import asyncio
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -146,6 +147,41 @@ TOOLS = [
             "required": ["path"],
         },
     ),
+    Tool(
+        name="export_sessions",
+        description=(
+            "Export session archives to per-frame FITS or NPY files in "
+            "parallel. Returns frame count and throughput."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "paths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "Archive files or directories to export "
+                        "(default: the data directory)"
+                    ),
+                },
+                "output_dir": {
+                    "type": "string",
+                    "description": "Output directory (default: <data_dir>/export)",
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["fits", "npy"],
+                    "description": "Output format (default: fits)",
+                },
+                "workers": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Worker processes (default: CPU count)",
+                },
+            },
+            "required": [],
+        },
+    ),
 ]
 
 
@@ -163,6 +199,7 @@ def register(server: Server) -> None:
     - session_log: Add log entries to session
     - session_event: Record significant events
     - get_data_dir / set_data_dir: Manage storage location
+    - export_sessions: Bulk export archives to FITS/NPY
 
     Args:
         server: MCP Server instance to register tools with. Must be
@@ -269,6 +306,13 @@ def register(server: Server) -> None:
             return await _get_data_dir()
         elif name == "set_data_dir":
             return await _set_data_dir(arguments["path"])
+        elif name == "export_sessions":
+            return await _export_sessions(
+                arguments.get("paths"),
+                arguments.get("output_dir"),
+                arguments.get("format", "fits"),
+                arguments.get("workers"),
+            )
         else:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
@@ -745,3 +789,78 @@ async def _set_data_dir(path: str) -> list[TextContent]:
                 text=json.dumps({"error": "internal", "message": str(e)}),
             )
         ]
+
+
+async def _export_sessions(
+    paths: list[str] | None,
+    output_dir: str | None,
+    fmt: str = "fits",
+    workers: int | None = None,
+) -> list[TextContent]:
+    """Export session archives to per-frame FITS or NPY files.
+
+    Runs export_archives() in a worker thread so the event loop stays
+    responsive while the process pool converts frames. Defaults export
+    everything under the configured data directory into
+    ``<data_dir>/export``.
+
+    Business context: Stacking and photometry tools consume FITS. Exposing
+    the export to AI agents lets a session end with analysis-ready files
+    without shell access to the rig.
+
+    Args:
+        paths: Archive files/directories, or None for the data directory.
+        output_dir: Destination directory, or None for ``<data_dir>/export``.
+        fmt: "fits" or "npy".
+        workers: Worker processes (None = CPU count).
+
+    Returns:
+        List with TextContent containing JSON:
+        {"status": "exported", "output_dir": str, "archives": int,
+         "frames": int, "bytes_read": int, "elapsed_sec": float,
+         "frames_per_second": float, "megabytes_per_second": float,
+         "errors": list[str]}
+        Returns error JSON on invalid input or exceptions.
+
+    Raises:
+        None. Exceptions caught and returned as error text.
+
+    Example:
+        >>> result = await _export_sessions(None, None, "fits", 4)
+        >>> json.loads(result[0].text)["frames"]
+        120
+    """
+    try:
+        from telescope_mcp.data.export import export_archives
+
+        data_dir = get_factory().config.data_dir
+        sources = [Path(p) for p in paths] if paths else [data_dir]
+        destination = Path(output_dir) if output_dir else data_dir / "export"
+
+        loop = asyncio.get_running_loop()
+        summary = await loop.run_in_executor(
+            None,
+            lambda: export_archives(sources, destination, fmt=fmt, workers=workers),
+        )
+
+        result = {
+            "status": "exported",
+            "output_dir": str(destination),
+            **summary.to_dict(),
+        }
+        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    except (FileNotFoundError, ValueError) as e:
+        return [
+            TextContent(
+                type="text",
+                text=json.dumps({"error": "validation", "message": str(e)}),
+            )
+        ]
+    except Exception as e:
+        logger.exception("Error exporting sessions")
+        return [
+            TextContent(
+                type="text",
+                text=json.dumps({"error": "internal", "message": str(e)}),
+            )
+        ]
@@ -1,8 +1,26 @@
 """Coordinate conversion utilities for astronomical observations.
 
 Provides functions for converting between horizontal (ALT/AZ) and equatorial
-(RA/Dec) coordinate systems using astropy. Requires observer location and
-observation time for accurate transformations.
+(RA/Dec) coordinate systems. Requires observer location and observation time
+for accurate transformations.
+
+Two engines are available through CoordinateTransformer:
+
+- ASTROPY: full astropy transform (precession, nutation, aberration, IERS
+  Earth orientation). Reference accuracy, about a millisecond per call.
+- FAST: analytic local sidereal time plus spherical trigonometry, with
+  precession, nutation and annual aberration applied as a cached rotation.
+  Agrees with astropy to within FAST_MODE_TOLERANCE_ARCSEC and costs tens
+  of microseconds per call, so it is suited to per-frame tagging and UI
+  polling.
+
+Both engines accept arrays of positions and timestamps and transform them
+in one vectorized call.
+
+For rigs without network access, configure_offline_iers() stops astropy
+from downloading Earth orientation tables, and start_transform_warmup()
+loads tables and lazy imports in the background at startup so the first
+real conversion costs the same as later ones.
 
 Business context: Essential for displaying where the telescope is pointing in
 celestial coordinates. When a user moves the telescope (changes ALT/AZ), the
@@ -14,28 +32,78 @@ Example:
     >>> ra, dec = altaz_to_radec(45.0, 180.0, lat=30.27, lon=-97.74)
     >>> print(f"RA: {format_ra_hms(ra)}, Dec: {format_dec_dms(dec)}")
     RA: 12h 34m 56.7s, Dec: +23° 45' 12.3"
+
+    >>> transformer = CoordinateTransformer(30.27, -97.74, mode="fast")
+    >>> ra, dec = transformer.altaz_to_radec_batch(alts, azs, timestamps)
 """
 
 from __future__ import annotations
 
+import math
+import threading
+import time
+from collections.abc import Sequence
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, TypedDict
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import TypedDict
 
+import numpy as np
 from astropy import units as u
 from astropy.coordinates import AltAz, EarthLocation, SkyCoord
 from astropy.time import Time
+from numpy.typing import ArrayLike, NDArray
+
+from telescope_mcp.observability import get_logger
 
-if TYPE_CHECKING:
-    pass
+logger = get_logger(__name__)
 
 __all__ = [
+    "FAST_MODE_TOLERANCE_ARCSEC",
+    "CoordinateTransformer",
     "EquatorialCoords",
+    "TransformMode",
     "altaz_to_radec",
     "radec_to_altaz",
     "format_ra_hms",
     "format_dec_dms",
+    "configure_offline_iers",
+    "warm_up_transforms",
+    "start_transform_warmup",
 ]
 
+#: Maximum separation between FAST and ASTROPY results for altitudes above
+#: 5°. Without refraction the engines agree to better than 10" (UT1 ≈ UTC
+#: and the truncated nutation series); with refraction the empirical
+#: Bennett/Saemundsson formulas differ from ERFA's model by up to ~28" at 5°.
+FAST_MODE_TOLERANCE_ARCSEC: float = 30.0
+
+#: Standard atmosphere used for refraction when none is given.
+DEFAULT_PRESSURE_HPA: float = 1010.0
+DEFAULT_TEMPERATURE_C: float = 10.0
+
+# Precession/nutation/aberration move by well under 0.1" per hour, so the
+# rotation into the equator of date is computed once per hour and reused.
+_FRAME_CACHE_SEC = 3600.0
+_ARCSEC = math.pi / (180.0 * 3600.0)
+_UNIX_EPOCH_JD = 2440587.5
+_J2000_JD = 2451545.0
+_J2000_OBLIQUITY = math.radians(23.4392911)
+_ABERRATION_CONSTANT = 20.49552 * _ARCSEC
+_VISIBLE_WAVELENGTH = 0.55 * u.micron
+
+# Type alias for observation times accepted by the batch methods: one
+# datetime, a sequence of datetimes, or POSIX seconds (scalar or array).
+ObsTimes = datetime | Sequence[datetime] | ArrayLike | None
+
+
+class TransformMode(str, Enum):
+    """Coordinate transform engine."""
+
+    ASTROPY = "astropy"
+    FAST = "fast"
+
 
 class EquatorialCoords(TypedDict):
     """Equatorial coordinates with formatted strings.
@@ -55,6 +123,569 @@ class EquatorialCoords(TypedDict):
     dec_dms: str
 
 
+def _rotation(axis: int, angle: float) -> NDArray[np.float64]:
+    """Return the 3x3 frame rotation by angle (radians) about axis 1, 2 or 3."""
+    c, s = math.cos(angle), math.sin(angle)
+    if axis == 1:
+        return np.array([[1.0, 0.0, 0.0], [0.0, c, s], [0.0, -s, c]])
+    if axis == 2:
+        return np.array([[c, 0.0, -s], [0.0, 1.0, 0.0], [s, 0.0, c]])
+    return np.array([[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]])
+
+
+@lru_cache(maxsize=256)
+def _frame_terms(
+    bucket: int,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], float]:
+    """Return slowly varying frame terms for one _FRAME_CACHE_SEC bucket.
+
+    Args:
+        bucket: floor(unix_seconds / _FRAME_CACHE_SEC).
+
+    Returns:
+        Tuple of (matrix, velocity, equation_of_equinoxes):
+            - matrix: rotation from J2000 (≈ICRS) to true equator of date
+              (IAU 1976 precession, dominant IAU 1980 nutation terms)
+            - velocity: Earth's orbital velocity in J2000 as a fraction of
+              c, for annual aberration
+            - equation_of_equinoxes: GAST - GMST in radians
+    """
+    unix = (bucket + 0.5) * _FRAME_CACHE_SEC
+    t = (unix / 86400.0 + _UNIX_EPOCH_JD - _J2000_JD) / 36525.0
+
+    zeta = (2306.2181 * t + 0.30188 * t**2 + 0.017998 * t**3) * _ARCSEC
+    z = (2306.2181 * t + 1.09468 * t**2 + 0.018203 * t**3) * _ARCSEC
+    theta = (2004.3109 * t - 0.42665 * t**2 - 0.041833 * t**3) * _ARCSEC
+    precession = _rotation(3, -z) @ _rotation(2, theta) @ _rotation(3, -zeta)
+
+    node = math.radians(125.04452 - 1934.136261 * t)
+    sun_lon = math.radians(280.4665 + 36000.7698 * t)
+    moon_lon = math.radians(218.3165 + 481267.8813 * t)
+    dpsi = (
+        -17.20 * math.sin(node)
+        - 1.32 * math.sin(2 * sun_lon)
+        - 0.23 * math.sin(2 * moon_lon)
+        + 0.21 * math.sin(2 * node)
+    ) * _ARCSEC
+    deps = (
+        9.20 * math.cos(node)
+        + 0.57 * math.cos(2 * sun_lon)
+        + 0.10 * math.cos(2 * moon_lon)
+        - 0.09 * math.cos(2 * node)
+    ) * _ARCSEC
+    eps = math.radians(23.439291 - 0.0130042 * t)
+    nutation = _rotation(1, -(eps + deps)) @ _rotation(3, -dpsi) @ _rotation(1, eps)
+
+    # Earth moves toward ecliptic longitude (sun - 90°); includes the
+    # eccentricity term so the residual stays well under an arcsecond
+    anomaly = math.radians(357.52911 + 35999.05029 * t)
+    sun_true = math.radians(
+        280.46646
+        + 36000.76983 * t
+        + 1.914602 * math.sin(anomaly)
+        + 0.019993 * math.sin(2 * anomaly)
+    )
+    perihelion = math.radians(102.93735 + 1.71946 * t)
+    ecc = 0.016708634
+    v_ecliptic = _ABERRATION_CONSTANT * np.array(
+        [
+            math.sin(sun_true) - ecc * math.sin(perihelion),
+            -(math.cos(sun_true) - ecc * math.cos(perihelion)),
+            0.0,
+        ]
+    )
+    velocity = _rotation(1, -_J2000_OBLIQUITY) @ v_ecliptic
+
+    return nutation @ precession, velocity, dpsi * math.cos(eps + deps)
+
+
+def _gmst[S: (float, NDArray[np.float64])](unix: S) -> S:
+    """Greenwich mean sidereal time in radians (Meeus 12.4, UT1 ≈ UTC)."""
+    days = unix / 86400.0 + (_UNIX_EPOCH_JD - _J2000_JD)
+    t = days / 36525.0
+    degrees = (
+        280.46061837 + 360.98564736629 * days + 0.000387933 * t**2 - t**3 / 38710000.0
+    )
+    return (degrees % 360.0) * (math.pi / 180.0)
+
+
+def _refraction_from_apparent(alt: ArrayLike) -> NDArray[np.float64]:
+    """Bennett (1982) refraction in degrees for an apparent altitude.
+
+    Standard conditions (1010 hPa, 10 °C). Clamped below -1° where the
+    formula is undefined.
+    """
+    h = np.maximum(alt, -1.0)
+    arcmin = 1.0 / np.tan(np.radians(h + 7.31 / (h + 4.4)))
+    return np.asarray(arcmin / 60.0, dtype=np.float64)
+
+
+def _refraction_from_true(alt: ArrayLike) -> NDArray[np.float64]:
+    """Saemundsson (1986) refraction in degrees for a true altitude.
+
+    Inverse companion of _refraction_from_apparent(), same conditions.
+    """
+    h = np.maximum(alt, -1.0)
+    arcmin = 1.02 / np.tan(np.radians(h + 10.3 / (h + 5.11)))
+    return np.asarray(arcmin / 60.0, dtype=np.float64)
+
+
+def _to_unix(obstime: ObsTimes) -> NDArray[np.float64]:
+    """Convert datetimes or POSIX seconds to a float64 array of POSIX seconds.
+
+    Naive datetimes are treated as UTC, matching astropy's Time.
+    """
+
+    def stamp(value: datetime) -> float:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return value.timestamp()
+
+    if obstime is None:
+        return np.array(datetime.now(UTC).timestamp())
+    if isinstance(obstime, datetime):
+        return np.array(stamp(obstime))
+    if isinstance(obstime, Sequence) and not isinstance(obstime, str):
+        return np.array(
+            [stamp(t) if isinstance(t, datetime) else float(t) for t in obstime],
+            dtype=np.float64,
+        )
+    return np.asarray(obstime, dtype=np.float64)
+
+
+class CoordinateTransformer:
+    """Reusable ALT/AZ ↔ RA/Dec transform for one observer location.
+
+    Builds the astropy EarthLocation (or the trig constants for FAST mode)
+    once, so repeated conversions only pay for the transform itself. All
+    methods accept numpy arrays; the *_batch methods transform many
+    positions and timestamps in a single vectorized call.
+
+    Business context: Coordinates are computed for every captured frame,
+    every position poll from the dashboard and every saved capture. Reusing
+    one transformer per site (and FAST mode where arcsecond accuracy is
+    enough - far better than the IMU's pointing accuracy) keeps that off
+    the capture path.
+
+    Attributes:
+        lat: Observer latitude in decimal degrees (positive = North).
+        lon: Observer longitude in decimal degrees (positive = East).
+        elevation: Observer elevation in meters.
+        mode: Transform engine in use.
+        refraction: Whether altitudes are apparent (refracted) altitudes.
+
+    Example:
+        >>> transformer = CoordinateTransformer(30.27, -97.74, mode="fast")
+        >>> coords = transformer.altaz_to_radec(45.0, 180.0)
+        >>> alt, az = transformer.radec_to_altaz(coords["ra"], coords["dec"])
+    """
+
+    def __init__(
+        self,
+        lat: float,
+        lon: float,
+        elevation: float = 0.0,
+        *,
+        mode: TransformMode | str = TransformMode.ASTROPY,
+        refraction: bool = False,
+        pressure_hpa: float = DEFAULT_PRESSURE_HPA,
+        temperature_c: float = DEFAULT_TEMPERATURE_C,
+    ) -> None:
+        """Create a transformer for an observer location.
+
+        Args:
+            lat: Observer latitude in decimal degrees [-90, +90].
+            lon: Observer longitude in decimal degrees [-180, +180].
+            elevation: Observer elevation in meters above sea level.
+            mode: TransformMode or its value ("astropy" or "fast").
+            refraction: Treat altitudes as observed through the atmosphere
+                (apparent altitude). Off by default, matching astropy's
+                AltAz frame without pressure.
+            pressure_hpa: Atmospheric pressure for refraction.
+            temperature_c: Air temperature for refraction.
+
+        Raises:
+            ValueError: If mode is not a TransformMode value.
+        """
+        self.lat = lat
+        self.lon = lon
+        self.elevation = elevation
+        self.mode = TransformMode(mode)
+        self.refraction = refraction
+        self._pressure_hpa = pressure_hpa
+        self._temperature_c = temperature_c
+
+        self._sin_lat = math.sin(math.radians(lat))
+        self._cos_lat = math.cos(math.radians(lat))
+        self._lon_rad = math.radians(lon)
+        # Bennett/Saemundsson formulas are for 1010 hPa and 10 °C
+        self._refraction_scale = (pressure_hpa / 1010.0) * (
+            283.0 / (273.0 + temperature_c)
+        )
+        self._location: EarthLocation | None = None
+
+    def __repr__(self) -> str:
+        """Return a concise representation for logs."""
+        return (
+            f"CoordinateTransformer(lat={self.lat}, lon={self.lon}, "
+            f"elevation={self.elevation}, mode={self.mode.value!r})"
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def altaz_to_radec(
+        self,
+        altitude: float,
+        azimuth: float,
+        obstime: datetime | None = None,
+    ) -> EquatorialCoords:
+        """Convert one horizontal position to equatorial coordinates.
+
+        Args:
+            altitude: Altitude in degrees above the horizon.
+            azimuth: Azimuth in degrees clockwise from north.
+            obstime: Observation time (UTC). None uses the current time.
+
+        Returns:
+            EquatorialCoords with RA/Dec in degrees and formatted strings.
+
+        Example:
+            >>> transformer.altaz_to_radec(45.0, 180.0)["ra_hms"]
+            '06h 12m 34.5s'
+        """
+        if self.mode is TransformMode.FAST:
+            ra_deg, dec_deg = self._fast_altaz_to_radec_one(
+                float(altitude), float(azimuth), float(_to_unix(obstime))
+            )
+        else:
+            ra, dec = self.altaz_to_radec_batch(altitude, azimuth, obstime)
+            ra_deg, dec_deg = float(ra), float(dec)
+        return EquatorialCoords(
+            ra=ra_deg,
+            dec=dec_deg,
+            ra_hours=ra_deg / 15.0,  # 360° = 24h, so 15°/h
+            ra_hms=format_ra_hms(ra_deg),
+            dec_dms=format_dec_dms(dec_deg),
+        )
+
+    def radec_to_altaz(
+        self,
+        ra: float,
+        dec: float,
+        obstime: datetime | None = None,
+    ) -> tuple[float, float]:
+        """Convert one equatorial position to horizontal coordinates.
+
+        Args:
+            ra: Right Ascension in degrees (0-360). Unlike the module-level
+                radec_to_altaz(), hours are never inferred.
+            dec: Declination in degrees.
+            obstime: Observation time (UTC). None uses the current time.
+
+        Returns:
+            Tuple of (altitude, azimuth) in degrees.
+
+        Example:
+            >>> alt, az = transformer.radec_to_altaz(83.82, -5.39)
+        """
+        if self.mode is TransformMode.FAST:
+            return self._fast_radec_to_altaz_one(
+                float(ra), float(dec), float(_to_unix(obstime))
+            )
+        alt, az = self.radec_to_altaz_batch(ra, dec, obstime)
+        return float(alt), float(az)
+
+    def altaz_to_radec_batch(
+        self,
+        altitude: ArrayLike,
+        azimuth: ArrayLike,
+        obstime: ObsTimes = None,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Convert many horizontal positions in one vectorized call.
+
+        Inputs broadcast against each other, so one timestamp can be paired
+        with many positions or one position tracked over many timestamps.
+
+        Args:
+            altitude: Altitudes in degrees.
+            azimuth: Azimuths in degrees.
+            obstime: datetime, sequence of datetimes, or POSIX seconds
+                (scalar or array). None uses the current time.
+
+        Returns:
+            Tuple of (ra, dec) arrays in degrees, RA wrapped to [0, 360).
+
+        Example:
+            >>> ra, dec = transformer.altaz_to_radec_batch(
+            ...     [30.0, 45.0, 60.0], 180.0, datetime.now(UTC)
+            ... )
+        """
+        alt, az, unix = np.broadcast_arrays(
+            np.asarray(altitude, dtype=np.float64),
+            np.asarray(azimuth, dtype=np.float64),
+            _to_unix(obstime),
+        )
+        if self.mode is TransformMode.FAST:
+            return self._fast_altaz_to_radec(alt, az, unix)
+
+        frame = self._altaz_frame(unix)
+        icrs = SkyCoord(alt=alt * u.deg, az=az * u.deg, frame=frame).icrs
+        return (
+            np.asarray(icrs.ra.deg, dtype=np.float64),
+            np.asarray(icrs.dec.deg, dtype=np.float64),
+        )
+
+    def radec_to_altaz_batch(
+        self,
+        ra: ArrayLike,
+        dec: ArrayLike,
+        obstime: ObsTimes = None,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Convert many equatorial positions in one vectorized call.
+
+        Args:
+            ra: Right Ascensions in degrees.
+            dec: Declinations in degrees.
+            obstime: datetime, sequence of datetimes, or POSIX seconds
+                (scalar or array). None uses the current time.
+
+        Returns:
+            Tuple of (altitude, azimuth) arrays in degrees, azimuth wrapped
+            to [0, 360).
+
+        Example:
+            >>> alt, az = transformer.radec_to_altaz_batch(83.82, -5.39, stamps)
+        """
+        ra_arr, dec_arr, unix = np.broadcast_arrays(
+            np.asarray(ra, dtype=np.float64),
+            np.asarray(dec, dtype=np.float64),
+            _to_unix(obstime),
+        )
+        if self.mode is TransformMode.FAST:
+            return self._fast_radec_to_altaz(ra_arr, dec_arr, unix)
+
+        sky = SkyCoord(ra=ra_arr * u.deg, dec=dec_arr * u.deg, frame="icrs")
+        altaz = sky.transform_to(self._altaz_frame(unix))
+        return (
+            np.asarray(altaz.alt.deg, dtype=np.float64),
+            np.asarray(altaz.az.deg, dtype=np.float64),
+        )
+
+    # ------------------------------------------------------------------
+    # ASTROPY engine
+    # ------------------------------------------------------------------
+
+    def _altaz_frame(self, unix: NDArray[np.float64]) -> AltAz:
+        """Build an AltAz frame for the cached location at the given times."""
+        if self._location is None:
+            self._location = EarthLocation(
+                lat=self.lat * u.deg,
+                lon=self.lon * u.deg,
+                height=self.elevation * u.m,
+            )
+        obstime = Time(unix, format="unix")
+        if not self.refraction:
+            return AltAz(obstime=obstime, location=self._location)
+        return AltAz(
+            obstime=obstime,
+            location=self._location,
+            pressure=self._pressure_hpa * u.hPa,
+            temperature=self._temperature_c * u.deg_C,
+            obswl=_VISIBLE_WAVELENGTH,
+        )
+
+    # ------------------------------------------------------------------
+    # FAST engine
+    # ------------------------------------------------------------------
+
+    def _frames(
+        self, unix: NDArray[np.float64]
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        """Gather cached frame terms for each timestamp.
+
+        Returns:
+            Tuple of (matrices (..., 3, 3), velocities (..., 3), equation of
+            equinoxes (...)) aligned with unix.
+        """
+        buckets = np.floor(unix / _FRAME_CACHE_SEC).astype(np.int64)
+        if buckets.size and buckets.min() == buckets.max():
+            # Common case (one capture time): let the terms broadcast
+            matrix, velocity, equinox = _frame_terms(int(buckets.flat[0]))
+            return matrix, velocity, np.asarray(equinox)
+        unique, inverse = np.unique(buckets, return_inverse=True)
+        terms = [_frame_terms(int(b)) for b in unique]
+        matrices = np.stack([m for m, _, _ in terms])[inverse]
+        velocities = np.stack([v for _, v, _ in terms])[inverse]
+        equinoxes = np.array([e for _, _, e in terms])[inverse]
+        shape = unix.shape
+        return (
+            matrices.reshape(*shape, 3, 3),
+            velocities.reshape(*shape, 3),
+            equinoxes.reshape(shape),
+        )
+
+    def _local_sidereal_time(
+        self, unix: NDArray[np.float64], equinoxes: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Local apparent sidereal time in radians."""
+        return _gmst(unix) + equinoxes + self._lon_rad
+
+    def _fast_altaz_to_radec(
+        self,
+        alt: NDArray[np.float64],
+        az: NDArray[np.float64],
+        unix: NDArray[np.float64],
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Analytic ALT/AZ → ICRS: trig to apparent RA/Dec, then un-rotate."""
+        if self.refraction:
+            alt = alt - _refraction_from_apparent(alt) * self._refraction_scale
+
+        h = np.radians(alt)
+        a = np.radians(az)
+        sin_h, cos_h = np.sin(h), np.cos(h)
+        sin_a, cos_a = np.sin(a), np.cos(a)
+        dec = np.arcsin(
+            np.clip(self._sin_lat * sin_h + self._cos_lat * cos_h * cos_a, -1, 1)
+        )
+        hour_angle = np.arctan2(
+            -sin_a * cos_h, self._cos_lat * sin_h - self._sin_lat * cos_h * cos_a
+        )
+
+        matrices, velocities, equinoxes = self._frames(unix)
+        ra = self._local_sidereal_time(unix, equinoxes) - hour_angle
+
+        cos_dec = np.cos(dec)
+        apparent = np.stack(
+            [cos_dec * np.cos(ra), cos_dec * np.sin(ra), np.sin(dec)], axis=-1
+        )
+        # True equator of date → J2000, then remove annual aberration
+        mean = np.einsum("...ji,...j->...i", matrices, apparent) - velocities
+        mean /= np.linalg.norm(mean, axis=-1, keepdims=True)
+
+        ra_out = np.degrees(np.arctan2(mean[..., 1], mean[..., 0])) % 360.0
+        dec_out = np.degrees(np.arcsin(np.clip(mean[..., 2], -1, 1)))
+        return ra_out, dec_out
+
+    def _fast_radec_to_altaz(
+        self,
+        ra: NDArray[np.float64],
+        dec: NDArray[np.float64],
+        unix: NDArray[np.float64],
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Analytic ICRS → ALT/AZ: rotate to apparent RA/Dec, then trig."""
+        ra_rad = np.radians(ra)
+        dec_rad = np.radians(dec)
+        cos_dec = np.cos(dec_rad)
+        mean = np.stack(
+            [cos_dec * np.cos(ra_rad), cos_dec * np.sin(ra_rad), np.sin(dec_rad)],
+            axis=-1,
+        )
+
+        matrices, velocities, equinoxes = self._frames(unix)
+        # Add annual aberration, then J2000 → true equator of date
+        shifted = mean + velocities
+        shifted /= np.linalg.norm(shifted, axis=-1, keepdims=True)
+        apparent = np.einsum("...ij,...j->...i", matrices, shifted)
+
+        app_ra = np.arctan2(apparent[..., 1], apparent[..., 0])
+        app_dec = np.arcsin(np.clip(apparent[..., 2], -1, 1))
+        hour_angle = self._local_sidereal_time(unix, equinoxes) - app_ra
+
+        sin_d, cos_d = np.sin(app_dec), np.cos(app_dec)
+        cos_ha = np.cos(hour_angle)
+        alt = np.degrees(
+            np.arcsin(
+                np.clip(self._sin_lat * sin_d + self._cos_lat * cos_d * cos_ha, -1, 1)
+            )
+        )
+        az = np.degrees(
+            np.arctan2(
+                -cos_d * np.sin(hour_angle),
+                self._cos_lat * sin_d - self._sin_lat * cos_d * cos_ha,
+            )
+        )
+
+        if self.refraction:
+            alt = alt + _refraction_from_true(alt) * self._refraction_scale
+        return alt, az % 360.0
+
+    # Scalar versions of the two methods above using math instead of numpy
+    # ufuncs; for one position numpy's per-call overhead dominates.
+
+    def _fast_altaz_to_radec_one(
+        self, alt: float, az: float, unix: float
+    ) -> tuple[float, float]:
+        """Scalar _fast_altaz_to_radec(); returns (ra, dec) in degrees."""
+        if self.refraction:
+            alt -= float(_refraction_from_apparent(alt)) * self._refraction_scale
+
+        h, a = math.radians(alt), math.radians(az)
+        sin_h, cos_h = math.sin(h), math.cos(h)
+        sin_a, cos_a = math.sin(a), math.cos(a)
+        sin_dec = self._sin_lat * sin_h + self._cos_lat * cos_h * cos_a
+        dec = math.asin(max(-1.0, min(1.0, sin_dec)))
+        hour_angle = math.atan2(
+            -sin_a * cos_h, self._cos_lat * sin_h - self._sin_lat * cos_h * cos_a
+        )
+
+        matrix, velocity, equinox = _frame_terms(math.floor(unix / _FRAME_CACHE_SEC))
+        ra = _gmst(unix) + equinox + self._lon_rad - hour_angle
+
+        cos_dec = math.cos(dec)
+        apparent = (cos_dec * math.cos(ra), cos_dec * math.sin(ra), math.sin(dec))
+        x, y, z = (
+            sum(matrix[j][i] * apparent[j] for j in range(3)) - velocity[i]
+            for i in range(3)
+        )
+        norm = math.sqrt(x * x + y * y + z * z)
+        ra_out = math.degrees(math.atan2(y, x)) % 360.0
+        return ra_out, math.degrees(math.asin(max(-1.0, min(1.0, z / norm))))
+
+    def _fast_radec_to_altaz_one(
+        self, ra: float, dec: float, unix: float
+    ) -> tuple[float, float]:
+        """Scalar _fast_radec_to_altaz(); returns (alt, az) in degrees."""
+        ra_rad, dec_rad = math.radians(ra), math.radians(dec)
+        cos_dec = math.cos(dec_rad)
+        matrix, velocity, equinox = _frame_terms(math.floor(unix / _FRAME_CACHE_SEC))
+        shifted = (
+            cos_dec * math.cos(ra_rad) + velocity[0],
+            cos_dec * math.sin(ra_rad) + velocity[1],
+            math.sin(dec_rad) + velocity[2],
+        )
+        norm = math.sqrt(sum(c * c for c in shifted))
+        x, y, z = (
+            sum(matrix[i][j] * shifted[j] for j in range(3)) / norm for i in range(3)
+        )
+
+        app_dec = math.asin(max(-1.0, min(1.0, z)))
+        hour_angle = _gmst(unix) + equinox + self._lon_rad - math.atan2(y, x)
+        sin_d, cos_d = math.sin(app_dec), math.cos(app_dec)
+        cos_ha = math.cos(hour_angle)
+        sin_alt = self._sin_lat * sin_d + self._cos_lat * cos_d * cos_ha
+        alt = math.degrees(math.asin(max(-1.0, min(1.0, sin_alt))))
+        az = math.degrees(
+            math.atan2(
+                -cos_d * math.sin(hour_angle),
+                self._cos_lat * sin_d - self._sin_lat * cos_d * cos_ha,
+            )
+        )
+
+        if self.refraction:
+            alt += float(_refraction_from_true(alt)) * self._refraction_scale
+        return alt, az % 360.0
+
+
+@lru_cache(maxsize=16)
+def _cached_transformer(
+    lat: float, lon: float, elevation: float, mode: TransformMode
+) -> CoordinateTransformer:
+    """Return a shared transformer for the module-level helpers."""
+    return CoordinateTransformer(lat, lon, elevation, mode=mode)
+
+
 def altaz_to_radec(
     altitude: float,
     azimuth: float,
@@ -63,12 +694,15 @@ def altaz_to_radec(
     lon: float,
     elevation: float = 0.0,
     obstime: datetime | None = None,
+    mode: TransformMode | str = TransformMode.ASTROPY,
 ) -> EquatorialCoords:
     """Convert horizontal coordinates to equatorial coordinates.
 
     Transforms altitude/azimuth (local horizontal) to right ascension/declination
-    (equatorial) coordinates for a given observer location and time. Uses astropy
-    for accurate coordinate transformations including precession and nutation.
+    (equatorial) coordinates for a given observer location and time. The
+    default ASTROPY mode includes precession, nutation and Earth orientation;
+    FAST mode is the analytic engine (see CoordinateTransformer). Transformers
+    are cached per location, so repeated calls reuse the EarthLocation.
 
     Business context: When the telescope moves to a new ALT/AZ position, this
     function computes the corresponding RA/Dec to display in the web UI. Enables
@@ -89,6 +723,8 @@ def altaz_to_radec(
             Default 0.0. Used for minor atmospheric refraction correction.
         obstime: Observation time in UTC. If None, uses current UTC time.
             Must be timezone-aware or will be treated as UTC.
+        mode: "astropy" (default, reference accuracy) or "fast" (analytic,
+            within FAST_MODE_TOLERANCE_ARCSEC, microseconds per call).
 
     Returns:
         EquatorialCoords dict containing:
@@ -99,7 +735,8 @@ def altaz_to_radec(
             - dec_dms: Dec formatted string (e.g., "+23° 45' 12.3\"")
 
     Raises:
-        None. Invalid coordinates produce valid but possibly unusual results.
+        ValueError: If mode is not a TransformMode value. Invalid coordinates
+            produce valid but possibly unusual results.
 
     Example:
         >>> coords = altaz_to_radec(45.0, 180.0, lat=30.27, lon=-97.74)
@@ -111,44 +748,8 @@ def altaz_to_radec(
         >>> t = datetime(2025, 6, 21, 22, 0, 0, tzinfo=timezone.utc)
         >>> coords = altaz_to_radec(60.0, 90.0, lat=40.0, lon=-74.0, obstime=t)
     """
-    if obstime is None:
-        obstime = datetime.now(UTC)
-
-    # Create astropy EarthLocation
-    location = EarthLocation(
-        lat=lat * u.deg,
-        lon=lon * u.deg,
-        height=elevation * u.m,
-    )
-
-    # Create astropy Time object
-    obs_time = Time(obstime)
-
-    # Create AltAz frame for this location and time
-    altaz_frame = AltAz(obstime=obs_time, location=location)
-
-    # Create coordinate in AltAz frame
-    altaz_coord = SkyCoord(
-        alt=altitude * u.deg,
-        az=azimuth * u.deg,
-        frame=altaz_frame,
-    )
-
-    # Transform to ICRS (equatorial)
-    icrs_coord = altaz_coord.transform_to("icrs")
-
-    # Extract values
-    ra_deg = float(icrs_coord.ra.deg)
-    dec_deg = float(icrs_coord.dec.deg)
-    ra_hours = ra_deg / 15.0  # 360° = 24h, so 15°/h
-
-    return EquatorialCoords(
-        ra=ra_deg,
-        dec=dec_deg,
-        ra_hours=ra_hours,
-        ra_hms=format_ra_hms(ra_deg),
-        dec_dms=format_dec_dms(dec_deg),
-    )
+    transformer = _cached_transformer(lat, lon, elevation, TransformMode(mode))
+    return transformer.altaz_to_radec(altitude, azimuth, obstime)
 
 
 def radec_to_altaz(
@@ -159,6 +760,7 @@ def radec_to_altaz(
     lon: float,
     elevation: float = 0.0,
     obstime: datetime | None = None,
+    mode: TransformMode | str = TransformMode.ASTROPY,
 ) -> tuple[float, float]:
     """Convert equatorial coordinates to horizontal coordinates.
 
@@ -179,6 +781,7 @@ def radec_to_altaz(
         lon: Observer longitude in decimal degrees [-180, +180].
         elevation: Observer elevation in meters above sea level (default 0.0).
         obstime: Observation time in UTC. If None, uses current UTC time.
+        mode: "astropy" (default) or "fast"; see altaz_to_radec().
 
     Returns:
         Tuple of (altitude, azimuth) in degrees.
@@ -186,7 +789,8 @@ def radec_to_altaz(
             - azimuth: Degrees clockwise from north (0=N, 90=E, 180=S, 270=W)
 
     Raises:
-        None. Invalid coordinates produce valid but possibly unusual results.
+        ValueError: If mode is not a TransformMode value. Invalid coordinates
+            produce valid but possibly unusual results.
 
     Example:
         >>> alt, az = radec_to_altaz(83.82, -5.39, lat=30.27, lon=-97.74)
@@ -196,33 +800,12 @@ def radec_to_altaz(
         >>> # RA in hours (auto-converted)
         >>> alt, az = radec_to_altaz(5.588, -5.39, lat=30.27, lon=-97.74)
     """
-    if obstime is None:
-        obstime = datetime.now(UTC)
-
     # Auto-convert RA from hours to degrees if needed
     if ra < 24:
         ra = ra * 15.0  # hours to degrees
 
-    # Create astropy EarthLocation
-    location = EarthLocation(
-        lat=lat * u.deg,
-        lon=lon * u.deg,
-        height=elevation * u.m,
-    )
-
-    # Create astropy Time object
-    obs_time = Time(obstime)
-
-    # Create AltAz frame for this location and time
-    altaz_frame = AltAz(obstime=obs_time, location=location)
-
-    # Create coordinate in ICRS (equatorial)
-    sky_coord = SkyCoord(ra=ra * u.deg, dec=dec * u.deg, frame="icrs")
-
-    # Transform to AltAz
-    altaz_coord = sky_coord.transform_to(altaz_frame)
-
-    return float(altaz_coord.alt.deg), float(altaz_coord.az.deg)
+    transformer = _cached_transformer(lat, lon, elevation, TransformMode(mode))
+    return transformer.radec_to_altaz(ra, dec, obstime)
 
 
 def format_ra_hms(ra_degrees: float) -> str:
@@ -291,3 +874,152 @@ def format_dec_dms(dec_degrees: float) -> str:
     arcsec = (arcmin_total - arcmin) * 60
 
     return f"{sign}{degrees:02d}° {arcmin:02d}' {arcsec:04.1f}\""
+
+
+def configure_offline_iers(table_path: Path | str | None = None) -> str:
+    """Configure astropy to use local Earth orientation data only.
+
+    By default astropy downloads the IERS-A table (UT1-UTC, polar motion)
+    the first time a transform needs it and again whenever its copy is
+    older than 30 days. Without network access that means a timeout on the
+    first conversion and warnings afterwards. This disables downloads and
+    the staleness check, then selects the best local table: table_path if
+    given, else a previously downloaded copy in the astropy cache, else the
+    table bundled with astropy.
+
+    Stale predictions only affect UT1 at the sub-second level (arcseconds
+    on the sky), far below the pointing sensor's accuracy.
+
+    Args:
+        table_path: IERS-A (finals2000A) or IERS-B file to load.
+
+    Returns:
+        Description of the table in use: the file path, "cache" or
+        "bundled".
+
+    Raises:
+        OSError: If table_path cannot be read.
+        ValueError: If table_path is not an IERS-A or IERS-B table.
+
+    Example:
+        >>> configure_offline_iers()
+        'bundled'
+        >>> configure_offline_iers("/opt/telescope/finals2000A.all")
+        '/opt/telescope/finals2000A.all'
+    """
+    from astropy.utils import iers
+    from astropy.utils.data import download_file, is_url_in_cache
+
+    iers.conf.auto_download = False
+    iers.conf.auto_max_age = None  # never refuse to extrapolate old tables
+    iers.conf.iers_degraded_accuracy = "warn"
+
+    if table_path is not None:
+        path = str(table_path)
+        table: iers.IERS
+        try:
+            table = iers.IERS_A.open(path)
+        except ValueError:
+            table = iers.IERS_B.open(path)
+        if len(table) == 0:
+            raise ValueError(f"{path} is not an IERS-A or IERS-B table")
+        iers.earth_orientation_table.set(table)
+        source = path
+    elif is_url_in_cache(iers.conf.iers_auto_url, on_missing="ignore"):
+        cached = download_file(iers.conf.iers_auto_url, cache=True)
+        iers.earth_orientation_table.set(iers.IERS_A.open(cached))
+        source = "cache"
+    else:
+        source = "bundled"
+
+    logger.info("Astropy IERS configured for offline use", source=source)
+    return source
+
+
+def warm_up_transforms(lat: float, lon: float, elevation: float = 0.0) -> float:
+    """Run one conversion per engine and direction to load lazy state.
+
+    The first astropy transform imports the frame graph, reads the leap
+    second and IERS tables and builds ERFA caches; the first FAST call
+    fills the hourly frame-term cache. Running both here, for the same
+    location the application uses, leaves later calls at steady-state cost.
+
+    Args:
+        lat: Observer latitude in decimal degrees.
+        lon: Observer longitude in decimal degrees.
+        elevation: Observer elevation in meters.
+
+    Returns:
+        Seconds spent warming up.
+
+    Example:
+        >>> warm_up_transforms(30.27, -97.74, 150.0)
+        0.84
+    """
+    started = time.perf_counter()
+    obstime = datetime.now(UTC)
+    for mode in TransformMode:
+        coords = altaz_to_radec(
+            45.0,
+            180.0,
+            lat=lat,
+            lon=lon,
+            elevation=elevation,
+            obstime=obstime,
+            mode=mode,
+        )
+        radec_to_altaz(
+            coords["ra"],
+            coords["dec"],
+            lat=lat,
+            lon=lon,
+            elevation=elevation,
+            obstime=obstime,
+            mode=mode,
+        )
+    return time.perf_counter() - started
+
+
+def start_transform_warmup(
+    lat: float,
+    lon: float,
+    elevation: float = 0.0,
+    *,
+    offline: bool = True,
+    table_path: Path | str | None = None,
+) -> threading.Thread:
+    """Configure IERS and warm up transforms on a background thread.
+
+    Intended for application startup: returns immediately so device
+    initialization is not delayed, and never raises into the caller;
+    failures are logged and the first conversion simply pays the cost.
+
+    Args:
+        lat: Observer latitude in decimal degrees.
+        lon: Observer longitude in decimal degrees.
+        elevation: Observer elevation in meters.
+        offline: Call configure_offline_iers() before warming up.
+        table_path: IERS table passed to configure_offline_iers().
+
+    Returns:
+        The started daemon thread (join() to wait for completion).
+
+    Example:
+        >>> thread = start_transform_warmup(30.27, -97.74)
+        >>> thread.join(timeout=10)
+    """
+
+    def run() -> None:
+        try:
+            if offline:
+                configure_offline_iers(table_path)
+            elapsed = warm_up_transforms(lat, lon, elevation)
+            logger.info(
+                "Coordinate transforms warmed up", elapsed_ms=round(elapsed * 1000, 1)
+            )
+        except Exception as e:
+            logger.warning("Coordinate transform warm-up failed", error=str(e))
+
+    thread = threading.Thread(target=run, name="transform-warmup", daemon=True)
+    thread.start()
+    return thread
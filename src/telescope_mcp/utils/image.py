@@ -31,7 +31,16 @@ from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
-__all__ = ["ImageEncoder", "CV2ImageEncoder"]
+__all__ = [
+    "ImageEncoder",
+    "CV2ImageEncoder",
+    "IMAGE_FORMATS",
+    "encode_image",
+    "to_uint8",
+]
+
+# Formats accepted by encode_image(); "raw" is the array's own bytes
+IMAGE_FORMATS: tuple[str, ...] = ("jpeg", "png", "raw")
 
 
 @runtime_checkable
@@ -257,3 +266,79 @@ class CV2ImageEncoder(ImageEncoder):
             color,
             thickness,
         )
+
+
+def to_uint8(img: NDArray[Any], out: NDArray[Any] | None = None) -> NDArray[Any]:
+    """Scale a sensor frame to 8 bits per channel for display encoding.
+
+    RAW16 frames keep the most significant byte (>> 8), matching the
+    ASI driver's historical JPEG path, computed in one pass. uint8 frames
+    are returned as-is without copying.
+
+    Args:
+        img: Mono (H, W) or BGR (H, W, 3) array of dtype uint8 or uint16.
+        out: Optional preallocated uint8 array of img's shape to write
+            scaled RAW16 pixels into (avoids a per-frame allocation).
+
+    Returns:
+        uint8 array with the same shape.
+
+    Raises:
+        ValueError: If dtype is neither uint8 nor uint16.
+
+    Example:
+        >>> to_uint8(np.full((2, 2), 0xABCD, dtype=np.uint16))[0, 0]
+        171
+    """
+    import numpy as np
+
+    if img.dtype == np.uint8:
+        return img
+    if img.dtype == np.uint16:
+        if out is None:
+            out = np.empty(img.shape, dtype=np.uint8)
+        # Shift in uint16, cast into the uint8 output in the same pass
+        return np.right_shift(img, 8, out=out, casting="unsafe")
+    raise ValueError(f"Unsupported image dtype for encoding: {img.dtype}")
+
+
+def encode_image(img: NDArray[Any], fmt: str = "jpeg", quality: int = 90) -> bytes:
+    """Encode a raw sensor frame in the requested container format.
+
+    Lets the consumer of a capture choose the encoding instead of the
+    driver: previews want JPEG, lossless exports want 16-bit PNG, and
+    pipelines that already hold the shape/dtype want the raw bytes.
+
+    Args:
+        img: Mono (H, W) or BGR (H, W, 3) array, uint8 or uint16.
+        fmt: One of IMAGE_FORMATS. "jpeg" scales uint16 to 8 bits;
+            "png" preserves 16-bit depth; "raw" returns img.tobytes().
+        quality: JPEG quality 1-100 (ignored for other formats).
+
+    Returns:
+        Encoded bytes.
+
+    Raises:
+        ValueError: If fmt is unknown, quality is out of range, or
+            OpenCV fails to encode the array.
+
+    Example:
+        >>> frame = np.zeros((480, 640), dtype=np.uint16)
+        >>> encode_image(frame, "png")[:4]
+        b'\\x89PNG'
+    """
+    if fmt == "raw":
+        return img.tobytes()
+    if fmt not in IMAGE_FORMATS:
+        raise ValueError(f"fmt must be one of {IMAGE_FORMATS}, got {fmt!r}")
+    if fmt == "png":
+        # Lazy import cv2 to avoid Python 3.13 cv2.typing bug at module load
+        import cv2 as _cv2
+
+        success, data = _cv2.imencode(".png", img)
+        if not success:
+            raise ValueError(
+                f"PNG encoding failed for image shape={img.shape}, dtype={img.dtype}"
+            )
+        return bytes(data.tobytes())
+    return CV2ImageEncoder().encode_jpeg(to_uint8(img), quality=quality)
@@ -2,25 +2,46 @@
 
 import asyncio
 import datetime
-from collections import deque
-from collections.abc import AsyncGenerator
+import os
+import re
+import time
+from collections.abc import AsyncGenerator, Callable, Iterator
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import BinaryIO
 
 import numpy as np
 import uvicorn
 import zwoasi as asi
 from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+from telescope_mcp.data.compaction import ArchiveCompactor, archive_lock
+from telescope_mcp.data.events import EventBus, EventPublisher
+from telescope_mcp.data.export import FrameRef, resolve_frame
+from telescope_mcp.data.telemetry import TelemetryRecorder
 from telescope_mcp.devices.motor import Motor
 from telescope_mcp.devices.sensor import Sensor
 from telescope_mcp.drivers.asi_sdk import get_sdk_library_path
-from telescope_mcp.drivers.config import get_factory
+from telescope_mcp.drivers.cameras.asi import FrameBufferPool
+from telescope_mcp.drivers.config import (
+    DEFAULT_LOCATION,
+    get_factory,
+    get_session_manager,
+)
 from telescope_mcp.observability import get_logger
-from telescope_mcp.utils.coordinates import altaz_to_radec
+from telescope_mcp.utils.coordinates import (
+    TransformMode,
+    altaz_to_radec,
+    start_transform_warmup,
+)
 from telescope_mcp.utils.image import CV2ImageEncoder, ImageEncoder
 
 logger = get_logger(__name__)
@@ -30,6 +51,22 @@ WEB_DIR = Path(__file__).parent
 TEMPLATES_DIR = WEB_DIR / "templates"
 STATIC_DIR = WEB_DIR / "static"
 
+# Daily capture archives written by the capture endpoint (relative to cwd)
+_CAPTURE_DIR = Path("data/captures")
+
+# Archive downloads: disk read size per streamed chunk, and allowed ids
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+_SESSION_ID_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+# /api/events: comment line sent after this much silence so proxies and
+# browsers keep the connection open; browsers reconnect after retry ms
+_EVENT_KEEPALIVE_SEC = 15.0
+_EVENT_RETRY_MS = 3000
+
+# /api/cameras serves SDK enumeration from memory for this long; each
+# enumeration is a USB round-trip that can collide with active exposures
+_CAMERA_LIST_TTL_SEC = 5.0
+
 # Camera state management
 _sdk_initialized = False
 _cameras: dict[int, asi.Camera] = {}  # Open camera instances
@@ -83,16 +120,24 @@ _motor_tasks: dict[str, asyncio.Task[None]] = {}
 # IMU sensor for position feedback
 _sensor: Sensor | None = None
 
-# Rolling average buffer for position smoothing (issue #11)
-# Stores last 5 sensor readings to smooth IMU noise (±0.5° jitter → ~0.1° stable).
-# With 5-second read intervals this is a 25-second rolling window.
-# On startup, averages whatever readings are available until buffer fills.
-_POSITION_BUFFER_SIZE = 5
-_position_buffer: deque[tuple[float, float]] = deque(maxlen=_POSITION_BUFFER_SIZE)
-
 # Motor device for telescope mount control
 _motor: Motor | None = None
 
+# Periodic sensor/motor telemetry into the active session
+_telemetry_recorder: TelemetryRecorder | None = None
+
+# Live telemetry fan-out to /api/events (position/motor polled only while
+# subscribed; camera streams publish per frame)
+_event_bus = EventBus()
+_event_publisher: EventPublisher | None = None
+
+# Low-priority background rewrite of finished capture/session archives
+_compactor: ArchiveCompactor | None = None
+
+# RAW16 stream buffers reused across stream restarts (page reloads, setting
+# changes) instead of allocating a full-frame bytearray per stream
+_stream_buffers = FrameBufferPool(max_free=1)
+
 # Image encoder (injectable for testing)
 _encoder: ImageEncoder | None = None
 
@@ -490,6 +535,369 @@ async def _cleanup_motor() -> None:
         _motor = None
 
 
+async def _init_telemetry() -> None:
+    """Start periodic sensor/motor telemetry recording.
+
+    Creates a TelemetryRecorder that samples the initialized sensor and
+    motor at the configured telemetry_rate_hz and writes into the global
+    SessionManager, so every session (including idle) carries columnar
+    mount position and environment history.
+
+    Business context: Correlating image quality with pointing and
+    temperature requires continuous history, not just values captured
+    alongside frames. Columnar storage keeps a full night at 10 Hz small.
+
+    Args:
+        None. Uses global factory configuration, _sensor and _motor.
+
+    Returns:
+        None. Sets global _telemetry_recorder when enabled.
+
+    Raises:
+        None. Failures are logged but don't prevent startup.
+
+    Example:
+        >>> await _init_telemetry()
+    """
+    global _telemetry_recorder
+    rate_hz = get_factory().config.telemetry_rate_hz
+    if rate_hz <= 0 or (_sensor is None and _motor is None):
+        return
+    try:
+        _telemetry_recorder = TelemetryRecorder(
+            get_session_manager(), sensor=_sensor, motor=_motor, rate_hz=rate_hz
+        )
+        await _telemetry_recorder.start()
+    except Exception as e:
+        logger.warning("Failed to start telemetry recorder", error=str(e))
+        _telemetry_recorder = None
+
+
+async def _cleanup_telemetry() -> None:
+    """Stop the telemetry recorder if running.
+
+    Args:
+        None. Uses global _telemetry_recorder.
+
+    Returns:
+        None. Clears global _telemetry_recorder.
+
+    Raises:
+        None. Errors are logged but don't prevent shutdown.
+
+    Example:
+        >>> await _cleanup_telemetry()
+    """
+    global _telemetry_recorder
+    if _telemetry_recorder is not None:
+        try:
+            await _telemetry_recorder.stop()
+        except Exception as e:
+            logger.error("Error stopping telemetry recorder", error=str(e))
+        _telemetry_recorder = None
+
+
+def _init_compaction() -> None:
+    """Start the background archive compactor if enabled.
+
+    Compacts finished archives in the dashboard capture directory and the
+    configured session data directory on a low-priority thread, using the
+    compaction_* settings from the factory configuration.
+
+    Business context: Daily capture archives grow by repeated in-place
+    appends and are stored uncompressed; on an SD-card-backed rig the
+    reclaimed space and sequential layout matter, and nobody should have
+    to remember to run a maintenance command.
+
+    Args:
+        None. Uses global factory configuration.
+
+    Returns:
+        None. Sets global _compactor when enabled.
+
+    Raises:
+        None. Failures are logged but don't prevent startup.
+
+    Example:
+        >>> _init_compaction()
+    """
+    global _compactor
+    config = get_factory().config
+    if config.compaction_interval_sec <= 0:
+        return
+    try:
+        _compactor = ArchiveCompactor(
+            [_CAPTURE_DIR, config.data_dir],
+            compression=config.compaction_compression,
+            max_bytes_per_sec=config.compaction_max_bytes_per_sec,
+            interval_sec=config.compaction_interval_sec,
+        )
+        _compactor.start()
+    except Exception as e:
+        logger.warning("Failed to start archive compactor", error=str(e))
+        _compactor = None
+
+
+def _init_transforms() -> None:
+    """Prepare astropy coordinate transforms on a background thread.
+
+    Configures offline IERS handling (per iers_offline/iers_table_path in
+    the factory configuration) and runs one conversion for the configured
+    observer location, so the first /api/position poll or tagged capture
+    costs the same as later ones. Returns immediately.
+
+    Business context: The rig usually has no network; left alone, astropy
+    tries to download Earth orientation tables on the first conversion and
+    the first position update stalls until the download times out.
+
+    Args:
+        None. Uses global factory configuration.
+
+    Returns:
+        None. Warm-up runs on a daemon thread.
+
+    Raises:
+        None. Failures are logged by the warm-up thread.
+
+    Example:
+        >>> _init_transforms()
+    """
+    config = get_factory().config
+    location = {**DEFAULT_LOCATION, **config.location}
+    start_transform_warmup(
+        location["lat"],
+        location["lon"],
+        location["alt"],
+        offline=config.iers_offline,
+        table_path=config.iers_table_path,
+    )
+
+
+def _cleanup_compaction() -> None:
+    """Stop the archive compactor, abandoning any in-progress rewrite.
+
+    Args:
+        None. Uses global _compactor.
+
+    Returns:
+        None. Clears global _compactor.
+
+    Raises:
+        None. Errors are logged but don't prevent shutdown.
+
+    Example:
+        >>> _cleanup_compaction()
+    """
+    global _compactor
+    if _compactor is not None:
+        try:
+            _compactor.stop()
+        except Exception as e:
+            logger.error("Error stopping archive compactor", error=str(e))
+        _compactor = None
+
+
+async def _read_position() -> dict[str, object]:
+    """Read fused ALT/AZ from the sensor and convert it to RA/Dec.
+
+    Shared by GET /api/position and the "position" event source, so
+    polling clients and /api/events subscribers see identical payloads.
+
+    Args:
+        None. Uses global _sensor and factory location.
+
+    Returns:
+        Dict with altitude, azimuth, ra, dec, ra_hours, ra_hms, dec_dms,
+        location, sensor_status ("ok", "error", "no_sensor"), and status.
+
+    Raises:
+        None. Sensor failures are reported via sensor_status.
+
+    Example:
+        >>> position = await _read_position()
+        >>> position["ra_hms"]
+        '12h 34m 56.7s'
+    """
+    # Read position from IMU sensor if available
+    altitude = 0.0
+    azimuth = 0.0
+    sensor_status = "no_sensor"
+
+    if _sensor is not None:
+        try:
+            # Streaming drivers smooth per sample (issue #11), no lag here
+            reading = await _sensor.read()
+            altitude = reading.altitude
+            azimuth = reading.azimuth
+            sensor_status = "ok"
+        except Exception as e:
+            logger.warning("Sensor read failed", error=str(e))
+            sensor_status = "error"
+
+    # Get observer location from config for coordinate conversion
+    config = get_factory().config
+    location = config.location
+
+    # Default location if not configured (Austin, TX)
+    lat = location.get("lat", DEFAULT_LOCATION["lat"])
+    lon = location.get("lon", DEFAULT_LOCATION["lon"])
+    elevation = location.get("alt", DEFAULT_LOCATION["alt"])
+
+    # Convert ALT/AZ to RA/Dec for display
+    equatorial = altaz_to_radec(
+        altitude=altitude,
+        azimuth=azimuth,
+        lat=lat,
+        lon=lon,
+        elevation=elevation,
+        mode=TransformMode.FAST,  # per poll/event; IMU-limited anyway
+    )
+
+    return {
+        "altitude": altitude,
+        "azimuth": azimuth,
+        "ra": equatorial["ra"],
+        "dec": equatorial["dec"],
+        "ra_hours": equatorial["ra_hours"],
+        "ra_hms": equatorial["ra_hms"],
+        "dec_dms": equatorial["dec_dms"],
+        "location": {"lat": lat, "lon": lon, "elevation": elevation},
+        "sensor_status": sensor_status,
+        "status": "ok",
+    }
+
+
+async def _read_motor_status() -> dict[str, object]:
+    """Snapshot both motor axes for the "motor" event source.
+
+    Args:
+        None. Uses global _motor.
+
+    Returns:
+        Dict keyed by axis ("altitude", "azimuth"), each with
+        position_steps, is_moving, speed, stalled, at_limit, and error.
+
+    Raises:
+        RuntimeError: If no motor is connected (counted by the publisher).
+
+    Example:
+        >>> status = await _read_motor_status()
+        >>> status["altitude"]["position_steps"]
+        1200
+    """
+    from telescope_mcp.drivers.motors.types import MotorType
+
+    if _motor is None or not _motor.connected:
+        raise RuntimeError("Motor not connected")
+    payload: dict[str, object] = {}
+    for axis in (MotorType.ALTITUDE, MotorType.AZIMUTH):
+        status = _motor.get_status(axis)
+        payload[axis.value] = {
+            "position_steps": status.position_steps,
+            "is_moving": status.is_moving,
+            "speed": status.speed,
+            "stalled": status.stalled,
+            "at_limit": status.at_limit,
+            "error": status.error,
+        }
+    return payload
+
+
+async def _init_events() -> None:
+    """Start publishing position and motor status to /api/events.
+
+    Registers the sensor position (with RA/Dec) and motor status as
+    polled sources at the configured event_rate_hz. Sources run only
+    while at least one client is subscribed, and once per period no
+    matter how many are.
+
+    Business context: Every open dashboard used to poll its own sensor
+    read and coordinate transform; with the bus, N dashboards share one
+    read stream.
+
+    Args:
+        None. Uses global factory configuration, _sensor and _motor.
+
+    Returns:
+        None. Sets global _event_publisher when enabled.
+
+    Raises:
+        None. Failures are logged but don't prevent startup.
+
+    Example:
+        >>> await _init_events()
+    """
+    global _event_publisher
+    rate_hz = get_factory().config.event_rate_hz
+    if rate_hz <= 0:
+        return
+    try:
+        _event_publisher = EventPublisher(_event_bus)
+        _event_publisher.add_source("position", _read_position, rate_hz)
+        if _motor is not None:
+            _event_publisher.add_source("motor", _read_motor_status, rate_hz)
+        await _event_publisher.start()
+    except Exception as e:
+        logger.warning("Failed to start event publisher", error=str(e))
+        _event_publisher = None
+
+
+async def _cleanup_events() -> None:
+    """Stop the event publisher if running.
+
+    Args:
+        None. Uses global _event_publisher.
+
+    Returns:
+        None. Clears global _event_publisher.
+
+    Raises:
+        None. Errors are logged but don't prevent shutdown.
+
+    Example:
+        >>> await _cleanup_events()
+    """
+    global _event_publisher
+    if _event_publisher is not None:
+        try:
+            await _event_publisher.stop()
+        except Exception as e:
+            logger.error("Error stopping event publisher", error=str(e))
+        _event_publisher = None
+
+
+async def _event_stream(topics: list[str] | None) -> AsyncGenerator[bytes, None]:
+    """Yield Server-Sent Events for bus topics until the client leaves.
+
+    Starts with a retry hint and the latest value of every selected topic,
+    then one message per event. After _EVENT_KEEPALIVE_SEC of silence a
+    comment line keeps intermediaries from closing the connection. The
+    subscription closes when the response is cancelled.
+
+    Args:
+        topics: Topic names or prefixes ("camera" for all cameras), or
+            None for everything.
+
+    Yields:
+        Encoded SSE messages.
+
+    Example:
+        >>> async for message in _event_stream(["position"]):
+        ...     print(message.decode())
+    """
+    with _event_bus.subscribe(topics) as subscription:
+        yield f"retry: {_EVENT_RETRY_MS}\n\n".encode()
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(), timeout=_EVENT_KEEPALIVE_SEC
+                )
+            except TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            yield event.to_sse()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Manage application lifecycle for startup and shutdown.
@@ -500,9 +908,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Startup actions:
     - Initialize ASI SDK for camera access
+    - Configure offline IERS data and warm up coordinate transforms
+      (background thread)
+    - Connect sensor and motor, start periodic telemetry recording
+    - Start live event publishing for /api/events
+    - Start low-priority background archive compaction
     - Log service startup
 
     Shutdown actions:
+    - Stop live event publishing
+    - Stop archive compaction
+    - Stop telemetry recording, disconnect motor and sensor
     - Close all open camera connections
     - Stop any active video streams
     - Log service shutdown
@@ -522,11 +938,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup: Initialize cameras, motors, sensors
     logger.info("Starting telescope control services...")
     _init_sdk()
+    _init_transforms()
     await _init_sensor()
     await _init_motor()
+    await _init_telemetry()
+    await _init_events()
+    _init_compaction()
     yield
     # Shutdown: Clean up
     logger.info("Shutting down telescope control services...")
+    await _cleanup_events()
+    _cleanup_compaction()
+    await _cleanup_telemetry()
     await _cleanup_motor()
     await _cleanup_sensor()
     _close_all_cameras()
@@ -543,6 +966,7 @@ def create_app(encoder: ImageEncoder | None = None) -> FastAPI:
     - Dashboard UI at / for browser-based telescope control
     - MJPEG camera streams at /stream/{camera_id}
     - REST API for camera and motor control at /api/*
+    - Resumable session archive downloads at /api/sessions/{id}/download
 
     This factory pattern allows testing with fresh app instances and
     supports different configurations per environment. The encoder
@@ -584,6 +1008,10 @@ def create_app(encoder: ImageEncoder | None = None) -> FastAPI:
     # Templates
     templates = Jinja2Templates(directory=TEMPLATES_DIR)
 
+    # Cached /api/cameras payload and when it was enumerated (monotonic)
+    camera_list: dict[str, object] | None = None
+    camera_list_at = 0.0
+
     # Routes
     @app.get("/", response_class=HTMLResponse)
     async def dashboard(request: Request) -> HTMLResponse:
@@ -818,7 +1246,7 @@ def create_app(encoder: ImageEncoder | None = None) -> FastAPI:
         )
 
     @app.get("/api/cameras")
-    async def api_list_cameras() -> JSONResponse:
+    async def api_list_cameras(refresh: bool = False) -> JSONResponse:
         """List all connected ASI cameras with basic info (discovery endpoint).
 
         Returns camera count and names for all detected ZWO ASI cameras via SDK
@@ -842,11 +1270,13 @@ def create_app(encoder: ImageEncoder | None = None) -> FastAPI:
         of {id, name} objects. IDs are 0-based sequential matching SDK
         enumeration order (typically USB port order). Empty array if no cameras
         (not an error). SDK errors (library load failure, USB access denied)
-        return {"error": str} with 500 status. No caching - always queries
-        hardware (enables hot-plug detection but adds 50-200 ms latency).
+        return {"error": str} with 500 status. Results are cached for
+        _CAMERA_LIST_TTL_SEC so dashboard polling is a memory lookup rather
+        than a USB round-trip (50-200 ms) per request; hot-plugged cameras
+        appear once the cache expires or on ?refresh=true.
 
         Args:
-            None. Query parameters not needed for simple enumeration.
+            refresh: Bypass the cache and re-enumerate immediately.
 
         Returns:
             JSONResponse with camera list:
@@ -872,21 +1302,29 @@ def create_app(encoder: ImageEncoder | None = None) -> FastAPI:
             ...     });
             >>> # Response: {"count": 2, "cameras": [{"id": 0, ...}, ...]}
         """
+        nonlocal camera_list, camera_list_at
+        now = time.monotonic()
+        if (
+            camera_list is not None
+            and not refresh
+            and now - camera_list_at < _CAMERA_LIST_TTL_SEC
+        ):
+            return JSONResponse(camera_list)
+
         _init_sdk()
         try:
             num_cameras = asi.get_num_cameras()
-            if num_cameras == 0:
-                return JSONResponse({"count": 0, "cameras": []})
-            names = asi.list_cameras()
-            return JSONResponse(
-                {
-                    "count": num_cameras,
-                    "cameras": [{"id": i, "name": n} for i, n in enumerate(names)],
-                }
-            )
+            names = asi.list_cameras() if num_cameras else []
         except Exception as e:
             return JSONResponse({"error": str(e)}, status_code=500)
 
+        camera_list = {
+            "count": num_cameras,
+            "cameras": [{"id": i, "name": n} for i, n in enumerate(names)],
+        }
+        camera_list_at = now
+        return JSONResponse(camera_list)
+
     # API routes for dashboard JavaScript
     @app.post("/api/motor/altitude")
     async def api_move_altitude(steps: int, speed: int = 100) -> dict[str, object]:
@@ -1549,55 +1987,156 @@ def create_app(encoder: ImageEncoder | None = None) -> FastAPI:
             ...         `Az: ${pos.azimuth.toFixed(2)} deg`;
             ... }, 1000);  // Update every second
         """
-        # Read position from IMU sensor if available
-        altitude = 0.0
-        azimuth = 0.0
-        sensor_status = "no_sensor"
+        return await _read_position()
+
+    @app.get("/api/events")
+    async def api_events(
+        topics: str | None = Query(
+            default=None,
+            description=(
+                "Comma-separated topics or prefixes (position, motor, camera); "
+                "all topics if omitted"
+            ),
+        ),
+    ) -> Response:
+        """Stream live telemetry as Server-Sent Events.
 
-        if _sensor is not None:
-            try:
-                reading = await _sensor.read()
-                # Add raw reading to rolling average buffer (issue #11)
-                _position_buffer.append((reading.altitude, reading.azimuth))
-                # Average all readings in buffer for smooth display
-                buf = _position_buffer
-                altitude = sum(r[0] for r in buf) / len(buf)
-                azimuth = sum(r[1] for r in buf) / len(buf)
-                sensor_status = "ok"
-            except Exception as e:
-                logger.warning("Sensor read failed", error=str(e))
-                sensor_status = "error"
-
-        # Get observer location from config for coordinate conversion
-        config = get_factory().config
-        location = config.location
-
-        # Default location if not configured (Austin, TX)
-        lat = location.get("lat", 30.2672)
-        lon = location.get("lon", -97.7431)
-        elevation = location.get("alt", 0.0)
-
-        # Convert ALT/AZ to RA/Dec for display
-        equatorial = altaz_to_radec(
-            altitude=altitude,
-            azimuth=azimuth,
-            lat=lat,
-            lon=lon,
-            elevation=elevation,
+        Multiplexes the in-process event bus to the browser: "position"
+        (the /api/position payload), "motor" (both axes), and "camera/<id>"
+        (per-frame stream statistics). Each SSE message carries the bus
+        sequence as id, the topic as event name, and JSON data. Slow
+        clients receive the newest value per topic rather than a backlog.
+
+        Business context: Dashboards poll on timers, so every tab costs its
+        own sensor read and coordinate transform. Over SSE, one producer
+        per device serves all tabs, and values arrive as they change.
+
+        Args:
+            topics: Comma-separated topic filter, e.g. "position,motor".
+
+        Returns:
+            StreamingResponse (text/event-stream) that runs until the client
+            disconnects, or JSONResponse 503 when event publishing is
+            disabled (event_rate_hz = 0) so clients fall back to polling.
+
+        Raises:
+            None.
+
+        Example:
+            >>> // Browser
+            >>> const events = new EventSource('/api/events?topics=position');
+            >>> events.addEventListener('position', (e) => {
+            ...     const pos = JSON.parse(e.data);
+            ...     console.log(pos.altitude, pos.azimuth, pos.ra_hms);
+            ... });
+        """
+        if _event_publisher is None:
+            return JSONResponse(
+                {"status": "error", "error": "Live events disabled"},
+                status_code=503,
+            )
+        selected = [t.strip() for t in (topics or "").split(",") if t.strip()]
+        return StreamingResponse(  # pragma: no cover - infinite stream
+            _event_stream(selected or None),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
 
-        return {
-            "altitude": altitude,
-            "azimuth": azimuth,
-            "ra": equatorial["ra"],
-            "dec": equatorial["dec"],
-            "ra_hours": equatorial["ra_hours"],
-            "ra_hms": equatorial["ra_hms"],
-            "dec_dms": equatorial["dec_dms"],
-            "location": {"lat": lat, "lon": lon, "elevation": elevation},
-            "sensor_status": sensor_status,
-            "status": "ok",
-        }
+    @app.api_route("/api/sessions/{session_id}/download", methods=["GET", "HEAD"])
+    async def api_download_session(
+        request: Request,
+        session_id: str,
+        camera: str | None = Query(
+            default=None, description="Camera key to download a single frame block"
+        ),
+        group: str = Query(
+            default="light",
+            description="Frame group: frames (session files) or light/dark/flat/bias",
+        ),
+        index: int = Query(default=0, ge=0, description="Frame index within group"),
+    ) -> Response:
+        """Stream a session archive (or one frame block) with Range support.
+
+        Serves the ASDF archive straight from disk in bounded chunks so
+        multi-GB files never load into memory. Honors single-range
+        ``Range`` requests (206 Partial Content) and ``If-Range`` with a
+        strong ETag derived from size and mtime, so interrupted transfers
+        resume with curl -C - or any download manager.
+
+        With ``camera`` set, streams only that frame's raw pixel buffer
+        (C order) from the memory-mapped archive; shape and dtype are
+        returned in X-Frame-Shape / X-Frame-Dtype headers.
+
+        Business context: Getting data off the rig previously required SSH
+        and scp with no resumability. The dashboard can now offer download
+        links that survive flaky Wi-Fi at the observing site.
+
+        Args:
+            request: Incoming request (Range, If-Range; GET or HEAD).
+            session_id: Archive filename stem (see _find_session_archive).
+            camera: Optional camera key for single-frame download.
+            group: Frame group when camera is given.
+            index: Frame index when camera is given.
+
+        Returns:
+            200 full body, 206 partial body, or 416 for unsatisfiable ranges.
+
+        Raises:
+            HTTPException: 404 if the session or frame does not exist.
+
+        Example:
+            >>> # Resume a partially downloaded archive
+            >>> # curl -C - -O http://rig:8080/api/sessions/session_20251231/download
+        """
+        path = _find_session_archive(session_id)
+        if path is None:
+            raise HTTPException(status_code=404, detail="Session not found")
+
+        if camera is None:
+            # Compaction swaps in a rewritten file with os.replace(); an
+            # open handle keeps the original inode, so the body, size and
+            # ETag all describe one snapshot even if that happens mid-stream
+            with path.open("rb") as snapshot:
+                stat = os.fstat(snapshot.fileno())
+                return _ranged_response(
+                    request,
+                    lambda start, end: _iter_file_range(
+                        os.fdopen(os.dup(snapshot.fileno()), "rb"), start, end
+                    ),
+                    stat.st_size,
+                    etag=f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"',
+                    filename=path.name,
+                    media_type="application/asdf",
+                )
+
+        # Frame downloads resolve the block by name on each read; compaction
+        # preserves every array's contents, so a swap cannot change them
+        stat = path.stat()
+
+        import asdf
+
+        ref = FrameRef(camera, group, index)
+        try:
+            with asdf.open(path, memmap=True, lazy_load=True) as af:
+                data, _, _ = resolve_frame(af.tree, ref)
+                shape = tuple(int(n) for n in data.shape)
+                dtype = np.dtype(data.dtype)
+        except (KeyError, IndexError, TypeError) as e:
+            raise HTTPException(status_code=404, detail="Frame not found") from e
+
+        size = int(np.prod(shape)) * dtype.itemsize
+        return _ranged_response(
+            request,
+            lambda start, end: _iter_frame_range(path, ref, start, end),
+            size,
+            etag=f'"{stat.st_size:x}-{stat.st_mtime_ns:x}-{camera}-{group}-{index}"',
+            filename=f"{path.stem}_{camera}_{group}_{index:04d}.raw",
+            media_type="application/octet-stream",
+            extra_headers={
+                "X-Frame-Shape": ",".join(str(n) for n in shape),
+                "X-Frame-Dtype": dtype.str,
+            },
+        )
 
     @app.post("/api/camera/{camera_id}/control")
     async def api_set_camera_control(
@@ -1768,7 +2307,6 @@ def create_app(encoder: ImageEncoder | None = None) -> FastAPI:
             ...  "error": "Main stream not running - start stream first"}
         """
         import datetime
-        from pathlib import Path
 
         # Camera name for organizing in ASDF
         camera_key = "finder" if camera_id == 0 else "main"
@@ -1819,7 +2357,7 @@ def create_app(encoder: ImageEncoder | None = None) -> FastAPI:
             info = camera.get_camera_property() if camera else {}
 
             # Create output directory
-            capture_dir = Path("data/captures")
+            capture_dir = _CAPTURE_DIR
             capture_dir.mkdir(parents=True, exist_ok=True)
 
             # Single session file per day (contains both cameras)
@@ -1846,8 +2384,16 @@ def create_app(encoder: ImageEncoder | None = None) -> FastAPI:
                 "capture_mode": "raw16_stream",
             }
 
-            # Add coordinates
-            await _add_coordinates_to_metadata(frame_meta, capture_time)
+            # Add coordinates (averaged over the frame's exposure if buffered)
+            frame_time = frame_info.get("frame_time")
+            await _add_coordinates_to_metadata(
+                frame_meta,
+                capture_time,
+                exposure_us=exp if isinstance(exp, int) else None,
+                exposure_end=(
+                    frame_time if isinstance(frame_time, datetime.datetime) else None
+                ),
+            )
 
             # Save to ASDF
             frame_index = await _save_frame_to_asdf(
@@ -1884,15 +2430,24 @@ def create_app(encoder: ImageEncoder | None = None) -> FastAPI:
 async def _add_coordinates_to_metadata(
     frame_meta: dict[str, object],
     capture_time: datetime.datetime,
+    exposure_us: int | None = None,
+    exposure_end: datetime.datetime | None = None,
 ) -> None:
     """Add telescope coordinates and environmental data to frame metadata.
 
     Reads sensor for ALT/AZ position, converts to RA/Dec, and adds to metadata.
     Logs warnings if sensor unavailable but does not raise exceptions.
 
+    When the exposure is known and the sensor buffers its stream, the
+    position is the mean over the exposure window taken from history and
+    RA/Dec is computed at the exposure midpoint. Otherwise the current
+    reading is used at capture_time.
+
     Args:
         frame_meta: Frame metadata dict to update (modified in place).
         capture_time: Timestamp for coordinate calculation.
+        exposure_us: Exposure length in microseconds, if known.
+        exposure_end: When the exposure finished. Defaults to capture_time.
 
     Returns:
         None. Modifies frame_meta dict in-place by adding 'coordinates' and
@@ -1937,7 +2492,14 @@ async def _add_coordinates_to_metadata(
         )
     else:
         try:
-            reading = await _sensor.read()
+            obstime = capture_time
+            if exposure_us and _sensor.history is not None:
+                end = exposure_end or capture_time
+                start = end - datetime.timedelta(microseconds=exposure_us)
+                obstime = start + (end - start) / 2
+                reading = await _sensor.read_between(start, end)
+            else:
+                reading = await _sensor.read()
             logger.debug(
                 "Sensor reading obtained",
                 altitude=reading.altitude,
@@ -1948,9 +2510,9 @@ async def _add_coordinates_to_metadata(
             # Get observer location from config
             config = get_factory().config
             location = config.location
-            lat = location.get("lat", 30.2672)
-            lon = location.get("lon", -97.7431)
-            elevation = location.get("alt", 0.0)
+            lat = location.get("lat", DEFAULT_LOCATION["lat"])
+            lon = location.get("lon", DEFAULT_LOCATION["lon"])
+            elevation = location.get("alt", DEFAULT_LOCATION["alt"])
 
             # Convert ALT/AZ to RA/Dec
             equatorial = altaz_to_radec(
@@ -1959,7 +2521,8 @@ async def _add_coordinates_to_metadata(
                 lat=lat,
                 lon=lon,
                 elevation=elevation,
-                obstime=capture_time,
+                obstime=obstime,
+                mode=TransformMode.FAST,
             )
 
             # Add coordinates to frame metadata
@@ -1974,7 +2537,7 @@ async def _add_coordinates_to_metadata(
                 "temperature": reading.temperature,
                 "humidity": reading.humidity,
                 "coordinate_source": "sensor",
-                "coordinate_timestamp": capture_time.isoformat(),
+                "coordinate_timestamp": obstime.isoformat(),
             }
             logger.info(
                 "Added coordinates to frame metadata",
@@ -2040,83 +2603,297 @@ async def _save_frame_to_asdf(
     height = frame_meta.get("height", img.shape[0])
     is_color = frame_meta.get("is_color", False)
 
-    if filepath.exists():
-        with asdf.open(str(filepath), mode="rw") as af:
-            # Ensure camera section exists
-            if "cameras" not in af.tree:
-                af.tree["cameras"] = {}
-            if camera_key not in af.tree["cameras"]:
-                af.tree["cameras"][camera_key] = {
-                    "info": {
-                        "name": info.get("Name", f"Camera {camera_key}"),
-                        "sensor_width": width,
-                        "sensor_height": height,
-                        "is_color": is_color,
-                        "bayer_pattern": frame_meta.get("bayer_pattern"),
-                    },
-                    "light": [],
-                    "dark": [],
-                    "flat": [],
-                    "bias": [],
-                }
+    # Shared with the archive compactor so its swap never drops this update
+    with archive_lock(filepath):
+        if filepath.exists():
+            with asdf.open(str(filepath), mode="rw") as af:
+                # Ensure camera section exists
+                if "cameras" not in af.tree:
+                    af.tree["cameras"] = {}
+                if camera_key not in af.tree["cameras"]:
+                    af.tree["cameras"][camera_key] = {
+                        "info": {
+                            "name": info.get("Name", f"Camera {camera_key}"),
+                            "sensor_width": width,
+                            "sensor_height": height,
+                            "is_color": is_color,
+                            "bayer_pattern": frame_meta.get("bayer_pattern"),
+                        },
+                        "light": [],
+                        "dark": [],
+                        "flat": [],
+                        "bias": [],
+                    }
+
+                # Add frame
+                af.tree["cameras"][camera_key][frame_type].append(
+                    {
+                        "data": img.copy(),
+                        "meta": frame_meta,
+                    }
+                )
+                frame_index = len(af.tree["cameras"][camera_key][frame_type]) - 1
+                af.update()
+        else:
+            # Create new session ASDF archive
+            capture_time = datetime.datetime.now(datetime.UTC)
+            date_str = datetime.datetime.now().strftime("%Y%m%d")
 
-            # Add frame
-            af.tree["cameras"][camera_key][frame_type].append(
+            tree = {
+                "metadata": {
+                    "created": capture_time.isoformat(),
+                    "session_date": date_str,
+                    "format_version": "1.0",
+                },
+                "cameras": {
+                    camera_key: {
+                        "info": {
+                            "name": info.get("Name", f"Camera {camera_key}"),
+                            "sensor_width": width,
+                            "sensor_height": height,
+                            "is_color": is_color,
+                            "bayer_pattern": frame_meta.get("bayer_pattern"),
+                        },
+                        "light": [],
+                        "dark": [],
+                        "flat": [],
+                        "bias": [],
+                    }
+                },
+            }
+            # Add the first frame
+            cameras_dict = tree["cameras"]
+            assert isinstance(cameras_dict, dict)
+            camera_dict = cameras_dict[camera_key]
+            assert isinstance(camera_dict, dict)
+            frame_list = camera_dict[frame_type]
+            assert isinstance(frame_list, list)
+            frame_list.append(
                 {
                     "data": img.copy(),
                     "meta": frame_meta,
                 }
             )
-            frame_index = len(af.tree["cameras"][camera_key][frame_type]) - 1
-            af.update()
-    else:
-        # Create new session ASDF archive
-        capture_time = datetime.datetime.now(datetime.UTC)
-        date_str = datetime.datetime.now().strftime("%Y%m%d")
-
-        tree = {
-            "metadata": {
-                "created": capture_time.isoformat(),
-                "session_date": date_str,
-                "format_version": "1.0",
-            },
-            "cameras": {
-                camera_key: {
-                    "info": {
-                        "name": info.get("Name", f"Camera {camera_key}"),
-                        "sensor_width": width,
-                        "sensor_height": height,
-                        "is_color": is_color,
-                        "bayer_pattern": frame_meta.get("bayer_pattern"),
-                    },
-                    "light": [],
-                    "dark": [],
-                    "flat": [],
-                    "bias": [],
-                }
-            },
-        }
-        # Add the first frame
-        cameras_dict = tree["cameras"]
-        assert isinstance(cameras_dict, dict)
-        camera_dict = cameras_dict[camera_key]
-        assert isinstance(camera_dict, dict)
-        frame_list = camera_dict[frame_type]
-        assert isinstance(frame_list, list)
-        frame_list.append(
-            {
-                "data": img.copy(),
-                "meta": frame_meta,
-            }
-        )
-        frame_index = 0
+            frame_index = 0
 
-        af = asdf.AsdfFile(tree)
-        af.write_to(str(filepath))
+            af = asdf.AsdfFile(tree)
+            af.write_to(str(filepath))
 
     return frame_index
 
 
+def _find_session_archive(session_id: str) -> Path | None:
+    """Locate the ASDF archive for a session id.
+
+    Searches the configured data directory (``YYYY/MM/DD/{id}.asdf`` written
+    by Session.close()) and the dashboard capture directory
+    (``session_YYYYMMDD.asdf``). The id is the archive filename stem.
+
+    Args:
+        session_id: Archive stem, e.g. "observation_m31_20251231_210000".
+
+    Returns:
+        Path to the archive, or None if not found or the id is not a plain
+        filename (path separators and ".." are rejected).
+
+    Example:
+        >>> _find_session_archive("session_20251231")
+        PosixPath('data/captures/session_20251231.asdf')
+    """
+    if not _SESSION_ID_PATTERN.match(session_id) or session_id.startswith("."):
+        return None
+    filename = f"{session_id}.asdf"
+    capture_path = _CAPTURE_DIR / filename
+    if capture_path.is_file():
+        return capture_path
+    data_dir = get_factory().config.data_dir
+    if data_dir.is_dir():
+        for candidate in data_dir.rglob(filename):
+            if candidate.is_file():
+                return candidate
+    return None
+
+
+def _parse_range_header(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single-range HTTP Range header into inclusive byte offsets.
+
+    Supports ``bytes=start-end``, ``bytes=start-`` and suffix ranges
+    ``bytes=-N``. Multi-range requests and other units are ignored (the
+    caller serves the full body, which RFC 9110 permits).
+
+    Args:
+        range_header: Raw Range header value, or None.
+        size: Total resource size in bytes.
+
+    Returns:
+        (start, end) inclusive offsets, or None to serve the full resource.
+
+    Raises:
+        ValueError: If the range is syntactically valid but unsatisfiable
+            (caller responds 416).
+
+    Example:
+        >>> _parse_range_header("bytes=100-199", 1000)
+        (100, 199)
+        >>> _parse_range_header("bytes=-100", 1000)
+        (900, 999)
+    """
+    if not range_header:
+        return None
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if first == "":
+            suffix = int(last)
+            if suffix <= 0:
+                raise ValueError("empty suffix range")
+            start, end = max(size - suffix, 0), size - 1
+        else:
+            start = int(first)
+            end = int(last) if last else size - 1
+    except ValueError as e:
+        if "suffix" in str(e):
+            raise
+        return None
+    if start < 0 or start >= size or end < start:
+        raise ValueError(f"Range {range_header} not satisfiable for {size} bytes")
+    return start, min(end, size - 1)
+
+
+def _iter_file_range(
+    source: Path | BinaryIO,
+    start: int,
+    end: int,
+    chunk_size: int = _DOWNLOAD_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield bytes ``start..end`` (inclusive) of a file in bounded chunks.
+
+    Synchronous generator; StreamingResponse runs it in a worker thread so
+    disk reads never block the event loop and memory stays at one chunk.
+
+    Args:
+        source: File to read, or an open binary handle (closed when the
+            generator finishes).
+        start: First byte offset.
+        end: Last byte offset (inclusive).
+        chunk_size: Maximum bytes per yielded chunk.
+
+    Yields:
+        Consecutive chunks covering the requested range.
+
+    Example:
+        >>> b"".join(_iter_file_range(Path("a.asdf"), 0, 3))
+        b'#ASD'
+    """
+    remaining = end - start + 1
+    with source.open("rb") if isinstance(source, Path) else source as f:
+        f.seek(start)
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _iter_frame_range(
+    path: Path,
+    ref: FrameRef,
+    start: int,
+    end: int,
+    chunk_size: int = _DOWNLOAD_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield raw pixel bytes of one frame block from a memory-mapped archive.
+
+    Args:
+        path: ASDF archive.
+        ref: Frame location within the archive.
+        start: First byte offset within the frame buffer.
+        end: Last byte offset (inclusive).
+        chunk_size: Maximum bytes per yielded chunk.
+
+    Yields:
+        Consecutive chunks of the frame's C-ordered pixel buffer.
+    """
+    import asdf
+
+    with asdf.open(path, memmap=True, lazy_load=True) as af:
+        data, _, _ = resolve_frame(af.tree, ref)
+        buffer = memoryview(np.ascontiguousarray(data)).cast("B")
+        for offset in range(start, end + 1, chunk_size):
+            yield bytes(buffer[offset : min(offset + chunk_size, end + 1)])
+
+
+def _ranged_response(
+    request: Request,
+    make_body: Callable[[int, int], Iterator[bytes]],
+    size: int,
+    *,
+    etag: str,
+    filename: str,
+    media_type: str,
+    extra_headers: dict[str, str] | None = None,
+) -> Response:
+    """Build a 200/206/416 streaming response honoring Range and If-Range.
+
+    Args:
+        request: Incoming request (Range, If-Range headers; HEAD method).
+        make_body: Callable (start, end) -> Iterator[bytes] producing the
+            selected byte range.
+        size: Total resource size in bytes.
+        etag: Strong validator for If-Range comparison.
+        filename: Suggested download filename.
+        media_type: Response Content-Type.
+        extra_headers: Additional headers (e.g. frame shape/dtype).
+
+    Returns:
+        StreamingResponse (200 or 206), or Response (416 / HEAD).
+
+    Example:
+        >>> _ranged_response(request, lambda s, e: _iter_file_range(p, s, e),
+        ...                  p.stat().st_size, etag='"abc"', filename=p.name,
+        ...                  media_type="application/asdf")
+    """
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        **(extra_headers or {}),
+    }
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range is not None and if_range != etag:
+        range_header = None  # Resource changed since partial download began
+
+    try:
+        byte_range = _parse_range_header(range_header, size)
+    except ValueError:
+        headers["Content-Range"] = f"bytes */{size}"
+        return Response(status_code=416, headers=headers)
+
+    if byte_range is None:
+        start, end, status = 0, size - 1, 200
+    else:
+        start, end = byte_range
+        status = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(max(end - start + 1, 0))
+
+    if request.method == "HEAD" or size == 0:
+        return Response(status_code=status, headers=headers, media_type=media_type)
+
+    return StreamingResponse(
+        make_body(start, end),
+        status_code=status,
+        headers=headers,
+        media_type=media_type,
+    )
+
+
 async def _generate_camera_stream(
     camera_id: int,
     exposure_us: int | None = None,
@@ -2217,6 +2994,7 @@ async def _generate_camera_stream(
         yield b"--frame\r\nContent-Type: image/jpeg\r\n\r\n" + jpeg + b"\r\n"
         return
 
+    frame_buffer: bytearray | None = None
     try:
         # Get camera info for dimensions
         info = camera.get_camera_property()
@@ -2266,8 +3044,9 @@ async def _generate_camera_stream(
             buffer_size = width * height * 2  # 16-bit = 2 bytes per pixel
             logger.info("Main camera using RAW16 mode for capture-ready streaming")
 
-        # Pre-allocate frame buffer (required for full-frame capture)
-        frame_buffer = bytearray(buffer_size)
+        # Frame buffer (required for full-frame capture), reused across streams
+        buffer_key = (width, height, asi.ASI_IMG_RAW16)
+        frame_buffer = _stream_buffers.acquire(buffer_key, buffer_size)
 
         # Stop any existing video capture before starting new one
         try:
@@ -2322,6 +3101,16 @@ async def _generate_camera_stream(
 
                 frame_count += 1
                 consecutive_errors = 0  # Reset on success
+                _event_bus.publish(
+                    f"camera/{camera_id}",
+                    {
+                        "camera_id": camera_id,
+                        "frames": frame_count,
+                        "frame_ms": round((loop.time() - frame_start) * 1000, 1),
+                        "exposure_us": exp,
+                        "gain": g,
+                    },
+                )
 
                 # All cameras use RAW16 - reshape and convert for display
                 img_raw = np.frombuffer(frame_buffer, dtype=np.uint16).reshape(
@@ -2329,8 +3118,13 @@ async def _generate_camera_stream(
                 )
 
                 # Store RAW16 frame for capture (before any processing)
-                # Both cameras can grab from stream without mode switch
-                _latest_frames[camera_id] = img_raw.copy()
+                # Both cameras can grab from stream without mode switch.
+                # Readers copy it, so refresh the stored array in place.
+                latest = _latest_frames.get(camera_id)
+                if latest is not None and latest.shape == img_raw.shape:
+                    np.copyto(latest, img_raw)
+                else:
+                    _latest_frames[camera_id] = img_raw.copy()
                 _latest_frame_info[camera_id] = {
                     "width": width,
                     "height": height,
@@ -2338,6 +3132,7 @@ async def _generate_camera_stream(
                     "is_color": is_color,
                     "exposure_us": exp,
                     "gain": g,
+                    "frame_time": datetime.datetime.now(datetime.UTC),
                 }
 
                 # Convert to 8-bit for display (scale 16-bit to 8-bit)
@@ -2455,6 +3250,8 @@ async def _generate_camera_stream(
                 logger.info(f"Stopped video capture on camera {camera_id}")
         except Exception as e:
             logger.error(f"Error stopping video capture: {e}")
+        if frame_buffer is not None:
+            _stream_buffers.release(buffer_key, frame_buffer)
 
 
 def main() -> None:
@@ -2,10 +2,11 @@
 
 const API_BASE = '';
 
-// Position polling - 5000ms to match sensor read rate (issue #11)
-// Prevents stale-to-fresh jumps by syncing display refresh with sensor cadence
+// Position updates are pushed over /api/events (SSE). Polling is the
+// fallback when the browser lacks EventSource or live events are disabled.
 const POSITION_POLL_INTERVAL_MS = 5000;
 let positionInterval;
+let positionEvents;
 
 // Motor state tracking for start/stop pattern
 let motorState = {
@@ -15,7 +16,7 @@ let motorState = {
 
 document.addEventListener('DOMContentLoaded', () => {
     updateStatus('connected', 'Connected');
-    startPositionPolling();
+    startPositionUpdates();
     setupMotorControls();
 
     // Hold step size slider (range 1-100 → 0.1°-10.0°)
@@ -32,7 +33,26 @@ function updateStatus(state, message) {
     status.textContent = message;
 }
 
-// Position polling
+// Position updates: server push, falling back to polling
+function startPositionUpdates() {
+    if (!window.EventSource) {
+        startPositionPolling();
+        return;
+    }
+    positionEvents = new EventSource(`${API_BASE}/api/events?topics=position`);
+    positionEvents.addEventListener('position', (e) => {
+        renderPosition(JSON.parse(e.data));
+    });
+    positionEvents.onerror = () => {
+        // EventSource retries dropped connections itself; CLOSED means the
+        // server refused the stream (e.g. 503 when events are disabled)
+        if (positionEvents.readyState === EventSource.CLOSED) {
+            console.warn('[events] live position unavailable, polling instead');
+            startPositionPolling();
+        }
+    };
+}
+
 function startPositionPolling() {
     updatePosition();
     positionInterval = setInterval(updatePosition, POSITION_POLL_INTERVAL_MS);
@@ -41,18 +61,21 @@ function startPositionPolling() {
 async function updatePosition() {
     try {
         const response = await fetch(`${API_BASE}/api/position`);
-        const data = await response.json();
-        // Update ALT/AZ display
-        document.getElementById('altitude').textContent = data.altitude.toFixed(1);
-        document.getElementById('azimuth').textContent = data.azimuth.toFixed(1);
-        // Update RA/Dec display
-        document.getElementById('ra').textContent = data.ra_hms || '--';
-        document.getElementById('dec').textContent = data.dec_dms || '--';
+        renderPosition(await response.json());
     } catch (err) {
         console.error('Position update failed:', err);
     }
 }
 
+function renderPosition(data) {
+    // Update ALT/AZ display
+    document.getElementById('altitude').textContent = data.altitude.toFixed(1);
+    document.getElementById('azimuth').textContent = data.azimuth.toFixed(1);
+    // Update RA/Dec display
+    document.getElementById('ra').textContent = data.ra_hms || '--';
+    document.getElementById('dec').textContent = data.dec_dms || '--';
+}
+
 // Motor control - tap for nudge, hold for step move
 // Track whether a hold was triggered to suppress the spurious click event
 let holdFired = { altitude: false, azimuth: false };
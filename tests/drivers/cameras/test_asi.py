@@ -32,6 +32,8 @@ Test Categories:
    - Camera discovery fallback paths
 """
 
+import threading
+import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -45,7 +47,9 @@ from telescope_mcp.drivers.cameras.asi import (
     CONTROL_MAP,
     ASICameraDriver,
     ASICameraInstance,
+    FrameBufferPool,
 )
+from telescope_mcp.observability import TimingStats
 
 # =============================================================================
 # Mock Fixtures
@@ -93,6 +97,7 @@ class MockASICamera:
         self.camera_id = camera_id
         self._closed = False
         self._exposure_started = False
+        self.buffers_received: list[bytearray | None] = []
         self._control_values: dict[int, tuple[int, bool]] = {
             asi.ASI_GAIN: (100, False),
             asi.ASI_EXPOSURE: (1000000, False),
@@ -359,7 +364,9 @@ class MockASICamera:
         """
         self._exposure_started = False
 
-    def get_data_after_exposure(self) -> bytes:
+    def get_data_after_exposure(
+        self, buffer_: bytearray | None = None
+    ) -> bytes | bytearray:
         """Return mock image data matching camera resolution.
 
         Generates synthetic grayscale gradient image for capture tests.
@@ -371,10 +378,12 @@ class MockASICamera:
         to valid JPEG, enabling end-to-end capture testing.
 
         Args:
-            self: Mock camera instance (implicit).
+            buffer_: Optional bytearray filled in place when its size
+                matches the frame, mirroring zwoasi's buffer_ argument.
 
         Returns:
-            bytes: Raw grayscale image data (1920x1080 = 2,073,600 bytes).
+            Raw grayscale image data (1920x1080 = 2,073,600 bytes), or
+            buffer_ itself when it was filled.
             Vertical gradient pattern: row i has intensity i*255/height.
 
         Raises:
@@ -391,6 +400,10 @@ class MockASICamera:
         # Add simple gradient pattern
         for i in range(height):
             img[i, :] = i * 255 // height
+        self.buffers_received.append(buffer_)
+        if buffer_ is not None and len(buffer_) == img.nbytes:
+            buffer_[:] = img.tobytes()
+            return buffer_
         return img.tobytes()
 
     def close(self) -> None:
@@ -1431,7 +1444,7 @@ class TestASICameraInstanceCapture:
         height = 1080
         raw16_data = np.zeros((height, width), dtype=np.uint16)
         raw16_data[:, :] = 32768  # Mid-gray in 16-bit
-        mock_camera.get_data_after_exposure = lambda: raw16_data.tobytes()
+        mock_camera.get_data_after_exposure = lambda buffer_=None: raw16_data.tobytes()
 
         result = camera_instance.capture(1, image_type=asi.ASI_IMG_RAW16)
 
@@ -1652,7 +1665,7 @@ class TestASICameraInstanceCapture:
         rgb_data[:, :, 0] = 100  # Blue channel
         rgb_data[:, :, 1] = 150  # Green channel
         rgb_data[:, :, 2] = 200  # Red channel
-        mock_camera.get_data_after_exposure = lambda: rgb_data.tobytes()
+        mock_camera.get_data_after_exposure = lambda buffer_=None: rgb_data.tobytes()
 
         instance = ASICameraInstance(0, mock_camera)
 
@@ -1664,6 +1677,531 @@ class TestASICameraInstanceCapture:
         assert result[:2] == b"\xff\xd8"  # JPEG magic bytes
 
 
+class TestASICameraInstanceCaptureArray:
+    """Test capture_array() method of ASICameraInstance.
+
+    Total: 2 tests.
+    """
+
+    def test_capture_array_keeps_raw16_depth(
+        self, camera_instance: ASICameraInstance, mock_camera: MockASICamera
+    ) -> None:
+        """Verify RAW16 frames are returned unscaled as uint16.
+
+        Business context:
+        Science frames must keep full 16-bit depth; only display encoding
+        may scale to 8 bits.
+
+        Arrangement:
+        Mock returns RAW16 data with a value whose low byte is non-zero.
+
+        Action:
+        capture_array(1, "RAW16") by name and with the SDK constant.
+
+        Assertion Strategy:
+        (H, W) uint16 array with the exact sensor value; name and SDK
+        constant produce the same frame.
+
+        Testing Principle:
+        Validates no lossy conversion on the raw path.
+        """
+        raw16 = np.full((1080, 1920), 0x1234, dtype=np.uint16)
+        mock_camera.get_data_after_exposure = lambda buffer_=None: raw16.tobytes()
+
+        by_name = camera_instance.capture_array(1, "RAW16")
+        by_constant = camera_instance.capture_array(1, asi.ASI_IMG_RAW16)
+
+        assert by_name.dtype == np.uint16
+        assert by_name.shape == (1080, 1920)
+        assert by_name[0, 0] == 0x1234
+        np.testing.assert_array_equal(by_name, by_constant)
+
+    def test_capture_array_rejects_unknown_name(
+        self, camera_instance: ASICameraInstance
+    ) -> None:
+        """Verify unknown image type names raise before exposing.
+
+        Arrangement:
+        Default camera_instance.
+
+        Action:
+        capture_array(1, "RAW12").
+
+        Assertion Strategy:
+        ValueError mentioning image_type.
+
+        Testing Principle:
+        Fail fast on invalid configuration.
+        """
+        with pytest.raises(ValueError, match="image_type"):
+            camera_instance.capture_array(1, "RAW12")
+
+
+class TestASICameraInstanceBufferPool:
+    """Test pooled frame buffers in ASICameraInstance.
+
+    Total: 4 tests.
+    """
+
+    def test_capture_reuses_pooled_buffer(
+        self, camera_instance: ASICameraInstance, mock_camera: MockASICamera
+    ) -> None:
+        """Verify repeated JPEG captures hand the SDK the same buffer.
+
+        Business context:
+        Stream and burst capture at full resolution should not allocate
+        a new multi-megabyte frame per exposure.
+
+        Arrangement:
+        Default RAW8 camera_instance.
+
+        Action:
+        capture(1) three times.
+
+        Assertion Strategy:
+        Every SDK call received the identical bytearray; pool counted one
+        allocation and two reuses.
+
+        Testing Principle:
+        Validates steady-state capture is allocation-free for frames.
+        """
+        for _ in range(3):
+            assert camera_instance.capture(1)[:2] == b"\xff\xd8"
+
+        first = mock_camera.buffers_received[0]
+        assert isinstance(first, bytearray)
+        assert all(buf is first for buf in mock_camera.buffers_received)
+        assert camera_instance.buffer_pool.allocations == 1
+        assert camera_instance.buffer_pool.reuses == 2
+
+    def test_capture_pooled_lease_lifecycle(
+        self, camera_instance: ASICameraInstance, mock_camera: MockASICamera
+    ) -> None:
+        """Verify pooled frames are zero-copy views released explicitly.
+
+        Arrangement:
+        Default RAW8 camera_instance.
+
+        Action:
+        capture_pooled() inside a with-block, then capture_pooled() again.
+
+        Assertion Strategy:
+        Array shares memory with the SDK buffer; array access after
+        release raises; the second lease reuses the released buffer.
+
+        Testing Principle:
+        Validates explicit release returns buffers and guards stale use.
+        """
+        with camera_instance.capture_pooled(1, "RAW8") as frame:
+            buffer = mock_camera.buffers_received[-1]
+            assert np.shares_memory(frame.array, np.frombuffer(buffer, np.uint8))
+            assert frame.array.shape == (1080, 1920)
+        assert frame.released
+        with pytest.raises(RuntimeError, match="after release"):
+            _ = frame.array
+        frame.release()  # idempotent
+
+        again = camera_instance.capture_pooled(1, "RAW8")
+        assert mock_camera.buffers_received[-1] is buffer
+        again.release()
+
+    def test_failed_exposure_returns_buffer_and_array_is_owned(
+        self, camera_instance: ASICameraInstance, mock_camera: MockASICamera
+    ) -> None:
+        """Verify failures do not leak leases and capture_array owns memory.
+
+        Arrangement:
+        Mock whose exposure status reports failure once.
+
+        Action:
+        capture_pooled() (fails), capture_pooled() (succeeds), then two
+        capture_array() calls.
+
+        Assertion Strategy:
+        Successful lease reuses the buffer from the failed attempt;
+        capture_array results do not share memory with each other.
+
+        Testing Principle:
+        Validates exception safety and ownership of unpooled arrays.
+        """
+        mock_camera.get_exposure_status = lambda: asi.ASI_EXP_FAILED
+        with pytest.raises(RuntimeError):
+            camera_instance.capture_pooled(1)
+        del mock_camera.get_exposure_status
+
+        with camera_instance.capture_pooled(1):
+            pass
+        assert camera_instance.buffer_pool.reuses == 1
+
+        first = camera_instance.capture_array(1)
+        second = camera_instance.capture_array(1)
+        assert first.flags.writeable
+        assert not np.shares_memory(first, second)
+
+    def test_pool_limits_free_buffers(self) -> None:
+        """Verify the pool keeps at most max_free buffers per key.
+
+        Arrangement:
+        FrameBufferPool(max_free=1).
+
+        Action:
+        Acquire two buffers, release both, acquire twice more.
+
+        Assertion Strategy:
+        Only one release is kept: one reuse, three allocations; negative
+        max_free raises ValueError.
+
+        Testing Principle:
+        Validates bounded memory held by idle buffers.
+        """
+        pool = FrameBufferPool(max_free=1)
+        key = (4, 2, asi.ASI_IMG_RAW8)
+        a, b = pool.acquire(key, 8), pool.acquire(key, 8)
+        pool.release(key, a)
+        pool.release(key, b)
+
+        assert pool.acquire(key, 8) is a
+        pool.acquire(key, 8)
+        assert (pool.allocations, pool.reuses) == (3, 1)
+        with pytest.raises(ValueError, match="max_free"):
+            FrameBufferPool(max_free=-1)
+
+
+class TestASICameraInstanceControlCache:
+    """Test the SDK control state cache in ASICameraInstance.
+
+    Total: 4 tests.
+    """
+
+    def test_repeated_capture_skips_exposure_and_image_type_writes(
+        self, camera_instance: ASICameraInstance, mock_camera: MockASICamera
+    ) -> None:
+        """Verify unchanged exposure and image type are written only once.
+
+        Business context:
+        Each SDK call is a USB control transfer; a stream at fixed settings
+        should not pay for them on every frame.
+
+        Arrangement:
+        Spy wrappers around set_control_value and set_image_type.
+
+        Action:
+        capture(1) three times, then capture(2).
+
+        Assertion Strategy:
+        One exposure write for the first three frames, a second when the
+        exposure changes; image type written once; skips counted.
+
+        Testing Principle:
+        Validates write-through only on state change.
+        """
+        set_value = MagicMock(wraps=mock_camera.set_control_value)
+        set_type = MagicMock(wraps=mock_camera.set_image_type)
+        mock_camera.set_control_value = set_value
+        mock_camera.set_image_type = set_type
+
+        for _ in range(3):
+            camera_instance.capture(1)
+        exposure_writes = [
+            c for c in set_value.call_args_list if c.args[0] == asi.ASI_EXPOSURE
+        ]
+        assert len(exposure_writes) == 1
+        assert set_type.call_count == 1
+        assert camera_instance.writes_skipped == 4
+
+        camera_instance.capture(2)
+        assert set_value.call_args_list[-1].args == (asi.ASI_EXPOSURE, 2)
+        assert set_type.call_count == 1
+
+    def test_set_control_same_value_served_from_cache(
+        self, camera_instance: ASICameraInstance, mock_camera: MockASICamera
+    ) -> None:
+        """Verify repeated set_control/get_control avoid SDK round-trips.
+
+        Arrangement:
+        Spy wrappers around set_control_value and get_control_value.
+
+        Action:
+        set_control("Gain", 150) twice, then get_control("Gain").
+
+        Assertion Strategy:
+        One write and one read-back reach the SDK; all three calls
+        report the confirmed hardware value.
+
+        Testing Principle:
+        Validates cached read-back is returned for unchanged requests.
+        """
+        set_value = MagicMock(wraps=mock_camera.set_control_value)
+        get_value = MagicMock(wraps=mock_camera.get_control_value)
+        mock_camera.set_control_value = set_value
+        mock_camera.get_control_value = get_value
+
+        first = camera_instance.set_control("Gain", 150)
+        second = camera_instance.set_control("Gain", 150)
+        read = camera_instance.get_control("Gain")
+
+        assert first["value"] == second["value"] == read["value"] == 150
+        assert set_value.call_count == 1
+        assert get_value.call_count == 1
+        assert camera_instance.writes_skipped == 1
+
+    def test_volatile_and_auto_controls_always_read(
+        self, camera_instance: ASICameraInstance, mock_camera: MockASICamera
+    ) -> None:
+        """Verify temperature and auto-mode controls bypass the cache.
+
+        Arrangement:
+        Gain reported in auto mode by the mock.
+
+        Action:
+        get_control("Temperature") and get_control("Gain") twice each,
+        changing the mock values in between.
+
+        Assertion Strategy:
+        Second reads return the new values the camera reported.
+
+        Testing Principle:
+        Validates values the camera changes itself are never stale.
+        """
+        mock_camera._control_values[asi.ASI_TEMPERATURE] = (250, False)
+        mock_camera._control_values[asi.ASI_GAIN] = (100, True)
+        camera_instance.get_control("Temperature")
+        camera_instance.get_control("Gain")
+
+        mock_camera._control_values[asi.ASI_TEMPERATURE] = (180, False)
+        mock_camera._control_values[asi.ASI_GAIN] = (240, True)
+
+        assert camera_instance.get_control("Temperature")["value"] == 180
+        assert camera_instance.get_control("Gain") == dict(
+            control="Gain", value=240, auto=True
+        )
+
+    def test_failed_exposure_invalidates_cache(
+        self, camera_instance: ASICameraInstance, mock_camera: MockASICamera
+    ) -> None:
+        """Verify an SDK failure forces the next capture to rewrite state.
+
+        Business context:
+        A failed exposure may follow a USB reset that reverted settings,
+        so cached state can no longer be trusted.
+
+        Arrangement:
+        One successful capture, then a mock reporting exposure failure.
+
+        Action:
+        capture(1) (fails), then capture(1) with status restored.
+
+        Assertion Strategy:
+        Exposure and image type are written again after the failure.
+
+        Testing Principle:
+        Validates the cache never masks a lost hardware setting.
+        """
+        camera_instance.capture(1)
+        set_value = MagicMock(wraps=mock_camera.set_control_value)
+        set_type = MagicMock(wraps=mock_camera.set_image_type)
+        mock_camera.set_control_value = set_value
+        mock_camera.set_image_type = set_type
+
+        mock_camera.get_exposure_status = lambda: asi.ASI_EXP_FAILED
+        with pytest.raises(RuntimeError):
+            camera_instance.capture(1)
+        del mock_camera.get_exposure_status
+        camera_instance.capture(1)
+
+        assert set_value.call_args_list[-1].args == (asi.ASI_EXPOSURE, 1)
+        assert set_type.call_count == 1
+
+
+class TestASICameraInstanceExposureWait:
+    """Test adaptive exposure completion waiting in ASICameraInstance.
+
+    Total: 5 tests.
+    """
+
+    @staticmethod
+    def _finish_at(mock_camera: MockASICamera, end: float) -> None:
+        """Make the mock report WORKING until monotonic time end."""
+        mock_camera.get_exposure_status = lambda: (
+            asi.ASI_EXP_SUCCESS if time.monotonic() >= end else asi.ASI_EXP_WORKING
+        )
+
+    def test_long_exposure_sleeps_then_polls_briefly(
+        self, camera_instance: ASICameraInstance, mock_camera: MockASICamera
+    ) -> None:
+        """Verify a long exposure costs a handful of status polls.
+
+        Business context:
+        Fixed 10 ms polling issued ~100 USB calls per second of exposure.
+
+        Arrangement:
+        Mock completing 300 ms after the start time.
+
+        Action:
+        _wait_for_exposure(300_000, start).
+
+        Assertion Strategy:
+        Returns after the expected end with fewer than 15 polls (fixed
+        polling would need ~30); overshoot recorded, non-negative, small.
+
+        Testing Principle:
+        Validates sleep-until-near-end plus shrinking poll interval.
+        """
+        start = time.monotonic()
+        self._finish_at(mock_camera, start + 0.3)
+
+        camera_instance._wait_for_exposure(300_000, start)
+
+        assert time.monotonic() - start >= 0.3
+        assert camera_instance.status_polls < 15
+        overshoot = camera_instance.last_overshoot_us
+        assert overshoot is not None
+        assert 0 <= overshoot < 50_000
+
+    def test_short_exposure_detected_within_poll_floor(
+        self, camera_instance: ASICameraInstance, mock_camera: MockASICamera
+    ) -> None:
+        """Verify short exposures are not delayed by a fixed poll interval.
+
+        Arrangement:
+        Mock completing 2 ms after the start time.
+
+        Action:
+        _wait_for_exposure(2_000, start).
+
+        Assertion Strategy:
+        Overshoot below the old 10 ms fixed interval.
+
+        Testing Principle:
+        Validates millisecond-scale completion latency.
+        """
+        start = time.monotonic()
+        self._finish_at(mock_camera, start + 0.002)
+
+        camera_instance._wait_for_exposure(2_000, start)
+
+        overshoot = camera_instance.last_overshoot_us
+        assert overshoot is not None
+        assert overshoot < 10_000
+
+    def test_overshoot_recorded_in_shared_timing_stats(
+        self, mock_sdk: MockASISDK
+    ) -> None:
+        """Verify every exposure's overshoot lands in the driver's TimingStats.
+
+        Business context:
+        A last-value property cannot show drift; monitoring needs the
+        distribution across captures and cameras.
+
+        Arrangement:
+        Driver built with a shared TimingStats; cameras 0 and 1 opened.
+
+        Action:
+        Three captures on camera 0, one on camera 1.
+
+        Assertion Strategy:
+        Per-camera counts 3 and 1 under overshoot_key, max matching the
+        largest recorded last_overshoot_us.
+
+        Testing Principle:
+        Validates overshoot is exported as a metric, not just logged.
+        """
+        stats = TimingStats()
+        driver = ASICameraDriver(sdk=mock_sdk, timing_stats=stats)
+        first, second = driver.open(0), driver.open(1)
+        seen = []
+        for _ in range(3):
+            first.capture(1)
+            seen.append(abs(first.last_overshoot_us or 0.0))
+        second.capture(1)
+
+        assert first.timing_stats is stats is second.timing_stats
+        summary = stats.get_summary(first.overshoot_key)
+        assert summary.count == 3
+        assert summary.max_abs_error_us == pytest.approx(max(seen))
+        assert stats.get_summary(second.overshoot_key).count == 1
+        assert first.overshoot_key != second.overshoot_key
+
+    def test_stop_exposure_from_other_thread_aborts_wait(
+        self, camera_instance: ASICameraInstance, mock_camera: MockASICamera
+    ) -> None:
+        """Verify stop_exposure() wakes a capture sleeping on a long exposure.
+
+        Business context:
+        Users abort 60 s exposures when clouds roll in; the capture thread
+        must not keep sleeping until the original end time.
+
+        Arrangement:
+        Mock that never completes; timer calling stop_exposure() after 50 ms.
+
+        Action:
+        capture(30_000_000) on the test thread.
+
+        Assertion Strategy:
+        RuntimeError "aborted" well under a second, with no status polls
+        spent during the sleep; the next capture succeeds.
+
+        Testing Principle:
+        Validates cross-thread cancellation of the interruptible wait.
+        """
+        mock_camera.get_exposure_status = lambda: asi.ASI_EXP_WORKING
+        timer = threading.Timer(0.05, camera_instance.stop_exposure)
+        start = time.monotonic()
+        timer.start()
+        try:
+            with pytest.raises(RuntimeError, match="aborted"):
+                camera_instance.capture(30_000_000)
+        finally:
+            timer.cancel()
+
+        assert time.monotonic() - start < 1.0
+        assert camera_instance.status_polls == 0
+        del mock_camera.get_exposure_status
+        assert camera_instance.capture(1)[:2] == b"\xff\xd8"
+
+    def test_stop_before_wait_is_kept_and_idle_stop_ignored(
+        self, camera_instance: ASICameraInstance, mock_camera: MockASICamera
+    ) -> None:
+        """Verify a stop racing the start of a capture still aborts it.
+
+        Business context:
+        A user pressing stop just as a capture begins must not be ignored
+        and left waiting out a long exposure.
+
+        Arrangement:
+        Exposures that never complete; stop_exposure() called while the
+        exposure control is being written, i.e. before the exposure starts.
+        Separately, a stop issued while no capture is running.
+
+        Action:
+        capture(30_000_000); stop_exposure() while idle; capture(1).
+
+        Assertion Strategy:
+        First capture raises "aborted" promptly; the idle stop does not
+        abort the following capture.
+
+        Testing Principle:
+        Cancellation state is scoped to the capture it was issued during.
+        """
+        mock_camera.get_exposure_status = lambda: asi.ASI_EXP_WORKING
+        set_control_value = mock_camera.set_control_value
+
+        def set_then_stopped(control_id: int, value: int) -> None:
+            set_control_value(control_id, value)
+            camera_instance.stop_exposure()
+
+        mock_camera.set_control_value = set_then_stopped
+        start = time.monotonic()
+        with pytest.raises(RuntimeError, match="aborted"):
+            camera_instance.capture(30_000_000)
+        assert time.monotonic() - start < 1.0
+
+        del mock_camera.get_exposure_status
+        mock_camera.set_control_value = set_control_value
+        camera_instance.stop_exposure()
+        assert camera_instance.capture(1)[:2] == b"\xff\xd8"
+
+
 class TestASICameraInstanceClose:
     """Test close() method of ASICameraInstance.
 
@@ -1299,3 +1299,61 @@ class TestDigitalTwinCameraInstanceSyntheticCapture:
 
         assert isinstance(result, bytes)
         assert result[:2] == b"\xff\xd8"
+
+
+class TestDigitalTwinCameraInstanceCaptureArray:
+    """Test capture_array() unencoded frame output.
+
+    Total: 2 tests.
+    """
+
+    def test_capture_array_formats(self, camera_info: CameraInfo) -> None:
+        """Verify each image type yields the matching dtype and shape.
+
+        Business context:
+        Camera stores the driver array in CaptureResult.raw; the twin must
+        mimic hardware RAW8/RAW16/RGB24 frames so science paths are
+        exercised without a sensor.
+
+        Arrangement:
+        Synthetic instance with gain 0 (deterministic pattern).
+
+        Action:
+        capture_array() with None, RAW8, RAW16, and RGB24.
+
+        Assertion:
+        BGR uint8 for None/RGB24, mono uint8 for RAW8, mono uint16 for
+        RAW16 whose high byte equals the RAW8 frame.
+        """
+        config = DigitalTwinConfig(image_source=ImageSource.SYNTHETIC)
+        instance = DigitalTwinCameraInstance(0, camera_info, config)
+        instance.set_control("Gain", 0)
+        height, width = camera_info["MaxHeight"], camera_info["MaxWidth"]
+
+        default = instance.capture_array(100000)
+        rgb = instance.capture_array(100000, "RGB24")
+        mono8 = instance.capture_array(100000, "RAW8")
+        mono16 = instance.capture_array(100000, "RAW16")
+
+        assert default.shape == rgb.shape == (height, width, 3)
+        assert mono8.shape == mono16.shape == (height, width)
+        assert mono8.dtype == np.uint8
+        assert mono16.dtype == np.uint16
+        np.testing.assert_array_equal(mono16 >> 8, mono8)
+
+    def test_capture_array_rejects_unknown_type(self, camera_info: CameraInfo) -> None:
+        """Verify unsupported image types raise ValueError.
+
+        Arrangement:
+        Default synthetic instance.
+
+        Action:
+        capture_array(1000, "RAW12").
+
+        Assertion:
+        ValueError naming the accepted formats.
+        """
+        instance = DigitalTwinCameraInstance(0, camera_info, DigitalTwinConfig())
+
+        with pytest.raises(ValueError, match="RAW16"):
+            instance.capture_array(1000, "RAW12")
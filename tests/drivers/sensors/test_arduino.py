@@ -8,6 +8,11 @@ Test Categories:
 - Altitude calculation from accelerometer data
 - Azimuth calculation from magnetometer data
 - Calibration (alt/az offsets and tilt correction)
+- Sample history (buffered, interpolated, and windowed reads)
+- Bulk ingestion (chunked reads, batch parsing)
+- Binary frame protocol (decoding, sequence gaps, CRC)
+- Orientation fusion (filtered altitude/azimuth behind read())
+- Magnetometer ellipsoid calibration (sweep, fit, corrected azimuth)
 - Command handling (STATUS, RESET, CALIBRATE, etc.)
 - Port enumeration and sensor discovery
 - Error handling
@@ -25,11 +30,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from telescope_mcp.drivers.sensors import (
     ArduinoSensorDriver,
     ArduinoSensorInstance,
+    MagnetometerCalibration,
 )
 
 if TYPE_CHECKING:
@@ -197,6 +204,35 @@ class MockSerialPort:
             return data
         return b""
 
+    def read(self, size: int = 1) -> bytes:
+        """Read up to size bytes from the front of the queue.
+
+        Simulates pyserial read() draining the receive buffer; queued
+        chunks are consumed as one byte stream.
+
+        Args:
+            size: Maximum bytes to return.
+
+        Returns:
+            Up to size queued bytes, or empty if queue empty.
+
+        Raises:
+            No exceptions raised.
+
+        Business context:
+            The sensor reader drains in_waiting bytes in one read() call
+            after each read_until(); mock lets tests exercise that path.
+
+        Example:
+            >>> port.queue_bytes(b"abcdef")
+            >>> port.read(4)
+            b"abcd"
+        """
+        data = b"".join(self._read_queue)
+        self._read_queue = [data[size:]] if data[size:] else []
+        self._in_waiting = len(data) - len(data[:size])
+        return data[:size]
+
     def readline(self) -> bytes:
         """Read a line (until newline) from the response queue.
 
@@ -1751,6 +1787,815 @@ class TestSensorReading:
         assert reading.azimuth < 10 or reading.azimuth > 350
 
 
+# =============================================================================
+# Sample History Tests
+# =============================================================================
+
+
+class TestSampleHistory:
+    """Test suite for the buffered sample history and its queries.
+
+    Categories:
+    1. Recording - parsed lines land in the ring (1 test)
+    2. Queries - averaged, interpolated, and windowed reads (3 tests)
+
+    Total: 4 tests.
+    """
+
+    def test_parse_line_records_samples(
+        self, arduino_instance: ArduinoSensorInstance
+    ) -> None:
+        """Verifies every valid line is appended to the history ring.
+
+        Business context:
+        The reader thread's stream is kept so later reads need no new
+        serial data.
+
+        Arrangement:
+        1. Parse an 8-field line, a legacy 6-field line, and a command
+           response.
+
+        Action:
+        Inspect instance.history.latest().
+
+        Assertion Strategy:
+        Validates recording by confirming:
+        - Two samples stored in channel order (aX..mZ, temp, humidity).
+        - Legacy line reordered and carries the last known environment.
+        - Command responses are not recorded.
+
+        Testing Principle:
+        Validates the ring mirrors exactly what read() would have seen.
+        """
+        arduino_instance._parse_line("0.5\t0.0\t0.87\t30.0\t0.0\t40.0\t22.5\t55.0")
+        arduino_instance._parse_line("0.1\t0.9\t0.2\t10.0\t20.0\t30.0")
+        arduino_instance._parse_line("OK: STATUS")
+
+        times, values = arduino_instance.history.latest()
+
+        assert len(arduino_instance.history) == 2
+        assert times[0] <= times[1]
+        assert values[0].tolist() == [0.5, 0.0, 0.87, 30.0, 0.0, 40.0, 22.5, 55.0]
+        assert values[1].tolist() == [0.1, 0.2, 0.9, 10.0, 30.0, 20.0, 22.5, 55.0]
+
+    def test_read_average_uses_buffered_vectors(
+        self, arduino_instance: ArduinoSensorInstance
+    ) -> None:
+        """Verifies read_average() derives angles from mean raw vectors.
+
+        Business context:
+        Averaging vectors before the angle math avoids azimuth wraparound
+        errors around north.
+
+        Arrangement:
+        1. Buffer headings of +10° and -10° (350°) around north.
+
+        Action:
+        Call read_average() for both samples, then ask for more than are
+        buffered.
+
+        Assertion Strategy:
+        Validates averaging by confirming:
+        - Mean magnetometer vector and azimuth ~0°, not 180°.
+        - raw_values reports the number of samples actually used.
+        - Empty history raises RuntimeError.
+
+        Testing Principle:
+        Validates history-backed reads match a vector mean.
+        """
+        with pytest.raises(RuntimeError, match="No sensor data"):
+            arduino_instance.read_average(5)
+        arduino_instance._parse_line("0.0\t0.0\t1.0\t0.9848\t0.1736\t0.0\t20.0\t40.0")
+        arduino_instance._parse_line("0.0\t0.0\t1.0\t0.9848\t-0.1736\t0.0\t22.0\t60.0")
+
+        reading = arduino_instance.read_average(10)
+
+        assert reading.magnetometer["mY"] == pytest.approx(0.0)
+        assert reading.azimuth == pytest.approx(0.0, abs=1e-6)
+        assert reading.temperature == pytest.approx(21.0)
+        assert reading.humidity == pytest.approx(50.0)
+        assert reading.raw_values == "averaged_2_samples"
+
+    def test_read_at_and_read_between(
+        self, arduino_instance: ArduinoSensorInstance
+    ) -> None:
+        """Verifies time-indexed reads use wall-clock instants.
+
+        Business context:
+        Frame tagging asks for the orientation during an exposure that
+        ended before metadata was assembled.
+
+        Arrangement:
+        1. Append samples with aX 0.0 and 1.0 one second apart, ending now.
+
+        Action:
+        read_at() the midpoint; read_between() around both samples and
+        over an empty sub-range.
+
+        Assertion Strategy:
+        Validates time queries by confirming:
+        - read_at() interpolates aX to ~0.5.
+        - read_between() averages both samples.
+        - An empty range interpolates at its midpoint.
+        - Reversed range raises ValueError.
+
+        Testing Principle:
+        Validates wall-clock queries map onto the monotonic sample times.
+        """
+        from datetime import UTC, datetime, timedelta
+
+        from telescope_mcp.drivers.sensors.history import monotonic_ns_at
+
+        now = datetime.now(UTC)
+        t_end = monotonic_ns_at(now)
+        history = arduino_instance.history
+        history.append([0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 20.0, 50.0], t_end - 10**9)
+        history.append([1.0, 0.0, 1.0, 1.0, 0.0, 0.0, 20.0, 50.0], t_end)
+
+        mid = arduino_instance.read_at(now - timedelta(milliseconds=500))
+        both = arduino_instance.read_between(
+            now - timedelta(seconds=2), now + timedelta(milliseconds=10)
+        )
+        gap = arduino_instance.read_between(
+            now - timedelta(milliseconds=800), now - timedelta(milliseconds=600)
+        )
+
+        assert mid.accelerometer["aX"] == pytest.approx(0.5, abs=0.01)
+        assert mid.raw_values == "interpolated"
+        assert both.raw_values == "averaged_2_samples"
+        assert both.accelerometer["aX"] == pytest.approx(0.5)
+        assert gap.raw_values == "interpolated"
+        assert gap.accelerometer["aX"] == pytest.approx(0.3, abs=0.01)
+        with pytest.raises(ValueError, match="precede"):
+            arduino_instance.read_between(now, now - timedelta(seconds=1))
+
+    def test_read_window_averages_recent_stream(
+        self, arduino_instance: ArduinoSensorInstance
+    ) -> None:
+        """Verifies read_window() averages the last duration of the stream.
+
+        Business context:
+        "Average the last 2 seconds" should come from samples already
+        received instead of spending 2 seconds collecting them.
+
+        Arrangement:
+        1. Buffer aX 0.0, 1.0, 2.0 at 1 s spacing.
+
+        Action:
+        read_window() over 1500 ms and over a long window.
+
+        Assertion Strategy:
+        Validates the window by confirming:
+        - 1500 ms ending at the newest sample holds the last two samples.
+        - A long window holds all three.
+        - Non-positive duration raises ValueError.
+
+        Testing Principle:
+        Validates time windows are anchored at the newest sample.
+        """
+        history = arduino_instance.history
+        for i in range(3):
+            history.append([float(i), 0.0, 1.0, 1.0, 0.0, 0.0, 20.0, 50.0], i * 10**9)
+
+        recent = arduino_instance.read_window(1500)
+        everything = arduino_instance.read_window(60_000)
+
+        assert recent.raw_values == "averaged_2_samples"
+        assert recent.accelerometer["aX"] == pytest.approx(1.5)
+        assert everything.raw_values == "averaged_3_samples"
+        with pytest.raises(ValueError, match="duration_ms"):
+            arduino_instance.read_window(0)
+
+
+# =============================================================================
+# Bulk Ingestion Tests
+# =============================================================================
+
+
+class TestBulkIngestion:
+    """Test suite for chunked serial ingestion in the reader thread.
+
+    Categories:
+    1. Batch parsing - line splitting, partial tails, fallbacks (2 tests)
+    2. Reader loop - drains in_waiting in one read (1 test)
+
+    Total: 3 tests.
+    """
+
+    def test_ingest_parses_batch_and_keeps_partial_tail(
+        self, arduino_instance: ArduinoSensorInstance
+    ) -> None:
+        """Verifies _ingest() publishes complete lines and buffers the rest.
+
+        Business context:
+        A drained chunk rarely ends on a line boundary; the unterminated
+        tail must be completed by the next chunk, not dropped or misparsed.
+
+        Arrangement:
+        1. Chunk with three data lines, a command response, and half a line.
+
+        Action:
+        Ingest the chunk, then the remainder of the last line.
+
+        Assertion Strategy:
+        Validates batch ingestion by confirming:
+        - Three samples published; the response is skipped.
+        - Latest state and raw_values come from the last complete line.
+        - The completed tail becomes the fourth sample.
+        - History timestamps are non-decreasing.
+
+        Testing Principle:
+        Validates framing is independent of chunk boundaries.
+        """
+        chunk = (
+            b"0.1\t0.0\t1.0\t30.0\t0.0\t40.0\t20.0\t50.0\r\n"
+            b"0.2\t0.0\t1.0\t30.0\t0.0\t40.0\t20.0\t50.0\r\n"
+            b"OK: started\r\n"
+            b"0.3\t0.0\t1.0\t30.0\t0.0\t40.0\t21.0\t51.0\r\n"
+            b"0.4\t0.0\t1.0"
+        )
+
+        lines, parsed = arduino_instance._ingest(chunk)
+        reading = arduino_instance.read()
+
+        assert len(lines) == 4
+        assert parsed == 3
+        assert len(arduino_instance.history) == 3
+        assert reading.accelerometer["aX"] == pytest.approx(0.3)
+        assert reading.temperature == pytest.approx(21.0)
+        assert reading.raw_values.startswith("0.3\t")
+
+        lines, parsed = arduino_instance._ingest(b"\t30.0\t0.0\t40.0\t20.0\t50.0\r\n")
+        times, values = arduino_instance.history.latest()
+
+        assert parsed == 1
+        assert values[:, 0].tolist() == pytest.approx([0.1, 0.2, 0.3, 0.4])
+        assert (times[1:] >= times[:-1]).all()
+
+    def test_ingest_isolates_malformed_rows(
+        self, arduino_instance: ArduinoSensorInstance
+    ) -> None:
+        """Verifies a bad value only drops its own line.
+
+        Business context:
+        Serial noise can corrupt one line of a batch; the rest of the
+        batch must still be published.
+
+        Arrangement:
+        1. Chunk with two good lines around a corrupted one, plus a legacy
+           6-field line.
+
+        Action:
+        Ingest the chunk.
+
+        Assertion Strategy:
+        Validates fallback by confirming:
+        - Two full-format lines and the legacy line are published.
+        - The corrupted line is skipped.
+
+        Testing Principle:
+        Validates batch parsing degrades to per-line parsing on errors.
+        """
+        chunk = (
+            b"0.1\t0.0\t1.0\t30.0\t0.0\t40.0\t20.0\t50.0\n"
+            b"0.2\t0.0\tx?\t30.0\t0.0\t40.0\t20.0\t50.0\n"
+            b"0.3\t0.0\t1.0\t30.0\t0.0\t40.0\t20.0\t50.0\n"
+            b"0.5\t1.0\t0.0\t30.0\t0.0\t40.0\n"
+        )
+
+        _, parsed = arduino_instance._ingest(chunk)
+        _, values = arduino_instance.history.latest()
+
+        assert parsed == 3
+        assert sorted(values[:, 0].tolist()) == pytest.approx([0.1, 0.3, 0.5])
+
+    def test_read_loop_drains_waiting_bytes(self) -> None:
+        """Verifies the reader drains in_waiting bytes with one read().
+
+        Business context:
+        At high output rates the reader must consume backlog in bulk
+        rather than one read_until() per line.
+
+        Arrangement:
+        1. Mock port with one line queued, followed by a 4-line block.
+        2. Reader thread started.
+
+        Action:
+        Wait until all five samples are buffered, then close.
+
+        Assertion Strategy:
+        Validates draining by confirming:
+        - All five samples reach the history.
+        - The 4-line block was consumed by a single read() call.
+
+        Testing Principle:
+        Validates the reader wakes once per chunk, not once per line.
+        """
+        import time
+
+        mock_serial = MockSerialPort()
+        line = "0.5\t0.0\t0.87\t30.0\t0.0\t40.0\t22.5\t55.0"
+        mock_serial.queue_line(line)
+        mock_serial.queue_bytes(f"{line}\r\n".encode() * 4)
+        read_sizes: list[int] = []
+        original_read = mock_serial.read
+
+        def spy_read(size: int = 1) -> bytes:
+            read_sizes.append(size)
+            return original_read(size)
+
+        mock_serial.read = spy_read  # type: ignore[method-assign]
+        instance = ArduinoSensorInstance._create_with_serial(
+            mock_serial, "/dev/test", start_reader=True
+        )
+        try:
+            deadline = time.monotonic() + 2.0
+            while len(instance.history) < 5 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            instance.close()
+
+        assert len(instance.history) == 5
+        assert read_sizes == [len(line) * 4 + 8]
+
+
+# =============================================================================
+# Binary Protocol Tests
+# =============================================================================
+
+
+class TestBinaryProtocol:
+    """Test suite for the binary frame protocol.
+
+    Categories:
+    1. Decoding - frames mixed with text, partial frames (1 test)
+    2. Link integrity - sequence gaps, CRC failures, restarts (2 tests)
+    3. Mode selection - BINARY/ASCII commands (1 test)
+    4. Reader - chunked reads in binary mode (1 test)
+
+    Total: 5 tests.
+    """
+
+    def test_frames_decoded_alongside_text(
+        self, arduino_instance: ArduinoSensorInstance
+    ) -> None:
+        """Verifies binary frames and ASCII lines share one stream.
+
+        Business context:
+        After the BINARY command the firmware replies in text and then
+        streams frames; the switch must not lose or garble samples.
+
+        Arrangement:
+        1. Chunk: one ASCII data line, the command reply, two frames, and
+           the first half of a third frame.
+
+        Action:
+        Ingest the chunk, then the rest of the third frame.
+
+        Assertion Strategy:
+        Validates decoding by confirming:
+        - The ASCII line and both frames are published in order.
+        - Environment channels round-trip at hundredths precision.
+        - The split frame is completed by the next chunk.
+        - link_stats reports binary protocol with three frames.
+
+        Testing Principle:
+        Validates protocol switching needs no reader coordination.
+        """
+        from telescope_mcp.drivers.sensors.arduino import (
+            BINARY_FRAME_SIZE,
+            encode_binary_frame,
+        )
+
+        frames = [
+            encode_binary_frame(i, [0.1 * i, 0.0, 1.0, 30.0, 0.0, 40.0, 21.37, 48.5])
+            for i in range(1, 4)
+        ]
+        half = BINARY_FRAME_SIZE // 2
+        chunk = (
+            b"0.0\t0.0\t1.0\t30.0\t0.0\t40.0\t20.0\t50.0\r\n"
+            b"CMD: Binary output\r\n" + frames[0] + frames[1] + frames[2][:half]
+        )
+
+        lines, parsed = arduino_instance._ingest(chunk)
+
+        assert parsed == 3
+        assert lines[1] == "CMD: Binary output"
+        assert arduino_instance.read().temperature == pytest.approx(21.37)
+
+        _, parsed = arduino_instance._ingest(frames[2][half:])
+        _, values = arduino_instance.history.latest()
+
+        assert parsed == 1
+        assert values[:, 0].tolist() == pytest.approx([0.0, 0.1, 0.2, 0.3])
+        assert arduino_instance.read().raw_values == "binary_frame_3"
+        assert arduino_instance.link_stats == {
+            "protocol": "binary",
+            "frames_received": 3,
+            "frames_lost": 0,
+            "frames_corrupt": 0,
+        }
+
+    def test_sequence_gaps_and_corruption_counted(
+        self, arduino_instance: ArduinoSensorInstance
+    ) -> None:
+        """Verifies lost and corrupted frames are detected.
+
+        Business context:
+        ASCII output silently drops samples; the binary sequence counter
+        and CRC make link problems visible.
+
+        Arrangement:
+        1. Frames with sequence numbers 65534, 65535, 0, 3 (wraparound,
+           then two missing) and one frame with a flipped payload byte.
+
+        Action:
+        Ingest all frames in one chunk.
+
+        Assertion Strategy:
+        Validates integrity checks by confirming:
+        - Wraparound is not counted as loss; the 0 -> 3 gap counts 2.
+        - The corrupted frame is rejected and counted.
+        - Frames after the corrupted one are still decoded.
+
+        Testing Principle:
+        Validates resynchronization after bad data.
+        """
+        from telescope_mcp.drivers.sensors.arduino import encode_binary_frame
+
+        sample = [0.5, 0.0, 0.87, 30.0, 0.0, 40.0, 22.5, 55.0]
+        bad = bytearray(encode_binary_frame(1, sample))
+        bad[10] ^= 0xFF
+        chunk = b"".join(
+            [
+                encode_binary_frame(65534, sample),
+                encode_binary_frame(65535, sample),
+                bytes(bad),
+                encode_binary_frame(0, sample),
+                encode_binary_frame(3, sample),
+            ]
+        )
+
+        _, parsed = arduino_instance._ingest(chunk)
+        stats = arduino_instance.link_stats
+
+        assert parsed == 4
+        assert stats["frames_lost"] == 2
+        assert stats["frames_corrupt"] >= 1
+        assert len(arduino_instance.history) == 4
+
+    def test_sequence_restart_is_resync_not_loss(
+        self, arduino_instance: ArduinoSensorInstance
+    ) -> None:
+        """Verifies a restarted frame counter is not reported as loss.
+
+        Business context:
+        A firmware reboot starts the u16 sequence again at 0; counting
+        the backwards jump as ~65k lost frames would bury real drops.
+
+        Arrangement:
+        1. Frames 500, 501, then 0, 1 as after a reboot.
+        2. Frames 10, then 2000 after set_binary_output() re-arms the
+           stream.
+
+        Action:
+        Ingest each group.
+
+        Assertion Strategy:
+        Validates resynchronization by confirming:
+        - The backwards jump counts no lost frames.
+        - After set_binary_output() the next frame starts a fresh count.
+
+        Testing Principle:
+        Validates loss counters only reflect dropped data.
+        """
+        from telescope_mcp.drivers.sensors.arduino import encode_binary_frame
+
+        sample = [0.5, 0.0, 0.87, 30.0, 0.0, 40.0, 22.5, 55.0]
+        arduino_instance._ingest(
+            b"".join(encode_binary_frame(i, sample) for i in (500, 501, 0, 1))
+        )
+        assert arduino_instance.link_stats["frames_lost"] == 0
+
+        arduino_instance._ingest(encode_binary_frame(10, sample))
+        arduino_instance.set_binary_output(True)
+        arduino_instance._ingest(encode_binary_frame(2000, sample))
+
+        assert arduino_instance.link_stats["frames_lost"] == 8
+        assert arduino_instance.link_stats["frames_received"] == 6
+
+    def test_set_binary_output_sends_commands(self) -> None:
+        """Verifies mode selection commands and the driver opt-in.
+
+        Business context:
+        Binary output is opt-in; ASCII stays the default and fallback.
+
+        Arrangement:
+        1. Driver created with binary_output=True and a mock port.
+
+        Action:
+        Open the sensor, switch back to ASCII, then close and retry.
+
+        Assertion Strategy:
+        Validates mode commands by confirming:
+        - Opening sends BINARY; set_binary_output(False) sends ASCII.
+        - A closed sensor raises RuntimeError.
+        - link_stats reports ASCII before any frame arrives.
+
+        Testing Principle:
+        Validates the opt-in path end to end.
+        """
+        mock_serial = MockSerialPort()
+        driver = ArduinoSensorDriver(binary_output=True)
+
+        instance = driver._open_with_serial(mock_serial)
+        instance.set_binary_output(False)
+
+        assert mock_serial.get_written_commands() == ["BINARY", "ASCII"]
+        assert instance.link_stats["protocol"] == "ascii"
+        instance.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            instance.set_binary_output(True)
+
+    def test_reader_takes_available_bytes_in_binary_mode(self) -> None:
+        """Verifies the reader does not wait for newlines in frames.
+
+        Business context:
+        Binary frames rarely contain 0x0A, so read_until(b"\\n") would
+        return only on its timeout and deliver frames about once a
+        second.
+
+        Arrangement:
+        1. Port holding ten frames whose read_until() fails the test.
+        2. Binary mode entered by decoding a first frame.
+
+        Action:
+        Run the reader thread until all frames are in history.
+
+        Assertion Strategy:
+        Validates chunked reads by confirming:
+        - All frames arrive without read_until() being called.
+        - The first read blocks for one byte (nothing waiting yet).
+
+        Testing Principle:
+        Validates latency does not depend on payload bytes.
+        """
+        import time
+
+        from telescope_mcp.drivers.sensors.arduino import encode_binary_frame
+
+        sample = [0.5, 0.0, 0.87, 30.0, 0.0, 40.0, 22.5, 55.0]
+
+        class FramePort:
+            is_open = True
+
+            def __init__(self) -> None:
+                self.stream = bytearray()
+                self.sizes: list[int] = []
+
+            @property
+            def in_waiting(self) -> int:
+                return len(self.stream)
+
+            def read(self, size: int = 1) -> bytes:
+                self.sizes.append(size)
+                if not self.stream:
+                    time.sleep(0.01)  # pyserial timeout
+                    self.stream += b"".join(
+                        encode_binary_frame(i, sample) for i in range(1, 11)
+                    )
+                data = bytes(self.stream[:size])
+                del self.stream[:size]
+                return data
+
+            def read_until(self, expected: bytes = b"\n") -> bytes:
+                raise AssertionError("binary mode must not wait for newlines")
+
+            def write(self, data: bytes) -> int:
+                return len(data)
+
+            def reset_input_buffer(self) -> None:
+                self.stream.clear()
+
+            def close(self) -> None:
+                self.is_open = False
+
+        port = FramePort()
+        instance = ArduinoSensorInstance._create_with_serial(
+            port, "/dev/ttyTEST", start_reader=False
+        )
+        instance._ingest(encode_binary_frame(0, sample))
+        instance._start_reader()
+        try:
+            deadline = time.monotonic() + 2.0
+            while len(instance.history) < 11 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            instance.close()
+
+        assert len(instance.history) == 11
+        assert port.sizes[0] == 1
+        assert instance.link_stats["frames_lost"] == 0
+
+
+# =============================================================================
+# Orientation Fusion Tests
+# =============================================================================
+
+
+class TestOrientationFusion:
+    """Test suite for the fused orientation behind read().
+
+    Categories:
+    1. Smoothing - noisy stream yields a steady estimate (1 test)
+    2. Re-seeding - reset() discards the estimate (1 test)
+
+    Total: 2 tests.
+    """
+
+    def test_read_reports_fused_orientation(
+        self, arduino_instance: ArduinoSensorInstance
+    ) -> None:
+        """Verifies read() angles come from the filtered vectors.
+
+        Business context:
+        Position polling used to average readings per request for
+        seconds of lag; the reader thread now smooths every sample.
+
+        Arrangement:
+        1. Chunk of 60 lines with aX alternating 0.45/0.55 around 0.5.
+
+        Action:
+        Ingest the chunk in one batch, then read().
+
+        Assertion Strategy:
+        Validates fusion by confirming:
+        - accelerometer reports the latest raw sample.
+        - altitude is far closer to the noise-free value than the raw
+          altitude of that sample.
+
+        Testing Principle:
+        Validates smoothing needs no averaging by the caller.
+        """
+        lines = [
+            f"{0.5 + (0.05 if i % 2 else -0.05)}\t0.0\t0.87\t30.0\t0.0\t40.0\t20\t50"
+            for i in range(60)
+        ]
+        truth = arduino_instance._calculate_altitude({"aX": 0.5, "aY": 0.0, "aZ": 0.87})
+        raw = arduino_instance._calculate_altitude({"aX": 0.55, "aY": 0.0, "aZ": 0.87})
+
+        arduino_instance._ingest("\r\n".join(lines).encode() + b"\r\n")
+        reading = arduino_instance.read()
+
+        assert reading.accelerometer["aX"] == pytest.approx(0.55)
+        assert abs(reading.altitude - truth) < 0.2 * abs(raw - truth)
+
+    def test_reset_reseeds_fusion(
+        self, arduino_instance: ArduinoSensorInstance
+    ) -> None:
+        """Verifies a device reset drops the old estimate.
+
+        Business context:
+        After RESET or magnetometer calibration the vectors jump; gliding
+        from the old estimate would report stale pointing.
+
+        Arrangement:
+        1. Instance with one sample pointing at 30°.
+
+        Action:
+        reset(), then parse a level sample.
+
+        Assertion Strategy:
+        Validates re-seeding by confirming altitude is exactly the new
+        sample's altitude.
+
+        Testing Principle:
+        Validates reference changes take effect immediately.
+        """
+        arduino_instance._parse_line("0.5\t0.0\t0.87\t30.0\t0.0\t40.0\t20\t50")
+        arduino_instance.reset()
+        arduino_instance._parse_line("0.0\t0.0\t1.0\t30.0\t0.0\t40.0\t20\t50")
+
+        assert arduino_instance.read().altitude == pytest.approx(0.0)
+
+
+class TestMagnetometerEllipsoid:
+    """Test suite for the hard/soft-iron sweep and its use in azimuth.
+
+    Categories:
+    1. Correction - sweep through the reader path fixes azimuth (1 test)
+    2. Lifecycle - errors, kept calibration, firmware CALIBRATE (1 test)
+
+    Total: 2 tests.
+    """
+
+    def test_sweep_fit_corrects_azimuth(
+        self, arduino_instance: ArduinoSensorInstance
+    ) -> None:
+        """Verifies a sweep over streamed batches removes iron distortion.
+
+        Business context:
+        Soft iron on the mount skews headings by degrees in a pattern
+        that an azimuth offset cannot remove.
+
+        Arrangement:
+        1. 2000 field directions covering the sphere, distorted by a
+           soft-iron matrix and hard-iron offset.
+
+        Action:
+        start_magnetometer_sweep(), publish the samples as reader
+        batches, finish_magnetometer_sweep(); compute azimuth of a
+        distorted level field at 40° before and after.
+
+        Assertion Strategy:
+        Validates correction by confirming:
+        - Sample count and fitted hard iron match.
+        - Azimuth error drops from degrees to a fraction of a degree.
+
+        Testing Principle:
+        Validates the fit is applied in the per-read heading path.
+        """
+        rng = np.random.default_rng(3)
+        soft = np.array([[1.25, 0.15, 0.0], [0.15, 0.8, 0.0], [0.0, 0.0, 1.0]])
+        hard = np.array([12.0, -6.0, 9.0])
+        directions = rng.normal(size=(2000, 3))
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        values = np.zeros((2000, 8))
+        values[:, 2] = 1.0
+        values[:, 3:6] = (45.0 * directions) @ soft.T + hard
+        bearing = np.radians(40.0)
+        level = 45.0 * np.array([np.cos(bearing), np.sin(bearing), 0.0])
+        mx, my, mz = soft @ level + hard
+        distorted = {"mX": mx, "mY": my, "mZ": mz}
+        accel = {"aX": 0.0, "aY": 0.0, "aZ": 1.0}
+        before = arduino_instance._calculate_azimuth(distorted, accel)
+
+        arduino_instance.start_magnetometer_sweep()
+        for batch in np.array_split(values, 20):
+            arduino_instance._publish_batch(batch, "batch")
+        calibration = arduino_instance.finish_magnetometer_sweep()
+        after = arduino_instance._calculate_azimuth(distorted, accel)
+
+        assert calibration.samples == 2000
+        assert arduino_instance.magnetometer_calibration is calibration
+        np.testing.assert_allclose(calibration.hard_iron, hard, atol=1e-6)
+        assert abs(before - 40.0) > 3.0
+        assert after == pytest.approx(40.0, abs=0.1)
+
+    def test_sweep_errors_and_firmware_calibrate_clears(
+        self,
+        arduino_instance: ArduinoSensorInstance,
+        mock_serial: MockSerialPort,
+    ) -> None:
+        """Verifies failed fits keep the old calibration and CALIBRATE drops it.
+
+        Business context:
+        A short or one-altitude sweep must not replace a good fit; the
+        firmware's offsets change the raw frame the fit was made in.
+
+        Arrangement:
+        1. Instance with a calibration installed via
+           set_magnetometer_calibration().
+
+        Action:
+        Finish without a sweep; sweep one ring of samples and finish;
+        run calibrate_magnetometer().
+
+        Assertion Strategy:
+        Validates lifecycle by confirming:
+        - RuntimeError without a sweep, ValueError for the ring.
+        - Installed calibration kept after the failed fit.
+        - Cleared after firmware calibration.
+
+        Testing Principle:
+        Validates calibration state never silently degrades.
+        """
+        installed = MagnetometerCalibration(
+            soft_iron=np.eye(3),
+            hard_iron=np.zeros(3),
+            field_strength=45.0,
+            rms_residual=0.0,
+            samples=0,
+        )
+        arduino_instance.set_magnetometer_calibration(installed)
+        with pytest.raises(RuntimeError, match="No magnetometer sweep"):
+            arduino_instance.finish_magnetometer_sweep()
+
+        arduino_instance.start_magnetometer_sweep()
+        for degrees in range(0, 360, 2):
+            rad = np.radians(degrees)
+            arduino_instance._parse_line(
+                f"0.0\t0.0\t1.0\t{30 * np.cos(rad)}\t{30 * np.sin(rad)}\t40.0\t20\t50"
+            )
+        with pytest.raises(ValueError, match="plane"):
+            arduino_instance.finish_magnetometer_sweep()
+        assert arduino_instance.magnetometer_calibration is installed
+
+        mock_serial.queue_line("OK: CALIBRATE")
+        arduino_instance.calibrate_magnetometer()
+        assert arduino_instance.magnetometer_calibration is None
+
+
 # =============================================================================
 # Command Handling Tests
 # =============================================================================
@@ -1762,8 +2607,9 @@ class TestCommandHandling:
     Categories:
     1. Write Commands - RESET, STOP, START (3 tests)
     2. Response Handling - Wait for response, separators, errors (5 tests)
+    3. Sample Rate - RATE command and rate read back from firmware (2 tests)
 
-    Total: 8 tests.
+    Total: 10 tests.
     """
 
     def test_send_command_writes_to_serial(
@@ -2217,6 +3063,87 @@ class TestCommandHandling:
         finally:
             type(mock_serial).in_waiting = original_in_waiting
 
+    def test_set_sample_rate_sends_rate_command(self) -> None:
+        """Verifies set_sample_rate() and the driver option send RATE.
+
+        Business context:
+        The firmware rate is configurable; the driver must tell it and
+        then timestamp and space reads at the new rate.
+
+        Arrangement:
+        1. Driver created with sample_rate_hz=50 and a mock port.
+
+        Action:
+        Open the sensor, set 20 Hz, try out-of-range and closed cases.
+
+        Assertion Strategy:
+        Validates the command path by confirming:
+        - Opening sends RATE 50; set_sample_rate(20) sends RATE 20.
+        - get_sample_rate() follows each setting.
+        - 0 and 101 Hz raise ValueError without writing.
+        - A closed sensor raises RuntimeError.
+
+        Testing Principle:
+        Validates the opt-in rate setting end to end.
+        """
+        mock_serial = MockSerialPort()
+        driver = ArduinoSensorDriver(sample_rate_hz=50)
+
+        instance = driver._open_with_serial(mock_serial)
+        assert instance.get_sample_rate() == 50.0
+        instance.set_sample_rate(20)
+        for bad in (0, 101):
+            with pytest.raises(ValueError, match="1-100"):
+                instance.set_sample_rate(bad)
+
+        assert mock_serial.get_written_commands() == ["RATE 50", "RATE 20"]
+        assert instance.get_sample_rate() == 20.0
+        instance.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            instance.set_sample_rate(10)
+
+    def test_sample_rate_read_from_firmware_replies(
+        self,
+        arduino_instance: ArduinoSensorInstance,
+        mock_serial: MockSerialPort,
+    ) -> None:
+        """Verifies the reported firmware rate drives timing.
+
+        Business context:
+        The firmware keeps its rate across host reconnects, so the
+        driver must use the rate the firmware reports, not assume 10 Hz.
+
+        Arrangement:
+        1. Instance without reader thread; STATUS reply queued reporting
+           25 Hz.
+
+        Action:
+        get_status(); then ingest a RATE reply for 50 Hz followed by five
+        samples in one chunk.
+
+        Assertion Strategy:
+        Validates rate tracking by confirming:
+        - get_status() updates get_sample_rate() to 25 Hz.
+        - The RATE reply updates it to 50 Hz and is not a sample.
+        - Batched samples are spaced 20 ms apart (1 / 50 Hz).
+
+        Testing Principle:
+        Validates one source of truth for the stream rate.
+        """
+        for line in ("=== SENSOR STATUS ===", "Sample Rate: 25 Hz", "=== END ==="):
+            mock_serial.queue_line(line)
+        mock_serial._in_waiting = 100
+        arduino_instance.get_status()
+        assert arduino_instance.get_sample_rate() == 25.0
+
+        sample = b"0.0\t0.0\t1.0\t30.0\t0.0\t40.0\t20.0\t50.0\n"
+        _, parsed = arduino_instance._ingest(b"OK: Sample Rate: 50 Hz\n" + sample * 5)
+        times, _ = arduino_instance.history.latest()
+
+        assert parsed == 5
+        assert arduino_instance.get_sample_rate() == 50.0
+        assert np.diff(times) == pytest.approx([20_000_000] * 4, abs=1)
+
 
 # =============================================================================
 # Sensor Info and Status Tests
@@ -2350,21 +3277,21 @@ class TestSensorInfo:
         self,
         arduino_instance: ArduinoSensorInstance,
     ) -> None:
-        """Verifies get_sample_rate() returns fixed 10 Hz rate.
+        """Verifies get_sample_rate() starts at the 10 Hz power-up rate.
 
         Tests sample rate retrieval for Arduino BLE33 firmware.
 
         Business context:
-        Arduino BLE33 Sense firmware streams sensor data at a fixed
-        10 Hz rate. This value is used by the device layer to calculate
-        timing for multi-sample averaged reads and determine poll intervals.
-        The rate is firmware-determined, not configurable at runtime.
+        Arduino BLE33 Sense firmware streams sensor data at 10 Hz after
+        power-up. This value is used by the device layer to calculate
+        timing for multi-sample averaged reads and determine poll intervals
+        until the firmware reports another rate.
 
         Arrangement:
-        1. Use arduino_instance (any state is fine, rate is constant).
+        1. Use arduino_instance before any rate report.
 
         Action:
-        Call get_sample_rate() to retrieve the fixed sample rate.
+        Call get_sample_rate() to retrieve the default sample rate.
 
         Assertion Strategy:
         Validates sample rate by confirming:
@@ -3140,7 +4067,7 @@ class TestArduinoSensorDriver:
         captured_port = None
         original_init = ArduinoSensorInstance.__init__
 
-        def capturing_init(self, port, baudrate=115200):
+        def capturing_init(self, port, baudrate=115200, *, record_to=None):
             """Mock __init__ that captures port and raises to stop execution.
 
             Captures the port argument for verification and raises
@@ -3204,7 +4131,7 @@ class TestArduinoSensorDriver:
         captured_port = None
         original_init = ArduinoSensorInstance.__init__
 
-        def capturing_init(self, port, baudrate=115200):
+        def capturing_init(self, port, baudrate=115200, *, record_to=None):
             """Mock __init__ that captures port and raises to stop execution.
 
             Captures the port argument for verification and raises
@@ -4118,6 +5045,7 @@ class TestArduinoSensorInstanceInit:
         - _port matches provided port.
         - _reader_thread is not None (started).
         - Serial constructor called with correct args.
+        - STATUS sent so the reader learns the firmware's rate.
 
         Testing Principle:
         Validates successful path initializes all components correctly.
@@ -4151,6 +5079,8 @@ class TestArduinoSensorInstanceInit:
                 assert instance._is_open is True
                 assert instance._port == "/dev/ttyACM0"
                 assert instance._reader_thread is not None
+                # Firmware asked for its current rate
+                assert "STATUS" in mock_serial_port.get_written_commands()
 
                 # Clean up
                 instance.close()
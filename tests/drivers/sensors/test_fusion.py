@@ -0,0 +1,208 @@
+"""Tests for IMU orientation fusion.
+
+Tests the OrientationFilter smoothing/tracking behavior and the
+tilt-compensated heading helper.
+
+Example:
+    pdm run pytest tests/drivers/sensors/test_fusion.py -v
+
+Test Organization:
+- TestOrientationFilter: Noise reduction, slew tracking, re-seeding
+- TestTiltCompensatedHeading: Heading invariance under tube pitch
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from telescope_mcp.drivers.sensors.fusion import (
+    OrientationFilter,
+    tilt_compensated_heading,
+)
+
+_STEP_NS = 100_000_000  # 10 Hz
+
+
+def _times(count: int, start: int = 0) -> np.ndarray:
+    """Return count timestamps 100 ms apart."""
+    return start + _STEP_NS * np.arange(count, dtype=np.int64)
+
+
+class TestOrientationFilter:
+    """Tests for OrientationFilter.
+
+    Categories:
+    1. Smoothing - noise reduction on a stationary sensor
+    2. Tracking - constant-rate slews without steady-state lag
+    3. Lifecycle - first sample, gaps, reset(), validation
+
+    Total: 3 tests.
+    """
+
+    def test_reduces_noise_when_stationary(self) -> None:
+        """Verifies the estimate is much quieter than raw samples.
+
+        Arrangement:
+            600 samples of a fixed vector plus Gaussian noise.
+
+        Action:
+            Batch update, sampling estimate() after each of the last 300.
+
+        Assertion Strategy:
+            Estimate spread below half the raw noise; mean unbiased.
+
+        Testing Principle:
+            Consumers get low-noise vectors without averaging per read.
+        """
+        rng = np.random.default_rng(0)
+        truth = np.array([0.5, 0.0, 0.87, 30.0, 0.0, 40.0])
+        values = truth + rng.normal(0.0, [0.01] * 3 + [1.0] * 3, size=(600, 6))
+        times = _times(600)
+        fusion = OrientationFilter(time_constant_s=1.0)
+        fusion.update(values[:300], times[:300])
+
+        estimates = []
+        for i in range(300, 600):
+            fusion.update(values[i : i + 1], times[i : i + 1])
+            estimates.append(fusion.estimate())
+        spread = np.std(estimates, axis=0)
+
+        assert np.all(spread[:3] < 0.005)
+        assert np.all(spread[3:] < 0.5)
+        np.testing.assert_allclose(np.mean(estimates, axis=0), truth, atol=0.2)
+
+    def test_tracks_constant_slew_without_lag(self) -> None:
+        """Verifies a ramp is followed without moving-average lag.
+
+        Arrangement:
+            Channel aX ramping 0.01 per sample (0.1/s) for 20 s.
+
+        Action:
+            Batch update, then estimate().
+
+        Assertion Strategy:
+            Estimate within 1% of one step of the true value, whereas a
+            20-sample average would trail by ~10 steps.
+
+        Testing Principle:
+            The rate term removes steady-state lag during slews.
+        """
+        values = np.zeros((200, 8))
+        values[:, 0] = 0.01 * np.arange(200)
+        fusion = OrientationFilter(time_constant_s=1.0)
+
+        fusion.update(values, _times(200))
+        estimate = fusion.estimate()
+
+        assert estimate is not None
+        assert estimate.shape == (6,)
+        assert estimate[0] == pytest.approx(values[-1, 0], abs=1e-4)
+
+    def test_seeds_on_first_sample_gap_and_reset(self) -> None:
+        """Verifies re-seeding and argument validation.
+
+        Arrangement:
+            Filter with tau 1 s.
+
+        Action:
+            Estimate before data; one sample; a sample after a 10 s gap;
+            reset() then a sample; mismatched lengths; bad tau.
+
+        Assertion Strategy:
+            None before data; seeded samples returned exactly; errors.
+
+        Testing Principle:
+            Stale state never blends into a fresh stream.
+        """
+        fusion = OrientationFilter(time_constant_s=1.0)
+        assert fusion.estimate() is None
+        assert fusion.time_constant_s == pytest.approx(1.0)
+
+        fusion.update(np.full((1, 6), 1.0), np.array([0]))
+        fusion.update(np.full((1, 6), 5.0), np.array([10_000_000_000]))
+        assert fusion.estimate().tolist() == [5.0] * 6
+        assert fusion.last_ns == 10_000_000_000
+
+        fusion.reset()
+        assert fusion.estimate() is None
+        fusion.update(np.full((1, 6), 2.0), np.array([10_100_000_000]))
+        assert fusion.estimate().tolist() == [2.0] * 6
+
+        with pytest.raises(ValueError, match="same length"):
+            fusion.update(np.zeros((2, 6)), np.array([0]))
+        with pytest.raises(ValueError, match="positive"):
+            OrientationFilter(time_constant_s=0)
+
+
+class TestTiltCompensatedHeading:
+    """Tests for tilt_compensated_heading().
+
+    Total: 2 tests.
+    """
+
+    def test_matches_plain_heading_when_level(self) -> None:
+        """Verifies the level case reduces to atan2(mY, mX).
+
+        Arrangement:
+            Level sensor, horizontal field at several bearings.
+
+        Action:
+            tilt_compensated_heading().
+
+        Assertion Strategy:
+            Equal to the uncompensated heading; 0.0 for a vertical field.
+
+        Testing Principle:
+            Existing azimuth calibration stays valid for a level sensor.
+        """
+        for bearing in (0.0, 45.0, 135.0, 270.0):
+            rad = math.radians(bearing)
+            mx, my = 30.0 * math.cos(rad), 30.0 * math.sin(rad)
+
+            heading = tilt_compensated_heading(0.0, 0.0, 1.0, mx, my, -40.0)
+
+            assert heading == pytest.approx(bearing, abs=1e-9)
+        assert tilt_compensated_heading(0.0, 0.0, 1.0, 0.0, 0.0, -40.0) == 0.0
+
+    def test_heading_invariant_under_pitch(self) -> None:
+        """Verifies pitching the tube does not swing the heading.
+
+        Arrangement:
+            World field with a strong vertical component; sensor pitched
+            about its Y axis from 0 to 70 degrees at a fixed bearing.
+
+        Action:
+            Rotate gravity and field into the sensor frame, compute the
+            compensated and the plain atan2 heading.
+
+        Assertion Strategy:
+            Compensated heading constant; plain heading drifts.
+
+        Testing Principle:
+            Azimuth is independent of altitude on an alt-az mount.
+        """
+        bearing = math.radians(60.0)
+        # Level-frame field: horizontal 20 µT at the bearing, 45 µT down
+        level_field = np.array(
+            [20.0 * math.cos(bearing), 20.0 * math.sin(bearing), -45.0]
+        )
+        plain = []
+        for pitch_deg in (0.0, 30.0, 70.0):
+            p = math.radians(pitch_deg)
+            # Sensor-frame coordinates of level vectors after pitching by p
+            rot = np.array(
+                [
+                    [math.cos(p), 0.0, math.sin(p)],
+                    [0.0, 1.0, 0.0],
+                    [-math.sin(p), 0.0, math.cos(p)],
+                ]
+            )
+            ax, ay, az = rot @ np.array([0.0, 0.0, 1.0])
+            mx, my, mz = rot @ level_field
+
+            heading = tilt_compensated_heading(ax, ay, az, mx, my, mz)
+
+            assert heading == pytest.approx(60.0, abs=1e-6)
+            plain.append(math.degrees(math.atan2(my, mx)))
+        assert abs(plain[-1] - plain[0]) > 10.0
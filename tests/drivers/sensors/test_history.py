@@ -0,0 +1,278 @@
+"""Tests for the sensor sample history ring buffer.
+
+Tests SensorHistory storage, time-indexed queries, and windowed
+statistics, plus the wall-clock/monotonic conversion helpers.
+
+Example:
+    pdm run pytest tests/drivers/sensors/test_history.py -v
+
+Test Organization:
+- TestSensorHistory: Ring storage, range/interpolation/stats queries
+- TestClockConversion: monotonic_ns_at() and datetime_at()
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from telescope_mcp.drivers.sensors.history import (
+    HISTORY_CHANNELS,
+    SensorHistory,
+    datetime_at,
+    monotonic_ns_at,
+)
+
+
+def _filled(capacity: int, count: int) -> SensorHistory:
+    """Return a history with samples i*100 ns holding value i on all channels."""
+    history = SensorHistory(capacity=capacity)
+    for i in range(count):
+        history.append([float(i)] * len(HISTORY_CHANNELS), t_ns=i * 100)
+    return history
+
+
+class TestSensorHistory:
+    """Tests for SensorHistory.
+
+    Categories:
+    1. Storage - wraparound keeps newest samples in order
+    2. Queries - between(), at(), stats()
+    3. Validation - bad capacity, channel count, timestamps
+    4. Span - oldest/newest timestamps
+    5. Batch - extend()
+
+    Total: 7 tests.
+    """
+
+    def test_wraparound_keeps_newest_in_order(self) -> None:
+        """Verifies the ring overwrites oldest samples and stays ordered.
+
+        Arrangement:
+            Capacity-4 history fed 7 samples.
+
+        Action:
+            latest() with and without n; clear().
+
+        Assertion Strategy:
+            Length capped at capacity; newest samples returned oldest
+            first; results are copies unaffected by later appends.
+
+        Testing Principle:
+            Preallocated storage never grows and never reorders.
+        """
+        history = _filled(capacity=4, count=7)
+
+        times, values = history.latest()
+        last_two, _ = history.latest(2)
+        history.append([99.0] * 8, t_ns=700)
+
+        assert len(history) == 4
+        assert times.tolist() == [300, 400, 500, 600]
+        assert values[:, 0].tolist() == [3.0, 4.0, 5.0, 6.0]
+        assert last_two.tolist() == [500, 600]
+        history.clear()
+        assert len(history) == 0
+        assert history.latest()[0].size == 0
+
+    def test_between_is_inclusive(self) -> None:
+        """Verifies range queries include both endpoints.
+
+        Arrangement:
+            Ten samples at 100 ns spacing.
+
+        Action:
+            between() on an exact range, a gap, and a reversed range.
+
+        Assertion Strategy:
+            Endpoint samples included; gap returns empty arrays;
+            reversed range raises ValueError.
+
+        Testing Principle:
+            "Samples in [t0, t1]" means a closed interval.
+        """
+        history = _filled(capacity=16, count=10)
+
+        times, values = history.between(200, 500)
+        empty_times, empty_values = history.between(210, 290)
+
+        assert times.tolist() == [200, 300, 400, 500]
+        assert values.shape == (4, 8)
+        assert empty_times.size == 0
+        assert empty_values.shape == (0, 8)
+        with pytest.raises(ValueError, match="t1_ns"):
+            history.between(500, 200)
+
+    def test_at_interpolates_and_clamps(self) -> None:
+        """Verifies linear interpolation between neighbouring samples.
+
+        Arrangement:
+            Samples 0..4 at 100 ns spacing, wrapped in a capacity-4 ring.
+
+        Action:
+            at() between samples, on a sample, and outside the range.
+
+        Assertion Strategy:
+            Midpoint interpolated; outside instants clamp to the edge
+            sample; an empty history raises LookupError.
+
+        Testing Principle:
+            Frame tagging at an arbitrary instant needs no extrapolation.
+        """
+        history = _filled(capacity=4, count=5)
+
+        assert history.at(250)[0] == pytest.approx(2.5)
+        assert history.at(300)[0] == pytest.approx(3.0)
+        assert history.at(0)[0] == 1.0
+        assert history.at(10_000)[0] == 4.0
+        with pytest.raises(LookupError):
+            SensorHistory().at(0)
+
+    def test_stats_by_samples_and_window(self) -> None:
+        """Verifies windowed mean and variance.
+
+        Arrangement:
+            Samples 0..9 at 100 ns spacing.
+
+        Action:
+            stats() by sample count, by time window, and over everything.
+
+        Assertion Strategy:
+            Means/variances match numpy on the same values; window bounds
+            reported; empty window raises LookupError.
+
+        Testing Principle:
+            Windowed noise estimates come straight from the buffer.
+        """
+        history = _filled(capacity=16, count=10)
+
+        by_count = history.stats(samples=4)
+        by_window = history.stats(window_ns=200)
+        everything = history.stats()
+
+        assert by_count.count == 4
+        assert by_count.mean[0] == pytest.approx(7.5)
+        assert by_count.variance[0] == pytest.approx(np.var([6, 7, 8, 9]))
+        assert (by_window.start_ns, by_window.end_ns) == (700, 900)
+        assert by_window.mean[7] == pytest.approx(8.0)
+        assert everything.count == 10
+        with pytest.raises(LookupError):
+            history.stats(window_ns=50, end_ns=5_000)
+        with pytest.raises(ValueError, match="not both"):
+            history.stats(samples=2, window_ns=100)
+
+    def test_invalid_inputs_rejected(self) -> None:
+        """Verifies construction and append validation.
+
+        Arrangement:
+            None.
+
+        Action:
+            Tiny capacity, wrong channel count, out-of-order timestamp,
+            non-positive n and window.
+
+        Assertion Strategy:
+            ValueError for each.
+
+        Testing Principle:
+            Bad data never silently corrupts the time index.
+        """
+        history = _filled(capacity=4, count=2)
+
+        with pytest.raises(ValueError, match="capacity"):
+            SensorHistory(capacity=1)
+        with pytest.raises(ValueError, match="channel"):
+            history.append([1.0, 2.0])
+        with pytest.raises(ValueError, match="non-decreasing"):
+            history.append([0.0] * 8, t_ns=50)
+        with pytest.raises(ValueError, match="n must"):
+            history.latest(0)
+        with pytest.raises(ValueError, match="window_ns"):
+            history.stats(window_ns=0)
+
+    def test_oldest_and_newest_timestamps(self) -> None:
+        """Verifies oldest_ns/newest_ns track the buffered span.
+
+        Arrangement:
+            Empty history, then one that has wrapped.
+
+        Action:
+            Read oldest_ns and newest_ns.
+
+        Assertion Strategy:
+            None when empty; oldest surviving and newest sample otherwise.
+
+        Testing Principle:
+            Callers can tell how much of a time window is already buffered.
+        """
+        empty = SensorHistory(capacity=4)
+        history = _filled(capacity=4, count=6)
+
+        assert empty.oldest_ns is None
+        assert empty.newest_ns is None
+        assert history.oldest_ns == 200
+        assert history.newest_ns == 500
+
+    def test_extend_records_batch(self) -> None:
+        """Verifies extend() matches repeated append() across wraparound.
+
+        Arrangement:
+            History of capacity 4 holding 3 samples.
+
+        Action:
+            extend() with 3 more, then with a batch larger than capacity.
+
+        Assertion Strategy:
+            Newest samples kept in order; oversize batch keeps its tail;
+            backwards timestamps and bad shapes raise ValueError.
+
+        Testing Principle:
+            Batch publishing is equivalent to per-sample appends.
+        """
+        history = _filled(capacity=4, count=3)
+        batch = np.repeat(np.arange(3.0, 6.0)[:, None], len(HISTORY_CHANNELS), 1)
+
+        history.extend(batch, np.array([300, 400, 500]))
+        times, values = history.latest()
+
+        assert times.tolist() == [200, 300, 400, 500]
+        assert values[:, 0].tolist() == [2.0, 3.0, 4.0, 5.0]
+
+        big = np.repeat(np.arange(6.0, 12.0)[:, None], len(HISTORY_CHANNELS), 1)
+        history.extend(big, np.arange(600, 1200, 100))
+
+        assert history.latest()[0].tolist() == [800, 900, 1000, 1100]
+        with pytest.raises(ValueError, match="non-decreasing"):
+            history.extend(batch[:1], np.array([0]))
+        with pytest.raises(ValueError, match="shape"):
+            history.extend(np.zeros((2, 3)), np.array([2000, 2001]))
+
+
+class TestClockConversion:
+    """Tests for wall-clock/monotonic conversion helpers.
+
+    Total: 1 test.
+    """
+
+    def test_round_trip_and_naive_utc(self) -> None:
+        """Verifies datetimes map to monotonic ns and back.
+
+        Arrangement:
+            A UTC instant one second ago and its naive equivalent.
+
+        Action:
+            monotonic_ns_at() then datetime_at().
+
+        Assertion Strategy:
+            Round trip within 1 ms; naive treated as UTC.
+
+        Testing Principle:
+            Frame timestamps and sensor samples share one timeline.
+        """
+        when = datetime.now(UTC) - timedelta(seconds=1)
+
+        t_ns = monotonic_ns_at(when)
+        naive_ns = monotonic_ns_at(when.replace(tzinfo=None))
+
+        assert abs(datetime_at(t_ns) - when) < timedelta(milliseconds=1)
+        assert abs(naive_ns - t_ns) < 1_000_000
@@ -0,0 +1,233 @@
+"""Tests for magnetometer ellipsoid calibration.
+
+Tests fit_ellipsoid() recovery of hard/soft-iron distortion, its input
+validation, and MagnetometerSweep accumulation.
+
+Example:
+    pdm run pytest tests/drivers/sensors/test_magnetometer.py -v
+
+Test Organization:
+- TestFitEllipsoid: Distortion recovery, rejected inputs
+- TestMagnetometerSweep: Batch accumulation and sample cap
+"""
+
+import numpy as np
+import pytest
+
+from telescope_mcp.drivers.sensors.magnetometer import (
+    MagnetometerSweep,
+    fit_ellipsoid,
+)
+
+_SOFT_IRON = np.array([[1.2, 0.1, 0.0], [0.1, 0.9, 0.05], [0.0, 0.05, 1.05]])
+_HARD_IRON = np.array([12.0, -7.0, 20.0])
+
+
+def _distorted_field(count: int, noise: float = 0.0, seed: int = 0) -> np.ndarray:
+    """Return count 48 µT field vectors over the sphere, distorted."""
+    rng = np.random.default_rng(seed)
+    directions = rng.normal(size=(count, 3))
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    field = (48.0 * directions) @ _SOFT_IRON.T + _HARD_IRON
+    return field + rng.normal(0.0, noise, size=field.shape)
+
+
+def _altitude_sweep(altitudes: tuple[float, ...], noise: float) -> np.ndarray:
+    """Return distorted 48 µT field vectors for azimuth turns at altitudes.
+
+    The field dips 60° below north; each altitude contributes one ring of
+    samples 2° apart in azimuth, as a mount slewing in azimuth produces.
+    """
+    rng = np.random.default_rng(3)
+    dip = np.radians(60.0)
+    field = 48.0 * np.array([np.cos(dip), 0.0, np.sin(dip)])
+    vectors = []
+    for altitude in np.radians(altitudes):
+        tilt = np.array(
+            [
+                [np.cos(altitude), 0.0, np.sin(altitude)],
+                [0.0, 1.0, 0.0],
+                [-np.sin(altitude), 0.0, np.cos(altitude)],
+            ]
+        )
+        for azimuth in np.radians(np.arange(0.0, 360.0, 2.0)):
+            c, s = np.cos(azimuth), np.sin(azimuth)
+            turn = np.array([[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]])
+            vectors.append(tilt @ turn @ field)
+    distorted = np.array(vectors) @ _SOFT_IRON.T + _HARD_IRON
+    return distorted + rng.normal(0.0, noise, size=distorted.shape)
+
+
+class TestFitEllipsoid:
+    """Tests for fit_ellipsoid().
+
+    Categories:
+    1. Recovery - exact and noisy distorted spheres
+    2. Validation - shape, sample count, planar and degenerate samples,
+       two-altitude sweeps
+
+    Total: 4 tests.
+    """
+
+    def test_recovers_exact_distortion(self) -> None:
+        """Verifies noise-free samples are mapped exactly onto a sphere.
+
+        Arrangement:
+            3000 distorted field vectors without noise.
+
+        Action:
+            fit_ellipsoid(), then apply() to the samples and to one vector.
+
+        Assertion Strategy:
+            Hard iron exact; soft iron symmetric; corrected magnitudes all
+            equal field_strength; single-vector apply matches batch.
+
+        Testing Principle:
+            The linear solve is exact when the model holds.
+        """
+        samples = _distorted_field(3000)
+
+        calibration = fit_ellipsoid(samples)
+        corrected = calibration.apply(samples)
+
+        np.testing.assert_allclose(calibration.hard_iron, _HARD_IRON, atol=1e-8)
+        np.testing.assert_allclose(calibration.soft_iron, calibration.soft_iron.T)
+        np.testing.assert_allclose(
+            np.linalg.norm(corrected, axis=1), calibration.field_strength
+        )
+        np.testing.assert_allclose(calibration.apply(samples[0]), corrected[0])
+        assert calibration.rms_residual < 1e-8
+        assert calibration.samples == 3000
+        assert calibration.to_dict()["hard_iron"] == calibration.hard_iron.tolist()
+
+    def test_noisy_samples_reduce_magnitude_spread(self) -> None:
+        """Verifies the fit removes distortion down to the noise level.
+
+        Arrangement:
+            3000 distorted vectors with 0.5 µT noise per axis.
+
+        Action:
+            fit_ellipsoid() and apply().
+
+        Assertion Strategy:
+            Hard iron within 0.2 µT; corrected magnitude spread near the
+            noise and far below the raw spread; rms_residual reports it.
+
+        Testing Principle:
+            Thousands of samples average out sensor noise.
+        """
+        samples = _distorted_field(3000, noise=0.5, seed=1)
+
+        calibration = fit_ellipsoid(samples)
+        corrected = np.linalg.norm(calibration.apply(samples), axis=1)
+        raw = np.linalg.norm(samples - samples.mean(axis=0), axis=1)
+
+        np.testing.assert_allclose(calibration.hard_iron, _HARD_IRON, atol=0.2)
+        assert np.std(corrected) < 0.7
+        assert np.std(raw) > 5 * np.std(corrected)
+        assert calibration.rms_residual == pytest.approx(np.std(corrected), rel=0.1)
+
+    def test_rejects_unusable_samples(self) -> None:
+        """Verifies inputs that cannot define an ellipsoid raise ValueError.
+
+        Arrangement:
+            Wrong shape, too few samples, one azimuth ring, and a
+            hyperboloid.
+
+        Action:
+            fit_ellipsoid() on each.
+
+        Assertion Strategy:
+            ValueError with a message naming the problem.
+
+        Testing Principle:
+            A bad sweep never yields a silently wrong calibration.
+        """
+        angles = np.linspace(0.0, 2 * np.pi, 400)
+        ring = np.column_stack(
+            (30 * np.cos(angles), 30 * np.sin(angles), np.full(400, 40.0))
+        )
+        rng = np.random.default_rng(2)
+        height = rng.uniform(-1.5, 1.5, size=500)
+        angle = rng.uniform(0.0, 2 * np.pi, size=500)
+        # Hyperboloid of one sheet: x² + y² - z² = 1
+        hyperboloid = np.column_stack(
+            (
+                np.cosh(height) * np.cos(angle),
+                np.cosh(height) * np.sin(angle),
+                np.sinh(height),
+            )
+        )
+
+        with pytest.raises(ValueError, match="shape"):
+            fit_ellipsoid(np.zeros((200, 2)))
+        with pytest.raises(ValueError, match="at least"):
+            fit_ellipsoid(_distorted_field(50))
+        with pytest.raises(ValueError, match="plane"):
+            fit_ellipsoid(ring)
+        with pytest.raises(ValueError, match="ellipsoid"):
+            fit_ellipsoid(30.0 * hyperboloid)
+
+    def test_rejects_two_altitude_sweep(self) -> None:
+        """Verifies a sweep at only two altitudes is refused.
+
+        Arrangement:
+            Azimuth turns with 0.3 µT noise at 10° and 60°, and at 10°,
+            35° and 60°.
+
+        Action:
+            fit_ellipsoid() on both sweeps.
+
+        Assertion Strategy:
+            Two rings raise ValueError asking for three altitudes (the
+            unconstrained fit would look fine by its residual but miss
+            the hard iron by ~20 µT); three rings recover the hard iron
+            within 1.5 µT.
+
+        Testing Principle:
+            A sweep that cannot determine the ellipsoid fails loudly.
+        """
+        with pytest.raises(ValueError, match="three or more altitudes"):
+            fit_ellipsoid(_altitude_sweep((10.0, 60.0), noise=0.3))
+
+        calibration = fit_ellipsoid(_altitude_sweep((10.0, 35.0, 60.0), noise=0.3))
+
+        np.testing.assert_allclose(calibration.hard_iron, _HARD_IRON, atol=1.5)
+
+
+class TestMagnetometerSweep:
+    """Tests for MagnetometerSweep.
+
+    Total: 1 test.
+    """
+
+    def test_accumulates_batches_up_to_cap(self) -> None:
+        """Verifies batches concatenate in order and stop at the cap.
+
+        Arrangement:
+            Sweep capped at 150 samples.
+
+        Action:
+            add() one vector, a 100-row batch, then another 100-row batch;
+            fit().
+
+        Assertion Strategy:
+            Empty sweep yields (0, 3); length capped at 150; samples keep
+            arrival order; fit runs on the stored samples.
+
+        Testing Principle:
+            Long-running sweeps have bounded memory.
+        """
+        sweep = MagnetometerSweep(max_samples=150)
+        assert sweep.samples().shape == (0, 3)
+        field = _distorted_field(201)
+
+        sweep.add(field[0])
+        sweep.add(field[1:101])
+        sweep.add(field[101:])
+
+        assert len(sweep) == 150
+        np.testing.assert_array_equal(sweep.samples(), field[:150])
+        assert sweep.fit().samples == 150
+        sweep.add(field[:10])
+        assert len(sweep) == 150
@@ -21,6 +21,9 @@ Example:
 
 from __future__ import annotations
 
+import math
+import statistics
+
 import pytest
 
 from telescope_mcp.drivers.sensors.twin import (
@@ -700,6 +703,64 @@ class TestDigitalTwinSensorInstance:
         assert "offset_y" in result
         assert "offset_z" in result
 
+    def test_magnetometer_sweep_removes_simulated_iron(self) -> None:
+        """Verifies the ellipsoid sweep recovers configured distortion.
+
+        Tests the twin's sweep mirrors the Arduino calibration workflow.
+
+        Business context:
+        Calibration tooling is developed against the twin, so its field
+        must carry hard/soft-iron distortion that a sweep can remove.
+
+        Arrangement:
+        1. Zero-noise position, hard iron (15, -8, 6) µT and a skewed
+           soft-iron matrix in the config.
+
+        Action:
+        Sweep azimuth in 2° steps at four altitudes with read() at each,
+        finish the sweep, then read around a full turn at 30°.
+
+        Assertion Strategy:
+        Validates the fit by confirming:
+        - Fitted hard iron within 1.5 µT of the configured offset.
+        - Field magnitude varies far less after calibration.
+        - reset() clears the calibration.
+
+        Testing Principle:
+        Validates twin parity with hardware calibration.
+        """
+        config = DigitalTwinSensorConfig(
+            noise_std_alt=0.0,
+            noise_std_az=0.0,
+            mag_hard_iron=(15.0, -8.0, 6.0),
+            mag_soft_iron=((1.2, 0.1, 0.0), (0.1, 0.85, 0.0), (0.0, 0.0, 1.0)),
+        )
+        instance = DigitalTwinSensorInstance(config)
+
+        def magnitudes() -> list[float]:
+            values = []
+            for azimuth in range(0, 360, 10):
+                instance.set_position(30.0, azimuth)
+                mag = instance.read().magnetometer
+                values.append(math.hypot(mag["mX"], mag["mY"], mag["mZ"]))
+            return values
+
+        raw_spread = statistics.pstdev(magnitudes())
+        instance.start_magnetometer_sweep()
+        for altitude in (0.0, 30.0, 60.0, 90.0):
+            for azimuth in range(0, 360, 2):
+                instance.set_position(altitude, azimuth)
+                instance.read()
+        calibration = instance.finish_magnetometer_sweep()
+
+        assert calibration.samples == 720
+        assert calibration.hard_iron.tolist() == pytest.approx(
+            [15.0, -8.0, 6.0], abs=1.5
+        )
+        assert statistics.pstdev(magnitudes()) < 0.4 * raw_spread
+        instance.reset()
+        assert instance.magnetometer_calibration is None
+
     def test_stop_output_is_noop(self, instance: DigitalTwinSensorInstance) -> None:
         """Verifies stop_output() executes without error (no-op).
 
@@ -1,26 +1,32 @@
 """Tests for sensor type definitions and validation functions.
 
 This module tests the shared types and validation helpers in types.py.
-Tests focus on the validate_position() function and SensorReading dataclass.
+Tests focus on the validate_position() function, SensorReading and
+SensorReadingBatch.
 
 Example:
     pdm run pytest tests/drivers/sensors/test_types.py -v
 
 Test Organization:
 - TestValidatePosition: Tests for validate_position() helper
-- TestSensorReading: Tests for SensorReading dataclass
+- TestSensorReading: Tests for SensorReading construction and lazy views
+- TestSensorReadingBatch: Tests for array-backed batches and averaging
 
 Coverage target: 100% for validate_position() function.
 """
 
-from datetime import UTC, datetime
+import time
+from datetime import UTC, datetime, timedelta
 
+import numpy as np
 import pytest
 
 from telescope_mcp.drivers.sensors.types import (
+    READING_COLUMNS,
     AccelerometerData,
     MagnetometerData,
     SensorReading,
+    SensorReadingBatch,
     validate_position,
 )
 
@@ -239,7 +245,7 @@ class TestValidatePosition:
 
 
 class TestSensorReading:
-    """Tests for SensorReading dataclass.
+    """Tests for SensorReading.
 
     Business context: SensorReading is the core data contract
     between sensor drivers and consumers.
@@ -326,3 +332,209 @@ class TestSensorReading:
         )
 
         assert reading.raw_values == ""
+
+    def test_from_values_builds_views_lazily(self) -> None:
+        """Verifies the compact constructor and its compatibility views.
+
+        Tests the allocation-light path drivers use per sample.
+
+        Business context:
+        Consumers that only read angles should not pay for dicts, a
+        datetime, or a formatted string on every sample.
+
+        Arrangement:
+        1. Eight channel values as a numpy row and a monotonic time.
+
+        Action:
+        SensorReading.from_values(), then access every view.
+
+        Assertion Strategy:
+        Validates compact storage by confirming:
+        - No __dict__ (slotted); floats, not numpy scalars.
+        - Dict views, channels(), t_ns and a UTC timestamp near now.
+        - raw_values formatted in the Arduino tab layout.
+        - Equal to a reading built with the keyword constructor.
+
+        Testing Principle:
+        Validates the fast path is a drop-in SensorReading.
+        """
+        row = np.array([0.0, 0.0, 1.0, 30.0, 0.0, 40.0, 22.5, 55.0])
+        t_ns = time.monotonic_ns()
+
+        reading = SensorReading.from_values(row, 45.0, 180.0, t_ns)
+
+        assert not hasattr(reading, "__dict__")
+        assert type(reading.temperature) is float
+        assert reading.accelerometer == {"aX": 0.0, "aY": 0.0, "aZ": 1.0}
+        assert reading.magnetometer == {"mX": 30.0, "mY": 0.0, "mZ": 40.0}
+        assert reading.channels() == tuple(row.tolist())
+        assert reading.t_ns == t_ns
+        assert abs((datetime.now(UTC) - reading.timestamp).total_seconds()) < 1.0
+        assert reading.timestamp is reading.timestamp  # converted once
+        assert reading.raw_values.split("\t") == [
+            "0.00",
+            "0.00",
+            "1.00",
+            "30.00",
+            "0.00",
+            "40.00",
+            "22.50",
+            "55.00",
+        ]
+        legacy = SensorReading(
+            accelerometer=reading.accelerometer,
+            magnetometer=reading.magnetometer,
+            altitude=45.0,
+            azimuth=180.0,
+            temperature=22.5,
+            humidity=55.0,
+            timestamp=reading.timestamp,
+            raw_values=reading.raw_values,
+        )
+        assert legacy == reading
+        assert abs(legacy.t_ns - t_ns) < 10_000_000
+        with pytest.raises(ValueError, match="8 channel values"):
+            SensorReading.from_values(row[:6], 45.0, 180.0, t_ns)
+
+
+class TestSensorReadingBatch:
+    """Tests for SensorReadingBatch.
+
+    Business context: Averaging and recording many samples should cost
+    one array row per sample, not a reading object with dicts.
+
+    Categories:
+    1. Packing - from_readings, indexing, column views, validation
+    2. Averaging - vectorized mean with circular azimuth, timestamps
+
+    Total: 3 tests.
+    """
+
+    def test_packs_and_indexes_readings(self) -> None:
+        """Verifies readings round-trip through the array.
+
+        Arrangement:
+        1. Three readings from from_values() with distinct values.
+
+        Action:
+        from_readings(), then index, iterate and read column views.
+
+        Assertion Strategy:
+        Validates packing by confirming:
+        - values shape (3, 10) in READING_COLUMNS order; t_ns kept.
+        - Indexed readings equal the originals' values and angles.
+        - Bad shapes raise ValueError.
+
+        Testing Principle:
+        Validates the batch is a lossless container.
+        """
+        readings = [
+            SensorReading.from_values(
+                [0.1 * i, 0.0, 1.0, 30.0, 0.0, 40.0, 20.0 + i, 50.0],
+                10.0 * i,
+                100.0 + i,
+                1_000 + i,
+            )
+            for i in range(3)
+        ]
+
+        batch = SensorReadingBatch.from_readings(readings)
+
+        assert batch.values.shape == (3, len(READING_COLUMNS))
+        assert batch.t_ns.tolist() == [1_000, 1_001, 1_002]
+        assert batch.altitude.tolist() == [0.0, 10.0, 20.0]
+        assert batch.azimuth.tolist() == [100.0, 101.0, 102.0]
+        assert len(batch) == 3
+        last = batch[-1]
+        assert last.channels() == readings[-1].channels()
+        assert (last.altitude, last.azimuth, last.t_ns) == (20.0, 102.0, 1_002)
+        assert [r.temperature for r in batch] == [20.0, 21.0, 22.0]
+        with pytest.raises(ValueError, match="shape"):
+            SensorReadingBatch(np.zeros((3, 8)), np.zeros(3))
+        with pytest.raises(ValueError, match="same length"):
+            SensorReadingBatch(np.zeros((3, 10)), np.zeros(2))
+
+    def test_mean_uses_circular_azimuth(self) -> None:
+        """Verifies mean() averages columns and wraps azimuth correctly.
+
+        Arrangement:
+        1. Batch of two readings at azimuth 350° and 10°, altitude 40°
+           and 50°.
+
+        Action:
+        mean(); mean() of an empty batch.
+
+        Assertion Strategy:
+        Validates averaging by confirming:
+        - Azimuth ~0°, not 180°; altitude and channels averaged.
+        - Stamped with the last t_ns; default raw_values description.
+        - ValueError when empty.
+
+        Testing Principle:
+        Validates vectorized averaging matches the scalar rules.
+        """
+        values = np.zeros((2, len(READING_COLUMNS)))
+        values[:, 2] = [0.9, 1.1]
+        values[:, 8] = [40.0, 50.0]
+        values[:, 9] = [350.0, 10.0]
+        batch = SensorReadingBatch(values, np.array([5, 9]))
+
+        averaged = batch.mean()
+
+        assert min(averaged.azimuth, 360.0 - averaged.azimuth) < 1e-9
+        assert averaged.altitude == pytest.approx(45.0)
+        assert averaged.accelerometer["aZ"] == pytest.approx(1.0)
+        assert averaged.t_ns == 9
+        assert averaged.raw_values == "averaged_2_samples"
+        with pytest.raises(ValueError, match="No readings"):
+            SensorReadingBatch(np.zeros((0, 10)), np.zeros(0)).mean()
+
+    def test_mean_keeps_last_original_timestamp(self, monkeypatch) -> None:
+        """Verifies mean() reports the newest reading's own timestamp.
+
+        Business context:
+        Readings built with a wall-clock timestamp (digital twin, live
+        reads) must not come back from averaging with a time re-derived
+        through the monotonic clock, which drifts from the original.
+
+        Arrangement:
+        1. Two readings constructed with explicit datetimes.
+        2. Wall clock stepped by an hour (as by NTP) after packing.
+        3. A raw batch with no source readings.
+
+        Action:
+        from_readings(...).mean(); mean() of the raw batch.
+
+        Assertion Strategy:
+        Validates stamping by confirming:
+        - The average carries the last reading's datetime unchanged.
+        - Without source readings the time is derived from t_ns.
+
+        Testing Principle:
+        Validates averaging preserves provenance.
+        """
+        accel = {"aX": 0.0, "aY": 0.0, "aZ": 1.0}
+        mag = {"mX": 30.0, "mY": 0.0, "mZ": 40.0}
+        stamps = [
+            datetime(2026, 3, 1, 22, 0, 0, tzinfo=UTC),
+            datetime(2026, 3, 1, 22, 0, 1, 123456, tzinfo=UTC),
+        ]
+        readings = [
+            SensorReading(accel, mag, 45.0, 180.0, 20.0, 50.0, stamp)
+            for stamp in stamps
+        ]
+
+        batch = SensorReadingBatch.from_readings(readings)
+        step_ns = 3600 * 1_000_000_000
+        stepped = time.time_ns() + step_ns
+        monkeypatch.setattr(
+            "telescope_mcp.drivers.sensors.history.time.time_ns",
+            lambda: stepped,
+        )
+        averaged = batch.mean()
+        raw = SensorReadingBatch(np.zeros((1, 10)), np.array([time.monotonic_ns()]))
+
+        assert averaged.timestamp == stamps[-1]
+        assert averaged.t_ns == batch.t_ns[-1]
+        expected = datetime.fromtimestamp(stepped / 1e9, UTC)
+        assert abs(raw.mean().timestamp - expected) < timedelta(seconds=5)
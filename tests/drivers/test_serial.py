@@ -0,0 +1,450 @@
+"""Tests for serial record and replay ports.
+
+Covers telescope_mcp.drivers.serial:
+- RecordingSerialPort: delegation, record format, truncated files,
+  unique file per open, periodic flush, close on port errors
+- ReplaySerialPort: pacing by speed, as-fast-as-possible, timeouts,
+  replay into ArduinoSensorInstance and SerialMotorController
+
+Example:
+    pdm run pytest tests/drivers/test_serial.py -v
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from telescope_mcp.drivers.motors import MotorType, SerialMotorController
+from telescope_mcp.drivers.sensors.arduino import ArduinoSensorInstance
+from telescope_mcp.drivers.serial import (
+    RECORDING_MAGIC,
+    RecordingSerialPort,
+    ReplaySerialPort,
+    SerialPort,
+    SerialRecord,
+    read_serial_recording,
+)
+
+_LINE = b"0.5\t0.0\t0.87\t30.0\t0.0\t40.0\t22.5\t55.0\n"
+
+
+class _ScriptedPort:
+    """Byte-stream port that appends one scripted reply per write."""
+
+    def __init__(self, stream: bytes = b"", replies: list[bytes] | None = None):
+        self.is_open = True
+        self._stream = bytearray(stream)
+        self._replies = list(replies or [])
+        self.written: list[bytes] = []
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._stream)
+
+    def _take(self, end: int) -> bytes:
+        data = bytes(self._stream[:end])
+        del self._stream[:end]
+        return data
+
+    def read_until(self, expected: bytes = b"\n", size: int | None = None) -> bytes:
+        found = self._stream.find(expected)
+        end = len(self._stream) if found < 0 else found + len(expected)
+        return self._take(end if size is None else min(end, size))
+
+    def read(self, size: int = 1) -> bytes:
+        return self._take(size)
+
+    def readline(self) -> bytes:
+        return self.read_until(b"\n")
+
+    def write(self, data: bytes) -> int:
+        self.written.append(bytes(data))
+        if self._replies:
+            self._stream += self._replies.pop(0)
+        return len(data)
+
+    def reset_input_buffer(self) -> None:
+        self._stream.clear()
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+class TestRecordingSerialPort:
+    """Tests for RecordingSerialPort and read_serial_recording().
+
+    Categories:
+    1. Capture - reads/writes recorded in order with timestamps
+    2. Format - truncated tail, bad magic
+    3. Integration - record_to on SerialMotorController
+    4. Durability - no overwrite on reopen, periodic flush, close on
+       port errors
+
+    Total: 5 tests.
+    """
+
+    def test_records_reads_and_writes_in_order(self, tmp_path: Path) -> None:
+        """Verifies every byte the driver saw is captured with its time.
+
+        Arrangement:
+            Recorder around a scripted port holding two lines.
+
+        Action:
+            write, read_until, read, readline on an empty stream, close.
+
+        Assertion Strategy:
+            Calls delegate unchanged; empty reads are not recorded;
+            records load back in order with non-decreasing timestamps;
+            close() closes the port and is idempotent.
+
+        Testing Principle:
+            A capture is a faithful transcript of one session.
+        """
+        port = _ScriptedPort(_LINE * 2)
+        path = tmp_path / "imu.tmcpser"
+        recorder = RecordingSerialPort(port, path)
+        assert isinstance(recorder, SerialPort)
+
+        assert recorder.write(b"STATUS\n") == 7
+        assert recorder.read_until(b"\n") == _LINE
+        assert recorder.in_waiting == len(_LINE)
+        assert recorder.read(recorder.in_waiting) == _LINE
+        assert recorder.readline() == b""
+        recorder.close()
+        recorder.close()
+
+        records = read_serial_recording(path)
+        assert [(r.direction, r.data) for r in records] == [
+            ("W", b"STATUS\n"),
+            ("R", _LINE),
+            ("R", _LINE),
+        ]
+        assert records[0].t_ns <= records[1].t_ns <= records[2].t_ns
+        assert recorder.records == 3 and not recorder.is_open
+        assert path.stat().st_size == len(RECORDING_MAGIC) + 3 * 13 + 7 + 2 * len(_LINE)
+
+    def test_truncated_tail_ignored_and_bad_magic_rejected(
+        self, tmp_path: Path
+    ) -> None:
+        """Verifies loading a capture cut short by a crash.
+
+        Arrangement:
+            Two-record capture with its last 5 bytes removed; a file
+            without the magic.
+
+        Action:
+            read_serial_recording() on both.
+
+        Assertion Strategy:
+            First record survives; the other file raises ValueError.
+
+        Testing Principle:
+            Field captures stay usable up to the moment of failure.
+        """
+        path = tmp_path / "cut.tmcpser"
+        recorder = RecordingSerialPort(_ScriptedPort(_LINE), path)
+        recorder.write(b"A0")
+        recorder.read_until()
+        recorder.close()
+        path.write_bytes(path.read_bytes()[:-5])
+        other = tmp_path / "other.bin"
+        other.write_bytes(b"not a recording")
+
+        records = read_serial_recording(path)
+        assert [(r.direction, r.data) for r in records] == [("W", b"A0")]
+        with pytest.raises(ValueError, match="not a serial recording"):
+            read_serial_recording(other)
+
+    def test_motor_controller_record_to(self, tmp_path: Path) -> None:
+        """Verifies record_to wraps the port opened by the constructor.
+
+        Arrangement:
+            pyserial patched to return a scripted port with axis and
+            move-complete replies.
+
+        Action:
+            SerialMotorController(..., record_to=path).move(); close.
+
+        Assertion Strategy:
+            Recording holds the axis select and move commands and both
+            replies.
+
+        Testing Principle:
+            Production sessions can be captured with one argument.
+        """
+        port = _ScriptedPort(replies=[b"{'axis': 0}", b"{'alldone': 1}\r\n"])
+        serial_module = MagicMock()
+        serial_module.Serial.return_value = port
+        path = tmp_path / "motor.tmcpser"
+
+        with patch.dict(sys.modules, {"serial": serial_module}):
+            controller = SerialMotorController("/dev/ttyTEST", record_to=path)
+        controller.move(MotorType.ALTITUDE, 1000)
+        controller.close()
+
+        records = read_serial_recording(path)
+        assert [r.direction for r in records] == ["W", "R", "W", "R"]
+        assert [r.data for r in records if r.direction == "W"] == port.written
+        assert records[-1].data == b"{'alldone': 1}\r\n"
+
+    def test_reopen_never_overwrites_and_flushes_periodically(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verifies a reconnect starts a new file and data reaches disk.
+
+        Arrangement:
+            Flush interval patched to zero; a first recorder holding one
+            write at imu.tmcpser.
+
+        Action:
+            Open two more recorders on the same path; inspect the file
+            before closing.
+
+        Assertion Strategy:
+            Later recorders write imu-1 and imu-2 siblings; the first
+            capture is untouched; its record is on disk before close().
+
+        Testing Principle:
+            A driver reconnect or crash does not lose earlier traffic.
+        """
+        monkeypatch.setattr(
+            "telescope_mcp.drivers.serial._RECORDING_FLUSH_INTERVAL_NS", 0
+        )
+        path = tmp_path / "imu.tmcpser"
+        first = RecordingSerialPort(_ScriptedPort(), path)
+        first.write(b"STATUS\n")
+
+        assert path.stat().st_size == len(RECORDING_MAGIC) + 13 + 7
+        second = RecordingSerialPort(_ScriptedPort(), path)
+        third = RecordingSerialPort(_ScriptedPort(), path)
+        for recorder in (first, second, third):
+            recorder.close()
+
+        assert first.path == path
+        assert second.path == tmp_path / "imu-1.tmcpser"
+        assert third.path == tmp_path / "imu-2.tmcpser"
+        assert [r.data for r in read_serial_recording(path)] == [b"STATUS\n"]
+        assert read_serial_recording(second.path) == []
+
+    def test_close_finishes_file_when_port_fails(self, tmp_path: Path) -> None:
+        """Verifies the recording is closed whatever state the port is in.
+
+        Arrangement:
+            A port whose close() raises, and a port that already reports
+            is_open False (device unplugged) under an Arduino instance
+            and a motor controller.
+
+        Action:
+            recorder.close(); instance.close(); controller.close().
+
+        Assertion Strategy:
+            The port error propagates from the recorder but its file is
+            closed; the drivers close their recorders although the port
+            is no longer open.
+
+        Testing Principle:
+            Captures are always finalized, especially after failures.
+        """
+        failing = _ScriptedPort()
+        failing.close = MagicMock(side_effect=OSError("device gone"))  # type: ignore[method-assign]
+        recorder = RecordingSerialPort(failing, tmp_path / "fail.tmcpser")
+        with pytest.raises(OSError, match="device gone"):
+            recorder.close()
+        assert recorder._file.closed
+
+        unplugged = _ScriptedPort()
+        unplugged.is_open = False
+        sensor_rec = RecordingSerialPort(unplugged, tmp_path / "imu.tmcpser")
+        ArduinoSensorInstance._create_with_serial(
+            sensor_rec, "/dev/ttyTEST", start_reader=False
+        ).close()
+        motor_rec = RecordingSerialPort(unplugged, tmp_path / "motor.tmcpser")
+        SerialMotorController._create_with_serial(motor_rec).close()
+
+        assert sensor_rec._file.closed
+        assert motor_rec._file.closed
+
+
+class TestReplaySerialPort:
+    """Tests for ReplaySerialPort.
+
+    Categories:
+    1. Pacing - data released at recorded time / speed
+    2. Blocking - partial reads on timeout, exhaustion, close, waking
+       a blocked read
+    3. Drivers - Arduino reader and motor controller on replayed traffic
+
+    Total: 5 tests.
+    """
+
+    def test_paces_by_speed_or_releases_all(self) -> None:
+        """Verifies recorded timing is reproduced and can be skipped.
+
+        Arrangement:
+            Two reads recorded 200 ms apart.
+
+        Action:
+            Replay at speed 2.0, and with speed None.
+
+        Assertion Strategy:
+            At 2x only the first chunk is waiting at start and the second
+            arrives after ~100 ms; with None both are waiting at once.
+
+        Testing Principle:
+            Real-time replay for reproduction, full speed for benchmarks.
+        """
+        records = [
+            SerialRecord("R", 0, b"first\n"),
+            SerialRecord("R", 200_000_000, b"second\n"),
+        ]
+
+        paced = ReplaySerialPort(records, speed=2.0)
+        assert paced.in_waiting == 6
+        assert paced.readline() == b"first\n"
+        start = time.monotonic()
+        assert paced.readline() == b"second\n"
+        assert 0.07 <= time.monotonic() - start < 0.5
+        assert paced.exhausted
+
+        fast = ReplaySerialPort(records, speed=None)
+        assert fast.in_waiting == 13
+        assert fast.read(13) == b"first\nsecond\n"
+        with pytest.raises(ValueError, match="non-negative"):
+            ReplaySerialPort(records, speed=-1.0)
+
+    def test_timeout_partial_reads_and_close(self) -> None:
+        """Verifies pyserial timeout semantics.
+
+        Arrangement:
+            Recording with an unterminated chunk; timeout 50 ms.
+
+        Action:
+            read_until() for a missing terminator, read past the end,
+            then close() and read again.
+
+        Assertion Strategy:
+            Partial bytes after ~timeout; empty read once exhausted waits
+            the timeout; reads after close return immediately.
+
+        Testing Principle:
+            Polling drivers neither hang nor spin on a finished replay.
+        """
+        replay = ReplaySerialPort(
+            [SerialRecord("R", 0, b"abc")], speed=None, timeout=0.05
+        )
+
+        start = time.monotonic()
+        assert replay.read_until(b"\n") == b"abc"
+        assert replay.read(4) == b""
+        assert time.monotonic() - start >= 0.09
+        replay.reset_input_buffer()
+        replay.close()
+        start = time.monotonic()
+        assert replay.readline() == b""
+        assert time.monotonic() - start < 0.04
+        assert not replay.is_open
+
+    def test_close_wakes_blocked_read(self) -> None:
+        """Verifies close() releases a read waiting on a long timeout.
+
+        Arrangement:
+            Exhausted recording with a 5 s timeout; a thread blocked in
+            readline().
+
+        Action:
+            close() from the test thread after 50 ms.
+
+        Assertion Strategy:
+            The blocked read returns empty well before its timeout.
+
+        Testing Principle:
+            Shutting down a replayed driver does not wait out timeouts.
+        """
+        replay = ReplaySerialPort([], speed=None, timeout=5.0)
+        result: list[bytes] = []
+        reader = threading.Thread(target=lambda: result.append(replay.readline()))
+        start = time.monotonic()
+        reader.start()
+        time.sleep(0.05)
+
+        replay.close()
+        reader.join(timeout=2.0)
+
+        assert result == [b""]
+        assert time.monotonic() - start < 1.0
+
+    def test_replays_arduino_stream_through_reader(self, tmp_path: Path) -> None:
+        """Verifies a recorded sensor stream drives the reader thread.
+
+        Arrangement:
+            Capture of 50 ASCII lines read through RecordingSerialPort.
+
+        Action:
+            Replay as fast as possible into _create_with_serial() with
+            the reader running.
+
+        Assertion Strategy:
+            All 50 samples reach history; read() returns the recorded
+            temperature and humidity.
+
+        Testing Principle:
+            Parser throughput can be measured on real traffic.
+        """
+        path = tmp_path / "imu.tmcpser"
+        recorder = RecordingSerialPort(_ScriptedPort(_LINE * 50), path)
+        while recorder.read_until(b"\n"):
+            pass
+        recorder.close()
+
+        replay = ReplaySerialPort(path, speed=None, timeout=0.05)
+        instance = ArduinoSensorInstance._create_with_serial(
+            replay, "/dev/replay", start_reader=True
+        )
+        try:
+            deadline = time.monotonic() + 2.0
+            while len(instance.history) < 50 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            reading = instance.read()
+        finally:
+            instance.close()
+
+        assert len(instance.history) == 50
+        assert replay.exhausted
+        assert (reading.temperature, reading.humidity) == (22.5, 55.0)
+
+    def test_replays_motor_session(self, tmp_path: Path) -> None:
+        """Verifies a recorded move replays into the motor controller.
+
+        Arrangement:
+            Capture of one altitude move made through a recorder.
+
+        Action:
+            Replay as fast as possible into _create_with_serial() and
+            repeat the move.
+
+        Assertion Strategy:
+            Move completes; commands written match the recording.
+
+        Testing Principle:
+            Controller behaviour reproduces without the mount.
+        """
+        path = tmp_path / "motor.tmcpser"
+        port = _ScriptedPort(replies=[b"{'axis': 0}", b"{'alldone': 1}\r\n"])
+        recorder = RecordingSerialPort(port, path)
+        SerialMotorController._create_with_serial(recorder).move(
+            MotorType.ALTITUDE, 1000
+        )
+        recorder.close()
+
+        replay = ReplaySerialPort(path, speed=None, timeout=0.05)
+        controller = SerialMotorController._create_with_serial(replay)
+        controller.move(MotorType.ALTITUDE, 1000)
+
+        assert replay.writes == replay.recorded_writes == port.written
+        assert replay.exhausted
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 
 from telescope_mcp.devices.camera import (
@@ -846,7 +848,7 @@ class TestCameraRecovery:
             specific behavior under test (capture success/failure).
 
         Args:
-            capture_side_effect: Side effect for capture method. Pass an exception
+            capture_side_effect: Side effect for capture_array. Pass an exception
                 class/instance to simulate capture failures, or a callable for
                 custom behavior. None means capture returns valid JPEG data.
 
@@ -855,7 +857,7 @@ class TestCameraRecovery:
             - get_info() returning camera metadata dict
             - get_controls() returning empty dict
             - set_control() returning empty dict
-            - capture() behavior per capture_side_effect
+            - capture_array() behavior per capture_side_effect
             - close() returning None
 
         Raises:
@@ -875,9 +877,9 @@ class TestCameraRecovery:
         mock_instance.get_controls.return_value = {}
         mock_instance.set_control.return_value = {}
         if capture_side_effect:
-            mock_instance.capture.side_effect = capture_side_effect
+            mock_instance.capture_array.side_effect = capture_side_effect
         else:
-            mock_instance.capture.return_value = b"\xff\xd8\xff\xe0test_jpeg"
+            mock_instance.capture_array.return_value = np.zeros((4, 4), dtype=np.uint8)
         mock_instance.close.return_value = None
         return mock_instance
 
@@ -1180,7 +1182,7 @@ class TestCameraOverlay:
 
     Covers lines: 1742 (_apply_overlay with overlay enabled).
 
-    Total: 3 tests.
+    Total: 4 tests.
     """
 
     def test_set_overlay_configures_overlay(self) -> None:
@@ -1265,6 +1267,41 @@ class TestCameraOverlay:
         finally:
             camera.disconnect()
 
+    def test_overlay_keeps_requested_format(self) -> None:
+        """Verifies the overlay is rendered in the caller's encoding.
+
+        Arrangement:
+        1. Passthrough renderer recording its input.
+        2. Camera with an enabled crosshair overlay.
+
+        Action:
+        capture() with format="png", then with format="raw".
+
+        Assertion Strategy:
+        Validates by confirming:
+        - PNG capture renders PNG bytes and reports format "png".
+        - Raw capture is returned without an overlay.
+        """
+        mock_renderer = Mock()
+        mock_renderer.render.side_effect = lambda data, config, info: data
+
+        driver = DigitalTwinCameraDriver()
+        camera = Camera(driver, CameraConfig(camera_id=0), renderer=mock_renderer)
+        camera.set_overlay(OverlayConfig(enabled=True, overlay_type="crosshair"))
+
+        try:
+            camera.connect()
+            png = camera.capture(CaptureOptions(format="png"))
+            raw = camera.capture(CaptureOptions(format="raw"))
+
+            assert png.format == "png" and png.has_overlay
+            assert png.image_data.startswith(b"\x89PNG")
+            assert mock_renderer.render.call_args[0][0].startswith(b"\x89PNG")
+            assert raw.format == "raw" and not raw.has_overlay
+            mock_renderer.render.assert_called_once()
+        finally:
+            camera.disconnect()
+
 
 class TestCameraControlErrors:
     """Test suite for set_control and get_control error handling.
@@ -2083,7 +2120,9 @@ class TestRecoveryCaptureFailure:
             mock.get_controls.return_value = {}
             mock.set_control.return_value = {}
             # Both instances fail on capture
-            mock.capture.side_effect = RuntimeError(f"Capture failed #{call_count[0]}")
+            mock.capture_array.side_effect = RuntimeError(
+                f"Capture failed #{call_count[0]}"
+            )
             mock.close.return_value = None
             return mock
 
@@ -2302,7 +2341,7 @@ class TestRecoveryWithoutHooks:
             where errors must be raised without hook invocation.
 
         Args:
-            capture_side_effect: Side effect for capture method. Pass an
+            capture_side_effect: Side effect for capture_array method. Pass an
                 exception to simulate capture failures, or None for success.
 
         Returns:
@@ -2320,9 +2359,9 @@ class TestRecoveryWithoutHooks:
         mock_instance.get_controls.return_value = {}
         mock_instance.set_control.return_value = {}
         if capture_side_effect:
-            mock_instance.capture.side_effect = capture_side_effect
+            mock_instance.capture_array.side_effect = capture_side_effect
         else:
-            mock_instance.capture.return_value = b"\xff\xd8\xff\xe0test"
+            mock_instance.capture_array.return_value = np.zeros((4, 4), dtype=np.uint8)
         mock_instance.close.return_value = None
         return mock_instance
 
@@ -2456,7 +2495,7 @@ class TestCameraWithStats:
         mock_instance.get_info.return_value = {"camera_id": 0, "name": "Mock"}
         mock_instance.get_controls.return_value = {}
         mock_instance.set_control.return_value = {}
-        mock_instance.capture.side_effect = RuntimeError("Capture failed")
+        mock_instance.capture_array.side_effect = RuntimeError("Capture failed")
         mock_instance.close.return_value = None
 
         mock_driver = Mock()
@@ -2567,10 +2606,10 @@ class TestCameraWithStats:
 
             if call_count[0] == 1:
                 # First instance - capture fails
-                instance.capture.side_effect = RuntimeError("Disconnect")
+                instance.capture_array.side_effect = RuntimeError("Disconnect")
             else:
                 # Second instance - capture succeeds
-                instance.capture.return_value = b"\xff\xd8\xff\xe0recovered"
+                instance.capture_array.return_value = np.full((4, 4), 7, np.uint8)
 
             return instance
 
@@ -2587,7 +2626,8 @@ class TestCameraWithStats:
         camera.connect()
         result = camera.capture()
 
-        assert b"recovered" in result.image_data
+        assert result.raw[0, 0] == 7
+        assert result.metadata["recovered"] is True
         # Stats should show both failure and success
         assert mock_stats.record_capture.call_count >= 2
         camera.disconnect()
@@ -2647,7 +2687,7 @@ class TestRecoveryInstanceCheck:
         mock_instance.get_info.return_value = {"camera_id": 0, "name": "Mock"}
         mock_instance.get_controls.return_value = {}
         mock_instance.set_control.return_value = {}
-        mock_instance.capture.side_effect = RuntimeError("Disconnect")
+        mock_instance.capture_array.side_effect = RuntimeError("Disconnect")
         mock_instance.close.return_value = None
 
         mock_driver = Mock()
@@ -2833,6 +2873,7 @@ class TestCameraCoordinateProviderIntegration:
         Validates coordinate injection by confirming:
         - metadata["coordinates"] exists.
         - Contains expected altitude and azimuth values.
+        - Provider asked for the exposure midpoint, not readout time.
 
         Testing Principle:
         Exercises line 1499 (_build_capture_result coordinate injection)
@@ -2840,16 +2881,24 @@ class TestCameraCoordinateProviderIntegration:
         """
         from telescope_mcp.devices.camera import CaptureCoordinates
 
+        requested: list[datetime | None] = []
+
         # Create mock coordinate provider that returns test coordinates
         class MockCoordinateProvider:
             """Mock provider that returns fixed test coordinates."""
 
-            def get_coordinates(self) -> CaptureCoordinates:
+            def get_coordinates(
+                self, when: datetime | None = None
+            ) -> CaptureCoordinates:
                 """Return test coordinates for coverage.
 
+                Args:
+                    when: Capture instant (ignored).
+
                 Returns:
                     CaptureCoordinates with test values.
                 """
+                requested.append(when)
                 return CaptureCoordinates(
                     altitude=45.0,
                     azimuth=180.0,
@@ -2879,5 +2928,6 @@ class TestCameraCoordinateProviderIntegration:
             assert coords["azimuth"] == 180.0
             assert coords["ra"] == 12.5
             assert coords["dec"] == 45.0
+            assert requested == [result.timestamp - timedelta(microseconds=50_000)]
         finally:
             camera.disconnect()
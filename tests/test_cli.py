@@ -8,6 +8,7 @@ Test Categories:
     - ``_strip_jsonc_comments``: JSONC comment removal and cleanup
     - ``_generate_mcp_template``: Template generation and validity
     - ``run_install``: Fresh install, merge, already-installed, corrupt
+    - ``run_export``: Export dispatch and error exit codes
     - ``main``: CLI dispatch to install vs server
 """
 
@@ -25,6 +26,7 @@ from telescope_mcp.cli import (
     _get_global_vscode_dir,
     _strip_jsonc_comments,
     main,
+    run_export,
     run_install,
 )
 
@@ -502,6 +504,41 @@ class TestMainDispatch:
             )
             assert result == 0
 
+    def test_export_subcommand(self, tmp_path: Path) -> None:
+        """'export' parses paths/options and returns run_export's code."""
+        with patch("telescope_mcp.cli.run_export", return_value=0) as mock_export:
+            with patch(
+                "sys.argv",
+                [
+                    "telescope-mcp",
+                    "export",
+                    str(tmp_path),
+                    "-o",
+                    str(tmp_path / "out"),
+                    "-f",
+                    "npy",
+                    "-j",
+                    "2",
+                ],
+            ):
+                result = main()
+            mock_export.assert_called_once_with(
+                [tmp_path],
+                tmp_path / "out",
+                fmt="npy",
+                workers=2,
+                overwrite=False,
+            )
+            assert result == 0
+
+    def test_run_export_reports_missing_path(self, tmp_path: Path) -> None:
+        """run_export returns 1 when an input path does not exist."""
+        assert run_export([tmp_path / "missing"], tmp_path / "out") == 1
+
+    def test_run_export_empty_directory(self, tmp_path: Path) -> None:
+        """run_export succeeds with zero frames for an empty directory."""
+        assert run_export([tmp_path], tmp_path / "out", workers=1) == 0
+
     def test_no_args_delegates_to_server(self) -> None:
         """No subcommand delegates to server.main().
 
@@ -752,6 +752,41 @@ class TestSensorCoordinateProvider:
         assert "dec_dms" in result
         assert "coordinate_timestamp" in result
 
+    def test_get_coordinates_at_capture_instant(
+        self, mock_sensor: MagicMock, mock_reading: MagicMock
+    ) -> None:
+        """Verifies coordinates describe the requested capture instant.
+
+        Business Context:
+        Camera asks for mid-exposure pointing; metadata assembled after
+        readout must not describe where the telescope points by then.
+
+        Arrangement:
+        1. Mock sensor returning a valid reading.
+        2. Capture instant 30 s in the past.
+
+        Action:
+        Call provider.get_coordinates(when).
+
+        Assertion Strategy:
+        - read_sync() asked for that instant.
+        - coordinate_timestamp is that instant.
+
+        Testing Principle:
+        Validates the capture time flows through to the sensor read.
+        """
+        from datetime import UTC, datetime, timedelta
+
+        mock_sensor.read_sync.return_value = mock_reading
+        provider = SensorCoordinateProvider(sensor=mock_sensor, lat=30.0, lon=-97.0)
+        when = datetime.now(UTC) - timedelta(seconds=30)
+
+        result = provider.get_coordinates(when)
+
+        assert result is not None
+        mock_sensor.read_sync.assert_called_once_with(when)
+        assert result["coordinate_timestamp"] == when.isoformat()
+
     def test_get_coordinates_exception_returns_none(
         self, mock_sensor: MagicMock
     ) -> None:
@@ -938,3 +973,56 @@ class TestSensorReadSync:
 
         result = sensor.read_sync()
         assert result is None
+
+    def test_read_sync_interpolates_buffered_history(self) -> None:
+        """Test read_sync(when) serves buffered drivers from history.
+
+        Arrangement:
+            Arduino instance (no reader thread) with samples whose aX
+            ramps 0.0 -> 0.9 over the last second; a second instance whose
+            newest sample is 5 s old.
+
+        Action:
+            Call read_sync(when) midway between two samples, then on the
+            stalled sensor.
+
+        Assertion Strategy:
+            Verify the reading is interpolated to when, and None for the
+            stalled stream.
+
+        Testing Principle:
+            Tests frame tagging uses the capture instant, never stale data.
+        """
+        import time
+        from datetime import timedelta
+
+        from telescope_mcp.devices.sensor import Sensor
+        from telescope_mcp.drivers.sensors import ArduinoSensorInstance
+        from telescope_mcp.drivers.sensors.history import datetime_at
+
+        def sensor_with_history(end_ns: int) -> Sensor:
+            instance = ArduinoSensorInstance._create_with_serial(
+                MagicMock(), "/dev/ttyTEST", start_reader=False
+            )
+            for i in range(10):
+                instance.history.append(
+                    [i * 0.1, 0.0, 1.0, 30.0, 0.0, 40.0, 20.0, 50.0],
+                    t_ns=end_ns - (9 - i) * 100_000_000,
+                )
+            sensor = Sensor(MagicMock())
+            sensor._connected = True
+            sensor._instance = instance
+            return sensor
+
+        now_ns = time.monotonic_ns()
+        sensor = sensor_with_history(now_ns)
+        when = datetime_at(now_ns - 250_000_000)
+
+        reading = sensor.read_sync(when)
+        stalled = sensor_with_history(now_ns - 5_000_000_000).read_sync(when)
+
+        assert reading is not None
+        assert reading.raw_values == "interpolated"
+        assert reading.accelerometer["aX"] == pytest.approx(0.65, abs=1e-3)
+        assert reading.timestamp - when < timedelta(microseconds=1)
+        assert stalled is None
@@ -0,0 +1,394 @@
+"""Tests for background archive compaction in telescope_mcp.data.compaction.
+
+Covers:
+- compact_archive(): defragment + recompress, verification, atomic swap
+- Skip rules: recently modified, already compacted, cancelled
+- Failure handling: corrupt archives leave no temporary files
+- ArchiveCompactor: directory scan, pass totals, thread lifecycle
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import asdf
+import numpy as np
+import pytest
+
+from telescope_mcp.data import (
+    ArchiveCompactor,
+    CompactionStatus,
+    archive_lock,
+    compact_archive,
+)
+
+
+def _frame(value: int) -> np.ndarray:
+    """Return a 64x64 uint16 frame filled with value."""
+    return np.full((64, 64), value, dtype=np.uint16)
+
+
+@pytest.fixture
+def fragmented_archive(tmp_path: Path) -> Path:
+    """Write a capture archive grown by repeated af.update() appends.
+
+    Mirrors _save_frame_to_asdf in the web app: the first frame is written
+    with write_to(), each later frame appended in place.
+
+    Returns:
+        Path to an archive with four light frames, mtime set one day back.
+    """
+    path = tmp_path / "captures" / "session_20251231.asdf"
+    path.parent.mkdir(parents=True)
+    tree = {
+        "metadata": {"session_date": "20251231"},
+        "cameras": {"finder": {"light": [{"data": _frame(0), "meta": {}}]}},
+    }
+    asdf.AsdfFile(tree).write_to(path)
+    for i in range(1, 4):
+        with asdf.open(path, mode="rw") as af:
+            af.tree["cameras"]["finder"]["light"].append(
+                {"data": _frame(i), "meta": {"index": i}}
+            )
+            af.update()
+    day_ago = time.time() - 86400
+    os.utime(path, (day_ago, day_ago))
+    return path
+
+
+class TestCompactArchive:
+    """Tests for compact_archive().
+
+    Categories:
+    1. Rewrite - data preserved, size reduced, marker recorded, mappable
+       by default
+    2. Skip Rules - recent, already compacted, cancelled, concurrent writer
+    3. Errors - invalid codec, corrupt archive cleanup
+
+    Total: 8 tests.
+    """
+
+    def test_compacts_and_preserves_frames(self, fragmented_archive: Path) -> None:
+        """Verifies zlib compaction shrinks the file without changing data.
+
+        Arrangement:
+            Fragmented archive with four constant frames.
+
+        Action:
+            compact_archive() with the zlib codec.
+
+        Assertion Strategy:
+            COMPACTED, smaller file, all frames and metadata equal, marker
+            records codec and array count, no temporary file left behind.
+
+        Testing Principle:
+            Lossless rewrite; the original is replaced only when verified.
+        """
+        result = compact_archive(fragmented_archive, compression="zlib")
+
+        assert result.status is CompactionStatus.COMPACTED
+        assert result.arrays == 4
+        assert result.bytes_after < result.bytes_before
+        assert result.bytes_saved == result.bytes_before - result.bytes_after
+        with asdf.open(fragmented_archive, validate_checksums=True) as af:
+            frames = af["cameras"]["finder"]["light"]
+            for i, entry in enumerate(frames):
+                np.testing.assert_array_equal(entry["data"], _frame(i))
+            assert frames[2]["meta"] == {"index": 2}
+            assert af["compaction"]["compression"] == "zlib"
+            assert af["compaction"]["arrays"] == 4
+        assert sorted(p.name for p in fragmented_archive.parent.iterdir()) == [
+            fragmented_archive.name
+        ]
+
+    def test_second_run_skips_unless_codec_changes(
+        self, fragmented_archive: Path
+    ) -> None:
+        """Verifies already-compacted archives are not rewritten again.
+
+        Arrangement:
+            Archive compacted once with zlib.
+
+        Action:
+            Compact again with zlib, then with compression=None.
+
+        Assertion Strategy:
+            Second run SKIPPED "already compacted"; codec change COMPACTED.
+
+        Testing Principle:
+            Periodic passes do no redundant I/O.
+        """
+        compact_archive(fragmented_archive, compression="zlib")
+
+        again = compact_archive(fragmented_archive, compression="zlib")
+        uncompressed = compact_archive(fragmented_archive, compression=None)
+
+        assert again.status is CompactionStatus.SKIPPED
+        assert again.reason == "already compacted"
+        assert uncompressed.status is CompactionStatus.COMPACTED
+
+    def test_default_rewrite_stays_uncompressed(self, fragmented_archive: Path) -> None:
+        """Verifies compression is opt-in so frames stay memory-mappable.
+
+        Arrangement:
+            Fragmented archive.
+
+        Action:
+            compact_archive() with default arguments.
+
+        Assertion Strategy:
+            COMPACTED; marker codec "none"; no frame block is compressed.
+
+        Testing Principle:
+            Memmap exports and ranged downloads never decompress frames.
+        """
+        result = compact_archive(fragmented_archive)
+
+        assert result.status is CompactionStatus.COMPACTED
+        with asdf.open(fragmented_archive, memmap=True, lazy_load=True) as af:
+            assert af["compaction"]["compression"] == "none"
+            for entry in af["cameras"]["finder"]["light"]:
+                assert af.get_array_compression(entry["data"]) is None
+
+    def test_recently_modified_archive_skipped(self, fragmented_archive: Path) -> None:
+        """Verifies archives still being written are left alone.
+
+        Arrangement:
+            Archive touched just now.
+
+        Action:
+            compact_archive() with min_age_sec=3600.
+
+        Assertion Strategy:
+            SKIPPED "recently modified"; file bytes unchanged.
+
+        Testing Principle:
+            Tonight's capture archive is never rewritten under the writer.
+        """
+        fragmented_archive.touch()
+        original = fragmented_archive.read_bytes()
+
+        result = compact_archive(fragmented_archive, min_age_sec=3600)
+
+        assert result.status is CompactionStatus.SKIPPED
+        assert result.reason == "recently modified"
+        assert fragmented_archive.read_bytes() == original
+
+    def test_cancel_leaves_original_untouched(self, fragmented_archive: Path) -> None:
+        """Verifies a set cancel event aborts before the swap.
+
+        Arrangement:
+            Already-set threading.Event.
+
+        Action:
+            compact_archive() with cancel=event and a throttle.
+
+        Assertion Strategy:
+            SKIPPED "cancelled"; original bytes unchanged; no temp file.
+
+        Testing Principle:
+            Shutdown never leaves a half-written archive.
+        """
+        original = fragmented_archive.read_bytes()
+        cancel = threading.Event()
+        cancel.set()
+
+        result = compact_archive(
+            fragmented_archive, max_bytes_per_sec=1e6, cancel=cancel
+        )
+
+        assert result.status is CompactionStatus.SKIPPED
+        assert result.reason == "cancelled"
+        assert fragmented_archive.read_bytes() == original
+        assert len(list(fragmented_archive.parent.iterdir())) == 1
+
+    def test_swap_waits_for_writer_and_keeps_its_update(
+        self, fragmented_archive: Path
+    ) -> None:
+        """Verifies an in-place update under archive_lock() is never lost.
+
+        Arrangement:
+            Test holds archive_lock() like _save_frame_to_asdf does.
+
+        Action:
+            Compact on a thread; once its copy is written, append a frame
+            in place, then release the lock.
+
+        Assertion Strategy:
+            Compaction blocks before the swap, then SKIPPED "modified
+            during compaction"; appended frame present; no temp file.
+
+        Testing Principle:
+            The unchanged-check and the replace are atomic w.r.t. writers.
+        """
+        tmp_copy = fragmented_archive.with_name(
+            f".{fragmented_archive.name}.compact.tmp"
+        )
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.append(compact_archive(fragmented_archive))
+        )
+
+        with archive_lock(fragmented_archive):
+            worker.start()
+            deadline = time.monotonic() + 5
+            while not tmp_copy.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            worker.join(0.2)
+            assert worker.is_alive()  # Waiting on the lock, not swapped
+            with asdf.open(fragmented_archive, mode="rw") as af:
+                af.tree["cameras"]["finder"]["light"].append(
+                    {"data": _frame(9), "meta": {"index": 4}}
+                )
+                af.update()
+        worker.join(5)
+
+        assert results[0].status is CompactionStatus.SKIPPED
+        assert results[0].reason == "modified during compaction"
+        with asdf.open(fragmented_archive) as af:
+            np.testing.assert_array_equal(
+                af["cameras"]["finder"]["light"][4]["data"], _frame(9)
+            )
+        assert not tmp_copy.exists()
+
+    def test_corrupt_archive_reports_failure(self, tmp_path: Path) -> None:
+        """Verifies unreadable archives are reported, not raised.
+
+        Arrangement:
+            File with an .asdf suffix containing garbage.
+
+        Action:
+            compact_archive().
+
+        Assertion Strategy:
+            FAILED with a reason; file unchanged; no temp file.
+
+        Testing Principle:
+            One bad file does not stop a background pass.
+        """
+        bad = tmp_path / "bad.asdf"
+        bad.write_bytes(b"not an asdf file")
+
+        result = compact_archive(bad)
+
+        assert result.status is CompactionStatus.FAILED
+        assert result.reason
+        assert bad.read_bytes() == b"not an asdf file"
+        assert [p.name for p in tmp_path.iterdir()] == ["bad.asdf"]
+
+    def test_invalid_compression_raises(self, fragmented_archive: Path) -> None:
+        """Verifies unknown codecs are rejected up front.
+
+        Arrangement:
+            Valid archive.
+
+        Action:
+            compact_archive(compression="gzip").
+
+        Assertion Strategy:
+            ValueError mentioning compression.
+
+        Testing Principle:
+            Configuration errors fail fast.
+        """
+        with pytest.raises(ValueError, match="compression"):
+            compact_archive(fragmented_archive, compression="gzip")
+
+
+class TestArchiveCompactor:
+    """Tests for the background ArchiveCompactor.
+
+    Categories:
+    1. Pass - scan directories, accumulate totals
+    2. Lifecycle - start/stop thread promptly
+    3. Validation - interval and codec
+
+    Total: 3 tests.
+    """
+
+    def test_run_once_compacts_all_archives(
+        self, fragmented_archive: Path, tmp_path: Path
+    ) -> None:
+        """Verifies a pass scans recursively and accumulates totals.
+
+        Arrangement:
+            Fragmented archive plus a hidden temp file and a missing
+            directory in the scan list.
+
+        Action:
+            run_once() with min_age_sec=0.
+
+        Assertion Strategy:
+            One COMPACTED result; hidden file ignored; totals updated.
+
+        Testing Principle:
+            Missing directories and stale temp files are tolerated.
+        """
+        (fragmented_archive.parent / ".old.asdf.compact.tmp").write_bytes(b"x")
+        compactor = ArchiveCompactor(
+            [tmp_path, tmp_path / "missing"], min_age_sec=0, max_bytes_per_sec=None
+        )
+
+        results = compactor.run_once()
+
+        assert [r.status for r in results] == [CompactionStatus.COMPACTED]
+        assert compactor.archives_compacted == 1
+        assert compactor.bytes_saved == results[0].bytes_saved
+        assert compactor.last_results[0].path == fragmented_archive
+
+    def test_start_stop_background_thread(self, fragmented_archive: Path) -> None:
+        """Verifies the thread runs a pass and stops promptly.
+
+        Arrangement:
+            Compactor with no startup delay and a long interval.
+
+        Action:
+            start(), wait for the first pass, stop().
+
+        Assertion Strategy:
+            Archive compacted by the thread; thread exits within timeout.
+
+        Testing Principle:
+            Long interval waits are interruptible by stop().
+        """
+        compactor = ArchiveCompactor(
+            [fragmented_archive.parent],
+            min_age_sec=0,
+            interval_sec=3600,
+            startup_delay_sec=0,
+        )
+
+        compactor.start()
+        compactor.start()  # idempotent
+        deadline = time.monotonic() + 5
+        while compactor.archives_compacted == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        started = time.monotonic()
+        compactor.stop()
+
+        assert compactor.archives_compacted == 1
+        assert not compactor.is_running
+        assert time.monotonic() - started < 2
+
+    def test_invalid_configuration_raises(self, tmp_path: Path) -> None:
+        """Verifies non-positive interval and unknown codec are rejected.
+
+        Arrangement:
+            None.
+
+        Action:
+            Construct with interval_sec=0, then compression="rar".
+
+        Assertion Strategy:
+            ValueError for each.
+
+        Testing Principle:
+            Fail fast on invalid configuration.
+        """
+        with pytest.raises(ValueError, match="interval_sec"):
+            ArchiveCompactor([tmp_path], interval_sec=0)
+        with pytest.raises(ValueError, match="compression"):
+            ArchiveCompactor([tmp_path], compression="rar")
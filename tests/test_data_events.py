@@ -0,0 +1,316 @@
+"""Tests for the live telemetry event bus.
+
+Covers telescope_mcp.data.events:
+- TelemetryEvent: SSE encoding
+- EventBus/Subscription: fan-out, latest-value coalescing, topic filters,
+  replay, cross-thread publish, close
+- EventPublisher: polling only while subscribed, one read per period
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import datetime
+
+import pytest
+
+from telescope_mcp.data import EventBus, EventPublisher, TelemetryEvent
+
+
+class TestEventBus:
+    """Tests for EventBus and Subscription.
+
+    Categories:
+    1. Fan-out - every subscriber receives, filters by topic/prefix
+    2. Latest-value - pending events coalesce per topic
+    3. Lifecycle - replay on subscribe, close, cross-thread publish
+    4. Encoding - SSE message format
+
+    Total: 5 tests.
+    """
+
+    async def test_fan_out_with_topic_filters(self) -> None:
+        """Verifies subscribers get matching topics, including by prefix.
+
+        Arrangement:
+            Bus with an all-topics, a "motor", and a "camera" subscriber.
+
+        Action:
+            Publish motor, camera/0 and camera/1 events.
+
+        Assertion Strategy:
+            Each subscriber receives exactly its topics in publish order;
+            sequence numbers increase by one.
+
+        Testing Principle:
+            One publish serves any number of consumers.
+        """
+        bus = EventBus()
+        everything = bus.subscribe()
+        motor = bus.subscribe(["motor"])
+        cameras = bus.subscribe(["camera"])
+
+        bus.publish("motor", {"steps": 1})
+        bus.publish("camera/0", {"frames": 10})
+        bus.publish("camera/1", {"frames": 20})
+
+        assert [(await everything.get()).topic for _ in range(3)] == [
+            "motor",
+            "camera/0",
+            "camera/1",
+        ]
+        assert (await motor.get()).data == {"steps": 1}
+        assert [cameras.get_nowait().seq for _ in range(2)] == [2, 3]
+        assert len(motor) == 0 and len(cameras) == 0
+        assert bus.subscriber_count == 3
+        assert bus.topics == ["motor", "camera/0", "camera/1"]
+
+    async def test_slow_consumer_gets_latest_value_only(self) -> None:
+        """Verifies pending events are replaced, not queued.
+
+        Arrangement:
+            One subscription that does not read while events arrive.
+
+        Action:
+            Publish 100 position events and one motor event, then drain.
+
+        Assertion Strategy:
+            Two events pending; position is the newest; 99 coalesced;
+            order follows when each topic first became pending.
+
+        Testing Principle:
+            Memory per consumer is bounded by the number of topics.
+        """
+        bus = EventBus()
+        subscription = bus.subscribe()
+
+        for i in range(100):
+            bus.publish("position", {"altitude": float(i)})
+        bus.publish("motor", {"steps": 5})
+
+        assert len(subscription) == 2
+        first = subscription.get_nowait()
+        assert (first.topic, first.data["altitude"]) == ("position", 99.0)
+        assert subscription.get_nowait().topic == "motor"
+        assert subscription.coalesced == 99
+        with pytest.raises(asyncio.QueueEmpty):
+            subscription.get_nowait()
+
+    async def test_replay_and_close(self) -> None:
+        """Verifies new subscribers start from current state and close cleanly.
+
+        Arrangement:
+            Bus with one published position.
+
+        Action:
+            Subscribe with and without replay; close one while a get() waits.
+
+        Assertion Strategy:
+            Replay delivers the latest value; replay=False delivers nothing;
+            the waiting get() ends iteration; closed subscriptions detach.
+
+        Testing Principle:
+            Dashboards render immediately and never leak subscriptions.
+        """
+        bus = EventBus()
+        bus.publish("position", {"altitude": 10.0})
+        bus.publish("position", {"altitude": 20.0})
+
+        with bus.subscribe(["position"]) as replayed:
+            assert replayed.get_nowait().data == {"altitude": 20.0}
+        quiet = bus.subscribe(replay=False)
+        assert len(quiet) == 0
+
+        async def collect() -> list[TelemetryEvent]:
+            return [event async for event in quiet]
+
+        waiter = asyncio.create_task(collect())
+        await asyncio.sleep(0)
+        quiet.close()
+        quiet.close()  # idempotent
+
+        assert await asyncio.wait_for(waiter, timeout=1.0) == []
+        assert replayed.closed and quiet.closed
+        assert bus.subscriber_count == 0
+        assert bus.latest("position").data == {"altitude": 20.0}
+        assert bus.latest("motor") is None
+        with pytest.raises(RuntimeError, match="closed"):
+            await quiet.get()
+
+    async def test_publish_from_another_thread_wakes_waiter(self) -> None:
+        """Verifies reader threads can publish directly.
+
+        Arrangement:
+            Subscription awaiting get() on the event loop.
+
+        Action:
+            Publish from a worker thread.
+
+        Assertion Strategy:
+            get() completes with the published event.
+
+        Testing Principle:
+            Producers need no event loop of their own.
+        """
+        bus = EventBus()
+        subscription = bus.subscribe()
+        waiter = asyncio.create_task(subscription.get())
+        await asyncio.sleep(0)
+
+        thread = threading.Thread(target=bus.publish, args=("camera/0", {"n": 1}))
+        thread.start()
+        thread.join()
+
+        event = await asyncio.wait_for(waiter, timeout=1.0)
+        assert event.topic == "camera/0"
+
+    def test_to_sse_format(self) -> None:
+        """Verifies the Server-Sent Events encoding.
+
+        Arrangement:
+            Event with a plain payload and one holding a datetime.
+
+        Action:
+            to_sse().
+
+        Assertion Strategy:
+            id/event/data lines and blank-line terminator; non-JSON values
+            stringified.
+
+        Testing Principle:
+            Browsers' EventSource parses messages by event name.
+        """
+        event = TelemetryEvent("position", {"altitude": 45.0}, 7, 0)
+        stamped = TelemetryEvent("camera/0", {"at": datetime(2026, 1, 1)}, 8, 0)
+
+        assert event.to_sse() == (
+            b'id: 7\nevent: position\ndata: {"altitude": 45.0}\n\n'
+        )
+        assert stamped.to_sse().endswith(b'data: {"at": "2026-01-01 00:00:00"}\n\n')
+
+
+class TestEventPublisher:
+    """Tests for EventPublisher polling sources.
+
+    Categories:
+    1. Demand - sources idle without subscribers
+    2. Sharing - one read per period for many subscribers
+    3. Errors - failing sources counted, invalid rate
+
+    Total: 3 tests.
+    """
+
+    async def test_polls_only_while_subscribed(self) -> None:
+        """Verifies no device reads happen without listeners.
+
+        Arrangement:
+            Publisher with a counting source at 200 Hz.
+
+        Action:
+            Start and wait with no subscribers, then subscribe, wait,
+            unsubscribe, and wait again.
+
+        Assertion Strategy:
+            Zero reads before subscribing; reads while subscribed; reads
+            stop after the last subscriber leaves.
+
+        Testing Principle:
+            An idle dashboard costs nothing.
+        """
+        bus = EventBus()
+        calls = 0
+
+        async def fetch() -> dict[str, object]:
+            nonlocal calls
+            calls += 1
+            return {"n": calls}
+
+        publisher = EventPublisher(bus)
+        publisher.add_source("position", fetch, rate_hz=200.0)
+        await publisher.start()
+        await publisher.start()  # idempotent
+        await asyncio.sleep(0.03)
+        assert calls == 0 and publisher.is_running
+
+        with bus.subscribe(["position"]) as subscription:
+            event = await asyncio.wait_for(subscription.get(), timeout=1.0)
+            await asyncio.sleep(0.03)
+        assert event.data["n"] >= 1
+        stopped_at = calls
+        await asyncio.sleep(0.03)
+
+        assert calls <= stopped_at + 1
+        assert publisher.published == calls
+        await publisher.stop()
+        await publisher.stop()  # safe when stopped
+        assert not publisher.is_running
+
+    async def test_many_subscribers_share_one_read_stream(self) -> None:
+        """Verifies N subscribers do not multiply source reads.
+
+        Arrangement:
+            Publisher at 50 Hz and ten subscribers.
+
+        Action:
+            Run for ~0.2 s.
+
+        Assertion Strategy:
+            Reads bounded by the rate (not rate x subscribers); every
+            subscriber received the latest value.
+
+        Testing Principle:
+            Cost scales with devices, not with dashboards.
+        """
+        bus = EventBus()
+        calls = 0
+
+        async def fetch() -> dict[str, object]:
+            nonlocal calls
+            calls += 1
+            return {"n": calls}
+
+        subscriptions = [bus.subscribe() for _ in range(10)]
+        publisher = EventPublisher(bus)
+        publisher.add_source("position", fetch, rate_hz=50.0)
+        await publisher.start()
+        await asyncio.sleep(0.2)
+        await publisher.stop()
+
+        assert 2 <= calls <= 15
+        for subscription in subscriptions:
+            assert subscription.get_nowait().data == {"n": calls}
+
+    async def test_failing_source_counted_and_invalid_rate(self) -> None:
+        """Verifies source errors do not stop polling.
+
+        Arrangement:
+            Source that always raises; one subscriber.
+
+        Action:
+            Run briefly; register a source with rate 0.
+
+        Assertion Strategy:
+            errors counted, task still running, nothing published;
+            ValueError for the bad rate.
+
+        Testing Principle:
+            A disconnected device must not kill the publisher.
+        """
+        bus = EventBus()
+
+        async def fetch() -> dict[str, object]:
+            raise RuntimeError("Motor not connected")
+
+        publisher = EventPublisher(bus)
+        publisher.add_source("motor", fetch, rate_hz=200.0)
+        subscription = bus.subscribe()
+        await publisher.start()
+        await asyncio.sleep(0.03)
+
+        assert publisher.is_running
+        assert publisher.errors >= 2
+        assert len(subscription) == 0
+        await publisher.stop()
+        with pytest.raises(ValueError, match="positive"):
+            publisher.add_source("motor", fetch, rate_hz=0)
@@ -0,0 +1,366 @@
+"""Tests for bulk archive export in telescope_mcp.data.export.
+
+Covers:
+- Frame enumeration for session files and capture archives
+- FITS header mapping from frame metadata
+- FITS and NPY output, skip/overwrite behavior, error reporting
+- Parallel export through the process pool
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import asdf
+import numpy as np
+import pytest
+from astropy.io import fits
+
+from telescope_mcp.data import Session, SessionType
+from telescope_mcp.data.export import (
+    ExportFormat,
+    FrameRef,
+    build_fits_header,
+    collect_archives,
+    export_archives,
+    list_archive_frames,
+)
+
+
+@pytest.fixture
+def session_archive(tmp_path: Path) -> Path:
+    """Write a session file with three uint16 frames from camera 'main'.
+
+    Returns:
+        Path to the written ASDF session file.
+    """
+    session = Session(SessionType.OBSERVATION, tmp_path / "data", target="M31")
+    for i in range(3):
+        session.add_frame(
+            "main",
+            np.full((4, 6), i, dtype=np.uint16),
+            settings={"exposure_us": 2_000_000, "gain": 120},
+        )
+    return session.close()
+
+
+@pytest.fixture
+def capture_archive(tmp_path: Path) -> Path:
+    """Write a dashboard-style capture archive with one light and one dark.
+
+    Returns:
+        Path to the written ASDF capture archive.
+    """
+    meta = {
+        "timestamp": "2025-12-31T03:00:00+00:00",
+        "exposure_us": 500_000,
+        "gain": 80,
+        "camera_name": "ZWO ASI482MC",
+        "width": 3,
+        "height": 2,
+        "coordinates": {"ra": 10.68, "dec": 41.27, "altitude": 60.0},
+        "capture_mode": "raw16_stream",
+    }
+    tree = {
+        "metadata": {"session_date": "20251231"},
+        "cameras": {
+            "finder": {
+                "info": {"name": "ZWO ASI482MC"},
+                "light": [{"data": np.ones((2, 3), np.uint16), "meta": meta}],
+                "dark": [{"data": np.zeros((2, 3), np.uint16), "meta": meta}],
+                "flat": [],
+                "bias": [],
+            }
+        },
+    }
+    path = tmp_path / "data" / "session_20251231.asdf"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    asdf.AsdfFile(tree).write_to(path)
+    return path
+
+
+class TestEnumeration:
+    """Tests for collect_archives() and list_archive_frames().
+
+    Total: 3 tests.
+    """
+
+    def test_list_session_frames(self, session_archive: Path) -> None:
+        """Verifies session files enumerate camera 'frames' entries.
+
+        Arrangement:
+            Session archive with three frames.
+
+        Action:
+            list_archive_frames().
+
+        Assertion Strategy:
+            Three refs in index order under group "frames".
+
+        Testing Principle:
+            Enumeration reads structure only, not pixels.
+        """
+        refs = list_archive_frames(session_archive)
+        assert refs == [FrameRef("main", "frames", i) for i in range(3)]
+
+    def test_list_capture_frames(self, capture_archive: Path) -> None:
+        """Verifies capture archives enumerate each non-empty group.
+
+        Arrangement:
+            Capture archive with one light and one dark.
+
+        Action:
+            list_archive_frames().
+
+        Assertion Strategy:
+            Refs for light then dark; empty groups skipped.
+
+        Testing Principle:
+            Both archive layouts are supported.
+        """
+        refs = list_archive_frames(capture_archive)
+        assert refs == [
+            FrameRef("finder", "light", 0),
+            FrameRef("finder", "dark", 0),
+        ]
+
+    def test_collect_archives_recurses_and_rejects_missing(
+        self, session_archive: Path, capture_archive: Path, tmp_path: Path
+    ) -> None:
+        """Verifies directories are searched recursively; missing paths raise.
+
+        Arrangement:
+            Two archives under tmp_path/data at different depths.
+
+        Action:
+            collect_archives() on the directory, then on a missing path.
+
+        Assertion Strategy:
+            Both archives found sorted; FileNotFoundError for missing.
+
+        Testing Principle:
+            CLI accepts a night directory as input.
+        """
+        found = collect_archives([tmp_path / "data"])
+        assert found == sorted([session_archive, capture_archive])
+
+        with pytest.raises(FileNotFoundError):
+            collect_archives([tmp_path / "nope"])
+
+
+class TestBuildFitsHeader:
+    """Tests for FITS header construction.
+
+    Total: 2 tests.
+    """
+
+    def test_maps_known_keys(self) -> None:
+        """Verifies standard keywords derive from frame metadata.
+
+        Arrangement:
+            Metadata with exposure, gain, camera, coordinates.
+
+        Action:
+            build_fits_header() with archive target.
+
+        Assertion Strategy:
+            EXPTIME in seconds, GAIN, INSTRUME, RA/DEC, OBJECT, IMAGETYP.
+
+        Testing Principle:
+            Downstream tools find conventional keywords.
+        """
+        header = build_fits_header(
+            {
+                "exposure_us": 1_500_000,
+                "gain": 100,
+                "camera_name": "ASI183",
+                "coordinates": {"ra": 1.5, "dec": -2.5},
+            },
+            camera="main",
+            group="light",
+            archive_meta={"target": "M42", "session_id": "obs_1"},
+        )
+
+        assert header["EXPTIME"] == 1.5
+        assert header["GAIN"] == 100
+        assert header["INSTRUME"] == "ASI183"
+        assert header["RA"] == 1.5
+        assert header["DEC"] == -2.5
+        assert header["OBJECT"] == "M42"
+        assert header["IMAGETYP"] == "Light Frame"
+
+    def test_preserves_unmapped_scalars_as_hierarch(self) -> None:
+        """Verifies unknown scalar keys survive as HIERARCH cards.
+
+        Arrangement:
+            Metadata with a custom scalar, a nested dict, and numpy scalar.
+
+        Action:
+            build_fits_header() for a dark frame.
+
+        Assertion Strategy:
+            Custom scalar present, nested dict skipped, IMAGETYP "Dark".
+
+        Testing Principle:
+            Capture-time metadata is not silently dropped.
+        """
+        header = build_fits_header(
+            {"filter_name": "Ha", "offset": np.int64(10), "extra": {"a": 1}},
+            camera="main",
+            group="dark",
+        )
+
+        assert header["FILTER_NAME"] == "Ha"
+        assert header["OFFSET"] == 10
+        assert "EXTRA" not in header
+        assert header["IMAGETYP"] == "Dark"
+
+
+class TestExportArchives:
+    """Tests for export_archives().
+
+    Total: 5 tests.
+    """
+
+    def test_export_fits_round_trip(
+        self, session_archive: Path, tmp_path: Path
+    ) -> None:
+        """Verifies FITS output preserves pixels and exposure header.
+
+        Arrangement:
+            Session archive with three frames.
+
+        Action:
+            Export in-process (workers=1) to FITS.
+
+        Assertion Strategy:
+            Three files, pixel data equal, EXPTIME 2.0 s, throughput > 0.
+
+        Testing Principle:
+            Lossless conversion with metadata.
+        """
+        out = tmp_path / "out"
+        summary = export_archives([session_archive], out, workers=1)
+
+        assert summary.frames == 3
+        assert summary.errors == []
+        assert summary.bytes_read == 3 * 4 * 6 * 2
+        assert summary.frames_per_second > 0
+        with fits.open(summary.files[2]) as hdul:
+            np.testing.assert_array_equal(hdul[0].data, np.full((4, 6), 2))
+            assert hdul[0].header["EXPTIME"] == 2.0
+            assert hdul[0].header["OBJECT"] == "M31"
+
+    def test_export_npy_writes_sidecar(
+        self, capture_archive: Path, tmp_path: Path
+    ) -> None:
+        """Verifies NPY export writes array plus JSON metadata sidecar.
+
+        Arrangement:
+            Capture archive with light and dark frames.
+
+        Action:
+            Export to NPY.
+
+        Assertion Strategy:
+            .npy loads to original data; .json holds meta and group.
+
+        Testing Principle:
+            NPY output keeps metadata alongside raw arrays.
+        """
+        summary = export_archives(
+            [capture_archive], tmp_path / "out", fmt=ExportFormat.NPY, workers=1
+        )
+
+        light = Path(next(f for f in summary.files if "light" in f))
+        np.testing.assert_array_equal(np.load(light), np.ones((2, 3)))
+        sidecar = json.loads(light.with_suffix(".json").read_text())
+        assert sidecar["group"] == "light"
+        assert sidecar["gain"] == 80
+
+    def test_existing_files_skipped_unless_overwrite(
+        self, session_archive: Path, tmp_path: Path
+    ) -> None:
+        """Verifies re-export skips existing outputs unless overwrite=True.
+
+        Arrangement:
+            One completed export.
+
+        Action:
+            Export again without and with overwrite.
+
+        Assertion Strategy:
+            Second run writes 0 frames; third writes 3.
+
+        Testing Principle:
+            Interrupted exports can resume cheaply.
+        """
+        out = tmp_path / "out"
+        export_archives([session_archive], out, workers=1)
+
+        assert export_archives([session_archive], out, workers=1).frames == 0
+        again = export_archives([session_archive], out, workers=1, overwrite=True)
+        assert again.frames == 3
+
+    def test_invalid_arguments_raise(
+        self, session_archive: Path, tmp_path: Path
+    ) -> None:
+        """Verifies invalid format, workers, and chunk size are rejected.
+
+        Arrangement:
+            Valid archive.
+
+        Action:
+            Call export_archives with bad parameters.
+
+        Assertion Strategy:
+            ValueError for each.
+
+        Testing Principle:
+            Fail fast before spawning workers.
+        """
+        with pytest.raises(ValueError):
+            export_archives([session_archive], tmp_path, fmt="tiff")
+        with pytest.raises(ValueError, match="workers"):
+            export_archives([session_archive], tmp_path, workers=0)
+        with pytest.raises(ValueError, match="chunk_size"):
+            export_archives([session_archive], tmp_path, chunk_size=0)
+
+    def test_parallel_export_matches_serial(
+        self, session_archive: Path, capture_archive: Path, tmp_path: Path
+    ) -> None:
+        """Verifies process-pool export produces the same files as serial.
+
+        Arrangement:
+            Two archives, chunk_size=1 so every frame is its own task.
+
+        Action:
+            Export with workers=2 (process pool).
+
+        Assertion Strategy:
+            Same relative file set as serial export, no errors, and an
+            unreadable archive is reported rather than raised.
+
+        Testing Principle:
+            Parallelism does not change output.
+        """
+        bad = tmp_path / "data" / "corrupt.asdf"
+        bad.write_bytes(b"not asdf")
+        serial = export_archives(
+            [session_archive, capture_archive], tmp_path / "serial", workers=1
+        )
+        parallel = export_archives(
+            [tmp_path / "data"], tmp_path / "parallel", workers=2, chunk_size=1
+        )
+
+        def rel(files: list[str], root: Path) -> list[str]:
+            return [str(Path(f).relative_to(root)) for f in files]
+
+        assert parallel.frames == serial.frames == 5
+        assert rel(parallel.files, tmp_path / "parallel") == rel(
+            serial.files, tmp_path / "serial"
+        )
+        assert len(parallel.errors) == 1
+        assert "corrupt.asdf" in parallel.errors[0]
+        assert parallel.to_dict()["archives"] == 3
@@ -0,0 +1,326 @@
+"""Tests for background exposure sequences in telescope_mcp.data.sequence.
+
+Covers:
+- SequenceStep validation and dict parsing
+- ExposureSequence: frames stored per frame type, session events, status
+- Abort mid-exposure and capture failure handling
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import asdf
+import numpy as np
+import pytest
+
+from telescope_mcp.data import (
+    ExposureSequence,
+    FrameType,
+    SequenceState,
+    SequenceStep,
+    SessionManager,
+    SessionType,
+)
+from telescope_mcp.devices.camera import Camera, CameraConfig
+from telescope_mcp.drivers.cameras.twin import DigitalTwinCameraDriver
+
+
+@pytest.fixture
+def camera():
+    """Connected digital twin Camera, disconnected on teardown."""
+    cam = Camera(DigitalTwinCameraDriver(), CameraConfig(camera_id=0))
+    cam.connect()
+    yield cam
+    cam.disconnect()
+
+
+@pytest.fixture
+def sessions(tmp_path: Path) -> SessionManager:
+    """SessionManager with an observation session active."""
+    manager = SessionManager(tmp_path / "data")
+    manager.start_session(SessionType.OBSERVATION, target="M42")
+    return manager
+
+
+class TestSequenceStep:
+    """Tests for SequenceStep.
+
+    Total: 2 tests.
+    """
+
+    def test_from_dict_parses_frame_type(self) -> None:
+        """Verifies tool-style dicts become typed steps.
+
+        Arrangement:
+            Dicts with and without frame_type.
+
+        Action:
+            SequenceStep.from_dict().
+
+        Assertion Strategy:
+            frame_type parsed to FrameType, defaulting to LIGHT.
+
+        Testing Principle:
+            MCP arguments map directly onto the engine's types.
+        """
+        dark = SequenceStep.from_dict(
+            {"count": 5, "exposure_us": 1000, "gain": 10, "frame_type": "dark"}
+        )
+        light = SequenceStep.from_dict({"count": 1, "exposure_us": 1, "gain": 0})
+
+        assert dark == SequenceStep(5, 1000, 10, FrameType.DARK)
+        assert light.frame_type is FrameType.LIGHT
+        assert light.image_type == "RAW16"
+
+    def test_invalid_values_rejected(self) -> None:
+        """Verifies non-positive count/exposure and negative gain raise.
+
+        Arrangement:
+            None.
+
+        Action:
+            Construct steps with invalid values and an unknown frame type.
+
+        Assertion Strategy:
+            ValueError naming the field each time.
+
+        Testing Principle:
+            Fail fast before any exposure starts.
+        """
+        with pytest.raises(ValueError, match="count"):
+            SequenceStep(0, 1000, 0)
+        with pytest.raises(ValueError, match="exposure_us"):
+            SequenceStep(1, 0, 0)
+        with pytest.raises(ValueError, match="gain"):
+            SequenceStep(1, 1000, -1)
+        with pytest.raises(ValueError, match="image_type"):
+            SequenceStep(1, 1000, 0, image_type="RAW12")
+        with pytest.raises(ValueError):
+            SequenceStep.from_dict(
+                {"count": 1, "exposure_us": 1, "gain": 0, "frame_type": "x"}
+            )
+
+
+class TestExposureSequence:
+    """Tests for the ExposureSequence background runner.
+
+    Categories:
+    1. Run - frames stored by type, events recorded, status complete,
+       per-frame metadata across steps
+    2. Abort - stop mid-exposure, frames kept
+    3. Errors - capture failure, invalid configuration
+
+    Total: 5 tests.
+    """
+
+    async def test_run_stores_frames_by_type(
+        self, camera: Camera, sessions: SessionManager
+    ) -> None:
+        """Verifies light and calibration frames land in the session file.
+
+        Arrangement:
+            Three light frames and two darks on the twin camera.
+
+        Action:
+            start(), wait(), end_session().
+
+        Assertion Strategy:
+            COMPLETED with 5/5 frames; ASDF holds 3 frames under the label
+            with settings, 2 dark_frames, and start/finish events.
+
+        Testing Principle:
+            One call drives many frames straight into storage.
+        """
+        sequence = ExposureSequence(
+            camera,
+            sessions,
+            [
+                SequenceStep(3, 1000, 20),
+                SequenceStep(2, 1000, 20, FrameType.DARK),
+            ],
+            label="main",
+        )
+
+        await sequence.start()
+        status = await sequence.wait()
+        path = sessions.end_session()
+
+        assert status.state is SequenceState.COMPLETED
+        assert (status.frames_done, status.frames_total) == (5, 5)
+        assert status.step_index == 1
+        assert status.to_dict()["finished_at"] is not None
+        with asdf.open(path) as af:
+            main = af["cameras"]["main"]
+            assert len(main["frames"]) == 3
+            assert main["settings"] == {"exposure_us": 1000, "gain": 20}
+            assert np.asarray(main["frames"][0]["data"]).ndim >= 2
+            assert len(af["calibration"]["dark_frames"]) == 2
+            events = [e["event"] for e in af["observability"]["events"]]
+        assert events[-2:] == ["sequence_started", "sequence_finished"]
+
+    async def test_steps_store_their_own_metadata(
+        self, camera: Camera, sessions: SessionManager
+    ) -> None:
+        """Verifies each frame records the settings it was captured with.
+
+        Arrangement:
+            Two light steps with different exposure, gain, and image type,
+            then one flat step.
+
+        Action:
+            start(), wait(), end_session().
+
+        Assertion Strategy:
+            Every light frame's meta matches its step (exposure, gain,
+            image_type, step_index) and has a timestamp; arrays match the
+            requested format; camera settings hold the latest step; the
+            flat frame carries meta too.
+
+        Testing Principle:
+            Mixed-setting sequences stay calibratable frame by frame.
+        """
+        sequence = ExposureSequence(
+            camera,
+            sessions,
+            [
+                SequenceStep(2, 1000, 20, image_type="RAW16"),
+                SequenceStep(1, 3000, 40, image_type="RAW8"),
+                SequenceStep(1, 500, 0, FrameType.FLAT),
+            ],
+            label="main",
+        )
+
+        await sequence.start()
+        await sequence.wait()
+        path = sessions.end_session()
+
+        with asdf.open(path) as af:
+            frames = af["cameras"]["main"]["frames"]
+            metas = [dict(frame["meta"]) for frame in frames]
+            dtypes = [np.asarray(frame["data"]).dtype for frame in frames]
+            settings = dict(af["cameras"]["main"]["settings"])
+            flat = af["calibration"]["flat_frames"][0]
+            flat_meta = dict(flat["meta"])
+            flat_shape = np.asarray(flat["data"]).shape
+
+        assert [
+            (m["exposure_us"], m["gain"], m["image_type"], m["step_index"])
+            for m in metas
+        ] == [(1000, 20, "RAW16", 0), (1000, 20, "RAW16", 0), (3000, 40, "RAW8", 1)]
+        assert all(m["timestamp"] and m["sequence_id"] for m in metas)
+        assert metas[0]["timestamp"] <= metas[1]["timestamp"] <= metas[2]["timestamp"]
+        assert dtypes == [np.uint16, np.uint16, np.uint8]
+        assert settings == {"exposure_us": 3000, "gain": 40}
+        assert (flat_meta["frame_type"], flat_meta["exposure_us"]) == ("flat", 500)
+        assert len(flat_shape) == 2
+
+    async def test_abort_stops_exposure_and_keeps_frames(
+        self, camera: Camera, sessions: SessionManager, monkeypatch
+    ) -> None:
+        """Verifies abort() interrupts a long exposure promptly.
+
+        Arrangement:
+            Driver returns one frame, then blocks until stop_exposure().
+
+        Action:
+            start(), wait for the blocking exposure, abort(), wait().
+
+        Assertion Strategy:
+            ABORTED with the first frame stored; abort() is idempotent.
+
+        Testing Principle:
+            Users can cancel a long sequence without losing data.
+        """
+        blocked = threading.Event()
+        stopped = threading.Event()
+        calls = []
+
+        def capture_array(exposure_us, image_type=None):
+            calls.append(exposure_us)
+            if len(calls) > 1:
+                blocked.set()
+                if stopped.wait(5):
+                    raise RuntimeError("Exposure aborted")
+            return np.zeros((4, 4), dtype=np.uint8)
+
+        instance = MagicMock(wraps=camera._instance)
+        instance.capture_array.side_effect = capture_array
+        instance.stop_exposure.side_effect = stopped.set
+        monkeypatch.setattr(camera, "_instance", instance)
+
+        sequence = ExposureSequence(camera, sessions, [SequenceStep(10, 60_000_000, 0)])
+        await sequence.start()
+        await asyncio.to_thread(blocked.wait, 2)
+        sequence.abort()
+        sequence.abort()
+        status = await asyncio.wait_for(sequence.wait(), timeout=5)
+
+        assert status.state is SequenceState.ABORTED
+        assert status.frames_done == 1
+        assert sessions.active_session is not None
+        assert camera.is_connected
+
+    async def test_capture_failure_marks_failed(
+        self, camera: Camera, sessions: SessionManager, monkeypatch
+    ) -> None:
+        """Verifies a failing camera ends the sequence as FAILED.
+
+        Arrangement:
+            Driver capture always raises; no recovery strategy.
+
+        Action:
+            start(), wait().
+
+        Assertion Strategy:
+            FAILED with an error message and zero frames; the runner does
+            not raise into the waiter.
+
+        Testing Principle:
+            Background failures are reported through status, not lost.
+        """
+        instance = MagicMock(wraps=camera._instance)
+        instance.capture_array.side_effect = RuntimeError("USB gone")
+        monkeypatch.setattr(camera, "_instance", instance)
+
+        sequence = ExposureSequence(camera, sessions, [SequenceStep(3, 1000, 0)])
+        await sequence.start()
+        status = await sequence.wait()
+
+        assert status.state is SequenceState.FAILED
+        assert status.error
+        assert status.frames_done == 0
+
+    async def test_invalid_configuration_raises(
+        self, camera: Camera, sessions: SessionManager
+    ) -> None:
+        """Verifies empty steps, negative interval, and double start raise.
+
+        Arrangement:
+            Valid camera and session manager.
+
+        Action:
+            Construct invalid sequences; start a valid one twice.
+
+        Assertion Strategy:
+            ValueError for configuration, RuntimeError for the second
+            start() and for wait() before start().
+
+        Testing Principle:
+            Misuse fails loudly instead of silently capturing nothing.
+        """
+        with pytest.raises(ValueError, match="steps"):
+            ExposureSequence(camera, sessions, [])
+        with pytest.raises(ValueError, match="interval_sec"):
+            ExposureSequence(camera, sessions, [SequenceStep(1, 1, 0)], interval_sec=-1)
+
+        sequence = ExposureSequence(camera, sessions, [SequenceStep(1, 1000, 0)])
+        with pytest.raises(RuntimeError, match="not started"):
+            await sequence.wait()
+        await sequence.start()
+        with pytest.raises(RuntimeError, match="already started"):
+            await sequence.start()
+        await sequence.wait()
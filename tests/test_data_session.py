@@ -533,8 +533,9 @@ class TestSessionAddFrame:
     4. Settings Update - update existing camera settings
     5. Multiple Frames - multiple frames same camera
     6. Closed Session - RuntimeError on closed session
+    7. Merge/Metadata - info and settings merged together, per-frame meta
 
-    Total: 6 tests.
+    Total: 8 tests.
     """
 
     def test_add_frame_creates_camera_entry(self, tmp_path: Path) -> None:
@@ -734,6 +735,48 @@ class TestSessionAddFrame:
         # But frame should be added
         assert len(session._cameras["main"]["frames"]) == 2
 
+    def test_add_frame_merges_info_and_settings_with_metadata(
+        self, tmp_path: Path
+    ) -> None:
+        """Verifies info and settings both merge and metadata is per frame.
+
+        Arrangement:
+            1. Create session and add a first frame with info and settings.
+
+        Action:
+            Add a second frame passing camera_info, settings, and metadata.
+
+        Assertion Strategy:
+            Validates merge by confirming:
+            - info and settings both updated (neither update is skipped).
+            - first frame stays a bare array.
+            - second frame stored as {"data", "meta"}.
+
+        Testing Principle:
+            Frames from different settings keep their own metadata.
+        """
+        session = Session(SessionType.OBSERVATION, tmp_path, target="M31")
+        frame = np.zeros((10, 10), dtype=np.uint16)
+        meta = {"exposure_us": 2000, "gain": 80, "timestamp": "2026-01-01T00:00:00"}
+
+        session.add_frame(
+            "main", frame, camera_info={"name": "ASI482MC"}, settings={"gain": 50}
+        )
+        session.add_frame(
+            "main",
+            frame,
+            camera_info={"temperature": -10.0},
+            settings={"gain": 80, "exposure_us": 2000},
+            metadata=meta,
+        )
+
+        camera = session._cameras["main"]
+        assert camera["info"] == {"name": "ASI482MC", "temperature": -10.0}
+        assert camera["settings"] == {"gain": 80, "exposure_us": 2000}
+        assert camera["frames"][0] is frame
+        assert camera["frames"][1] == {"data": frame, "meta": meta}
+        assert session._frames_captured == 2
+
 
 class TestSessionAddTelemetry:
     """Tests for Session.add_telemetry() method.
@@ -0,0 +1,425 @@
+"""Tests for columnar telemetry storage and the background recorder.
+
+Covers telescope_mcp.data.telemetry:
+- TelemetryColumns: append, NaN fill, doubling growth, snapshot copies
+- Session/SessionManager add_telemetry_sample() and ASDF array output
+- TelemetryRecorder: sampling digital twin Sensor/Motor, start/stop, errors
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import asdf
+import numpy as np
+import pytest
+
+from telescope_mcp.data import (
+    Session,
+    SessionManager,
+    SessionType,
+    TelemetryColumns,
+    TelemetryRecorder,
+)
+from telescope_mcp.data.telemetry import TELEMETRY_CHANNELS
+from telescope_mcp.devices.motor import Motor
+from telescope_mcp.devices.sensor import Sensor
+from telescope_mcp.drivers.motors import DigitalTwinMotorDriver
+from telescope_mcp.drivers.sensors import DigitalTwinSensorDriver
+
+
+class TestTelemetryColumns:
+    """Tests for the growable columnar buffer.
+
+    Categories:
+    1. Append - values stored, missing channels NaN, unknown rejected
+    2. Growth - capacity doubles while preserving data
+    3. Snapshot - to_arrays() returns trimmed independent copies
+
+    Total: 5 tests.
+    """
+
+    def test_append_stores_values_and_nan_for_missing(self) -> None:
+        """Verifies supplied channels are stored and others become NaN.
+
+        Arrangement:
+            Empty TelemetryColumns.
+
+        Action:
+            Append one sample with only altitude and azimuth.
+
+        Assertion Strategy:
+            Length is 1, timestamp and supplied channels match, every other
+            channel is NaN.
+
+        Testing Principle:
+            Aligned columns even when a device is absent.
+        """
+        columns = TelemetryColumns()
+        columns.append(123, altitude=45.0, azimuth=180.0)
+
+        arrays = columns.to_arrays()
+        assert len(columns) == 1
+        assert arrays["timestamp_ns"].dtype == np.int64
+        assert arrays["timestamp_ns"][0] == 123
+        assert arrays["altitude"][0] == 45.0
+        assert arrays["azimuth"][0] == 180.0
+        assert math.isnan(arrays["temperature"][0])
+        assert math.isnan(arrays["altitude_steps"][0])
+
+    def test_append_rejects_unknown_channel(self) -> None:
+        """Verifies unknown channel names raise KeyError without appending.
+
+        Arrangement:
+            Empty TelemetryColumns.
+
+        Action:
+            Append with a misspelled channel name.
+
+        Assertion Strategy:
+            KeyError raised and buffer remains empty.
+
+        Testing Principle:
+            Typos must not silently drop data.
+        """
+        columns = TelemetryColumns()
+        with pytest.raises(KeyError, match="altitud"):
+            columns.append(1, altitud=1.0)
+        assert len(columns) == 0
+
+    def test_growth_doubles_capacity_and_preserves_data(self) -> None:
+        """Verifies columns grow by doubling and keep earlier samples.
+
+        Arrangement:
+            TelemetryColumns with initial_capacity=2.
+
+        Action:
+            Append five samples.
+
+        Assertion Strategy:
+            Capacity grew to 8 and all timestamps/values are intact.
+
+        Testing Principle:
+            Amortized O(1) growth without data loss.
+        """
+        columns = TelemetryColumns(initial_capacity=2)
+        for i in range(5):
+            columns.append(i, temperature=float(i))
+
+        arrays = columns.to_arrays()
+        assert columns.capacity == 8
+        np.testing.assert_array_equal(arrays["timestamp_ns"], np.arange(5))
+        np.testing.assert_array_equal(arrays["temperature"], np.arange(5.0))
+
+    def test_to_arrays_returns_independent_copies(self) -> None:
+        """Verifies snapshots are unaffected by later appends or clear().
+
+        Arrangement:
+            Columns with one sample and a snapshot taken.
+
+        Action:
+            Clear and append a different sample.
+
+        Assertion Strategy:
+            Original snapshot still holds the first value.
+
+        Testing Principle:
+            Serialization can proceed while recording continues.
+        """
+        columns = TelemetryColumns()
+        columns.append(1, humidity=50.0)
+        snapshot = columns.to_arrays()
+
+        columns.clear()
+        columns.append(2, humidity=99.0)
+
+        assert snapshot["humidity"][0] == 50.0
+        assert set(snapshot) == {"timestamp_ns", *TELEMETRY_CHANNELS}
+
+    def test_invalid_initial_capacity_raises(self) -> None:
+        """Verifies non-positive capacity is rejected.
+
+        Arrangement:
+            None.
+
+        Action:
+            Construct TelemetryColumns(initial_capacity=0).
+
+        Assertion Strategy:
+            ValueError raised.
+
+        Testing Principle:
+            Fail fast on invalid configuration.
+        """
+        with pytest.raises(ValueError, match="initial_capacity"):
+            TelemetryColumns(initial_capacity=0)
+
+
+class TestSessionTelemetrySamples:
+    """Tests for columnar samples through Session and SessionManager.
+
+    Categories:
+    1. ASDF Output - samples written as arrays under telemetry/samples,
+       wall-clock anchor under telemetry/samples_anchor
+    2. Closed Session - add_telemetry_sample rejected
+    3. Manager Forwarding - samples go to active session
+
+    Total: 4 tests.
+    """
+
+    def test_close_writes_samples_as_arrays(self, tmp_path: Path) -> None:
+        """Verifies close() writes columnar samples as ASDF arrays.
+
+        Arrangement:
+            Session with three samples.
+
+        Action:
+            Close session and reopen the ASDF file.
+
+        Assertion Strategy:
+            telemetry/samples contains ndarray columns of length 3 while
+            existing dict telemetry keys remain.
+
+        Testing Principle:
+            Columns, not lists of dicts, reach disk.
+        """
+        session = Session(SessionType.EXPERIMENT, tmp_path)
+        for i in range(3):
+            session.add_telemetry_sample(i * 100, altitude=10.0 + i)
+
+        path = session.close()
+
+        with asdf.open(path) as af:
+            samples = af["telemetry"]["samples"]
+            assert np.asarray(samples["altitude"]).tolist() == [10.0, 11.0, 12.0]
+            assert np.asarray(samples["timestamp_ns"]).tolist() == [0, 100, 200]
+            assert "mount_position" in af["telemetry"]
+
+    def test_close_writes_epoch_anchor(self, tmp_path: Path) -> None:
+        """Verifies archived monotonic timestamps can be mapped to wall time.
+
+        Arrangement:
+            One session with a monotonic-stamped sample, one without any.
+
+        Action:
+            Close both and reopen the ASDF files.
+
+        Assertion Strategy:
+            samples_anchor maps the sample to within a second of the wall
+            clock at recording; no anchor when nothing was recorded.
+
+        Testing Principle:
+            Telemetry lines up with frame ISO timestamps across reboots.
+        """
+        session = Session(SessionType.EXPERIMENT, tmp_path)
+        wall_before = time.time_ns()
+        session.add_telemetry_sample(time.monotonic_ns(), altitude=1.0)
+        empty = Session(SessionType.EXPERIMENT, tmp_path / "empty")
+
+        path = session.close()
+        empty_path = empty.close()
+
+        with asdf.open(path) as af:
+            anchor = af["telemetry"]["samples_anchor"]
+            stamp = int(np.asarray(af["telemetry"]["samples"]["timestamp_ns"])[0])
+            unix_ns = anchor["unix_ns"] + (stamp - anchor["monotonic_ns"])
+            assert abs(unix_ns - wall_before) < 1_000_000_000
+        with asdf.open(empty_path) as af:
+            assert af["telemetry"]["samples_anchor"] is None
+
+    def test_add_sample_on_closed_session_raises(self, tmp_path: Path) -> None:
+        """Verifies closed sessions reject columnar samples.
+
+        Arrangement:
+            Closed Session.
+
+        Action:
+            Call add_telemetry_sample().
+
+        Assertion Strategy:
+            RuntimeError raised.
+
+        Testing Principle:
+            Closed sessions are immutable.
+        """
+        session = Session(SessionType.EXPERIMENT, tmp_path)
+        session.close()
+
+        with pytest.raises(RuntimeError, match="closed session"):
+            session.add_telemetry_sample(1, altitude=1.0)
+
+    def test_manager_forwards_to_active_session(self, tmp_path: Path) -> None:
+        """Verifies SessionManager forwards samples to the active session.
+
+        Arrangement:
+            SessionManager with an observation session started.
+
+        Action:
+            Add two samples through the manager.
+
+        Assertion Strategy:
+            Active session's columns hold both samples.
+
+        Testing Principle:
+            Recorder targeting the manager follows session rotation.
+        """
+        manager = SessionManager(data_dir=tmp_path)
+        manager.start_session(SessionType.OBSERVATION, target="M31")
+
+        manager.add_telemetry_sample(1, temperature=10.0)
+        manager.add_telemetry_sample(2, temperature=11.0)
+
+        session = manager.active_session
+        assert session is not None
+        assert len(session.telemetry_columns) == 2
+        manager.shutdown()
+
+
+class TestTelemetryRecorder:
+    """Tests for TelemetryRecorder sampling and lifecycle.
+
+    Categories:
+    1. Sampling - sensor and motor channels populated
+    2. Lifecycle - start/stop background task
+    3. Errors - device failures recorded as NaN, invalid rate
+
+    Total: 5 tests.
+    """
+
+    async def test_sample_once_reads_sensor_and_motor(self, tmp_path: Path) -> None:
+        """Verifies one sample captures sensor and motor state.
+
+        Arrangement:
+            Connected digital twin Sensor and Motor, Session sink.
+
+        Action:
+            Call sample_once().
+
+        Assertion Strategy:
+            All channels are finite; step columns match motor positions.
+
+        Testing Principle:
+            Recorder maps devices onto the documented channels.
+        """
+        sensor = Sensor(DigitalTwinSensorDriver())
+        motor = Motor(DigitalTwinMotorDriver())
+        await sensor.connect()
+        await motor.connect()
+        session = Session(SessionType.EXPERIMENT, tmp_path)
+        recorder = TelemetryRecorder(session, sensor=sensor, motor=motor)
+
+        await recorder.sample_once()
+
+        arrays = session.telemetry_columns.to_arrays()
+        for name in TELEMETRY_CHANNELS:
+            assert np.isfinite(arrays[name][0]), name
+        assert recorder.samples_recorded == 1
+        await sensor.disconnect()
+        await motor.disconnect()
+
+    async def test_start_stop_records_periodically(self, tmp_path: Path) -> None:
+        """Verifies the background task records multiple samples.
+
+        Arrangement:
+            Recorder at 200 Hz with no devices and a Session sink.
+
+        Action:
+            Start, sleep briefly, stop.
+
+        Assertion Strategy:
+            Several samples recorded, task no longer running, and sample
+            timestamps are strictly increasing.
+
+        Testing Principle:
+            Periodic scheduling without a device still produces rows.
+        """
+        session = Session(SessionType.EXPERIMENT, tmp_path)
+        recorder = TelemetryRecorder(session, rate_hz=200.0)
+
+        await recorder.start()
+        await recorder.start()  # idempotent
+        assert recorder.is_running
+        await asyncio.sleep(0.05)
+        await recorder.stop()
+        await recorder.stop()  # safe when stopped
+
+        timestamps = session.telemetry_columns.to_arrays()["timestamp_ns"]
+        assert not recorder.is_running
+        assert len(timestamps) >= 3
+        assert np.all(np.diff(timestamps) > 0)
+
+    async def test_sensor_failure_counts_error_and_stores_nan(
+        self, tmp_path: Path
+    ) -> None:
+        """Verifies a failing sensor yields NaN rows instead of stopping.
+
+        Arrangement:
+            Mock sensor whose read() raises.
+
+        Action:
+            Call sample_once().
+
+        Assertion Strategy:
+            errors == 1, sample still written with NaN altitude.
+
+        Testing Principle:
+            Transient device faults must not lose the time base.
+        """
+        sensor = Mock(spec=Sensor)
+        sensor.connected = True
+        sensor.read = AsyncMock(side_effect=RuntimeError("serial glitch"))
+        session = Session(SessionType.EXPERIMENT, tmp_path)
+        recorder = TelemetryRecorder(session, sensor=sensor)
+
+        await recorder.sample_once()
+
+        assert recorder.errors == 1
+        assert math.isnan(session.telemetry_columns.to_arrays()["altitude"][0])
+
+    async def test_closed_sink_does_not_kill_task(self, tmp_path: Path) -> None:
+        """Verifies sink errors are counted while the loop keeps running.
+
+        Arrangement:
+            Recorder targeting an already-closed Session.
+
+        Action:
+            Start, sleep briefly.
+
+        Assertion Strategy:
+            Task still running and errors counted.
+
+        Testing Principle:
+            Background recorder is resilient to session lifecycle races.
+        """
+        session = Session(SessionType.EXPERIMENT, tmp_path)
+        session.close()
+        recorder = TelemetryRecorder(session, rate_hz=200.0)
+
+        await recorder.start()
+        await asyncio.sleep(0.02)
+        assert recorder.is_running
+        await recorder.stop()
+        assert recorder.errors >= 1
+
+    def test_invalid_rate_raises(self, tmp_path: Path) -> None:
+        """Verifies non-positive sampling rate is rejected.
+
+        Arrangement:
+            Session sink.
+
+        Action:
+            Construct recorder with rate_hz=0.
+
+        Assertion Strategy:
+            ValueError raised.
+
+        Testing Principle:
+            Fail fast on invalid configuration.
+        """
+        session = Session(SessionType.EXPERIMENT, tmp_path)
+        with pytest.raises(ValueError, match="rate_hz"):
+            TelemetryRecorder(session, rate_hz=0)
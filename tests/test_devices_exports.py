@@ -103,9 +103,9 @@ class TestDevicesExports:
             Validates documentation currency, ensuring code comments
             accurately reflect implementation.
         """
-        assert (
-            len(devices.__all__) == 39
-        ), f"Expected 39 exports (per comment), got {len(devices.__all__)}"
+        assert len(devices.__all__) == 45, (
+            f"Expected 45 exports (per comment), got {len(devices.__all__)}"
+        )
 
     def test_export_categories(self) -> None:
         """Verifies expected symbols exist in each export category.
@@ -133,7 +133,11 @@ class TestDevicesExports:
         """
         # Key exports that must exist
         camera_exports = ["Camera", "CameraConfig", "CaptureResult", "CameraInfo"]
-        controller_exports = ["CameraController", "SyncCaptureConfig"]
+        controller_exports = [
+            "CameraController",
+            "SyncCaptureConfig",
+            "GroupCaptureMember",
+        ]
         registry_exports = ["CameraRegistry", "init_registry", "get_registry"]
         sensor_exports = ["Sensor", "SensorConfig", "SensorDeviceStatus"]
 
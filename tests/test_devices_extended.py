@@ -1,9 +1,16 @@
 """Extended tests for device layer - Camera, Controller, Registry."""
 
+import asyncio
+import threading
 import time
+from concurrent.futures import Future
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
+from telescope_mcp.devices import camera_controller, camera_registry
 from telescope_mcp.devices.camera import (
     Camera,
     CameraConfig,
@@ -11,19 +18,24 @@ from telescope_mcp.devices.camera import (
     CameraHooks,
     CameraInfo,
     CameraNotConnectedError,
+    CaptureAbortedError,
     CaptureOptions,
+    CaptureResult,
     OverlayConfig,
     SystemClock,
 )
 from telescope_mcp.devices.camera_controller import (
     CameraController,
     CameraNotFoundError,
+    GroupCaptureMember,
     SyncCaptureConfig,
     SyncCaptureError,
 )
 from telescope_mcp.devices.camera_registry import (
     CameraNotInRegistryError,
     CameraRegistry,
+    HotplugEvent,
+    HotplugEventKind,
     NullRecoveryStrategy,
     RecoveryStrategy,
     get_registry,
@@ -183,6 +195,90 @@ class TestCameraCapture:
         assert config.camera_id == 0
         assert config.name == "Test"
 
+    def test_capture_raw_keeps_array_and_encodes_lazily(self, camera):
+        """Verifies capture_raw returns the sensor array with no encode yet.
+
+        Arrangement:
+        1. Camera fixture backed by the digital twin.
+
+        Action:
+        capture_raw(image_type="RAW16"), then access image_data twice and
+        encode("png").
+
+        Assertion Strategy:
+        Validates lazy raw results by confirming:
+        - raw is uint16 at camera resolution, image_type "RAW16".
+        - is_encoded False until image_data is read.
+        - image_data is JPEG and memoized (same object on re-read).
+        - PNG encoding is independent and also memoized.
+
+        Testing Principle:
+        Science captures never pay for an encode nobody reads.
+        """
+        result = camera.capture_raw(exposure_us=50000, image_type="RAW16")
+
+        assert result.raw.dtype == np.uint16
+        assert (result.height, result.width) == result.raw.shape
+        assert result.image_type == "RAW16"
+        assert not result.is_encoded
+
+        jpeg = result.image_data
+        assert jpeg[:2] == b"\xff\xd8"
+        assert result.is_encoded
+        assert result.image_data is jpeg
+        assert result.encode("png") is result.encode("png")
+
+    def test_capture_format_option_selects_image_data_encoding(self, camera):
+        """Verifies CaptureOptions.format picks the image_data encoding.
+
+        Arrangement:
+        1. Camera fixture backed by the digital twin.
+
+        Action:
+        capture() with format="raw" and image_type="RAW8".
+
+        Assertion Strategy:
+        image_data equals raw.tobytes(); JPEG still available on demand.
+
+        Testing Principle:
+        Consumers choose the encoding, not the driver.
+        """
+        result = camera.capture(
+            CaptureOptions(exposure_us=50000, format="raw", image_type="RAW8")
+        )
+
+        assert result.image_data == result.raw.tobytes()
+        assert result.encode("jpeg", quality=60)[:2] == b"\xff\xd8"
+
+    def test_encoded_only_result_rejects_other_formats(self):
+        """Verifies results without raw return supplied bytes only.
+
+        Arrangement:
+        CaptureResult built from JPEG bytes (as overlay rendering does).
+
+        Action:
+        Read image_data, then encode("png"); construct with neither input.
+
+        Assertion Strategy:
+        Supplied bytes returned as-is; ValueError for PNG and for an
+        empty result.
+
+        Testing Principle:
+        Pre-encoded results are never silently re-encoded.
+        """
+        result = CaptureResult(
+            image_data=b"\xff\xd8jpeg",
+            timestamp=datetime.now(UTC),
+            exposure_us=1000,
+            gain=0,
+        )
+
+        assert result.image_data == b"\xff\xd8jpeg"
+        with pytest.raises(ValueError, match="pre-encoded"):
+            result.encode("png")
+        with pytest.raises(ValueError, match="image_data or raw"):
+            CaptureResult(timestamp=datetime.now(UTC), exposure_us=1, gain=0)
+
 
 class TestCameraOverlay:
     """Tests for Camera overlay functionality."""
@@ -882,6 +978,519 @@ class TestCameraControls:
         camera.disconnect()
 
 
+class TestCameraAsync:
+    """Tests for the async Camera API on per-camera executors.
+
+    Categories:
+    1. Capture - result parity, encoding off the loop, loop stays responsive
+    2. Cancellation - task cancel and stop_exposure abort without recovery
+    3. Streaming/Controls - stream_async, async control methods
+    4. Lifecycle - executor released on disconnect
+
+    Total: 8 tests.
+    """
+
+    @pytest.fixture
+    def camera(self):
+        """Connected digital twin Camera for async tests.
+
+        Returns:
+            Camera: Connected camera (camera_id=0), disconnected on teardown.
+        """
+        cam = Camera(DigitalTwinCameraDriver(), CameraConfig(camera_id=0))
+        cam.connect()
+        yield cam
+        cam.disconnect()
+
+    @staticmethod
+    def _make_blocking(camera, monkeypatch):
+        """Replace the instance capture with one that blocks until stopped.
+
+        Simulates the ASI SDK: capture_array() waits for the exposure and raises
+        once stop_exposure() is called from another thread.
+
+        Returns:
+            Tuple of (started, stopped) threading.Events.
+        """
+        started = threading.Event()
+        stopped = threading.Event()
+
+        def blocking_capture(exposure_us, image_type=None):
+            started.set()
+            if stopped.wait(5):
+                raise RuntimeError("Exposure failed with status: 3")
+            return np.zeros((2, 2), dtype=np.uint8)
+
+        instance = MagicMock(wraps=camera._instance)
+        instance.capture_array.side_effect = blocking_capture
+        instance.stop_exposure.side_effect = stopped.set
+        monkeypatch.setattr(camera, "_instance", instance)
+        return started, stopped
+
+    async def test_capture_async_matches_capture(self, camera):
+        """Verifies capture_async returns a normal CaptureResult.
+
+        Arrangement:
+            Connected twin camera.
+
+        Action:
+            await capture_async with explicit exposure and gain.
+
+        Assertion Strategy:
+            JPEG bytes, requested settings, work ran off the loop thread.
+
+        Testing Principle:
+            Async API is a drop-in for capture().
+        """
+        loop_thread = threading.get_ident()
+        seen = []
+        camera._hooks.on_capture = lambda r: seen.append(threading.get_ident())
+
+        result = await camera.capture_async(CaptureOptions(exposure_us=20_000, gain=30))
+
+        assert result.image_data[:2] == b"\xff\xd8"
+        assert (result.exposure_us, result.gain) == (20_000, 30)
+        assert seen and seen[0] != loop_thread
+
+    async def test_capture_async_encodes_on_worker(self, camera, monkeypatch):
+        """Verifies the JPEG encode runs on the camera worker, not the loop.
+
+        Arrangement:
+            Spy on CaptureResult.encode recording the calling thread.
+
+        Action:
+            await capture_async.
+
+        Assertion Strategy:
+            Encode ran off the loop thread; image_data is already memoized.
+
+        Testing Principle:
+            Full-resolution encodes must not stall MCP tool calls.
+        """
+        loop_thread = threading.get_ident()
+        threads = []
+        encode = CaptureResult.encode
+
+        def spy(self, fmt="jpeg", quality=None):
+            threads.append(threading.get_ident())
+            return encode(self, fmt, quality)
+
+        monkeypatch.setattr(CaptureResult, "encode", spy)
+
+        result = await camera.capture_async(CaptureOptions(exposure_us=20_000))
+
+        assert threads and loop_thread not in threads
+        assert result.is_encoded  # image_data on the loop is a memo hit
+
+    async def test_event_loop_responsive_during_exposure(self, camera, monkeypatch):
+        """Verifies other coroutines run while an exposure is in progress.
+
+        Arrangement:
+            Instance capture blocks until stop_exposure().
+
+        Action:
+            Start capture_async, then run a ticker coroutine.
+
+        Assertion Strategy:
+            Ticker completes while the capture task is still pending.
+
+        Testing Principle:
+            Long exposures don't stall MCP tool calls.
+        """
+        started, _ = self._make_blocking(camera, monkeypatch)
+        task = asyncio.create_task(camera.capture_async())
+        await asyncio.to_thread(started.wait, 2)
+
+        ticks = 0
+        for _ in range(5):
+            await asyncio.sleep(0)
+            ticks += 1
+
+        assert ticks == 5
+        assert not task.done()
+        camera.stop_exposure()
+        with pytest.raises(CaptureAbortedError):
+            await task
+
+    async def test_cancel_aborts_exposure_without_recovery(self, camera, monkeypatch):
+        """Verifies cancelling the task stops the exposure, not reconnects.
+
+        Arrangement:
+            Blocking instance capture; recovery spy on the camera.
+
+        Action:
+            Cancel the capture_async task mid-exposure.
+
+        Assertion Strategy:
+            CancelledError raised, stop_exposure reached the driver, the
+            worker unwound without attempting recovery, camera still usable.
+
+        Testing Principle:
+            Abort is distinct from disconnect.
+        """
+        started, stopped = self._make_blocking(camera, monkeypatch)
+        recover_calls = []
+        camera._recover_and_capture = lambda **kw: recover_calls.append(kw)
+
+        task = asyncio.create_task(camera.capture_async())
+        await asyncio.to_thread(started.wait, 2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert stopped.is_set()
+        # Wait for the worker to finish unwinding before asserting
+        await camera._run_blocking(lambda: None)
+        assert recover_calls == []
+        assert camera.is_connected
+
+    async def test_stream_async_yields_frames_until_stopped(self, camera):
+        """Verifies stream_async yields sequential frames and stops cleanly.
+
+        Arrangement:
+            Connected twin camera.
+
+        Action:
+            Iterate stream_async, stop_stream() after third frame.
+
+        Assertion Strategy:
+            Sequence numbers 0..2, streaming flag cleared.
+
+        Testing Principle:
+            Async stream mirrors stream() semantics.
+        """
+        frames = []
+        async for frame in camera.stream_async(
+            CaptureOptions(apply_overlay=False), max_fps=1000
+        ):
+            frames.append(frame.sequence_number)
+            if len(frames) == 3:
+                camera.stop_stream()
+
+        assert frames == [0, 1, 2]
+        assert not camera.is_streaming
+
+    async def test_async_controls_round_trip(self, camera):
+        """Verifies async control setters/getters reach the driver.
+
+        Arrangement:
+            Connected twin camera.
+
+        Action:
+            set_control_async, set_control_info_async, then read back.
+
+        Assertion Strategy:
+            Values read back match; Gain tracked for future captures.
+
+        Testing Principle:
+            Control methods share the camera's worker thread.
+        """
+        await camera.set_control_async("Gain", 77)
+        info = await camera.set_control_info_async("Exposure", 12_345)
+
+        assert await camera.get_control_async("Gain") == 77
+        assert (await camera.get_control_info_async("Exposure"))["value"] == 12_345
+        assert info["value"] == 12_345
+        assert camera._current_gain == 77
+
+    async def test_not_connected_raises(self):
+        """Verifies async capture requires a connection.
+
+        Arrangement:
+            Unconnected camera.
+
+        Action:
+            await capture_async(); stop_exposure().
+
+        Assertion Strategy:
+            CameraNotConnectedError; stop_exposure is a no-op.
+
+        Testing Principle:
+            Same preconditions as the sync API.
+        """
+        cam = Camera(DigitalTwinCameraDriver(), CameraConfig(camera_id=0))
+
+        cam.stop_exposure()
+        with pytest.raises(CameraNotConnectedError):
+            await cam.capture_async()
+
+    async def test_disconnect_releases_executor(self, camera):
+        """Verifies disconnect shuts the worker down and reconnect works.
+
+        Arrangement:
+            Camera that has run one async capture.
+
+        Action:
+            disconnect(), connect(), capture_async() again.
+
+        Assertion Strategy:
+            Executor cleared on disconnect; new capture succeeds.
+
+        Testing Principle:
+            No thread leak across reconnects.
+        """
+        await camera.capture_async()
+        assert camera._executor is not None
+
+        camera.disconnect()
+        assert camera._executor is None
+
+        camera.connect()
+        assert (await camera.capture_async()).image_data
+
+
+class TestCameraBurst:
+    """Tests for pipelined burst() and stream(pipelined=True).
+
+    Categories:
+    1. Delivery - ordered, pre-encoded results; pipelined stream
+    2. Overlap - next exposure starts while the previous frame processes
+    3. Backpressure/Errors - bounded in-flight depth, failure propagation
+    4. Buffer reuse - pooled leases in stream() and burst(reuse_buffers)
+
+    Total: 6 tests.
+    """
+
+    @pytest.fixture
+    def camera(self):
+        """Connected digital twin Camera for burst tests.
+
+        Returns:
+            Camera: Connected camera (camera_id=0), disconnected on teardown.
+        """
+        cam = Camera(DigitalTwinCameraDriver(), CameraConfig(camera_id=0))
+        cam.connect()
+        yield cam
+        cam.disconnect()
+
+    @staticmethod
+    def _numbered_frames(camera, monkeypatch, fail_at=None):
+        """Make the instance return frames filled with their capture index.
+
+        Returns:
+            List of capture indices in the order the driver was called.
+        """
+        calls = []
+
+        def capture_array(exposure_us, image_type=None):
+            index = len(calls)
+            calls.append(index)
+            if index == fail_at:
+                raise RuntimeError("USB transfer failed")
+            return np.full((4, 4), index, dtype=np.uint8)
+
+        instance = MagicMock(wraps=camera._instance)
+        instance.capture_array.side_effect = capture_array
+        monkeypatch.setattr(camera, "_instance", instance)
+        return calls
+
+    def test_burst_delivers_encoded_frames_in_order(self, camera, monkeypatch):
+        """Verifies burst yields count frames in capture order, pre-encoded.
+
+        Arrangement:
+            Driver frames numbered 0..4; on_capture records its thread.
+
+        Action:
+            list(camera.burst(5)).
+
+        Assertion Strategy:
+            raw[0, 0] == index for each result; JPEG already cached;
+            on_capture ran off the caller's thread.
+
+        Testing Principle:
+            Pipelining does not reorder or change results.
+        """
+        self._numbered_frames(camera, monkeypatch)
+        hook_threads = []
+        camera._hooks.on_capture = lambda r: hook_threads.append(threading.get_ident())
+
+        results = list(camera.burst(5, CaptureOptions(apply_overlay=False)))
+
+        assert [int(r.raw[0, 0]) for r in results] == [0, 1, 2, 3, 4]
+        assert all(r.is_encoded and r.image_data[:2] == b"\xff\xd8" for r in results)
+        assert len(hook_threads) == 5
+        assert threading.get_ident() not in hook_threads
+
+    def test_next_exposure_overlaps_processing(self, camera, monkeypatch):
+        """Verifies exposure N+1 starts before frame N finishes processing.
+
+        Arrangement:
+            on_capture for frame 0 blocks until the driver is called for
+            frame 1 (or 2 s elapse).
+
+        Action:
+            list(camera.burst(3)).
+
+        Assertion Strategy:
+            The hook saw the second capture start while it was running.
+
+        Testing Principle:
+            Acquisition and processing run concurrently.
+        """
+        calls = self._numbered_frames(camera, monkeypatch)
+        overlapped = []
+
+        def slow_hook(result):
+            if int(result.raw[0, 0]) == 0:
+                deadline = time.monotonic() + 2
+                while len(calls) < 2 and time.monotonic() < deadline:
+                    time.sleep(0.001)
+                overlapped.append(len(calls) >= 2)
+
+        camera._hooks.on_capture = slow_hook
+
+        assert len(list(camera.burst(3, CaptureOptions(apply_overlay=False)))) == 3
+        assert overlapped == [True]
+
+    def test_depth_bounds_frames_in_flight(self, camera, monkeypatch):
+        """Verifies acquisition pauses when the consumer falls behind.
+
+        Arrangement:
+            Unbounded burst with depth=2.
+
+        Action:
+            Take one frame, wait, then close the generator.
+
+        Assertion Strategy:
+            Exactly delivered + depth frames were captured; no captures
+            after close; camera still usable.
+
+        Testing Principle:
+            Backpressure instead of unbounded buffering.
+        """
+        calls = self._numbered_frames(camera, monkeypatch)
+        frames = camera.burst(None, CaptureOptions(apply_overlay=False), depth=2)
+
+        next(frames)
+        time.sleep(0.2)
+        assert len(calls) == 3
+
+        frames.close()
+        assert len(calls) == 3
+        assert camera.capture(CaptureOptions(apply_overlay=False)).raw is not None
+
+    def test_capture_failure_raised_after_earlier_frames(self, camera, monkeypatch):
+        """Verifies a failing capture surfaces after delivered frames.
+
+        Arrangement:
+            Driver fails on the third call; no recovery strategy.
+
+        Action:
+            Iterate burst(5).
+
+        Assertion Strategy:
+            Frames 0 and 1 delivered, then CameraError; invalid arguments
+            and a disconnected camera raise before iteration.
+
+        Testing Principle:
+            Errors are ordered with frames, not lost on the worker thread.
+        """
+        with pytest.raises(ValueError, match="depth"):
+            camera.burst(3, depth=0)
+        with pytest.raises(CameraNotConnectedError):
+            Camera(DigitalTwinCameraDriver(), CameraConfig(camera_id=0)).burst(1)
+        self._numbered_frames(camera, monkeypatch, fail_at=2)
+        received = []
+
+        with pytest.raises(CameraError):
+            for result in camera.burst(5, CaptureOptions(apply_overlay=False)):
+                received.append(int(result.raw[0, 0]))
+
+        assert received == [0, 1]
+
+    def test_pipelined_stream_stops_cleanly(self, camera):
+        """Verifies stream(pipelined=True) numbers frames and stops.
+
+        Arrangement:
+            Connected twin camera.
+
+        Action:
+            Pipelined stream, stop_stream() after the third frame.
+
+        Assertion Strategy:
+            Sequence numbers 0..2 with JPEG data; streaming flag cleared.
+
+        Testing Principle:
+            Pipelined stream keeps stream() semantics.
+        """
+        frames = []
+        for frame in camera.stream(
+            CaptureOptions(exposure_us=1_000, apply_overlay=False),
+            max_fps=1000,
+            pipelined=True,
+        ):
+            assert frame.image_data[:2] == b"\xff\xd8"
+            frames.append(frame.sequence_number)
+            if len(frames) == 3:
+                camera.stop_stream()
+
+        assert frames == [0, 1, 2]
+        assert not camera.is_streaming
+
+    def test_stream_and_burst_reuse_pooled_buffers(self, camera, monkeypatch):
+        """Verifies stream() and burst(reuse_buffers=True) recycle leases.
+
+        Arrangement:
+            Instance gains a capture_pooled() that leases one of the
+            arrays it has handed back, allocating only when none is free.
+
+        Action:
+            Three frames from stream(), then burst(4, reuse_buffers=True)
+            with depth=1, then a plain burst(2).
+
+        Assertion Strategy:
+            Every lease is released; streaming and the reusing burst
+            allocate at most depth + 2 buffers; delivered results lose
+            raw once the loop moves on but keep their JPEG; the plain
+            burst never leases.
+
+        Testing Principle:
+            Hot capture loops do not allocate a frame per capture.
+        """
+        free: list[np.ndarray] = []
+        stats = {"allocated": 0, "leased": 0, "released": 0}
+
+        class _Lease:
+            def __init__(self, array):
+                self.array = array
+
+            def release(self):
+                stats["released"] += 1
+                free.append(self.array)
+
+        def capture_pooled(exposure_us, image_type=None):
+            stats["leased"] += 1
+            if not free:
+                stats["allocated"] += 1
+                free.append(np.empty((4, 4), dtype=np.uint8))
+            array = free.pop()
+            array.fill(stats["leased"])
+            return _Lease(array)
+
+        instance = MagicMock(wraps=camera._instance)
+        instance.capture_pooled = MagicMock(side_effect=capture_pooled)
+        monkeypatch.setattr(camera, "_instance", instance)
+        opts = CaptureOptions(exposure_us=1_000, apply_overlay=False)
+
+        for frame in camera.stream(opts, max_fps=1000):
+            assert frame.image_data[:2] == b"\xff\xd8"
+            if frame.sequence_number == 2:
+                camera.stop_stream()
+        assert stats["allocated"] == 1
+        assert stats["leased"] == stats["released"] == 3
+
+        delivered = []
+        for result in camera.burst(4, opts, depth=1, reuse_buffers=True):
+            assert result.raw is not None
+            delivered.append(result)
+        assert stats["leased"] == stats["released"] == 7
+        assert stats["allocated"] <= 3
+        assert all(r.raw is None and r.is_encoded for r in delivered)
+
+        assert all(r.raw is not None for r in camera.burst(2, opts))
+        assert stats["leased"] == 7
+
+
 class TestCameraController:
     """Tests for CameraController sync capture."""
 
@@ -1531,6 +2140,23 @@ class TestCameraControllerCoverage:
         assert exc_info.value.camera_name == "missing_cam"
 
 
+def _mock_camera() -> MagicMock:
+    """Return a mock Camera whose submit() runs work inline.
+
+    CameraController queues each capture with Camera.submit(); running it
+    on the calling thread keeps mock-camera scheduling deterministic.
+    """
+    camera = MagicMock()
+
+    def submit(func, *args):
+        future: Future = Future()
+        future.set_result(func(*args))
+        return future
+
+    camera.submit.side_effect = submit
+    return camera
+
+
 class TestCameraControllerErrorHandling:
     """Tests for CameraController error handling paths."""
 
@@ -1559,9 +2185,9 @@ class TestCameraControllerErrorHandling:
         """
         from unittest.mock import Mock
 
-        mock_primary = Mock()
+        mock_primary = _mock_camera()
         mock_primary.capture_raw.side_effect = RuntimeError("Primary failed")
-        mock_secondary = Mock()
+        mock_secondary = _mock_camera()
         mock_secondary.capture_raw.return_value = Mock()
 
         controller = CameraController(
@@ -1604,14 +2230,13 @@ class TestCameraControllerErrorHandling:
             Validates structured exceptions, ensuring failures include
             role and original error for debugging.
         """
-        from unittest.mock import Mock
 
         # Use real driver for primary to avoid timing issues
         driver = DigitalTwinCameraDriver()
         primary_cam = Camera(driver, CameraConfig(camera_id=0))
         primary_cam.connect()
 
-        mock_secondary = Mock()
+        mock_secondary = _mock_camera()
         mock_secondary.capture_raw.side_effect = RuntimeError("Secondary failed")
 
         controller = CameraController(
@@ -1660,9 +2285,9 @@ class TestCameraControllerErrorHandling:
         """
         from unittest.mock import Mock
 
-        mock_primary = Mock()
+        mock_primary = _mock_camera()
         mock_primary.capture_raw.return_value = None
-        mock_secondary = Mock()
+        mock_secondary = _mock_camera()
         mock_secondary.capture_raw.return_value = Mock()
 
         controller = CameraController(
@@ -1707,9 +2332,9 @@ class TestCameraControllerErrorHandling:
         """
         from unittest.mock import Mock
 
-        mock_primary = Mock()
+        mock_primary = _mock_camera()
         mock_primary.capture_raw.side_effect = RuntimeError("HW error")
-        mock_secondary = Mock()
+        mock_secondary = _mock_camera()
         mock_secondary.capture_raw.return_value = Mock()
 
         controller = CameraController(
@@ -1733,6 +2358,348 @@ class TestCameraControllerErrorHandling:
 # TestCameraRegistry - comprehensive tests for camera_registry.py
 
 
+class TestCameraControllerScheduling:
+    """Tests for per-camera worker dispatch and sleep+spin sync scheduling.
+
+    Total: 4 tests.
+    """
+
+    class _SleepOnlyClock:
+        """Clock that only advances when slept (deterministic timing)."""
+
+        def __init__(self) -> None:
+            """Start at t=0 with no recorded sleeps."""
+            self.now = 0.0
+            self.sleeps: list[float] = []
+
+        def monotonic(self) -> float:
+            """Return the current simulated time."""
+            return self.now
+
+        def sleep(self, seconds: float) -> None:
+            """Record the sleep and advance simulated time by it."""
+            self.sleeps.append(seconds)
+            self.now += max(seconds, 0.0)
+
+    def test_repeated_sync_capture_sub_millisecond(self):
+        """Verifies repeated real-clock sync captures stay under 1ms error.
+
+        Arrangement:
+        Twin finder/main cameras, default SystemClock and spin threshold.
+
+        Action:
+        Five sync captures (100ms primary, 10ms secondary).
+
+        Assertion Strategy:
+        timing_stats has 5 samples; median absolute error < 1000us (the
+        median tolerates a one-off GIL stall on a loaded test host); the
+        cameras' own executors serve every call.
+
+        Testing Principle:
+        Validates the precision goal: warm threads plus spin-wait remove
+        thread startup and sleep overshoot from the timing error.
+        """
+        driver = DigitalTwinCameraDriver()
+        finder = Camera(driver, CameraConfig(camera_id=0))
+        main = Camera(driver, CameraConfig(camera_id=1))
+        finder.connect()
+        main.connect()
+        controller = CameraController(cameras={"finder": finder, "main": main})
+        config = SyncCaptureConfig(
+            primary="finder",
+            secondary="main",
+            primary_exposure_us=100_000,
+            secondary_exposure_us=10_000,
+        )
+
+        try:
+            results = [controller.sync_capture(config)]
+            workers = (finder._executor, main._executor)
+            for _ in range(4):
+                results.append(controller.sync_capture(config))
+            summary = controller.timing_stats.get_summary("finder/main")
+            assert None not in workers
+            assert (finder._executor, main._executor) == workers
+        finally:
+            finder.disconnect()
+            main.disconnect()
+
+        errors = sorted(abs(r.timing_error_us) for r in results)
+        assert summary.count == 5
+        assert summary.last_error_us == results[-1].timing_error_us
+        assert errors[2] < 1000
+
+    def test_wait_until_sleeps_then_spins(self):
+        """Verifies the wait sleeps to the spin threshold, then spins.
+
+        Arrangement:
+        Clock advancing 50us per monotonic() call and by the slept amount.
+
+        Action:
+        _wait_until(1.0) with a 2ms spin threshold.
+
+        Assertion Strategy:
+        Exactly one sleep, ending ~2ms early; returns at or just past 1.0.
+
+        Testing Principle:
+        Validates the hybrid scheduler never sleeps into the final window.
+        """
+        clock = self._SleepOnlyClock()
+        original = clock.monotonic
+
+        def ticking() -> float:
+            """Advance 50us per read, like a real clock during a spin."""
+            clock.now += 50e-6
+            return original()
+
+        clock.monotonic = ticking
+        controller = CameraController(clock=clock, spin_threshold_sec=0.002)
+
+        controller._wait_until(1.0)
+
+        assert len(clock.sleeps) == 1
+        assert clock.sleeps[0] == pytest.approx(0.998, abs=1e-4)
+        assert 1.0 <= clock.now < 1.0001
+
+    def test_secondary_scheduled_from_primary_start(self, monkeypatch):
+        """Verifies the delay is measured from the primary's recorded start.
+
+        Arrangement:
+        Sleep-only clock, spin disabled, mock cameras.
+
+        Action:
+        sync_capture() with 1s primary and 100ms secondary.
+
+        Assertion Strategy:
+        Secondary sleeps exactly the 450ms ideal delay; timing error 0
+        recorded in timing_stats and logged with the running summary.
+
+        Testing Principle:
+        Validates deterministic scheduling with injected clocks.
+        """
+        clock = self._SleepOnlyClock()
+        primary = _mock_camera()
+        secondary = _mock_camera()
+        controller = CameraController(
+            cameras={"p": primary, "s": secondary},
+            clock=clock,
+            spin_threshold_sec=0,
+        )
+        log = MagicMock()
+        monkeypatch.setattr(camera_controller, "logger", log)
+
+        result = controller.sync_capture(
+            SyncCaptureConfig(
+                primary="p",
+                secondary="s",
+                primary_exposure_us=1_000_000,
+                secondary_exposure_us=100_000,
+            )
+        )
+
+        assert clock.sleeps == [pytest.approx(0.45)]
+        assert result.timing_error_us == 0
+        assert controller.timing_stats.get_summary("p/s").count == 1
+        log.info.assert_called_once()
+        assert log.info.call_args.args == ("Sync capture timing",)
+        assert log.info.call_args.kwargs["cameras"] == "p/s"
+        assert log.info.call_args.kwargs["count"] == 1
+        log.warning.assert_not_called()
+
+    def test_captures_share_camera_worker_and_validation(self):
+        """Verifies sync captures are queued on each Camera's own worker.
+
+        Arrangement:
+        Twin finder/main cameras; capture_raw wrapped to record the
+        thread it runs on.
+
+        Action:
+        sync_capture(), then construct with negative spin.
+
+        Assertion Strategy:
+        Each capture ran on its camera's "camera-<id>" worker thread, the
+        same one capture_async uses; negative spin_threshold_sec raises
+        ValueError.
+
+        Testing Principle:
+        Validates SDK calls on one handle stay serialized across the sync
+        and async APIs.
+        """
+        driver = DigitalTwinCameraDriver()
+        cameras = {
+            "p": Camera(driver, CameraConfig(camera_id=0)),
+            "s": Camera(driver, CameraConfig(camera_id=1)),
+        }
+        threads: dict[str, str] = {}
+        for name, camera in cameras.items():
+            camera.connect()
+            capture_raw = camera.capture_raw
+
+            def recording(*args, _name=name, _capture=capture_raw, **kwargs):
+                threads[_name] = threading.current_thread().name
+                return _capture(*args, **kwargs)
+
+            camera.capture_raw = recording
+        controller = CameraController(cameras=cameras)
+
+        try:
+            controller.sync_capture(
+                SyncCaptureConfig(
+                    primary="p",
+                    secondary="s",
+                    primary_exposure_us=2_000,
+                    secondary_exposure_us=1_000,
+                )
+            )
+        finally:
+            for camera in cameras.values():
+                camera.disconnect()
+
+        assert threads["p"].startswith("camera-0")
+        assert threads["s"].startswith("camera-1")
+
+        with pytest.raises(ValueError, match="spin_threshold_sec"):
+            CameraController(spin_threshold_sec=-1)
+
+
+class TestCameraControllerGroup:
+    """Tests for N-camera synchronized capture groups.
+
+    Total: 4 tests.
+    """
+
+    @pytest.fixture
+    def controller(self):
+        """Controller with three mock cameras on the real clock."""
+        controller = CameraController(
+            cameras={
+                "finder": _mock_camera(),
+                "main": _mock_camera(),
+                "guide": _mock_camera(),
+            }
+        )
+        yield controller
+
+    def test_calculate_group_timing(self, controller):
+        """Verifies offsets align every midpoint to the longest exposure.
+
+        Arrangement:
+        Exposures 10s, 2s, 0.5s.
+
+        Action:
+        calculate_group_timing(), then with empty and non-positive input.
+
+        Assertion Strategy:
+        Offsets 0, 4s, 4.75s; ValueError for invalid input.
+
+        Testing Principle:
+        Validates the pairwise formula generalized to N cameras.
+        """
+        offsets = controller.calculate_group_timing(
+            {"finder": 10_000_000, "main": 2_000_000, "guide": 500_000}
+        )
+
+        assert offsets == {"finder": 0, "main": 4_000_000, "guide": 4_750_000}
+        with pytest.raises(ValueError, match="empty"):
+            controller.calculate_group_timing({})
+        with pytest.raises(ValueError, match="guide"):
+            controller.calculate_group_timing({"finder": 1, "guide": 0})
+
+    def test_group_capture_aligns_midpoints(self, controller):
+        """Verifies all members run in parallel with per-camera timing.
+
+        Arrangement:
+        Members listed shortest-first: guide 10ms, main 40ms, finder 100ms.
+
+        Action:
+        sync_capture_group().
+
+        Assertion Strategy:
+        finder is the reference (offset 0, error 0); ideal offsets 30ms
+        and 45ms; measured starts within 5ms; results keep request order;
+        timing_stats has one entry per non-reference camera.
+
+        Testing Principle:
+        Validates one call replaces chained pairwise syncs.
+        """
+        result = controller.sync_capture_group(
+            [
+                GroupCaptureMember("guide", 10_000),
+                GroupCaptureMember("main", 40_000, gain=100),
+                GroupCaptureMember("finder", 100_000),
+            ]
+        )
+
+        assert result.reference == "finder"
+        assert list(result.members) == ["guide", "main", "finder"]
+        assert result.members["finder"].timing_error_us == 0
+        assert result.members["main"].ideal_offset_us == 30_000
+        assert result.members["guide"].ideal_offset_us == 45_000
+        assert result.max_abs_timing_error_us < 5_000
+        controller.get_camera("main").capture_raw.assert_called_once_with(
+            exposure_us=40_000, gain=100
+        )
+        assert set(controller.timing_stats.get_all_summaries()) == {
+            "finder/main",
+            "finder/guide",
+        }
+
+    def test_member_failure_names_camera(self, controller):
+        """Verifies a failing member raises SyncCaptureError with its name.
+
+        Arrangement:
+        guide capture_raw raises RuntimeError.
+
+        Action:
+        sync_capture_group() with all three cameras.
+
+        Assertion Strategy:
+        SyncCaptureError with camera_role "guide" and original_error set.
+
+        Testing Principle:
+        Validates failure attribution in groups of any size.
+        """
+        controller.get_camera("guide").capture_raw.side_effect = RuntimeError("USB")
+
+        with pytest.raises(SyncCaptureError) as exc_info:
+            controller.sync_capture_group(
+                [
+                    GroupCaptureMember("finder", 20_000),
+                    GroupCaptureMember("main", 10_000),
+                    GroupCaptureMember("guide", 5_000),
+                ]
+            )
+
+        assert exc_info.value.camera_role == "guide"
+        assert isinstance(exc_info.value.original_error, RuntimeError)
+
+    def test_invalid_members_rejected(self, controller):
+        """Verifies duplicate and unknown cameras are rejected up front.
+
+        Arrangement:
+        Controller with finder/main/guide.
+
+        Action:
+        Group with a repeated camera, then with an unregistered one.
+
+        Assertion Strategy:
+        ValueError for the duplicate, CameraNotFoundError for the unknown;
+        no capture started.
+
+        Testing Principle:
+        Validates fail-fast before any exposure begins.
+        """
+        with pytest.raises(ValueError, match="Duplicate"):
+            controller.sync_capture_group(
+                [GroupCaptureMember("main", 1_000), GroupCaptureMember("main", 500)]
+            )
+        with pytest.raises(CameraNotFoundError):
+            controller.sync_capture_group(
+                [GroupCaptureMember("main", 1_000), GroupCaptureMember("aux", 500)]
+            )
+        controller.get_camera("main").capture_raw.assert_not_called()
+
+
 class TestCameraRegistry:
     """Test suite for CameraRegistry discovery and singleton management.
 
@@ -2488,6 +3455,356 @@ class TestCameraRegistry:
         assert cameras[0].is_color is True
 
 
+class TestCameraRegistryHotplug:
+    """Tests for TTL-cached discovery and the hotplug monitor.
+
+    Categories:
+    1. TTL - cached within TTL, re-scan after expiry, validation
+    2. Scan - baseline, attach/detach events, subscribers, pre-open,
+       renumbered devices evict cached cameras
+    3. Monitor - deferred during exposure (including recovery retries),
+       thread lifecycle, scans serialized with get()
+
+    Total: 7 tests.
+    """
+
+    class _FakeClock:
+        """Clock whose monotonic time only moves when advanced."""
+
+        def __init__(self) -> None:
+            self.now = 0.0
+
+        def monotonic(self) -> float:
+            return self.now
+
+        def sleep(self, seconds: float) -> None:
+            self.now += seconds
+
+    @staticmethod
+    def _switchable_driver(visible: set[int]) -> MagicMock:
+        """Twin driver whose discovery only reports camera IDs in visible."""
+        twin = DigitalTwinCameraDriver()
+        all_cameras = twin.get_connected_cameras()
+        driver = MagicMock(wraps=twin)
+        driver.get_connected_cameras.side_effect = lambda: {
+            cam_id: info for cam_id, info in all_cameras.items() if cam_id in visible
+        }
+        return driver
+
+    def test_discovery_cached_until_ttl_expires(self) -> None:
+        """Verifies discover() only re-scans once the TTL has elapsed.
+
+        Arrangement:
+            Registry with a 10 s TTL on a fake clock.
+
+        Action:
+            discover() at t=0, t=9 and t=10; get() of an unknown ID before
+            and after expiry.
+
+        Assertion Strategy:
+            Driver enumerated once within the TTL and again at expiry;
+            unknown get() raises without a scan until the cache expires;
+            negative TTL raises ValueError.
+
+        Testing Principle:
+            Repeated lookups are memory hits, not USB enumerations.
+        """
+        clock = self._FakeClock()
+        driver = self._switchable_driver({0})
+        registry = CameraRegistry(driver, clock=clock, discovery_ttl_sec=10.0)
+
+        first = registry.discover()
+        clock.now = 9.0
+        assert registry.discover() is first
+        with pytest.raises(CameraNotInRegistryError):
+            registry.get(1)
+        assert driver.get_connected_cameras.call_count == 1
+
+        clock.now = 10.0
+        assert registry.discover() is not first
+        assert driver.get_connected_cameras.call_count == 2
+
+        clock.now = 20.0
+        with pytest.raises(CameraNotInRegistryError):
+            registry.get(1)
+        assert driver.get_connected_cameras.call_count == 3
+
+        with pytest.raises(ValueError, match="discovery_ttl_sec"):
+            CameraRegistry(driver, discovery_ttl_sec=-1)
+
+    def test_scan_reports_changes_and_pre_opens(self) -> None:
+        """Verifies attach/detach events reach subscribers and pre-open.
+
+        Arrangement:
+            Discovery sees camera 0 only; two subscribers, one raising.
+
+        Action:
+            scan_once() as baseline; make camera 1 visible and scan; hide
+            camera 0, unsubscribe, and scan again.
+
+        Assertion Strategy:
+            Baseline emits nothing; second scan emits ATTACHED for 1 and
+            connects it; third emits DETACHED for 0 to the remaining
+            subscriber only; the raising subscriber never breaks a scan.
+
+        Testing Principle:
+            Consumers learn about plug/unplug without polling, and a new
+            camera is ready before the first capture.
+        """
+        visible = {0}
+        registry = CameraRegistry(
+            self._switchable_driver(visible), discovery_ttl_sec=None
+        )
+        seen: list[HotplugEvent] = []
+        unsubscribe = registry.subscribe(seen.append)
+
+        def broken(event: HotplugEvent) -> None:
+            raise RuntimeError("subscriber bug")
+
+        registry.subscribe(broken)
+
+        assert registry.scan_once() == []
+
+        visible.add(1)
+        attached = registry.scan_once()
+
+        assert attached == [
+            HotplugEvent(HotplugEventKind.ATTACHED, 1, attached[0].info)
+        ]
+        assert seen == attached
+        assert registry.get(1).is_connected
+
+        unsubscribe()
+        unsubscribe()  # idempotent
+        visible.discard(0)
+        detached = registry.scan_once()
+
+        assert [(e.kind, e.camera_id) for e in detached] == [
+            (HotplugEventKind.DETACHED, 0)
+        ]
+        assert seen == attached
+        registry.clear()
+
+    def test_scan_deferred_while_exposing(self, monkeypatch) -> None:
+        """Verifies scans never enumerate the bus during an exposure.
+
+        Arrangement:
+            Registry with camera 0 held; is_exposing forced True.
+
+        Action:
+            scan_once().
+
+        Assertion Strategy:
+            Returns [] without calling the driver; scans again once the
+            exposure ends.
+
+        Testing Principle:
+            Hotplug polling must not compete with a capture for USB.
+        """
+        driver = self._switchable_driver({0})
+        registry = CameraRegistry(driver)
+        camera = registry.get(0)
+        calls = driver.get_connected_cameras.call_count
+        monkeypatch.setattr(type(camera), "is_exposing", property(lambda self: True))
+
+        assert registry.scan_once() == []
+        assert driver.get_connected_cameras.call_count == calls
+
+        monkeypatch.undo()
+        registry.scan_once()
+        assert driver.get_connected_cameras.call_count == calls + 1
+
+    def test_monitor_thread_lifecycle(self) -> None:
+        """Verifies start_monitor() scans in the background until stopped.
+
+        Arrangement:
+            Registry on the twin driver; subscriber recording events.
+
+        Action:
+            start_monitor() twice with a short interval, make camera 1
+            appear, then clear().
+
+        Assertion Strategy:
+            ATTACHED event delivered by the monitor thread; clear() stops
+            it; non-positive interval raises ValueError.
+
+        Testing Principle:
+            The monitor is idempotent and shut down with the registry.
+        """
+        visible = {0}
+        registry = CameraRegistry(self._switchable_driver(visible))
+        attached = threading.Event()
+        registry.subscribe(
+            lambda event: (
+                attached.set() if event.kind is HotplugEventKind.ATTACHED else None
+            )
+        )
+        with pytest.raises(ValueError, match="interval_sec"):
+            registry.start_monitor(interval_sec=0)
+
+        registry.discover()
+        registry.start_monitor(interval_sec=0.01, pre_open=False)
+        registry.start_monitor(interval_sec=0.01)  # idempotent
+        assert registry.is_monitoring
+        visible.add(1)
+
+        assert attached.wait(2)
+        registry.clear()
+        assert not registry.is_monitoring
+
+    def test_renumbered_devices_evict_cached_cameras(self) -> None:
+        """Verifies index changes are diffed by device, not by position.
+
+        Arrangement:
+            Two cameras held at indices 0 and 1; discovery then reports
+            only the second camera, renumbered to index 0 (what the SDK
+            does after camera 0 is unplugged).
+
+        Action:
+            scan_once(), then get(0); recovery check for the old index.
+
+        Assertion Strategy:
+            Camera 0's own device is reported DETACHED, the renumbered
+            camera DETACHED at 1 and ATTACHED at 0; both stale Cameras
+            are disconnected and evicted; get(0) is a new Camera named
+            after the device now at index 0; recovery refuses to rebind
+            a Camera to a different device.
+
+        Testing Principle:
+            A camera_id never silently switches to another sensor.
+        """
+        finder = {"name": "ASI120MC-S", "max_width": 1280, "max_height": 960}
+        main = {"name": "ASI482MC", "max_width": 1920, "max_height": 1080}
+        scans = [{0: finder, 1: main}]
+        driver = MagicMock(wraps=DigitalTwinCameraDriver())
+        driver.get_connected_cameras.side_effect = lambda: scans[-1]
+        registry = CameraRegistry(driver, discovery_ttl_sec=None)
+        first = registry.get(0, auto_connect=True)
+        second = registry.get(1, auto_connect=True)
+        strategy = RecoveryStrategy(registry)
+
+        scans.append({0: main})
+        events = registry.scan_once(pre_open=False)
+
+        assert [(e.kind, e.camera_id, e.info.name) for e in events] == [
+            (HotplugEventKind.DETACHED, 0, "ASI120MC-S"),
+            (HotplugEventKind.DETACHED, 1, "ASI482MC"),
+            (HotplugEventKind.ATTACHED, 0, "ASI482MC"),
+        ]
+        assert not first.is_connected and not second.is_connected
+        assert registry.camera_ids == []
+        assert registry.get(0) is not first
+        assert registry.get(0).config.name == "ASI482MC"
+
+        # A Camera still bound to the finder must not recover onto the main
+        registry.remove(0)
+        registry.get(0)
+        scans.append({0: finder})
+        assert strategy.attempt_recovery(0) is False
+        registry.get(0)  # A new Camera bound to the finder
+        assert strategy.attempt_recovery(0) is True
+        registry.clear()
+
+    def test_scan_waits_for_concurrent_get(self, monkeypatch) -> None:
+        """Verifies a monitor scan cannot interleave with get() creating a Camera.
+
+        Arrangement:
+            Cameras 0 and 1 visible; Camera construction blocks until
+            released, simulating get(1) being preempted mid-creation.
+
+        Action:
+            get(1) on one thread; camera 1 unplugged and scan_once() run on
+            another while get(1) is still constructing; then release.
+
+        Assertion Strategy:
+            The scan waits for get(1) to finish, then evicts the Camera it
+            created; the registry holds no Camera for the detached device.
+
+        Testing Principle:
+            Monitor eviction and tool-thread get() share the registry lock.
+        """
+        visible = {0, 1}
+        registry = CameraRegistry(
+            self._switchable_driver(visible), discovery_ttl_sec=None
+        )
+        registry.discover()
+        constructing = threading.Event()
+        release = threading.Event()
+        real_camera = camera_registry.Camera
+
+        def slow_camera(*args, **kwargs):
+            constructing.set()
+            release.wait(5)
+            return real_camera(*args, **kwargs)
+
+        monkeypatch.setattr(camera_registry, "Camera", slow_camera)
+        getter = threading.Thread(target=registry.get, args=(1,))
+        getter.start()
+        assert constructing.wait(5)
+
+        visible.discard(1)
+        scanner = threading.Thread(target=registry.scan_once, daemon=True)
+        scanner.start()
+        scanner.join(0.2)
+        blocked = scanner.is_alive()
+        release.set()
+        getter.join(5)
+        scanner.join(5)
+
+        assert blocked
+        assert not registry.has(1)
+        assert registry.camera_ids == []
+        registry.clear()
+
+    def test_recovery_retry_defers_scans(self) -> None:
+        """Verifies the post-recovery capture counts as an exposure.
+
+        Arrangement:
+            Registry camera whose first capture fails with a USB error;
+            the reopened instance runs scan_once() mid-capture.
+
+        Action:
+            capture().
+
+        Assertion Strategy:
+            Frame is marked recovered; the scan during the retry was
+            deferred (no enumeration); is_exposing is False afterwards.
+
+        Testing Principle:
+            Recovery keeps the same exposure bookkeeping as a capture.
+        """
+        twin = DigitalTwinCameraDriver()
+        driver = MagicMock(wraps=twin)
+        registry = CameraRegistry(driver, discovery_ttl_sec=None)
+        scans: list[list[HotplugEvent]] = []
+        opened: list[MagicMock] = []
+
+        def capture(exposure_us, image_type=None):
+            scans.append(registry.scan_once())
+            return np.zeros((4, 4), dtype=np.uint8)
+
+        def open_camera(camera_id):
+            instance = MagicMock(wraps=twin.open(camera_id))
+            instance.capture_array.side_effect = (
+                capture if opened else RuntimeError("USB reset")
+            )
+            opened.append(instance)
+            return instance
+
+        driver.open.side_effect = open_camera
+        camera = registry.get(0, auto_connect=True)
+        enumerations = driver.get_connected_cameras.call_count
+
+        result = camera.capture(CaptureOptions(apply_overlay=False))
+
+        assert result.metadata["recovered"] is True
+        assert scans == [[]]
+        # Only the recovery rescan enumerated the bus
+        assert driver.get_connected_cameras.call_count == enumerations + 1
+        assert not camera.is_exposing
+        registry.clear()
+
+
 class TestRecoveryStrategy:
     """Test suite for RecoveryStrategy USB recovery mechanism."""
 
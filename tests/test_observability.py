@@ -25,6 +25,7 @@ from telescope_mcp.observability.stats import (
     CameraStats,
     CameraStatsCollector,
     StatsSummary,
+    TimingStats,
     _percentile,
 )
 
@@ -1780,6 +1781,92 @@ class TestCameraStats:
         assert "timestamp" in result
 
 
+class TestTimingStats:
+    """Tests for TimingStats running scheduling-error statistics.
+
+    Total: 3 tests.
+    """
+
+    def test_summary_statistics(self):
+        """Verifies windowed and all-time fields are computed correctly.
+
+        Arrangement:
+        Window of 4 with samples -100, 100, 300, 500, -900 (first drops out).
+
+        Action:
+        get_summary() for the operation.
+
+        Assertion Strategy:
+        count is all-time (5); mean, stddev, and absolute-error fields
+        cover only the last 4 samples; max_abs and last are -900.
+
+        Testing Principle:
+        Validates bounded memory with all-time extremes preserved.
+        """
+        stats = TimingStats(window_size=4)
+        for error in (-100, 100, 300, 500, -900):
+            stats.record("finder/main", error)
+
+        summary = stats.get_summary("finder/main")
+
+        assert summary.count == 5
+        assert summary.mean_error_us == 0.0
+        assert summary.mean_abs_error_us == 450.0
+        assert summary.stddev_error_us == pytest.approx((1_160_000 / 4) ** 0.5)
+        assert summary.max_abs_error_us == 900.0
+        assert summary.last_error_us == -900.0
+        assert 500 < summary.p95_abs_error_us <= 900
+
+    def test_empty_and_reset(self):
+        """Verifies unknown operations are empty and reset clears samples.
+
+        Arrangement:
+        Two operations with one sample each.
+
+        Action:
+        Query an unknown name, reset one operation, then all.
+
+        Assertion Strategy:
+        Unknown name has count 0; reset removes only the named entry;
+        reset() empties get_all_summaries().
+
+        Testing Principle:
+        Validates isolation between operations.
+        """
+        stats = TimingStats()
+        stats.record("a/b", 10)
+        stats.record("c/d", 20)
+
+        assert stats.get_summary("x/y").count == 0
+        stats.reset("a/b")
+        assert list(stats.get_all_summaries()) == ["c/d"]
+        stats.reset()
+        assert stats.get_all_summaries() == {}
+
+    def test_to_dict_serializable(self):
+        """Verifies export is JSON-serializable and keyed by operation.
+
+        Arrangement:
+        One recorded sample.
+
+        Action:
+        to_dict() then json.dumps().
+
+        Assertion Strategy:
+        Operation present with its fields; timestamp included.
+
+        Testing Principle:
+        Validates session/API export compatibility.
+        """
+        stats = TimingStats()
+        stats.record("finder/main", 42)
+
+        data = json.loads(json.dumps(stats.to_dict()))
+
+        assert data["operations"]["finder/main"]["last_error_us"] == 42.0
+        assert "timestamp" in data
+
+
 class TestPercentile:
     """Tests for _percentile helper.
 
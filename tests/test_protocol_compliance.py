@@ -254,6 +254,28 @@ class TestSerialProtocolCompliance:
                 """
                 return b"test\r\n"
 
+            def read(self, size: int = 1) -> bytes:
+                """Read up to size bytes (stub implementation).
+
+                Stub method for protocol compliance testing. Returns a
+                fixed response truncated to size.
+
+                Args:
+                    size: Maximum bytes to read.
+
+                Returns:
+                    bytes: Up to size bytes of "test\\r\\n".
+
+                Raises:
+                    No exceptions raised. Stub always succeeds.
+
+                Example:
+                    >>> mock = MockSerialPort()
+                    >>> mock.read(4)
+                    b'test'
+                """
+                return b"test\r\n"[:size]
+
             def readline(self) -> bytes:
                 """Read line from serial port (stub implementation).
 
@@ -7,9 +7,11 @@ The Sensor class provides an async interface wrapping synchronous drivers:
 - async connect() / disconnect() for lifecycle
 - async read(samples=N) for single or averaged readings
 - async read_for(duration_ms) for time-based sampling
+- async read_at(when) / read_between(start, end) from buffered history
 - sample_rate_hz property queried from device on connect
 """
 
+import time
 from datetime import UTC, datetime
 from unittest.mock import Mock
 
@@ -2582,3 +2584,373 @@ class TestSensorCoverageGaps:
         assert status["is_open"] is True
         # error was None, should NOT be included
         assert "error" not in status
+
+
+class TestSensorBufferedReads:
+    """Tests for history-backed reads through the Sensor device.
+
+    Categories:
+    1. Buffered - averaged reads served from driver history
+    2. Fallback - drivers without history, validation
+    3. Waiting - only missing samples/duration are waited for
+    4. Limits - durations beyond history, stalled streams
+
+    Total: 7 tests.
+    """
+
+    @pytest.mark.asyncio
+    async def test_read_samples_served_from_history(self, monkeypatch) -> None:
+        """Verifies read(samples=N) uses buffered samples without waiting.
+
+        Business context:
+        The Arduino reader thread has already received the samples; an
+        averaged read should not cost N sample intervals of latency.
+
+        Arrangement:
+        1. Arduino instance (mock serial, no reader thread) with 10 parsed
+           lines, opened through a mock driver.
+        2. asyncio.sleep patched to fail if called.
+
+        Action:
+        Call read(samples=5), read_at() and read_between().
+
+        Assertion Strategy:
+        - history exposes the driver's SensorHistory.
+        - Averaged reading built from the newest 5 samples, no sleep.
+        - Time-indexed reads come from history.
+
+        Testing Principle:
+        Validates buffered reads are instant and use the newest data.
+        """
+        from unittest.mock import MagicMock
+
+        from telescope_mcp.drivers.sensors import ArduinoSensorInstance, SensorHistory
+
+        instance = ArduinoSensorInstance._create_with_serial(
+            MagicMock(), "/dev/ttyTEST", start_reader=False
+        )
+        for i in range(10):
+            instance._parse_line(f"{i * 0.1}\t0.0\t1.0\t30.0\t0.0\t40.0\t20.0\t50.0")
+        mock_driver = Mock()
+        mock_driver.open.return_value = instance
+
+        async def no_sleep(delay: float) -> None:
+            raise AssertionError("buffered read must not sleep")
+
+        sensor = Sensor(mock_driver)
+        await sensor.connect()
+        monkeypatch.setattr("telescope_mcp.devices.sensor.asyncio.sleep", no_sleep)
+
+        reading = await sensor.read(samples=5)
+        now = datetime.now(UTC)
+        at = await sensor.read_at(now)
+        window = await sensor.read_between(now.replace(year=2000), now)
+
+        assert isinstance(sensor.history, SensorHistory)
+        assert reading.raw_values == "averaged_5_samples"
+        assert reading.accelerometer["aX"] == pytest.approx(0.7)
+        assert at.raw_values == "interpolated"
+        assert window.raw_values == "averaged_10_samples"
+        await sensor.disconnect()
+        assert sensor.history is None
+
+    @pytest.mark.asyncio
+    async def test_time_reads_fall_back_without_history(self) -> None:
+        """Verifies read_at()/read_between() on drivers without history.
+
+        Business context:
+        The digital twin generates readings on demand; frame tagging must
+        still work with it.
+
+        Arrangement:
+        1. Sensor on the digital twin driver.
+
+        Action:
+        Call read_at(), read_between(), a reversed range, and reads while
+        disconnected.
+
+        Assertion Strategy:
+        - history is None; time reads return a live reading.
+        - Reversed range raises ValueError.
+        - Disconnected sensor raises RuntimeError.
+
+        Testing Principle:
+        Validates graceful degradation for non-streaming drivers.
+        """
+        sensor = Sensor(DigitalTwinSensorDriver())
+        now = datetime.now(UTC)
+        with pytest.raises(RuntimeError, match="not connected"):
+            await sensor.read_at(now)
+        with pytest.raises(RuntimeError, match="not connected"):
+            await sensor.read_between(now, now)
+
+        await sensor.connect()
+        at = await sensor.read_at(now)
+        window = await sensor.read_between(now, now)
+
+        assert sensor.history is None
+        assert 0 <= at.altitude <= 90
+        assert 0 <= window.azimuth < 360
+        with pytest.raises(ValueError, match="precede"):
+            await sensor.read_between(now, now.replace(year=2000))
+        await sensor.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_read_waits_only_for_missing_samples(self, monkeypatch) -> None:
+        """Verifies read(samples=N) sleeps only for samples not yet buffered.
+
+        Business context:
+        Right after connect only part of an averaging window is buffered;
+        the caller should wait for the gap, not the whole window.
+
+        Arrangement:
+        1. Arduino instance (no reader thread) with 3 parsed lines.
+        2. asyncio.sleep patched to record delays and parse one line per
+           call, simulating the reader thread.
+
+        Action:
+        read(samples=3, wait=False), then read(samples=5).
+
+        Assertion Strategy:
+        - wait=False averages the buffered samples without sleeping.
+        - Waiting sleeps for 2 missing intervals, then averages 5 samples.
+
+        Testing Principle:
+        Validates latency is proportional to missing data only.
+        """
+        from unittest.mock import MagicMock
+
+        from telescope_mcp.drivers.sensors import ArduinoSensorInstance
+
+        instance = ArduinoSensorInstance._create_with_serial(
+            MagicMock(), "/dev/ttyTEST", start_reader=False
+        )
+        line = "0.0\t0.0\t1.0\t30.0\t0.0\t40.0\t20.0\t50.0"
+        for _ in range(3):
+            instance._parse_line(line)
+        mock_driver = Mock()
+        mock_driver.open.return_value = instance
+        sensor = Sensor(mock_driver)
+        await sensor.connect()
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+            instance._parse_line(line)
+
+        monkeypatch.setattr("telescope_mcp.devices.sensor.asyncio.sleep", fake_sleep)
+
+        partial = await sensor.read(samples=5, wait=False)
+        assert partial.raw_values == "averaged_3_samples"
+        assert delays == []
+
+        full = await sensor.read(samples=5)
+
+        assert full.raw_values == "averaged_5_samples"
+        assert delays[0] == pytest.approx(2 / sensor.sample_rate_hz)
+        await sensor.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_read_for_served_from_buffered_window(self, monkeypatch) -> None:
+        """Verifies read_for() averages buffered stream time without waiting.
+
+        Business context:
+        A 2-second average on a sensor streaming for longer than 2 s
+        should return immediately.
+
+        Arrangement:
+        1. Arduino instance with 30 samples 100 ms apart (3 s of stream)
+           ending now.
+        2. asyncio.sleep patched to fail if called.
+
+        Action:
+        Call read_for(duration_ms=2000).
+
+        Assertion Strategy:
+        - Samples from the last 2 s of stream averaged, no sleep.
+
+        Testing Principle:
+        Validates duration reads are instant once the window is buffered.
+        """
+        from unittest.mock import MagicMock
+
+        from telescope_mcp.drivers.sensors import ArduinoSensorInstance
+
+        instance = ArduinoSensorInstance._create_with_serial(
+            MagicMock(), "/dev/ttyTEST", start_reader=False
+        )
+        start_ns = time.monotonic_ns() - 29 * 100_000_000
+        for i in range(30):
+            instance.history.append(
+                [0.0, 0.0, 1.0, 30.0, 0.0, 40.0, 20.0, 50.0],
+                t_ns=start_ns + i * 100_000_000,
+            )
+        mock_driver = Mock()
+        mock_driver.open.return_value = instance
+        sensor = Sensor(mock_driver)
+        await sensor.connect()
+
+        async def no_sleep(delay: float) -> None:
+            raise AssertionError("buffered window must not sleep")
+
+        monkeypatch.setattr("telescope_mcp.devices.sensor.asyncio.sleep", no_sleep)
+
+        reading = await sensor.read_for(duration_ms=2000)
+
+        assert reading.raw_values == "averaged_21_samples"
+        await sensor.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_read_for_waits_until_window_covered(self, monkeypatch) -> None:
+        """Verifies read_for() keeps waiting while the stream lags.
+
+        Business context:
+        A reader delivering slower than the nominal rate must not cut a
+        calibration average short after a single sleep.
+
+        Arrangement:
+        1. Arduino instance with 5 samples 100 ms apart ending now.
+        2. asyncio.sleep patched to record delays and deliver one sample
+           per call, however long the sleep.
+
+        Action:
+        read_for(duration_ms=2000), then read_for() beyond the history.
+
+        Assertion Strategy:
+        - First sleep is the uncovered 1.5 s; sleeps repeat until 20
+          samples span the window, which is then averaged.
+        - A duration longer than capacity / rate raises ValueError.
+
+        Testing Principle:
+        Validates the window is covered, not merely waited for once.
+        """
+        from unittest.mock import MagicMock
+
+        from telescope_mcp.drivers.sensors import ArduinoSensorInstance
+
+        instance = ArduinoSensorInstance._create_with_serial(
+            MagicMock(), "/dev/ttyTEST", start_reader=False
+        )
+        values = [0.0, 0.0, 1.0, 30.0, 0.0, 40.0, 20.0, 50.0]
+        start_ns = time.monotonic_ns() - 4 * 100_000_000
+        for i in range(5):
+            instance.history.append(values, t_ns=start_ns + i * 100_000_000)
+        mock_driver = Mock()
+        mock_driver.open.return_value = instance
+        sensor = Sensor(mock_driver)
+        await sensor.connect()
+        delays: list[float] = []
+
+        async def slow_stream(delay: float) -> None:
+            delays.append(delay)
+            newest = instance.history.newest_ns
+            instance.history.append(values, t_ns=newest + 100_000_000)
+
+        monkeypatch.setattr("telescope_mcp.devices.sensor.asyncio.sleep", slow_stream)
+
+        reading = await sensor.read_for(duration_ms=2000)
+
+        assert delays[0] == pytest.approx(1.5)
+        assert len(delays) == 15
+        assert reading.raw_values == "averaged_20_samples"
+        span_ms = instance.history.capacity * 1000 / sensor.sample_rate_hz
+        with pytest.raises(ValueError, match="exceeds"):
+            await sensor.read_for(duration_ms=int(span_ms) + 1)
+        await sensor.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_read_for_rejects_stalled_stream(self) -> None:
+        """Verifies a stream that stopped is not averaged as current.
+
+        Business context:
+        After a cable pull the history still holds the last samples;
+        reporting them as the present orientation would mis-tag frames.
+
+        Arrangement:
+        1. Arduino instance with 30 samples whose newest is 5 s old.
+
+        Action:
+        read_for(duration_ms=1000, wait=False).
+
+        Assertion Strategy:
+        - RuntimeError naming the stall.
+
+        Testing Principle:
+        Validates stale data fails loudly instead of silently.
+        """
+        from unittest.mock import MagicMock
+
+        from telescope_mcp.drivers.sensors import ArduinoSensorInstance
+
+        instance = ArduinoSensorInstance._create_with_serial(
+            MagicMock(), "/dev/ttyTEST", start_reader=False
+        )
+        start_ns = time.monotonic_ns() - 8_000_000_000
+        for i in range(30):
+            instance.history.append(
+                [0.0, 0.0, 1.0, 30.0, 0.0, 40.0, 20.0, 50.0],
+                t_ns=start_ns + i * 100_000_000,
+            )
+        mock_driver = Mock()
+        mock_driver.open.return_value = instance
+        sensor = Sensor(mock_driver)
+        await sensor.connect()
+
+        with pytest.raises(RuntimeError, match="stalled"):
+            await sensor.read_for(duration_ms=1000, wait=False)
+        await sensor.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_all_buffered_reads_reject_stalled_stream(self) -> None:
+        """Verifies every history-backed read applies the staleness check.
+
+        Business context:
+        Frame tagging uses read_at()/read_between() and pointing uses
+        read(samples=N); a stalled stream must not feed any of them.
+
+        Arrangement:
+        1. Arduino instance with 30 samples whose newest is 5 s old.
+        2. Digital twin instance for comparison.
+
+        Action:
+        read(samples=5), read_at() and read_between() on the stalled
+        sensor; protocol checks on both instances.
+
+        Assertion Strategy:
+        - Each read raises RuntimeError naming the stall.
+        - Arduino matches BufferedSensorInstance; the twin does not.
+
+        Testing Principle:
+        Validates one freshness rule across all buffered read paths.
+        """
+        from unittest.mock import MagicMock
+
+        from telescope_mcp.drivers.sensors import (
+            ArduinoSensorInstance,
+            BufferedSensorInstance,
+        )
+
+        instance = ArduinoSensorInstance._create_with_serial(
+            MagicMock(), "/dev/ttyTEST", start_reader=False
+        )
+        start_ns = time.monotonic_ns() - 8_000_000_000
+        for i in range(30):
+            instance.history.append(
+                [0.0, 0.0, 1.0, 30.0, 0.0, 40.0, 20.0, 50.0],
+                t_ns=start_ns + i * 100_000_000,
+            )
+        mock_driver = Mock()
+        mock_driver.open.return_value = instance
+        sensor = Sensor(mock_driver)
+        await sensor.connect()
+        now = datetime.now(UTC)
+
+        assert isinstance(instance, BufferedSensorInstance)
+        assert not isinstance(DigitalTwinSensorDriver().open(), BufferedSensorInstance)
+        with pytest.raises(RuntimeError, match="stalled"):
+            await sensor.read(samples=5, wait=False)
+        with pytest.raises(RuntimeError, match="stalled"):
+            await sensor.read_at(now)
+        with pytest.raises(RuntimeError, match="stalled"):
+            await sensor.read_between(now.replace(year=2000), now)
+        await sensor.disconnect()
@@ -182,6 +182,32 @@ class TestCreateServer:
         assert server1 is not None
         assert server2 is not None
 
+    def test_create_server_starts_transform_warmup(self, monkeypatch):
+        """Verifies server creation shares the dashboard's warmup path.
+
+        Arrangement:
+        1. Digital twin mode enabled.
+        2. _init_transforms replaced with a recording stub.
+
+        Action:
+        Creates server.
+
+        Assertion Strategy:
+        Validates warmup wiring by confirming:
+        - _init_transforms called exactly once.
+
+        Testing Principle:
+        Validates a single source of truth for site location and
+        IERS settings used by the coordinate warmup.
+        """
+        calls = []
+        monkeypatch.setattr(
+            server_module, "_init_transforms", lambda: calls.append(True)
+        )
+        use_digital_twin()
+        create_server()
+        assert calls == [True]
+
     def test_start_dashboard_idempotent(self):
         """Verifies start_dashboard is idempotent when already running.
 
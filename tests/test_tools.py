@@ -994,9 +994,10 @@ class TestCameraToolsIntegration:
         """Verifies TOOLS list contains all expected camera tools.
 
         Arrangement:
-        1. cameras.TOOLS defines 5 camera tools.
+        1. cameras.TOOLS defines 8 camera tools.
         2. Expected: list_cameras, get_camera_info, capture_frame,
-           set_camera_control, get_camera_control.
+           set_camera_control, get_camera_control, start_sequence,
+           get_sequence_status, abort_sequence.
         3. Validates tool registration completeness.
 
         Action:
@@ -1009,7 +1010,8 @@ class TestCameraToolsIntegration:
         - 'capture_frame' in tool_names.
         - 'set_camera_control' in tool_names.
         - 'get_camera_control' in tool_names.
-        - len(tool_names) = 5.
+        - sequence tools in tool_names.
+        - len(tool_names) = 8.
 
         Testing Principle:
         Validates API completeness, ensuring all
@@ -1023,7 +1025,10 @@ class TestCameraToolsIntegration:
         assert "capture_frame" in tool_names
         assert "set_camera_control" in tool_names
         assert "get_camera_control" in tool_names
-        assert len(tool_names) == 5
+        assert "start_sequence" in tool_names
+        assert "get_sequence_status" in tool_names
+        assert "abort_sequence" in tool_names
+        assert len(tool_names) == 8
 
     @pytest.mark.asyncio
     async def test_base64_image_decoding(self):
@@ -7,7 +7,7 @@ Covers edge cases and error paths not tested in test_tools.py:
 """
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -168,7 +168,9 @@ class TestCameraToolsCoverage:
         Covers exception handler in _capture_frame (lines 441-448).
         """
         mock_camera = MagicMock()
-        mock_camera.capture.side_effect = RuntimeError("Capture timeout")
+        mock_camera.capture_async = AsyncMock(
+            side_effect=RuntimeError("Capture timeout")
+        )
 
         mock_registry = MagicMock()
         mock_registry.get.return_value = mock_camera
@@ -189,7 +191,7 @@ class TestCameraToolsCoverage:
         """Verifies _set_camera_control handles exceptions gracefully.
 
         Arrangement:
-        1. Mock camera that raises ValueError on set_control_info.
+        1. Mock camera that raises ValueError on set_control_info_async.
         2. Simulates invalid control name.
 
         Action:
@@ -204,8 +206,8 @@ class TestCameraToolsCoverage:
         Covers exception handler in _set_camera_control (lines 499-506).
         """
         mock_camera = MagicMock()
-        mock_camera.set_control_info.side_effect = ValueError(
-            "Unknown control: InvalidControl"
+        mock_camera.set_control_info_async = AsyncMock(
+            side_effect=ValueError("Unknown control: InvalidControl")
         )
 
         mock_registry = MagicMock()
@@ -229,7 +231,7 @@ class TestCameraToolsCoverage:
         """Verifies _get_camera_control handles exceptions gracefully.
 
         Arrangement:
-        1. Mock camera that raises ValueError on get_control_info.
+        1. Mock camera that raises ValueError on get_control_info_async.
         2. Simulates invalid control name.
 
         Action:
@@ -244,8 +246,8 @@ class TestCameraToolsCoverage:
         Covers exception handler in _get_camera_control.
         """
         mock_camera = MagicMock()
-        mock_camera.get_control_info.side_effect = ValueError(
-            "Unknown control: BadControl"
+        mock_camera.get_control_info_async = AsyncMock(
+            side_effect=ValueError("Unknown control: BadControl")
         )
 
         mock_registry = MagicMock()
@@ -641,8 +643,9 @@ class TestCameraToolsCoverage:
         Assertion Strategy:
             Validates module API surface by confirming:
             - TOOLS attribute exists on module.
-            - Exactly 5 tools defined (list_cameras, get_camera_info, capture_frame,
-              set_camera_control, get_camera_control).
+            - Exactly 8 tools defined (list_cameras, get_camera_info, capture_frame,
+              set_camera_control, get_camera_control, start_sequence,
+              get_sequence_status, abort_sequence).
             - All expected tool names present in the list.
 
         Testing Principle:
@@ -650,13 +653,16 @@ class TestCameraToolsCoverage:
             for MCP server registration and client discovery protocols.
         """
         assert hasattr(cameras, "TOOLS")
-        assert len(cameras.TOOLS) == 5
+        assert len(cameras.TOOLS) == 8
         tool_names = [t.name for t in cameras.TOOLS]
         assert "list_cameras" in tool_names
         assert "get_camera_info" in tool_names
         assert "capture_frame" in tool_names
         assert "set_camera_control" in tool_names
         assert "get_camera_control" in tool_names
+        assert "start_sequence" in tool_names
+        assert "get_sequence_status" in tool_names
+        assert "abort_sequence" in tool_names
 
     # -------------------------------------------------------------------------
     # register function coverage
@@ -927,3 +933,176 @@ class TestCameraToolsCoverage:
 
         result = await list_tools_handler()
         assert result == cameras.TOOLS
+
+
+class TestSequenceTools:
+    """Tests for start_sequence, get_sequence_status, and abort_sequence.
+
+    Uses a connected digital twin Camera behind a mock registry and a real
+    SessionManager in tmp_path.
+
+    Total: 4 tests.
+    """
+
+    @pytest.fixture(autouse=True)
+    def _clear_sequences(self):
+        """Reset the module-level sequence table around each test."""
+        cameras._sequences.clear()
+        yield
+        cameras._sequences.clear()
+
+    @pytest.fixture
+    def registry(self):
+        """Mock registry returning a connected twin camera."""
+        from telescope_mcp.devices.camera import Camera, CameraConfig
+        from telescope_mcp.drivers.cameras.twin import DigitalTwinCameraDriver
+
+        camera = Camera(DigitalTwinCameraDriver(), CameraConfig(camera_id=0))
+        camera.connect()
+        registry = MagicMock()
+        registry.get.return_value = camera
+        yield registry
+        camera.disconnect()
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """SessionManager writing to tmp_path."""
+        from telescope_mcp.data import SessionManager
+
+        return SessionManager(tmp_path / "data")
+
+    async def test_start_then_status_completes(self, registry, manager):
+        """Verifies a started sequence runs to completion and reports status.
+
+        Arrangement:
+            Twin camera registry and idle session manager.
+
+        Action:
+            _start_sequence() with two light frames, wait, then
+            _get_sequence_status() by ID and with no ID.
+
+        Assertion Strategy:
+            Start returns a sequence_id in pending/running state; status
+            reports completed with 2/2 frames; None selects the latest.
+
+        Testing Principle:
+            One tool call drives a whole series without per-frame round trips.
+        """
+        result = await cameras._start_sequence(
+            0,
+            [{"count": 2, "exposure_us": 1000, "gain": 10}],
+            registry=registry,
+            manager=manager,
+        )
+        started = json.loads(result[0].text)
+        await cameras._sequences[started["sequence_id"]].wait()
+
+        by_id = json.loads(
+            (await cameras._get_sequence_status(started["sequence_id"]))[0].text
+        )
+        latest = json.loads((await cameras._get_sequence_status())[0].text)
+
+        assert started["state"] in ("pending", "running")
+        assert by_id["state"] == "completed"
+        assert (by_id["frames_done"], by_id["frames_total"]) == (2, 2)
+        assert latest["sequence_id"] == started["sequence_id"]
+
+    async def test_errors_returned_as_json(self, registry, manager):
+        """Verifies invalid steps and unknown IDs return JSON errors.
+
+        Arrangement:
+            Empty sequence table.
+
+        Action:
+            Start with a zero count, then query and abort an unknown ID.
+
+        Assertion Strategy:
+            "invalid_argument" for the bad step, "not_found" for both
+            unknown-ID calls; no camera is requested for invalid input.
+
+        Testing Principle:
+            Tool errors are structured, never raised to the MCP client.
+        """
+        invalid = await cameras._start_sequence(
+            0,
+            [{"count": 0, "exposure_us": 1000, "gain": 10}],
+            registry=registry,
+            manager=manager,
+        )
+        status = await cameras._get_sequence_status("seq_missing")
+        abort = await cameras._abort_sequence("seq_missing")
+
+        assert json.loads(invalid[0].text)["error"] == "invalid_argument"
+        assert json.loads(status[0].text)["error"] == "not_found"
+        assert json.loads(abort[0].text)["error"] == "not_found"
+        registry.get.assert_not_called()
+
+    async def test_abort_and_busy_camera(self, registry, manager):
+        """Verifies one sequence per camera and abort via the tool.
+
+        Arrangement:
+            Long-exposure sequence started on camera 0.
+
+        Action:
+            Start a second sequence on the same camera, then
+            _abort_sequence() the first.
+
+        Assertion Strategy:
+            Second start returns "busy"; abort reports "aborted".
+
+        Testing Principle:
+            Concurrent sequences never fight over one sensor.
+        """
+        first = await cameras._start_sequence(
+            0,
+            [{"count": 100, "exposure_us": 1000, "gain": 10}],
+            interval_sec=1.0,
+            registry=registry,
+            manager=manager,
+        )
+        sequence_id = json.loads(first[0].text)["sequence_id"]
+        second = await cameras._start_sequence(
+            0,
+            [{"count": 1, "exposure_us": 1000, "gain": 10}],
+            registry=registry,
+            manager=manager,
+        )
+        aborted = await cameras._abort_sequence(sequence_id)
+
+        assert json.loads(second[0].text)["error"] == "busy"
+        assert json.loads(aborted[0].text)["state"] == "aborted"
+
+    async def test_finished_sequences_capped(self, registry, manager, monkeypatch):
+        """Verifies the sequence table does not grow without bound.
+
+        Arrangement:
+            Cap of two finished sequences.
+
+        Action:
+            Start and finish four one-frame sequences in turn.
+
+        Assertion Strategy:
+            At most three entries remain (two finished plus the newest);
+            the oldest is gone and reports "not_found"; the newest is kept.
+
+        Testing Principle:
+            A long-running server does not leak one entry per sequence.
+        """
+        monkeypatch.setattr(cameras, "_MAX_FINISHED_SEQUENCES", 2)
+        ids = []
+        for _ in range(4):
+            result = await cameras._start_sequence(
+                0,
+                [{"count": 1, "exposure_us": 1000, "gain": 10}],
+                registry=registry,
+                manager=manager,
+            )
+            ids.append(json.loads(result[0].text)["sequence_id"])
+            await cameras._sequences[ids[-1]].wait()
+
+        status = await cameras._get_sequence_status(ids[0])
+
+        assert len(cameras._sequences) <= 3
+        assert ids[0] not in cameras._sequences
+        assert ids[-1] in cameras._sequences
+        assert json.loads(status[0].text)["error"] == "not_found"
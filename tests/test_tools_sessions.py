@@ -172,7 +172,7 @@ class TestToolsConstant:
             assert isinstance(tool, Tool)
 
     def test_tools_count(self) -> None:
-        """Verifies TOOLS contains exactly 7 session tools.
+        """Verifies TOOLS contains exactly 8 session tools.
 
         The expected tools are:
         - start_session
@@ -182,6 +182,7 @@ class TestToolsConstant:
         - session_event
         - get_data_dir
         - set_data_dir
+        - export_sessions
 
         Arrangement:
         1. sessions.TOOLS is module-level constant.
@@ -192,13 +193,13 @@ class TestToolsConstant:
 
         Assertion Strategy:
         Validates tool completeness by confirming:
-        - TOOLS has exactly 7 items.
+        - TOOLS has exactly 8 items.
 
         Testing Principle:
         Validates completeness, ensuring all required session tools
         are exported for MCP client discovery.
         """
-        assert len(sessions.TOOLS) == 7
+        assert len(sessions.TOOLS) == 8
 
     def test_start_session_tool_schema(self) -> None:
         """Verifies start_session tool has correct input schema.
@@ -2064,6 +2065,110 @@ class TestGetDataDir:
         assert "Factory not initialized" in data["message"]
 
 
+# =============================================================================
+# Test _export_sessions()
+# =============================================================================
+
+
+class TestExportSessions:
+    """Tests for _export_sessions() function."""
+
+    @pytest.mark.asyncio
+    async def test_export_defaults_to_data_dir(self, tmp_path: Path) -> None:
+        """Verifies export defaults to data_dir sources and data_dir/export.
+
+        Arrangement:
+        1. Real session archive with two frames written under tmp_path.
+        2. Factory mock whose data_dir is tmp_path.
+
+        Action:
+        Call _export_sessions with no paths/output_dir and workers=1.
+
+        Assertion Strategy:
+        - status is "exported" with frames == 2.
+        - FITS files exist under tmp_path/export.
+        - Throughput fields present.
+
+        Testing Principle:
+        Validates end-to-end tool path without a process pool.
+        """
+        import numpy as np
+
+        from telescope_mcp.data import Session
+
+        session = Session(SessionType.EXPERIMENT, tmp_path)
+        session.add_frame("main", np.zeros((4, 4), dtype=np.uint16))
+        session.add_frame("main", np.ones((4, 4), dtype=np.uint16))
+        session.close()
+        factory = MagicMock()
+        factory.config.data_dir = tmp_path
+
+        with patch("telescope_mcp.tools.sessions.get_factory", return_value=factory):
+            result = await sessions._export_sessions(None, None, "fits", 1)
+
+        data = json.loads(result[0].text)
+        assert data["status"] == "exported"
+        assert data["frames"] == 2
+        assert "frames_per_second" in data
+        assert len(list((tmp_path / "export").rglob("*.fits"))) == 2
+
+    @pytest.mark.asyncio
+    async def test_export_missing_path_is_validation_error(
+        self, tmp_path: Path
+    ) -> None:
+        """Verifies a nonexistent source path returns a validation error.
+
+        Arrangement:
+        1. Factory mock with data_dir=tmp_path.
+
+        Action:
+        Call _export_sessions with a path that doesn't exist.
+
+        Assertion Strategy:
+        - error is "validation" and message names the path.
+
+        Testing Principle:
+        Validates input errors are distinguished from internal failures.
+        """
+        factory = MagicMock()
+        factory.config.data_dir = tmp_path
+
+        with patch("telescope_mcp.tools.sessions.get_factory", return_value=factory):
+            result = await sessions._export_sessions(
+                [str(tmp_path / "missing.asdf")], None
+            )
+
+        data = json.loads(result[0].text)
+        assert data["error"] == "validation"
+        assert "missing.asdf" in data["message"]
+
+    @pytest.mark.asyncio
+    async def test_export_exception_handling(self) -> None:
+        """Verifies unexpected exceptions are returned as internal errors.
+
+        Arrangement:
+        1. get_factory() raises RuntimeError.
+
+        Action:
+        Call _export_sessions.
+
+        Assertion Strategy:
+        - error is "internal" with original message.
+
+        Testing Principle:
+        Validates exception safety of the tool handler.
+        """
+        with patch(
+            "telescope_mcp.tools.sessions.get_factory",
+            side_effect=RuntimeError("boom"),
+        ):
+            result = await sessions._export_sessions(None, None)
+
+        data = json.loads(result[0].text)
+        assert data["error"] == "internal"
+        assert "boom" in data["message"]
+
+
 # =============================================================================
 # Test _set_data_dir()
 # =============================================================================
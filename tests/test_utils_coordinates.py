@@ -1,7 +1,8 @@
 """Tests for coordinate conversion utilities.
 
-Validates altaz_to_radec, radec_to_altaz, and formatting functions
-using known astronomical values and edge cases.
+Validates altaz_to_radec, radec_to_altaz, CoordinateTransformer (FAST
+mode against astropy, batching), offline IERS setup and warm-up, and
+formatting functions using known astronomical values and edge cases.
 
 Example:
     pdm run pytest tests/test_utils_coordinates.py -v
@@ -9,13 +10,24 @@ Example:
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+from astropy import units as u
+from astropy.coordinates import SkyCoord
 
 from telescope_mcp.utils.coordinates import (
+    FAST_MODE_TOLERANCE_ARCSEC,
+    CoordinateTransformer,
+    TransformMode,
     altaz_to_radec,
+    configure_offline_iers,
     format_dec_dms,
     format_ra_hms,
     radec_to_altaz,
+    start_transform_warmup,
+    warm_up_transforms,
 )
 
 
@@ -275,6 +287,272 @@ class TestRadecToAltaz:
         assert abs(final_az - original_az) < 0.01
 
 
+class TestCoordinateTransformer:
+    """Test suite for CoordinateTransformer engines and batching.
+
+    Categories:
+    1. FAST vs ASTROPY Agreement - both directions, with refraction (2 tests)
+    2. Batching - vectorized results match per-call results (1 test)
+    3. Inputs - obstime forms, mode validation, module-level mode (2 tests)
+
+    Total: 5 tests.
+    """
+
+    LAT = 30.2672
+    LON = -97.7431
+    START = datetime(2025, 1, 1, tzinfo=UTC).timestamp()
+
+    @staticmethod
+    def _separation_arcsec(
+        lon1: np.ndarray, lat1: np.ndarray, lon2: np.ndarray, lat2: np.ndarray
+    ) -> np.ndarray:
+        """Angular separation between two sets of spherical positions."""
+        return (
+            SkyCoord(lon1 * u.deg, lat1 * u.deg)
+            .separation(SkyCoord(lon2 * u.deg, lat2 * u.deg))
+            .arcsec
+        )
+
+    def _random_sky(self, n: int, min_alt: float):
+        """Return reproducible altitudes, azimuths and POSIX times over a year."""
+        rng = np.random.default_rng(7)
+        return (
+            rng.uniform(min_alt, 89.5, n),
+            rng.uniform(0.0, 360.0, n),
+            self.START + rng.uniform(0.0, 365 * 86400.0, n),
+        )
+
+    def test_fast_matches_astropy_within_tolerance(self) -> None:
+        """Verifies the analytic engine agrees with astropy both ways.
+
+        Business context: FAST mode tags every frame, so its error must be
+        bounded and documented.
+
+        Arrangement: 500 random positions above 5° spread over a year.
+        Action: Transform with both engines, forward and inverse.
+        Assertion: Max separation below FAST_MODE_TOLERANCE_ARCSEC.
+        """
+        alt, az, times = self._random_sky(500, min_alt=5.0)
+        reference = CoordinateTransformer(self.LAT, self.LON, 150.0)
+        fast = CoordinateTransformer(self.LAT, self.LON, 150.0, mode="fast")
+
+        ra_ref, dec_ref = reference.altaz_to_radec_batch(alt, az, times)
+        ra_fast, dec_fast = fast.altaz_to_radec_batch(alt, az, times)
+        alt_back, az_back = fast.radec_to_altaz_batch(ra_ref, dec_ref, times)
+
+        forward = self._separation_arcsec(ra_ref, dec_ref, ra_fast, dec_fast)
+        inverse = self._separation_arcsec(az, alt, az_back, alt_back)
+        assert forward.max() < FAST_MODE_TOLERANCE_ARCSEC
+        assert inverse.max() < FAST_MODE_TOLERANCE_ARCSEC
+
+    def test_fast_refraction_matches_astropy(self) -> None:
+        """Verifies optional refraction tracks astropy's refracted AltAz.
+
+        Business context: Near the horizon refraction is arcminutes, far
+        above the unrefracted tolerance.
+
+        Arrangement: Positions above 10°, refraction on for both engines.
+        Action: Transform forward with both engines.
+        Assertion: Within tolerance; refraction shifts low targets by
+            arcminutes.
+        """
+        alt, az, times = self._random_sky(200, min_alt=10.0)
+        reference = CoordinateTransformer(self.LAT, self.LON, refraction=True)
+        fast = CoordinateTransformer(self.LAT, self.LON, mode="fast", refraction=True)
+        plain = CoordinateTransformer(self.LAT, self.LON, mode="fast")
+
+        ra_ref, dec_ref = reference.altaz_to_radec_batch(alt, az, times)
+        ra_fast, dec_fast = fast.altaz_to_radec_batch(alt, az, times)
+        ra_plain, dec_plain = plain.altaz_to_radec_batch(alt, az, times)
+
+        error = self._separation_arcsec(ra_ref, dec_ref, ra_fast, dec_fast)
+        shift = self._separation_arcsec(ra_plain, dec_plain, ra_fast, dec_fast)
+        assert error.max() < FAST_MODE_TOLERANCE_ARCSEC
+        assert shift[alt < 30.0].min() > 60.0  # ~1.7' of refraction at 30°
+
+    @pytest.mark.parametrize("mode", ["astropy", "fast"])
+    def test_batch_matches_single_calls(self, mode: str) -> None:
+        """Verifies vectorized results equal per-call results.
+
+        Business context: Batch tagging of a burst must not change values.
+
+        Arrangement: Five positions sharing one timestamp, then one position
+            over five timestamps.
+        Action: Batch call (broadcasting) vs. single calls.
+        Assertion: Identical to within 1e-6 degrees.
+        """
+        transformer = CoordinateTransformer(self.LAT, self.LON, mode=mode)
+        obstime = datetime(2025, 6, 21, 4, 0, tzinfo=UTC)
+        alts = np.array([10.0, 30.0, 45.0, 60.0, 85.0])
+        times = [obstime + timedelta(hours=h) for h in range(5)]
+
+        ra, dec = transformer.altaz_to_radec_batch(alts, 120.0, obstime)
+        alt, az = transformer.radec_to_altaz_batch(83.82, -5.39, times)
+
+        for i in range(5):
+            single = transformer.altaz_to_radec(alts[i], 120.0, obstime)
+            assert single["ra"] == pytest.approx(ra[i], abs=1e-6)
+            assert single["dec"] == pytest.approx(dec[i], abs=1e-6)
+            assert transformer.radec_to_altaz(83.82, -5.39, times[i]) == (
+                pytest.approx(alt[i], abs=1e-6),
+                pytest.approx(az[i], abs=1e-6),
+            )
+
+    def test_obstime_forms_are_equivalent(self) -> None:
+        """Verifies datetimes, naive datetimes and POSIX seconds agree.
+
+        Business context: Frame timestamps arrive as datetimes or as
+        monotonic-derived POSIX seconds.
+
+        Arrangement: One instant expressed three ways.
+        Action: Fast conversion with each form.
+        Assertion: Same RA/Dec.
+        """
+        aware = datetime(2025, 6, 21, 4, 0, tzinfo=UTC)
+        transformer = CoordinateTransformer(self.LAT, self.LON, mode="fast")
+
+        results = [
+            transformer.altaz_to_radec(45.0, 180.0, aware),
+            transformer.altaz_to_radec(45.0, 180.0, aware.replace(tzinfo=None)),
+        ]
+        ra, dec = transformer.altaz_to_radec_batch(45.0, 180.0, aware.timestamp())
+
+        for result in results:
+            assert result["ra"] == pytest.approx(float(ra), abs=1e-9)
+            assert result["dec"] == pytest.approx(float(dec), abs=1e-9)
+
+    def test_module_functions_accept_mode(self) -> None:
+        """Verifies mode passes through the module-level helpers.
+
+        Business context: Existing call sites opt into FAST with one kwarg.
+
+        Arrangement: Fixed time and position.
+        Action: altaz_to_radec()/radec_to_altaz() in both modes; bad mode.
+        Assertion: Modes agree within tolerance; unknown mode raises.
+        """
+        obstime = datetime(2025, 6, 21, 4, 0, tzinfo=UTC)
+        kwargs = {"lat": self.LAT, "lon": self.LON, "obstime": obstime}
+
+        ref = altaz_to_radec(45.0, 180.0, **kwargs)
+        fast = altaz_to_radec(45.0, 180.0, mode=TransformMode.FAST, **kwargs)
+        alt, az = radec_to_altaz(ref["ra"], ref["dec"], mode="fast", **kwargs)
+
+        tolerance_deg = FAST_MODE_TOLERANCE_ARCSEC / 3600.0
+        assert fast["ra"] == pytest.approx(ref["ra"], abs=tolerance_deg * 2)
+        assert fast["dec"] == pytest.approx(ref["dec"], abs=tolerance_deg)
+        assert (alt, az) == (
+            pytest.approx(45.0, abs=tolerance_deg),
+            pytest.approx(180.0, abs=tolerance_deg * 2),
+        )
+        with pytest.raises(ValueError):
+            altaz_to_radec(45.0, 180.0, mode="approximate", **kwargs)
+
+
+class TestTransformStartup:
+    """Test suite for offline IERS configuration and transform warm-up.
+
+    Categories:
+    1. Offline IERS - bundled default, explicit table, bad table (2 tests)
+    2. Warm-up - background thread completes, failures contained (2 tests)
+
+    Total: 4 tests.
+    """
+
+    @pytest.fixture
+    def iers_conf(self, monkeypatch):
+        """Restore astropy IERS settings and table after each test."""
+        from astropy.utils import iers
+
+        for name in ("auto_download", "auto_max_age", "iers_degraded_accuracy"):
+            monkeypatch.setattr(iers.conf, name, getattr(iers.conf, name))
+        yield iers
+        iers.earth_orientation_table.set(None)
+
+    def test_offline_uses_bundled_table(self, iers_conf, monkeypatch) -> None:
+        """Verifies downloads are disabled and the bundled table is used.
+
+        Business context: The rig has no network; astropy must never try
+        to fetch IERS-A on the first conversion.
+
+        Arrangement: Astropy download cache reported empty.
+        Action: configure_offline_iers(), then a conversion in 2025.
+        Assertion: "bundled"; auto_download off, no max age; conversion works.
+        """
+        monkeypatch.setattr("astropy.utils.data.is_url_in_cache", lambda *a, **k: False)
+
+        source = configure_offline_iers()
+        coords = altaz_to_radec(
+            45.0,
+            180.0,
+            lat=30.0,
+            lon=-97.0,
+            obstime=datetime(2025, 6, 21, 4, 0, tzinfo=UTC),
+        )
+
+        assert source == "bundled"
+        assert iers_conf.conf.auto_download is False
+        assert iers_conf.conf.auto_max_age is None
+        assert 0.0 <= coords["ra"] < 360.0
+
+    def test_explicit_table_loaded(self, iers_conf, tmp_path) -> None:
+        """Verifies a local IERS file becomes the active table.
+
+        Business context: Operators can copy a fresh finals2000A file onto
+        the rig by hand.
+
+        Arrangement: Astropy's bundled IERS-A file path; a garbage file.
+        Action: configure_offline_iers() with each.
+        Assertion: Path returned and table active; garbage raises.
+        """
+        source = configure_offline_iers(iers_conf.IERS_A_FILE)
+
+        assert source == str(iers_conf.IERS_A_FILE)
+        assert isinstance(iers_conf.earth_orientation_table.get(), iers_conf.IERS_A)
+
+        bad = tmp_path / "finals.all"
+        bad.write_text("not an IERS table")
+        with pytest.raises(ValueError):
+            configure_offline_iers(bad)
+
+    def test_warmup_thread_completes(self) -> None:
+        """Verifies the background warm-up finishes and reports nothing.
+
+        Business context: Started from lifespan/create_server; must not
+        block startup.
+
+        Arrangement: Location not used elsewhere in the suite.
+        Action: start_transform_warmup(offline=False), join.
+        Assertion: Daemon thread finished; warm_up_transforms reports time.
+        """
+        thread = start_transform_warmup(12.5, 45.25, 300.0, offline=False)
+        thread.join(timeout=30)
+
+        assert thread.daemon
+        assert not thread.is_alive()
+        assert warm_up_transforms(12.5, 45.25, 300.0) >= 0.0
+
+    def test_warmup_failure_is_logged(self, monkeypatch) -> None:
+        """Verifies warm-up errors never propagate to the caller.
+
+        Business context: A broken IERS file must not stop the server.
+
+        Arrangement: warm_up_transforms patched to raise.
+        Action: start_transform_warmup(), join.
+        Assertion: Thread exits normally.
+        """
+        import telescope_mcp.utils.coordinates as coordinates
+
+        def broken(*args: object) -> float:
+            raise RuntimeError("no tables")
+
+        monkeypatch.setattr(coordinates, "warm_up_transforms", broken)
+
+        thread = start_transform_warmup(0.0, 0.0, offline=False)
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+
+
 class TestFormatRaHms:
     """Test suite for format_ra_hms function.
 
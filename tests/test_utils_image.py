@@ -9,7 +9,12 @@ from unittest.mock import patch
 import numpy as np
 import pytest
 
-from telescope_mcp.utils.image import CV2ImageEncoder, ImageEncoder
+from telescope_mcp.utils.image import (
+    CV2ImageEncoder,
+    ImageEncoder,
+    encode_image,
+    to_uint8,
+)
 
 
 class TestImageEncoderProtocol:
@@ -799,3 +804,87 @@ class TestCV2ImageEncoderPutText:
 
         # Thicker lines should use more pixels
         assert img_thick.sum() > img_thin.sum()
+
+
+class TestEncodeImage:
+    """Tests for to_uint8() and encode_image() helpers.
+
+    Total: 3 tests.
+    """
+
+    def test_to_uint8_keeps_high_byte(self) -> None:
+        """Verifies RAW16 scales by >> 8 and uint8 passes through.
+
+        Business context:
+        Preview JPEGs of 16-bit frames must match the ASI driver's
+        historical scaling so dashboards look the same.
+
+        Arrangement:
+        uint16 frame of 0xABCD and a uint8 frame.
+
+        Action:
+        to_uint8() on both, plus a float frame.
+
+        Assertion Strategy:
+        0xAB for RAW16; same object for uint8; ValueError for float.
+
+        Testing Principle:
+        Validates lossless-where-possible dtype handling.
+        """
+        frame16 = np.full((2, 3), 0xABCD, dtype=np.uint16)
+        frame8 = np.zeros((2, 3), dtype=np.uint8)
+
+        assert to_uint8(frame16)[0, 0] == 0xAB
+        assert to_uint8(frame8) is frame8
+        with pytest.raises(ValueError, match="dtype"):
+            to_uint8(np.zeros((2, 2), dtype=np.float32))
+
+    def test_png_preserves_16_bit(self) -> None:
+        """Verifies PNG output round-trips RAW16 exactly.
+
+        Business context:
+        Consumers choosing PNG want a lossless, full-depth export.
+
+        Arrangement:
+        uint16 gradient frame.
+
+        Action:
+        encode_image(fmt="png") then cv2.imdecode unchanged.
+
+        Assertion Strategy:
+        PNG signature; decoded array equals the source.
+
+        Testing Principle:
+        Validates consumer-chosen lossless encoding.
+        """
+        import cv2
+
+        frame = np.arange(12, dtype=np.uint16).reshape(3, 4) * 5000
+
+        data = encode_image(frame, "png")
+
+        assert data[:4] == b"\x89PNG"
+        decoded = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_UNCHANGED)
+        np.testing.assert_array_equal(decoded, frame)
+
+    def test_jpeg_raw_and_unknown_formats(self) -> None:
+        """Verifies JPEG and raw outputs and rejects unknown formats.
+
+        Arrangement:
+        Small uint16 frame.
+
+        Action:
+        encode_image() as jpeg, raw, and tiff.
+
+        Assertion Strategy:
+        JPEG magic bytes; raw equals tobytes(); ValueError for tiff.
+
+        Testing Principle:
+        Validates format dispatch.
+        """
+        frame = np.full((8, 8), 40000, dtype=np.uint16)
+
+        assert encode_image(frame, "jpeg", quality=70)[:2] == b"\xff\xd8"
+        assert encode_image(frame, "raw") == frame.tobytes()
+        with pytest.raises(ValueError, match="fmt"):
+            encode_image(frame, "tiff")
@@ -9,6 +9,7 @@ Author: Test suite
 Date: 2025-12-18
 """
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -819,6 +820,31 @@ class TestCameraAPIEndpoints:
         assert "error" in data
         assert "SDK error" in data["error"]
 
+    def test_list_cameras_cached_between_requests(self, client, mock_asi):
+        """Verifies GET /api/cameras reuses a recent enumeration.
+
+        Arrangement:
+        mock_asi fixture with 2 cameras.
+
+        Action:
+        Two plain GETs, then GET with ?refresh=true.
+
+        Assertion Strategy:
+        get_num_cameras called once for the two plain requests and again
+        for the refresh; all responses identical.
+
+        Testing Principle:
+        Dashboard polling does not enumerate the USB bus on every request.
+        """
+        first = client.get("/api/cameras").json()
+        second = client.get("/api/cameras").json()
+        assert mock_asi.get_num_cameras.call_count == 1
+
+        refreshed = client.get("/api/cameras", params={"refresh": "true"}).json()
+
+        assert mock_asi.get_num_cameras.call_count == 2
+        assert first == second == refreshed
+
     def test_set_camera_control_gain(self, client, mock_asi):
         """Verifies POST /api/camera/{id}/control sets gain successfully.
 
@@ -1765,6 +1791,179 @@ class TestPositionAPIEndpoint:
                 # Restore original sensor state
                 app_module._sensor = original_sensor
 
+    def test_position_uses_fused_sensor_read(self, mock_asi, mock_sdk_path):
+        """Verifies streaming sensors are read once, without re-averaging.
+
+        Business context:
+        The Arduino driver fuses every sample in its reader thread, so
+        the endpoint takes the filtered estimate instead of averaging
+        buffered or polled readings and adding lag.
+
+        Arrangement:
+        1. Mock sensor exposing a SensorHistory with 3 samples.
+
+        Action:
+        Issues GET /api/position.
+
+        Assertion Strategy:
+        Validates the fused read by confirming:
+        - read() awaited once with no sample count.
+        - Returned position is that reading, status "ok".
+        """
+        from unittest.mock import AsyncMock
+
+        import telescope_mcp.web.app as app_module
+        from telescope_mcp.drivers.sensors import SensorHistory
+
+        history = SensorHistory()
+        for i in range(3):
+            history.append([0.0] * 8, t_ns=i)
+        mock_sensor = MagicMock()
+        mock_sensor.history = history
+        mock_sensor.read = AsyncMock(
+            return_value=MagicMock(altitude=30.0, azimuth=120.0)
+        )
+
+        app = create_app(encoder=MockImageEncoder())
+
+        with TestClient(app) as test_client:
+            original_sensor = app_module._sensor
+            app_module._sensor = mock_sensor
+            try:
+                data = test_client.get("/api/position").json()
+            finally:
+                app_module._sensor = original_sensor
+
+        mock_sensor.read.assert_awaited_once_with()
+        assert data["sensor_status"] == "ok"
+        assert (data["altitude"], data["azimuth"]) == (30.0, 120.0)
+
+
+class TestLiveEvents:
+    """Tests for the /api/events Server-Sent Events feed.
+
+    Categories:
+    1. Endpoint - disabled feed returns 503 for polling fallback
+    2. Stream - retry hint, replayed state, unsubscribe on close
+    3. Sources - position and motor registered from config
+
+    Total: 3 tests.
+    """
+
+    def test_events_disabled_returns_503(self, mock_asi, mock_sdk_path):
+        """Verifies clients are told to poll when events are disabled.
+
+        Arrangement:
+        1. App running with the event publisher cleared (event_rate_hz=0).
+
+        Action:
+        Issues GET /api/events.
+
+        Assertion Strategy:
+        Status 503 with an error payload.
+        """
+        import telescope_mcp.web.app as app_module
+
+        app = create_app(encoder=MockImageEncoder())
+
+        with TestClient(app) as test_client:
+            original = app_module._event_publisher
+            app_module._event_publisher = None
+            try:
+                response = test_client.get("/api/events")
+            finally:
+                app_module._event_publisher = original
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_event_stream_replays_and_unsubscribes(self, mock_asi, mock_sdk_path):
+        """Verifies the SSE generator output and cleanup.
+
+        Business context:
+        A dashboard opening the feed must show the current position at
+        once, and a closed tab must stop costing sensor reads.
+
+        Arrangement:
+        1. Position and motor already published on the app bus.
+
+        Action:
+        Read two messages from _event_stream(["position"]), then close it.
+
+        Assertion Strategy:
+        Validates the stream by confirming:
+        - First message is the retry hint.
+        - Second is the latest position only (motor filtered out).
+        - Closing the generator removes its subscription.
+        """
+        import telescope_mcp.web.app as app_module
+        from telescope_mcp.web.app import _event_stream
+
+        bus = app_module._event_bus
+        subscribers = bus.subscriber_count
+        bus.publish("motor", {"altitude": {"position_steps": 0}})
+        bus.publish("position", {"altitude": 12.5})
+
+        stream = _event_stream(["position"])
+        retry = await anext(stream)
+        message = await anext(stream)
+        assert bus.subscriber_count == subscribers + 1
+        await stream.aclose()
+
+        assert retry.startswith(b"retry: ")
+        assert b"event: position\n" in message
+        assert message.endswith(b'data: {"altitude": 12.5}\n\n')
+        assert bus.subscriber_count == subscribers
+
+    @pytest.mark.asyncio
+    async def test_init_events_registers_sources(self, mock_asi, mock_sdk_path):
+        """Verifies startup wires position and motor into the bus.
+
+        Arrangement:
+        1. Factory config with event_rate_hz=20.
+        2. Connected mock motor reporting one status per axis.
+
+        Action:
+        _init_events(), subscribe to "motor", then _cleanup_events().
+
+        Assertion Strategy:
+        Publisher running after init; the motor event carries both axes;
+        publisher cleared after cleanup, and not created at rate 0.
+        """
+        import asyncio
+
+        import telescope_mcp.web.app as app_module
+        from telescope_mcp.drivers.config import DriverConfig
+        from telescope_mcp.drivers.motors.types import MotorStatus, MotorType
+        from telescope_mcp.web.app import _cleanup_events, _init_events
+
+        motor = MagicMock(connected=True)
+        motor.get_status.side_effect = lambda axis: MotorStatus(
+            motor=axis, is_moving=axis is MotorType.AZIMUTH, position_steps=100
+        )
+        factory = MagicMock(config=DriverConfig(event_rate_hz=20.0))
+        original_motor = app_module._motor
+        app_module._motor = motor
+        try:
+            with patch("telescope_mcp.web.app.get_factory", return_value=factory):
+                await _init_events()
+                assert app_module._event_publisher is not None
+                bus = app_module._event_bus
+                with bus.subscribe(["motor"], replay=False) as subscription:
+                    event = await asyncio.wait_for(subscription.get(), 1.0)
+                await _cleanup_events()
+                assert app_module._event_publisher is None
+
+                factory.config.event_rate_hz = 0
+                await _init_events()
+                assert app_module._event_publisher is None
+        finally:
+            app_module._motor = original_motor
+
+        assert event.data["altitude"]["position_steps"] == 100
+        assert event.data["azimuth"]["is_moving"] is True
+
 
 class TestLifecycleManagement:
     """Tests for application startup and shutdown lifecycle."""
@@ -1877,6 +2076,48 @@ class TestLifecycleManagement:
             app_module._sensor = original_sensor
             app_module.get_factory = original_get_factory
 
+    def test_init_transforms_uses_config(self, mock_asi, mock_sdk_path):
+        """Verifies startup warm-up gets the configured location and IERS mode.
+
+        Arrangement:
+        1. Factory config with a partial location (no "alt") and an IERS
+           table path with downloads allowed.
+        2. start_transform_warmup patched.
+
+        Action:
+        Call _init_transforms().
+
+        Assertion Strategy:
+        Warm-up called once with configured lat/lon, default elevation,
+        offline=False and the table path.
+
+        Testing Principle:
+        The warm-up prepares the exact transformer /api/position will use.
+        """
+        from telescope_mcp.drivers.config import DEFAULT_LOCATION, DriverConfig
+        from telescope_mcp.web.app import _init_transforms
+
+        config = DriverConfig(
+            location={"lat": 45.0, "lon": 7.5},
+            iers_offline=False,
+            iers_table_path=Path("/data/finals2000A.all"),
+        )
+        factory = MagicMock(config=config)
+
+        with (
+            patch("telescope_mcp.web.app.get_factory", return_value=factory),
+            patch("telescope_mcp.web.app.start_transform_warmup") as warmup,
+        ):
+            _init_transforms()
+
+        warmup.assert_called_once_with(
+            45.0,
+            7.5,
+            DEFAULT_LOCATION["alt"],
+            offline=False,
+            table_path=Path("/data/finals2000A.all"),
+        )
+
     @pytest.mark.asyncio
     async def test_cleanup_sensor_when_none(self, mock_asi, mock_sdk_path):
         """Verifies _cleanup_sensor handles None sensor gracefully.
@@ -3163,6 +3404,67 @@ class TestAddCoordinatesToMetadata:
 
         assert "coordinates" not in frame_meta
 
+    @pytest.mark.asyncio
+    async def test_averages_over_exposure_window_from_history(self):
+        """Verifies buffered sensors are averaged over the exposure window.
+
+        Tests that frames are tagged with the mean position while the
+        shutter was open, at the exposure midpoint, without a live read.
+
+        Arrangement:
+        1. Mock sensor exposing a SensorHistory and async read_between().
+        2. 2-second exposure that ended 1 second before capture_time.
+
+        Action:
+        Calls _add_coordinates_to_metadata with exposure_us/exposure_end.
+
+        Assertion Strategy:
+        Validates window tagging by confirming:
+        - read_between() called with [end - exposure, end]; read() unused.
+        - RA/Dec computed and stamped at the exposure midpoint.
+        """
+        import datetime
+        from unittest.mock import AsyncMock
+
+        from telescope_mcp.drivers.sensors import SensorHistory
+        from telescope_mcp.web.app import _add_coordinates_to_metadata
+
+        reading = MagicMock(altitude=40.0, azimuth=90.0, temperature=5.0, humidity=70.0)
+        mock_sensor = MagicMock()
+        mock_sensor.connected = True
+        mock_sensor.history = SensorHistory()
+        mock_sensor.read = AsyncMock(side_effect=AssertionError("live read"))
+        mock_sensor.read_between = AsyncMock(return_value=reading)
+
+        capture_time = datetime.datetime.now(datetime.UTC)
+        end = capture_time - datetime.timedelta(seconds=1)
+        start = end - datetime.timedelta(seconds=2)
+        frame_meta: dict[str, object] = {}
+
+        with patch("telescope_mcp.web.app._sensor", mock_sensor):
+            with patch("telescope_mcp.web.app.altaz_to_radec") as mock_convert:
+                mock_convert.return_value = {
+                    "ra": 1.0,
+                    "dec": 2.0,
+                    "ra_hours": 0.1,
+                    "ra_hms": "0h",
+                    "dec_dms": "2d",
+                }
+                await _add_coordinates_to_metadata(
+                    frame_meta,
+                    capture_time,
+                    exposure_us=2_000_000,
+                    exposure_end=end,
+                )
+
+        midpoint = end - datetime.timedelta(seconds=1)
+        mock_sensor.read_between.assert_awaited_once_with(start, end)
+        assert mock_convert.call_args.kwargs["obstime"] == midpoint
+        coords = frame_meta["coordinates"]
+        assert isinstance(coords, dict)
+        assert coords["altitude"] == 40.0
+        assert coords["coordinate_timestamp"] == midpoint.isoformat()
+
 
 class TestSaveFrameToAsdf:
     """Tests for _save_frame_to_asdf function."""
@@ -3374,6 +3676,297 @@ class TestSaveFrameToAsdf:
             assert len(af.tree["cameras"]["finder"]["light"]) == 1
 
 
+class TestSessionDownload:
+    """Tests for GET/HEAD /api/sessions/{session_id}/download.
+
+    Categories:
+    1. Whole Archive - full body, Range, suffix Range, 416, If-Range, HEAD,
+       compaction swap mid-stream
+    2. Single Frame - raw pixel buffer with shape/dtype headers
+    3. Lookup - unknown and path-like session ids
+    4. Range Parsing - _parse_range_header edge cases
+
+    Total: 9 tests.
+    """
+
+    @pytest.fixture
+    def archive(self, tmp_path):
+        """Write a capture archive into a patched capture directory.
+
+        Yields:
+            Tuple of (archive path, light frame array).
+        """
+        import asdf
+
+        frame = np.arange(24, dtype=np.uint16).reshape(4, 6)
+        tree = {
+            "metadata": {"session_date": "20251231"},
+            "cameras": {
+                "finder": {
+                    "info": {"name": "ZWO ASI482MC"},
+                    "light": [{"data": frame, "meta": {"exposure_us": 1000}}],
+                    "dark": [],
+                    "flat": [],
+                    "bias": [],
+                }
+            },
+        }
+        capture_dir = tmp_path / "captures"
+        capture_dir.mkdir()
+        path = capture_dir / "session_20251231.asdf"
+        asdf.AsdfFile(tree).write_to(path)
+        with patch("telescope_mcp.web.app._CAPTURE_DIR", capture_dir):
+            yield path, frame
+
+    def test_full_download_streams_file(self, client, archive):
+        """Verifies a plain GET returns the whole archive with validators.
+
+        Arrangement:
+            Capture archive in patched capture directory.
+
+        Action:
+            GET without Range.
+
+        Assertion Strategy:
+            200, body equals file bytes, Accept-Ranges and ETag present.
+
+        Testing Principle:
+            Clients learn they can resume from the first response.
+        """
+        path, _ = archive
+        response = client.get("/api/sessions/session_20251231/download")
+
+        assert response.status_code == 200
+        assert response.content == path.read_bytes()
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["etag"].startswith('"')
+        assert "session_20251231.asdf" in response.headers["content-disposition"]
+
+    def test_range_and_suffix_range_return_partial_content(self, client, archive):
+        """Verifies bounded and suffix Range requests return 206 slices.
+
+        Arrangement:
+            Capture archive.
+
+        Action:
+            GET with bytes=10-19, then bytes=-7.
+
+        Assertion Strategy:
+            206 with matching Content-Range, Content-Length and body slice.
+
+        Testing Principle:
+            Interrupted downloads resume at an arbitrary offset.
+        """
+        path, _ = archive
+        data = path.read_bytes()
+        url = "/api/sessions/session_20251231/download"
+
+        response = client.get(url, headers={"Range": "bytes=10-19"})
+        assert response.status_code == 206
+        assert response.content == data[10:20]
+        assert response.headers["content-range"] == f"bytes 10-19/{len(data)}"
+        assert response.headers["content-length"] == "10"
+
+        response = client.get(url, headers={"Range": "bytes=-7"})
+        assert response.status_code == 206
+        assert response.content == data[-7:]
+
+    def test_unsatisfiable_range_returns_416(self, client, archive):
+        """Verifies a range beyond the end returns 416 with total size.
+
+        Arrangement:
+            Capture archive.
+
+        Action:
+            GET with a start offset past EOF.
+
+        Assertion Strategy:
+            416 and Content-Range "bytes */size".
+
+        Testing Principle:
+            RFC 9110 unsatisfiable range semantics.
+        """
+        path, _ = archive
+        size = path.stat().st_size
+        response = client.get(
+            "/api/sessions/session_20251231/download",
+            headers={"Range": f"bytes={size}-"},
+        )
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{size}"
+
+    def test_if_range_mismatch_returns_full_body(self, client, archive):
+        """Verifies a stale If-Range validator ignores Range.
+
+        Arrangement:
+            Capture archive.
+
+        Action:
+            GET with Range and an If-Range ETag that does not match.
+
+        Assertion Strategy:
+            200 with the full body; matching ETag yields 206.
+
+        Testing Principle:
+            A changed archive is never spliced onto an old partial file.
+        """
+        path, _ = archive
+        url = "/api/sessions/session_20251231/download"
+        etag = client.head(url).headers["etag"]
+
+        stale = client.get(url, headers={"Range": "bytes=0-3", "If-Range": '"x"'})
+        fresh = client.get(url, headers={"Range": "bytes=0-3", "If-Range": etag})
+
+        assert stale.status_code == 200
+        assert stale.content == path.read_bytes()
+        assert fresh.status_code == 206
+        assert fresh.content == path.read_bytes()[:4]
+
+    def test_head_returns_headers_without_body(self, client, archive):
+        """Verifies HEAD reports size and validators with no body.
+
+        Arrangement:
+            Capture archive.
+
+        Action:
+            HEAD request.
+
+        Assertion Strategy:
+            200, Content-Length equals file size, empty body.
+
+        Testing Principle:
+            Download managers probe size before fetching.
+        """
+        path, _ = archive
+        response = client.head("/api/sessions/session_20251231/download")
+
+        assert response.status_code == 200
+        assert response.headers["content-length"] == str(path.stat().st_size)
+        assert response.content == b""
+
+    def test_download_survives_compaction_swap(self, client, archive):
+        """Verifies a rewrite during streaming does not truncate the body.
+
+        Arrangement:
+            Capture archive; body generator patched to os.replace() the
+            archive with a shorter file before yielding anything.
+
+        Action:
+            GET without Range.
+
+        Assertion Strategy:
+            Body and Content-Length equal the original file.
+
+        Testing Principle:
+            Compaction may run at any time without corrupting downloads.
+        """
+        import telescope_mcp.web.app as app_module
+
+        path, _ = archive
+        original = path.read_bytes()
+        stream = app_module._iter_file_range
+
+        def swap_then_stream(source, start, end):
+            replacement = path.with_suffix(".tmp")
+            replacement.write_bytes(b"#ASDF compacted")
+            os.replace(replacement, path)
+            yield from stream(source, start, end)
+
+        with patch.object(app_module, "_iter_file_range", swap_then_stream):
+            response = client.get("/api/sessions/session_20251231/download")
+
+        assert response.status_code == 200
+        assert response.headers["content-length"] == str(len(original))
+        assert response.content == original
+
+    def test_single_frame_download_returns_raw_pixels(self, client, archive):
+        """Verifies camera/group/index select one frame's raw buffer.
+
+        Arrangement:
+            Capture archive with a 4x6 uint16 light frame.
+
+        Action:
+            GET full frame, then a ranged slice; request a missing index.
+
+        Assertion Strategy:
+            Body equals frame.tobytes(); shape/dtype headers set; ranged
+            slice matches; missing frame is 404.
+
+        Testing Principle:
+            Single frames can be fetched without the whole night's archive.
+        """
+        _, frame = archive
+        url = "/api/sessions/session_20251231/download"
+        params = {"camera": "finder", "group": "light", "index": 0}
+
+        response = client.get(url, params=params)
+        assert response.status_code == 200
+        assert response.content == frame.tobytes()
+        assert response.headers["x-frame-shape"] == "4,6"
+        assert response.headers["x-frame-dtype"] == frame.dtype.str
+
+        ranged = client.get(url, params=params, headers={"Range": "bytes=4-11"})
+        assert ranged.status_code == 206
+        assert ranged.content == frame.tobytes()[4:12]
+
+        missing = client.get(url, params={**params, "index": 5})
+        assert missing.status_code == 404
+
+    def test_unknown_or_path_like_session_returns_404(self, client, archive):
+        """Verifies unknown ids and traversal attempts are not found.
+
+        Arrangement:
+            Capture archive; data_dir patched to an empty tmp directory.
+
+        Action:
+            GET unknown id and a dot-prefixed id.
+
+        Assertion Strategy:
+            Both 404.
+
+        Testing Principle:
+            Only archive stems are addressable.
+        """
+        path, _ = archive
+        factory = MagicMock()
+        factory.config.data_dir = path.parent / "empty"
+        with patch("telescope_mcp.web.app.get_factory", return_value=factory):
+            assert client.get("/api/sessions/nope/download").status_code == 404
+            assert client.get("/api/sessions/..secret/download").status_code == 404
+
+    def test_parse_range_header_edge_cases(self):
+        """Verifies Range parsing for supported and ignored forms.
+
+        Arrangement:
+            Resource of 100 bytes.
+
+        Action:
+            Parse open-ended, clamped, multi-range, foreign-unit, and
+            invalid headers.
+
+        Assertion Strategy:
+            Offsets clamped to size; unsupported forms return None;
+            unsatisfiable forms raise ValueError.
+
+        Testing Principle:
+            Unsupported ranges fall back to a full 200 response.
+        """
+        from telescope_mcp.web.app import _parse_range_header
+
+        assert _parse_range_header(None, 100) is None
+        assert _parse_range_header("bytes=90-", 100) == (90, 99)
+        assert _parse_range_header("bytes=50-500", 100) == (50, 99)
+        assert _parse_range_header("bytes=-500", 100) == (0, 99)
+        assert _parse_range_header("bytes=0-1,5-6", 100) is None
+        assert _parse_range_header("items=0-1", 100) is None
+        assert _parse_range_header("bytes=a-b", 100) is None
+        with pytest.raises(ValueError):
+            _parse_range_header("bytes=-0", 100)
+        with pytest.raises(ValueError):
+            _parse_range_header("bytes=20-10", 100)
+
+
 class TestMainFunction:
     """Tests for main() entry point."""
 